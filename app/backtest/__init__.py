@@ -0,0 +1,31 @@
+"""
+Backtesting tools that run strategies over whole histories at once.
+"""
+
+from app.backtest.sweep import ParameterSpace, ParameterSweep, SharedArrayStore
+from app.backtest.vectorized import (
+    ParityMismatch,
+    ParityReport,
+    VectorizedBacktester,
+    VectorizedBacktestResult,
+)
+from app.backtest.walk_forward import (
+    WalkForwardOptimizer,
+    WalkForwardResult,
+    WalkForwardWindow,
+    walk_forward_windows,
+)
+
+__all__ = [
+    "ParameterSpace",
+    "ParameterSweep",
+    "ParityMismatch",
+    "ParityReport",
+    "SharedArrayStore",
+    "VectorizedBacktester",
+    "VectorizedBacktestResult",
+    "WalkForwardOptimizer",
+    "WalkForwardResult",
+    "WalkForwardWindow",
+    "walk_forward_windows",
+]
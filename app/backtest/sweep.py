@@ -0,0 +1,591 @@
+"""
+Parallel parameter sweeps over a strategy YAML.
+
+A sweep takes one strategy configuration, a parameter space (grid or random
+search) and the bars of each timeframe, and runs one VectorizedBacktester per
+parameter set on a process pool:
+
+- Parameters are dotted paths into the strategy YAML
+  (``entry.long.conditions.0.value``, ``risk.sl.value``) or into the indicator
+  configuration (``indicators.1.ema.period``)
+- Base OHLCV columns and every distinct indicator column are computed once in
+  the parent and placed in one shared memory block; workers map it read-only
+  instead of receiving pickled frames or recomputing indicators
+- Results are collected into a columnar table (one row per parameter set)
+- With a checkpoint folder, results are flushed as parquet parts while the
+  sweep runs; a restarted sweep skips every parameter set already stored
+
+Example:
+    ```python
+    space = ParameterSpace.grid({
+        "indicators.1.ema.period": [10, 20, 50],
+        "risk.sl.value": [1.0, 2.0],
+    })
+    sweep = ParameterSweep.from_yaml(
+        "config/strategies/xauusd/trend.yaml", data, space,
+        pip_value=100.0, indicator_configs=indicators,
+        workers=4, checkpoint_dir="./sweeps/trend",
+    )
+    results = sweep.run()
+    print(results.sort_values("net_profit", ascending=False).head())
+    ```
+
+Command line:
+
+    python -m app.backtest.sweep strategy.yaml ./data --symbol xauusd --config ./config \\
+        --space space.yaml --pip-value 100 --workers 4 --checkpoint ./sweeps/run1
+"""
+
+import argparse
+import copy
+import hashlib
+import itertools
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from app.backtest.vectorized import VectorizedBacktester
+from app.indicators.indicator_manager import IndicatorManager
+from app.strategy_builder.core.domain.models import TradingStrategy
+
+
+INDICATOR_PREFIX = "indicators"
+
+BASE_COLUMNS = ("open", "high", "low", "close", "tick_volume")
+
+
+class ParameterSpace:
+    """Parameter sets of a sweep: a full grid or seeded random samples"""
+
+    def __init__(self, parameter_sets: List[Dict[str, Any]]):
+        self.parameter_sets = parameter_sets
+
+    @classmethod
+    def grid(cls, parameters: Dict[str, Sequence[Any]]) -> "ParameterSpace":
+        """
+        Every combination of the given values.
+
+        Args:
+            parameters: Path -> candidate values
+        """
+        paths = list(parameters)
+        combinations = itertools.product(*(parameters[path] for path in paths))
+        return cls([dict(zip(paths, values)) for values in combinations])
+
+    @classmethod
+    def random(cls, parameters: Dict[str, Any], samples: int, seed: int = 0) -> "ParameterSpace":
+        """
+        Random search.
+
+        Each parameter is either a list of choices or a range
+        ``{"low": a, "high": b}`` (integers when both bounds are integers,
+        inclusive; floats otherwise). Duplicated draws are dropped.
+
+        Args:
+            parameters: Path -> choices or range
+            samples: Number of draws
+            seed: Random seed, so a resumed sweep draws the same sets
+        """
+        rng = np.random.default_rng(seed)
+        parameter_sets, seen = [], set()
+        for _ in range(samples):
+            params = {path: _draw(spec, rng) for path, spec in parameters.items()}
+            key = json.dumps(params, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                parameter_sets.append(params)
+        return cls(parameter_sets)
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "ParameterSpace":
+        """
+        Build from a YAML-style specification.
+
+        ``{"grid": {...}}`` or ``{"random": {...}, "samples": 100, "seed": 1}``
+        """
+        if "grid" in spec:
+            return cls.grid(spec["grid"])
+        if "random" in spec:
+            return cls.random(spec["random"], int(spec.get("samples", 100)), int(spec.get("seed", 0)))
+        raise ValueError("Parameter space needs a 'grid' or 'random' section")
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.parameter_sets)
+
+    def __len__(self) -> int:
+        return len(self.parameter_sets)
+
+
+def _draw(spec: Any, rng: np.random.Generator) -> Any:
+    """Draw one value from a choice list or a low/high range."""
+    if isinstance(spec, dict):
+        low, high = spec["low"], spec["high"]
+        if isinstance(low, int) and isinstance(high, int):
+            return int(rng.integers(low, high + 1))
+        return float(rng.uniform(low, high))
+    choices = list(spec)
+    return choices[int(rng.integers(len(choices)))]
+
+
+def apply_parameters(
+    strategy_config: Dict[str, Any],
+    indicator_configs: Dict[str, dict],
+    params: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, dict]]:
+    """
+    Return copies of the strategy and indicator configurations with parameters set.
+
+    Args:
+        strategy_config: Strategy YAML as a dictionary
+        indicator_configs: Indicator configuration per timeframe
+        params: Dotted path -> value; ``indicators.<tf>.<name>.<param>``
+            targets indicator_configs, anything else the strategy
+
+    Returns:
+        (strategy_config, indicator_configs) with the values applied
+
+    Raises:
+        KeyError: If a path does not exist in the configuration
+    """
+    strategy_config = copy.deepcopy(strategy_config)
+    indicator_configs = copy.deepcopy(indicator_configs)
+    for path, value in params.items():
+        parts = path.split(".")
+        if parts[0] == INDICATOR_PREFIX:
+            _set_path(indicator_configs, parts[1:], value, path)
+        else:
+            _set_path(strategy_config, parts, value, path)
+    return strategy_config, indicator_configs
+
+
+def _set_path(target: Any, parts: List[str], value: Any, path: str) -> None:
+    """Set a nested dict/list value; list indices are given as digits and only leaf dict keys may be new."""
+    try:
+        for part in parts[:-1]:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        if isinstance(target, list):
+            target[int(parts[-1])] = value
+        elif isinstance(target, dict):
+            target[parts[-1]] = value
+        else:
+            raise TypeError(type(target).__name__)
+    except (KeyError, IndexError, TypeError, ValueError):
+        raise KeyError(f"Parameter path not found: {path}")
+
+
+def run_id(strategy_config: Dict[str, Any], indicator_configs: Dict[str, dict], params: Dict[str, Any]) -> str:
+    """Stable identifier of one parameter set on one base configuration."""
+    payload = json.dumps(
+        {"strategy": strategy_config, "indicators": indicator_configs, "params": params},
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class SharedArrayStore:
+    """Packs named NumPy arrays into one shared memory block"""
+
+    def __init__(self):
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+    def add(self, key: str, array: np.ndarray) -> None:
+        """Register an array (copied into shared memory on publish)."""
+        self._arrays[key] = np.ascontiguousarray(array)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._arrays
+
+    def publish(self) -> Dict[str, Any]:
+        """
+        Copy every array into a new shared memory block.
+
+        Returns:
+            Picklable layout for ``attach``: block name and per-array offset/dtype/shape
+        """
+        layout, offset = {}, 0
+        for key, array in self._arrays.items():
+            offset = (offset + 63) // 64 * 64
+            layout[key] = (offset, array.dtype.str, array.shape)
+            offset += array.nbytes
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for key, array in self._arrays.items():
+            start, dtype, shape = layout[key]
+            view = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=start)
+            view[...] = array
+        self._arrays.clear()
+        return {"name": self._shm.name, "arrays": layout}
+
+    @staticmethod
+    def attach(spec: Dict[str, Any]) -> Tuple[shared_memory.SharedMemory, Dict[str, np.ndarray]]:
+        """
+        Map a published block and return read-only views of its arrays.
+
+        The SharedMemory handle must stay referenced while the views are used.
+        """
+        shm = shared_memory.SharedMemory(name=spec["name"])
+        views = {}
+        for key, (start, dtype, shape) in spec["arrays"].items():
+            view = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start)
+            view.flags.writeable = False
+            views[key] = view
+        return shm, views
+
+    def close(self) -> None:
+        """Release and unlink the block."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+# Per-worker state, set by _init_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(spec: Dict[str, Any], context: Dict[str, Any]) -> None:
+    """Process pool initializer: map the shared block once per worker."""
+    logging.getLogger('vectorized-backtest').setLevel(logging.WARNING)
+    shm, views = SharedArrayStore.attach(spec)
+    _WORKER.update(shm=shm, views=views, **context)
+
+
+def _run_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one parameter set in a worker (or inline) against the mapped arrays."""
+    started = time.perf_counter()
+    row = {"run_id": task["run_id"], **task["params"]}
+    try:
+        data = _assemble_frames(_WORKER["views"], _WORKER["layout"], task["columns"])
+        backtester = VectorizedBacktester(
+            TradingStrategy(**task["strategy"]),
+            data,
+            _WORKER["pip_value"],
+            initial_balance=_WORKER["initial_balance"],
+            contract_size=_WORKER["contract_size"],
+        )
+        row.update(backtester.run().summary())
+        row["error"] = None
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    row["seconds"] = time.perf_counter() - started
+    return row
+
+
+def _assemble_frames(
+    views: Dict[str, np.ndarray],
+    layout: Dict[str, Dict[str, Any]],
+    columns: Dict[str, Dict[str, str]]
+) -> Dict[str, pd.DataFrame]:
+    """Build per-timeframe frames over the shared arrays (no values copied)."""
+    frames = {}
+    for tf, tf_layout in layout.items():
+        times = pd.DatetimeIndex(views[f"{tf}/time"].view("M8[ns]"))
+        if tf_layout["tz"]:
+            times = times.tz_localize("UTC").tz_convert(tf_layout["tz"])
+        frame_data: Dict[str, Any] = {"time": times}
+        for name in tf_layout["columns"]:
+            frame_data[name] = views[f"{tf}/{name}"]
+        frame_data.update(tf_layout["objects"])
+        for name, key in columns.get(tf, {}).items():
+            frame_data[name] = views[key]
+        frames[tf] = pd.DataFrame(frame_data, copy=False)
+    return frames
+
+
+class ParameterSweep:
+    """Runs a parameter space through VectorizedBacktester on a process pool"""
+
+    def __init__(
+        self,
+        strategy_config: Dict[str, Any],
+        data: Dict[str, pd.DataFrame],
+        space: ParameterSpace,
+        pip_value: float,
+        indicator_configs: Optional[Dict[str, dict]] = None,
+        workers: Optional[int] = None,
+        checkpoint_dir: Optional[str] = None,
+        checkpoint_every: int = 50,
+        initial_balance: float = 10000.0,
+        contract_size: float = 1.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            strategy_config: Strategy YAML as a dictionary
+            data: OHLC bars per timeframe; extra columns (e.g. regime) are passed through
+            space: Parameter sets to evaluate
+            pip_value: Pips-to-price divisor for SL/TP distances
+            indicator_configs: Indicator configuration per timeframe
+            workers: Process count (default: CPU count); 0 or 1 runs inline
+            checkpoint_dir: Folder for resumable result parts (default: no checkpoints)
+            checkpoint_every: Results per checkpoint part
+            initial_balance: Starting balance of every run
+            contract_size: Account currency per unit per price point
+            logger: Optional logger
+        """
+        self.strategy_config = strategy_config
+        self.data = data
+        self.space = space
+        self.pip_value = pip_value
+        self.indicator_configs = indicator_configs or {}
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.initial_balance = initial_balance
+        self.contract_size = contract_size
+        self.logger = logger or logging.getLogger('parameter-sweep')
+        self._part = 0
+        self._layout: Dict[str, Dict[str, Any]] = {}
+        self._run_ids: List[str] = []
+        self._known_outputs: Dict[Tuple[str, str, str], Dict[str, str]] = {}
+
+    @classmethod
+    def from_yaml(cls, strategy_path: str, data: Dict[str, pd.DataFrame], space: ParameterSpace, **kwargs) -> "ParameterSweep":
+        """Create a sweep from a strategy YAML file."""
+        with open(strategy_path, "r", encoding="utf-8") as f:
+            strategy_config = yaml.safe_load(f)
+        return cls(strategy_config, data, space, **kwargs)
+
+    def run(self) -> pd.DataFrame:
+        """
+        Evaluate every parameter set not already in the checkpoint.
+
+        Returns:
+            Results table with run_id, one column per parameter and the
+            backtest summary metrics, in parameter space order
+        """
+        done = self._load_checkpoint()
+        tasks, store = self._plan(done)
+        self.logger.info(
+            f"Sweep: {len(self.space)} parameter sets, {len(done)} from checkpoint, "
+            f"{len(tasks)} to run on {max(self.workers, 1)} worker(s)"
+        )
+
+        started = time.perf_counter()
+        rows: List[Dict[str, Any]] = []
+        pending: List[Dict[str, Any]] = []
+        try:
+            context = {
+                "layout": self._layout,
+                "pip_value": self.pip_value,
+                "initial_balance": self.initial_balance,
+                "contract_size": self.contract_size,
+            }
+            spec = store.publish()
+            for row in self._execute(tasks, spec, context):
+                rows.append(row)
+                pending.append(row)
+                if row["error"]:
+                    self.logger.warning(f"✗ {row['run_id']}: {row['error']}")
+                if len(pending) >= self.checkpoint_every:
+                    self._write_part(pending)
+                    pending = []
+        finally:
+            if pending:
+                self._write_part(pending)
+            store.close()
+
+        elapsed = time.perf_counter() - started
+        if tasks:
+            self.logger.info(f"✓ Sweep finished: {len(tasks)} runs in {elapsed:.1f}s ({len(tasks) / elapsed:.1f} runs/s)")
+
+        results = pd.DataFrame(list(done.values()) + rows)
+        if results.empty:
+            return results
+        order = {rid: position for position, rid in enumerate(self._run_ids)}
+        results = results[results["run_id"].isin(order)]
+        return results.sort_values("run_id", key=lambda ids: ids.map(order)).reset_index(drop=True)
+
+    def _execute(
+        self,
+        tasks: List[Dict[str, Any]],
+        spec: Dict[str, Any],
+        context: Dict[str, Any],
+        function: Callable[[Dict[str, Any]], Any] = _run_task
+    ) -> Iterator[Any]:
+        """Yield task results (of ``function`` applied to each task) as they complete."""
+        if not tasks:
+            return
+
+        # The first run happens in this process: it JIT-compiles the trade loop once,
+        # and forked workers inherit the compiled code instead of compiling it each
+        inline = tasks if self.workers <= 1 else tasks[:1]
+        _init_worker(spec, context)
+        try:
+            for task in inline:
+                yield function(task)
+        finally:
+            _WORKER.pop("shm").close()
+            _WORKER.clear()
+
+        remaining = tasks[len(inline):]
+        if not remaining:
+            return
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(spec, context)) as pool:
+            futures = [pool.submit(function, task) for task in remaining]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _plan(self, done: Dict[str, Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], SharedArrayStore]:
+        """Resolve parameter sets into tasks and fill the shared store."""
+        store = SharedArrayStore()
+        self._layout = {}
+        self._known_outputs = {}
+        for tf, frame in self.data.items():
+            frame = frame.reset_index(drop=True)
+            times = pd.DatetimeIndex(frame["time"])
+            store.add(f"{tf}/time", times.asi8)
+            numeric, objects = [], {}
+            for name in frame.columns:
+                if name == "time":
+                    continue
+                values = frame[name].to_numpy()
+                if np.issubdtype(values.dtype, np.number) or values.dtype == np.bool_:
+                    store.add(f"{tf}/{name}", values)
+                    numeric.append(name)
+                else:
+                    objects[name] = values
+            self._layout[tf] = {"columns": numeric, "objects": objects, "tz": str(times.tz) if times.tz else None}
+
+        tasks, computed = [], 0
+        self._run_ids = []
+        for params in self.space:
+            strategy_config, indicator_configs = apply_parameters(self.strategy_config, self.indicator_configs, params)
+            rid = run_id(self.strategy_config, self.indicator_configs, params)
+            self._run_ids.append(rid)
+            if rid in done:
+                continue
+
+            columns: Dict[str, Dict[str, str]] = {}
+            for tf, config in indicator_configs.items():
+                if tf not in self.data:
+                    continue
+                for name, indicator_params in (config or {}).items():
+                    outputs = self._indicator_columns(store, tf, name, indicator_params)
+                    computed += outputs is not None
+                    columns.setdefault(tf, {}).update(outputs or self._known_outputs[(tf, name, _freeze(indicator_params))])
+            tasks.append({"run_id": rid, "params": params, "strategy": strategy_config, "columns": columns})
+
+        if computed:
+            self.logger.info(f"Computed {computed} distinct indicator configurations once for {len(tasks)} runs")
+        return tasks, store
+
+    def _indicator_columns(self, store: SharedArrayStore, tf: str, name: str, params: dict) -> Optional[Dict[str, str]]:
+        """Compute one indicator once per distinct (timeframe, name, params); None if already stored."""
+        key = (tf, name, _freeze(params))
+        if key in self._known_outputs:
+            return None
+
+        base = self.data[tf].reset_index(drop=True)
+        computed = IndicatorManager(base[["time", *[c for c in BASE_COLUMNS if c in base.columns]]], {name: params}, is_bulk=True)
+        result = computed.get_historical_data()
+        digest = hashlib.sha1(key[2].encode("utf-8")).hexdigest()[:8]
+        outputs = {}
+        for column in result.columns:
+            if column == "time" or column in BASE_COLUMNS:
+                continue
+            store_key = f"{tf}/{column}@{name}:{digest}"
+            store.add(store_key, result[column].to_numpy(dtype=np.float64))
+            outputs[column] = store_key
+        self._known_outputs[key] = outputs
+        return outputs
+
+    def _load_checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        """Rows already computed, by run_id."""
+        if not self.checkpoint_dir or not self.checkpoint_dir.exists():
+            return {}
+        parts = sorted(self.checkpoint_dir.glob("part-*.parquet"))
+        self._part = len(parts)
+        if not parts:
+            return {}
+        table = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
+        table = table.drop_duplicates("run_id", keep="last")
+        return {row["run_id"]: row for row in table.to_dict("records")}
+
+    def _write_part(self, rows: List[Dict[str, Any]]) -> None:
+        """Write a checkpoint part atomically."""
+        if not self.checkpoint_dir:
+            return
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        target = self.checkpoint_dir / f"part-{self._part:05d}.parquet"
+        tmp_target = target.with_name(target.name + ".tmp")
+        pd.DataFrame(rows).to_parquet(tmp_target, index=False)
+        os.replace(tmp_target, target)
+        self._part += 1
+        self.logger.debug(f"Checkpoint {target.name}: {len(rows)} results")
+
+
+def _freeze(params: Any) -> str:
+    """Canonical string of indicator parameters."""
+    return json.dumps(params or {}, sort_keys=True, default=str)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m app.backtest.sweep strategy.yaml ./data --symbol xauusd --config ./config \\
+            --space space.yaml --pip-value 100 --workers 4 --checkpoint ./sweeps/run1 --output results.parquet
+    """
+    from app.data.backtest_data import BacktestDataSource
+    from app.utils.multi_symbol_loader import load_indicators_for_symbol
+
+    parser = argparse.ArgumentParser(description="Parallel parameter sweep of a strategy YAML")
+    parser.add_argument("strategy")
+    parser.add_argument("data_path", help="Folder with {symbol}_{tf}.parquet files")
+    parser.add_argument("--symbol", required=True)
+    parser.add_argument("--config", help="Configuration folder with indicators/<symbol>/")
+    parser.add_argument("--space", required=True, help="YAML with a grid or random section")
+    parser.add_argument("--pip-value", type=float, required=True)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--checkpoint")
+    parser.add_argument("--checkpoint-every", type=int, default=50)
+    parser.add_argument("--balance", type=float, default=10000.0)
+    parser.add_argument("--output", help="Write the results table to this parquet file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger('parameter-sweep')
+
+    with open(args.space, "r", encoding="utf-8") as f:
+        space = ParameterSpace.from_dict(yaml.safe_load(f))
+    with open(args.strategy, "r", encoding="utf-8") as f:
+        strategy_config = yaml.safe_load(f)
+
+    timeframes = [str(tf) for tf in strategy_config["timeframes"]]
+    source = BacktestDataSource(args.data_path, args.symbol)
+    source.load_data(timeframes)
+    data = {tf: source.get_historical_data(args.symbol, tf) for tf in timeframes}
+    indicator_configs = load_indicators_for_symbol(args.config, args.symbol, logger) if args.config else {}
+    indicator_configs = {tf: config for tf, config in indicator_configs.items() if tf in timeframes}
+
+    sweep = ParameterSweep(
+        strategy_config, data, space, args.pip_value,
+        indicator_configs=indicator_configs,
+        workers=args.workers,
+        checkpoint_dir=args.checkpoint,
+        checkpoint_every=args.checkpoint_every,
+        initial_balance=args.balance,
+        logger=logger,
+    )
+    results = sweep.run()
+    if args.output:
+        results.to_parquet(args.output, index=False)
+    if not results.empty:
+        print(results.sort_values("net_profit", ascending=False).head(20).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
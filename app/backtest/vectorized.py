@@ -0,0 +1,1150 @@
+"""
+Vectorized backtester for YAML strategies.
+
+The event-driven backtest streams bars one at a time through
+IndicatorProcessor, StrategyEngine.evaluate and ConditionEvaluator. This module
+runs the same TradingStrategy over the whole history in a few array passes:
+
+1. Indicators are computed once per timeframe with the numba ``batch_update``
+   kernels (IndicatorManager in bulk mode) and ``previous_*`` columns are added
+   with a shift, as RecentRowsProcessor does bar by bar.
+2. Every timeframe is aligned to the base (smallest) timeframe by last-closed
+   bar: at each base bar, a higher timeframe contributes the last bar whose
+   close time (open time + timeframe length) is not after the base bar's close.
+3. Entry and exit rules (all / any / complex trees) are compiled into boolean
+   NumPy arrays, one element per base bar. Numeric comparisons, crosses,
+   changes_to and remains are plain array expressions; anything else (string
+   regimes, booleans, mixed types) is evaluated by the real ConditionEvaluator
+   once per distinct input combination and broadcast back, so the semantics
+   match the event-driven path exactly. Lookback references (``close[-3]``,
+   ``max(high[-1], 20)``) are columns shifted or rolled over the rows of
+   their own timeframe, and rising/falling compare consecutive shifts; a
+   condition is False where its timeframe has too few rows, as with a short
+   recent rows buffer.
+4. Trades are simulated in a numba loop using the strategy's position sizing,
+   stop loss and take profit models.
+
+Simulation model:
+- Signals are evaluated at bar close and filled at the base timeframe close
+- Exits are processed before entries on the same bar, as EntryManager does
+- At most one open position per direction
+- Stops and targets are checked from the next bar on, against the bar's
+  open/high/low; when a bar touches both, the stop wins
+- Trailing stops ratchet on bar closes
+- Time-based exits (``max_duration``) use bar time instead of wall-clock time
+- Limit entries (``atr_distance``), profit guards, indicator take profits and
+  activation schedules are not modelled
+
+Columns that are not indicator outputs (e.g. ``regime``) must already be in
+the input frames; missing columns make their conditions False, as in the
+event-driven path.
+
+Example:
+    ```python
+    backtester = VectorizedBacktester(
+        strategy,
+        data={"1": m1_bars, "15": m15_bars},
+        pip_value=100.0,
+        indicator_configs={"1": {"ema_20": {"period": 20}}},
+    )
+    result = backtester.run()
+    print(f"{result.net_profit:.2f} over {len(result.trades)} fills "
+          f"at {result.bars_per_second:,.0f} bars/s")
+
+    assert backtester.check_parity(max_bars=500).ok
+    ```
+
+Command line:
+
+    python -m app.backtest.vectorized ./data --config ./config --symbol xauusd --pip-value 100
+"""
+
+import argparse
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from app.data.bar_cache import timeframe_delta
+from app.indicators.indicator_manager import IndicatorManager
+from app.strategy_builder.core.domain.enums import (
+    ConditionOperatorEnum,
+    LogicModeEnum,
+    PositionSizingTypeEnum,
+)
+from app.strategy_builder.core.domain.models import (
+    Condition,
+    ConditionTree,
+    EntryRules,
+    SeriesReference,
+    TradingStrategy,
+    parse_series_reference,
+)
+from app.strategy_builder.core.evaluators.compiler import lookback_depths
+from app.strategy_builder.core.evaluators.condition import ConditionEvaluator
+from app.strategy_builder.core.evaluators.lookback import PREVIOUS_OPERATORS, TREND_OPERATORS, uses_lookback
+from app.strategy_builder.core.evaluators.factory import DefaultEvaluatorFactory
+from app.strategy_builder.core.services.executor import create_strategy_executor
+from app.strategy_builder.infrastructure.logging import create_null_logger
+
+
+PREVIOUS_PREFIX = "previous_"
+
+SIGNAL_NAMES = ("entry_long", "entry_short", "exit_long", "exit_short")
+
+# Position sizing modes
+SIZING_FIXED = 0
+SIZING_PERCENTAGE = 1
+SIZING_VOLATILITY = 2
+
+# Stop loss modes
+SL_DISTANCE = 0
+SL_INDICATOR = 1
+SL_MONETARY = 2
+
+# Exit reasons recorded per fill
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+EXIT_SIGNAL = 3
+EXIT_TIME = 4
+EXIT_END_OF_DATA = 5
+
+EXIT_REASONS = {
+    EXIT_STOP_LOSS: "stop_loss",
+    EXIT_TAKE_PROFIT: "take_profit",
+    EXIT_SIGNAL: "signal",
+    EXIT_TIME: "time",
+    EXIT_END_OF_DATA: "end_of_data",
+}
+
+_NUMERIC_OPERATORS = {
+    ConditionOperatorEnum.EQ: np.equal,
+    ConditionOperatorEnum.NE: np.not_equal,
+    ConditionOperatorEnum.LT: np.less,
+    ConditionOperatorEnum.LTE: np.less_equal,
+    ConditionOperatorEnum.GT: np.greater,
+    ConditionOperatorEnum.GTE: np.greater_equal,
+}
+
+_DURATION_UNITS = {"m": "min", "h": "h", "d": "D", "w": "W"}
+
+
+@dataclass
+class VectorizedBacktestResult:
+    """
+    Result of a vectorized backtest.
+
+    Attributes:
+        strategy_name: Name of the simulated strategy
+        trades: One row per fill (partial take profits produce several rows per position)
+        equity: Balance plus open profit at each base bar close, indexed by bar time
+        initial_balance: Starting balance
+        bars: Base timeframe bars simulated
+        timings: Seconds spent per stage (indicators, compile, simulate)
+    """
+    strategy_name: str
+    trades: pd.DataFrame
+    equity: pd.Series
+    initial_balance: float
+    bars: int
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def net_profit(self) -> float:
+        """Realized profit over the whole run."""
+        return float(self.trades["pnl"].sum()) if len(self.trades) else 0.0
+
+    @property
+    def final_balance(self) -> float:
+        """Balance after the last fill."""
+        return self.initial_balance + self.net_profit
+
+    @property
+    def bars_per_second(self) -> float:
+        """Throughput of rule compilation plus simulation (indicators excluded)."""
+        elapsed = self.timings.get("compile", 0.0) + self.timings.get("simulate", 0.0)
+        return self.bars / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Share of fills closed in profit."""
+        return float((self.trades["pnl"] > 0).mean()) if len(self.trades) else 0.0
+
+    @property
+    def max_drawdown(self) -> float:
+        """Largest peak-to-trough fall of the equity curve, in account currency."""
+        if self.equity.empty:
+            return 0.0
+        values = self.equity.to_numpy()
+        peaks = np.maximum.accumulate(np.r_[self.initial_balance, values])[1:]
+        return float((peaks - values).max())
+
+    def summary(self) -> Dict[str, float]:
+        """Headline metrics as a flat dictionary."""
+        return {
+            "net_profit": self.net_profit,
+            "final_balance": self.final_balance,
+            "fills": len(self.trades),
+            "win_rate": self.win_rate,
+            "max_drawdown": self.max_drawdown,
+            "bars": self.bars,
+        }
+
+
+@dataclass
+class ParityMismatch:
+    """A bar where the vectorized and event-driven signals disagree."""
+    time: pd.Timestamp
+    signal: str
+    vectorized: bool
+    event_driven: bool
+
+
+@dataclass
+class ParityReport:
+    """
+    Comparison of vectorized signals with the event-driven evaluation.
+
+    Attributes:
+        bars_checked: Base bars evaluated through StrategyExecutor
+        mismatches: Every disagreeing (bar, signal) pair
+    """
+    bars_checked: int
+    mismatches: List[ParityMismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True when every checked signal matched."""
+        return not self.mismatches
+
+
+class VectorizedBacktester:
+    """Runs one TradingStrategy over whole histories with array operations"""
+
+    def __init__(
+        self,
+        strategy: TradingStrategy,
+        data: Dict[str, pd.DataFrame],
+        pip_value: float,
+        indicator_configs: Optional[Dict[str, dict]] = None,
+        initial_balance: float = 10000.0,
+        contract_size: float = 1.0,
+        volatility_column: str = "ATR",
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Prepare indicators and the timeframe alignment.
+
+        Args:
+            strategy: Strategy to simulate
+            data: OHLC bars per timeframe (``time`` is the bar open time)
+            pip_value: Pips-to-price divisor, as given to EntryManager
+            indicator_configs: Indicator configuration per timeframe (same format
+                as the indicator YAML files); timeframes without one keep their columns
+            initial_balance: Starting balance for percentage/volatility sizing
+            contract_size: Account currency per unit per price point, used for P&L
+            volatility_column: Base timeframe column used by volatility sizing
+            logger: Optional logger
+
+        Raises:
+            ValueError: If pip_value is not positive or the base timeframe has no data
+        """
+        if pip_value <= 0:
+            raise ValueError("pip_value must be positive")
+
+        self.strategy = strategy
+        self.pip_value = pip_value
+        self.initial_balance = initial_balance
+        self.contract_size = contract_size
+        self.volatility_column = volatility_column
+        self.logger = logger or logging.getLogger('vectorized-backtest')
+
+        timeframes = [_tf_key(tf) for tf in strategy.timeframes]
+        self.base_timeframe = min(timeframes, key=timeframe_delta)
+        if self.base_timeframe not in data or data[self.base_timeframe].empty:
+            raise ValueError(f"No data for base timeframe {self.base_timeframe}")
+
+        started = time.perf_counter()
+        indicator_configs = indicator_configs or {}
+        self.frames: Dict[str, pd.DataFrame] = {}
+        for tf in timeframes:
+            if tf not in data or data[tf].empty:
+                self.logger.warning(f"No data for timeframe {tf}; its conditions will be False")
+                continue
+            self.frames[tf] = _prepare_frame(data[tf], indicator_configs.get(tf))
+        self.timings: Dict[str, float] = {"indicators": time.perf_counter() - started}
+
+        base = self.frames[self.base_timeframe]
+        self.times = pd.DatetimeIndex(base["time"])
+        self.bars = len(base)
+        base_close = _close_ns(base, self.base_timeframe)
+
+        # Row of each timeframe visible at every base bar (-1 before its first close)
+        self._rows: Dict[str, np.ndarray] = {}
+        for tf, frame in self.frames.items():
+            if tf == self.base_timeframe:
+                self._rows[tf] = np.arange(self.bars, dtype=np.int64)
+            else:
+                close_ns = _close_ns(frame, tf)
+                self._rows[tf] = np.searchsorted(close_ns, base_close, side="right").astype(np.int64) - 1
+
+        self._columns: Dict[Tuple[str, str], np.ndarray] = {}
+        self._references: Dict[Tuple[str, SeriesReference, int], Tuple[Optional[np.ndarray], np.ndarray]] = {}
+        self._signals: Optional[Dict[str, np.ndarray]] = None
+        self._null_logger = create_null_logger()
+
+    # ------------------------------------------------------------------
+    # Rule compilation
+    # ------------------------------------------------------------------
+
+    def signals(self) -> Dict[str, np.ndarray]:
+        """
+        Compile the strategy rules into boolean arrays over the base timeframe.
+
+        Exit arrays hold the condition part only; time-based exits depend on
+        open positions and are applied during simulation.
+
+        Returns:
+            Dictionary with entry_long, entry_short, exit_long and exit_short arrays
+        """
+        if self._signals is not None:
+            return self._signals
+
+        started = time.perf_counter()
+        entry = self.strategy.entry
+        exit_rules = self.strategy.exit
+        active = not self.strategy.activation or self.strategy.activation.enabled
+
+        signals = {
+            "entry_long": self.compile_rules(entry.long) if entry and entry.long else self._false(),
+            "entry_short": self.compile_rules(entry.short) if entry and entry.short else self._false(),
+            "exit_long": self.compile_rules(exit_rules.long) if exit_rules and exit_rules.long else self._false(),
+            "exit_short": self.compile_rules(exit_rules.short) if exit_rules and exit_rules.short else self._false(),
+        }
+        if not active:
+            signals = {name: self._false() for name in signals}
+
+        self._signals = signals
+        self.timings["compile"] = time.perf_counter() - started
+        return signals
+
+    def compile_rules(self, rules: EntryRules) -> np.ndarray:
+        """
+        Compile an entry or exit rule set (condition part) into a boolean array.
+
+        Args:
+            rules: EntryRules or ExitRules
+
+        Returns:
+            Boolean array, True where the rules are met
+        """
+        if rules.mode == LogicModeEnum.COMPLEX:
+            return self._compile_tree(rules.tree) if rules.tree else self._false()
+
+        if not rules.conditions:
+            return self._false()
+
+        result = self.compile_condition(rules.conditions[0])
+        for condition in rules.conditions[1:]:
+            if rules.mode == LogicModeEnum.ALL:
+                result = result & self.compile_condition(condition)
+            else:
+                result = result | self.compile_condition(condition)
+        return result
+
+    def compile_condition(self, condition: Condition) -> np.ndarray:
+        """
+        Compile a single condition into a boolean array.
+
+        Args:
+            condition: Condition to compile
+
+        Returns:
+            Boolean array, True where the condition holds
+        """
+        tf = _tf_key(condition.timeframe)
+        if tf not in self.frames:
+            return self._false()
+
+        signal = self._column(tf, condition.signal)
+        if signal is None:
+            return self._false()
+
+        if condition.operator in TREND_OPERATORS:
+            result = self._compile_trend(tf, condition)
+        else:
+            result = self._compile_numeric(tf, condition, signal)
+            if result is None:
+                result = self._compile_by_value(tf, condition)
+            if uses_lookback(condition):
+                result = result & self._lookback_available(tf, condition)
+
+        return result & (self._rows[tf] >= 0)
+
+    def _compile_tree(self, tree: ConditionTree) -> np.ndarray:
+        """Compile a condition tree recursively."""
+        parts = [
+            self.compile_condition(node) if isinstance(node, Condition) else self._compile_tree(node)
+            for node in tree.conditions
+        ]
+        if tree.operator == "not":
+            return ~parts[0]
+
+        result = parts[0]
+        for part in parts[1:]:
+            result = result & part if tree.operator == "and" else result | part
+        return result
+
+    def _compile_numeric(self, tf: str, condition: Condition, signal: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Array expression for numeric signals against numeric targets.
+
+        Mirrors ConditionEvaluator's casting: plain comparisons cast the target
+        to the signal's type (so integer signals truncate the target), crosses
+        compare as floats, changes_to/remains compare without casting.
+
+        Returns:
+            Boolean array, or None when the condition needs the generic path
+        """
+        if not _is_numeric(signal):
+            return None
+
+        operator = condition.operator
+        value = condition.value
+        integer_signal = np.issubdtype(signal.dtype, np.integer)
+        frame = self.frames[tf]
+
+        if operator in (ConditionOperatorEnum.IN, ConditionOperatorEnum.NOT_IN):
+            if not all(_is_number(v) for v in value):
+                return None
+            members = np.asarray(value, dtype=np.float64)
+            if integer_signal:
+                members = np.trunc(members)
+            hit = np.isin(signal, members)
+            return hit if operator == ConditionOperatorEnum.IN else ~hit
+
+        if isinstance(value, str) and (value in frame.columns or parse_series_reference(value) is not None):
+            target = self._column(tf, value)
+            if target is None:
+                return self._false()
+            if not _is_numeric(target):
+                return None
+            prev_target = self._column(tf, f"{PREVIOUS_PREFIX}{value}")
+        elif _is_number(value):
+            target = prev_target = np.float64(value)
+        else:
+            return None
+
+        if operator in (ConditionOperatorEnum.CROSSES_ABOVE, ConditionOperatorEnum.CROSSES_BELOW):
+            previous = self._column(tf, f"{PREVIOUS_PREFIX}{condition.signal}")
+            if previous is None or prev_target is None or not _is_numeric(previous) or not _is_numeric(prev_target):
+                return self._false()
+            with np.errstate(invalid="ignore"):
+                if operator == ConditionOperatorEnum.CROSSES_ABOVE:
+                    return (previous <= prev_target) & (signal > target)
+                return (previous >= prev_target) & (signal < target)
+
+        if operator in (ConditionOperatorEnum.CHANGES_TO, ConditionOperatorEnum.REMAINS):
+            previous = self._column(tf, f"{PREVIOUS_PREFIX}{condition.signal}")
+            if previous is None:
+                return self._false()
+            if not _is_numeric(previous):
+                return None
+            with np.errstate(invalid="ignore"):
+                if operator == ConditionOperatorEnum.CHANGES_TO:
+                    return (signal == target) & (previous != target)
+                return (signal == target) & (previous == target)
+
+        compare = _NUMERIC_OPERATORS.get(operator)
+        if compare is None:
+            return None
+        if integer_signal:
+            # np.int64(target) truncates; NaN targets fall back to a float comparison
+            target = np.where(np.isnan(target), target, np.trunc(target))
+        with np.errstate(invalid="ignore"):
+            return compare(signal, target)
+
+    def _compile_by_value(self, tf: str, condition: Condition) -> np.ndarray:
+        """
+        Evaluate a condition with ConditionEvaluator once per distinct input combination.
+
+        Used for strings, booleans and mixed types, whose columns have few
+        distinct values (regimes, flags), so the cost is a factorize per column.
+        """
+        lookback = uses_lookback(condition)
+        names = [condition.signal, f"{PREVIOUS_PREFIX}{condition.signal}"]
+        if isinstance(condition.value, str):
+            names += [condition.value, f"{PREVIOUS_PREFIX}{condition.value}"]
+
+        columns = [(name, self._column(tf, name)) for name in dict.fromkeys(names)]
+        columns = [(name, values) for name, values in columns if values is not None]
+
+        codes, uniques = [], []
+        for _, values in columns:
+            column_codes, column_uniques = pd.factorize(values, use_na_sentinel=False)
+            codes.append(column_codes.astype(np.int64))
+            uniques.append(column_uniques)
+
+        if np.prod([float(max(len(u), 1)) for u in uniques]) < 2.0 ** 62:
+            key = np.zeros(self.bars, dtype=np.int64)
+            for column_codes, column_uniques in zip(codes, uniques):
+                key = key * max(len(column_uniques), 1) + column_codes
+            _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        else:
+            _, first, inverse = np.unique(np.stack(codes, axis=1), axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        outcomes = np.zeros(len(first), dtype=bool)
+        for position, row_index in enumerate(first):
+            row = pd.Series(
+                {name: values[row_index] for name, values in columns},
+                dtype=object,
+            )
+            evaluator = ConditionEvaluator({tf: deque([row])}, self._null_logger)
+            try:
+                if lookback:
+                    # The row holds the resolved references under their own names
+                    outcomes[position] = bool(evaluator.evaluate_row(condition, row))
+                else:
+                    outcomes[position] = bool(evaluator.evaluate(condition))
+            except (ValueError, TypeError, KeyError):
+                outcomes[position] = False
+
+        return outcomes[inverse]
+
+    def _compile_trend(self, tf: str, condition: Condition) -> np.ndarray:
+        """
+        Array expression for rising/falling: a strict move on each of the last ``value`` bars.
+
+        Returns:
+            Boolean array, False where a value is missing or not a number
+        """
+        reference = parse_series_reference(condition.signal) or SeriesReference(condition.signal)
+        series = [self._series(tf, reference, shift) for shift in range(int(condition.value) + 1)]
+        if any(values is None or not _is_numeric(values) for values, _ in series):
+            return self._false()
+
+        compare = np.greater if condition.operator == ConditionOperatorEnum.RISING else np.less
+        result = np.ones(self.bars, dtype=bool)
+        for (newer, available), (older, _) in zip(series, series[1:]):
+            with np.errstate(invalid="ignore"):
+                result &= available & compare(newer, older)
+        return result & series[-1][1]
+
+    def _lookback_available(self, tf: str, condition: Condition) -> np.ndarray:
+        """
+        Bars where every reference of a lookback condition can be resolved.
+
+        Mirrors LookbackTest, which is False when its timeframe has too few
+        rows for a reference or an aggregate window holds a non-number.
+        """
+        references = [parse_series_reference(condition.signal) or SeriesReference(condition.signal)]
+        value = condition.value
+        if isinstance(value, str):
+            target = parse_series_reference(value)
+            if target is None and value in self.frames[tf].columns:
+                target = SeriesReference(value)
+            if target is not None:
+                references.append(target)
+
+        shifts = (0, 1) if condition.operator in PREVIOUS_OPERATORS else (0,)
+        result = np.ones(self.bars, dtype=bool)
+        for reference in references:
+            for shift in shifts:
+                values, available = self._series(tf, reference, shift)
+                if values is None:
+                    return self._false()
+                result &= available
+        return result
+
+    def _series(self, tf: str, reference: SeriesReference, shift: int = 0) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        """
+        Values of a reference ``shift`` bars back, aligned to the base bars.
+
+        Offsets index the rows of the reference's own timeframe, so ``close[-1]``
+        on H1 is the H1 bar before the last closed one at every base bar.
+
+        Returns:
+            (values, available): values is None when the column does not exist;
+            available is False where the timeframe has too few rows or an
+            aggregate window holds a non-number
+        """
+        key = (tf, reference, shift)
+        if key not in self._references:
+            frame = self.frames[tf]
+            if reference.column not in frame.columns:
+                self._references[key] = (None, self._false())
+                return self._references[key]
+
+            column = frame[reference.column].to_numpy()
+            positions = np.arange(len(frame)) - (reference.offset + shift)
+            if reference.function is None:
+                values = column[np.maximum(positions, 0)]
+                available = positions >= 0
+            else:
+                numbers = column.astype(np.float64) if _is_numeric(column) else np.full(len(frame), np.nan)
+                window = pd.Series(numbers).shift(reference.offset + shift).rolling(reference.window)
+                aggregated = (window.max() if reference.function == "max" else window.min()).to_numpy()
+                available = ~np.isnan(aggregated)
+                values = aggregated
+                if np.issubdtype(column.dtype, np.integer):
+                    # max()/min() of ints stays an int in the event-driven path
+                    values = np.where(available, aggregated, 0).astype(column.dtype)
+
+            aligned = np.maximum(self._rows[tf], 0)
+            self._references[key] = (values[aligned], available[aligned])
+        return self._references[key]
+
+    def _column(self, tf: str, name: str) -> Optional[np.ndarray]:
+        """
+        Column of a timeframe aligned to the base bars (None if the column does not exist).
+
+        Lookback references (``close[-3]``, ``max(high, 20)``) and their
+        ``previous_`` names resolve through _series.
+        """
+        key = (tf, name)
+        if key not in self._columns:
+            frame = self.frames[tf]
+            if name in frame.columns:
+                values = frame[name].to_numpy()
+                self._columns[key] = values[np.maximum(self._rows[tf], 0)]
+            else:
+                shift = 1 if name.startswith(PREVIOUS_PREFIX) else 0
+                reference = parse_series_reference(name[len(PREVIOUS_PREFIX):] if shift else name)
+                if reference is None:
+                    return None
+                self._columns[key] = self._series(tf, reference, shift)[0]
+        return self._columns[key]
+
+    def _false(self) -> np.ndarray:
+        return np.zeros(self.bars, dtype=bool)
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        initial_balance: Optional[float] = None
+    ) -> VectorizedBacktestResult:
+        """
+        Simulate the strategy over the base timeframe, or a window of it.
+
+        Signals are compiled once over all bars, so a window sees the same
+        indicator values and previous-bar columns as a full run; only the
+        trade loop is restricted. Positions still open at the window end are
+        closed there.
+
+        Args:
+            start: First bar time simulated (default: first bar)
+            end: Bars at or after this time are excluded (default: run to the last bar)
+            initial_balance: Starting balance of this run (default: the backtester's)
+
+        Returns:
+            VectorizedBacktestResult with fills and the equity curve
+        """
+        signals = self.signals()
+        started = time.perf_counter()
+        balance = self.initial_balance if initial_balance is None else initial_balance
+        lo = 0 if start is None else int(self.times.searchsorted(pd.Timestamp(start), side="left"))
+        hi = self.bars if end is None else int(self.times.searchsorted(pd.Timestamp(end), side="left"))
+        hi = max(hi, lo)
+        window = slice(lo, hi)
+
+        base = self.frames[self.base_timeframe]
+        prices = [base[c].to_numpy(dtype=np.float64) for c in ("open", "high", "low", "close")]
+        close = prices[3]
+        time_ns = self.times.asi8
+
+        exit_and_time, max_duration = self._time_exit_parameters()
+        sizing_mode, sizing_value, volatility = self._sizing_parameters()
+        sl_mode, sl_value, sl_long, sl_short, trail = self._stop_loss_parameters(close)
+        tp_absolute, tp_percent, tp_fraction, tp_move_stop = self._take_profit_parameters()
+
+        signals = {name: values[window] for name, values in signals.items()}
+        max_fills = int(signals["entry_long"].sum() + signals["entry_short"].sum()) * (len(tp_fraction) + 1) + 2
+
+        equity, fills, count = _simulate(
+            prices[0][window], prices[1][window], prices[2][window], close[window], time_ns[window],
+            signals["entry_long"], signals["entry_short"], signals["exit_long"], signals["exit_short"],
+            exit_and_time, max_duration,
+            sizing_mode, sizing_value, volatility[window],
+            sl_mode, sl_value, sl_long[window], sl_short[window], trail,
+            tp_absolute, tp_percent, tp_fraction, tp_move_stop,
+            float(self.contract_size), float(balance), max_fills,
+        )
+        self.timings["simulate"] = time.perf_counter() - started
+
+        trades = self._trades_frame(fills, count, offset=lo)
+        result = VectorizedBacktestResult(
+            strategy_name=self.strategy.name,
+            trades=trades,
+            equity=pd.Series(equity, index=self.times[window], name="equity"),
+            initial_balance=balance,
+            bars=hi - lo,
+            timings=dict(self.timings),
+        )
+        self.logger.info(
+            f"✓ {self.strategy.name}: {result.bars} bars, {len(trades)} fills, "
+            f"net {result.net_profit:.2f} ({result.bars_per_second:,.0f} bars/s)"
+        )
+        return result
+
+    def _time_exit_parameters(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per direction: whether time and conditions must both hold, and max duration in ns."""
+        exit_and_time = np.zeros(2, dtype=np.bool_)
+        max_duration = np.zeros(2, dtype=np.int64)
+        exit_rules = self.strategy.exit
+        for direction, rules in enumerate((exit_rules.long, exit_rules.short) if exit_rules else ()):
+            if rules is None:
+                continue
+            # Same combination as LogicEvaluator.evaluate_exit_rules
+            exit_and_time[direction] = rules.mode == LogicModeEnum.ALL and bool(rules.time_based or rules.profit_guard)
+            if rules.time_based and rules.time_based.max_duration:
+                max_duration[direction] = _parse_duration(rules.time_based.max_duration).value
+        return exit_and_time, max_duration
+
+    def _sizing_parameters(self) -> Tuple[int, float, np.ndarray]:
+        """Sizing mode, configured value and the volatility array."""
+        sizing = self.strategy.risk.position_sizing
+        if sizing is None:
+            raise ValueError("Strategy must have position sizing configuration")
+
+        volatility = np.full(self.bars, np.nan)
+        if sizing.type == PositionSizingTypeEnum.FIXED:
+            return SIZING_FIXED, float(sizing.value), volatility
+        if sizing.type == PositionSizingTypeEnum.PERCENTAGE:
+            return SIZING_PERCENTAGE, float(sizing.value), volatility
+
+        column = self._column(self.base_timeframe, self.volatility_column)
+        if column is None:
+            raise ValueError(f"Volatility sizing needs a '{self.volatility_column}' column on the base timeframe")
+        return SIZING_VOLATILITY, float(sizing.value), column.astype(np.float64)
+
+    def _stop_loss_parameters(self, close: np.ndarray):
+        """Stop loss mode, value, per-bar indicator levels and trailing distance."""
+        sl = self.strategy.risk.sl
+        levels = np.full(self.bars, np.nan)
+        trail = 0.0
+
+        if sl.type == "monetary":
+            return SL_MONETARY, float(sl.value), levels, levels, trail
+
+        if sl.type == "trailing":
+            initial = sl.activation_price if sl.activation_price else sl.step
+            return SL_DISTANCE, self._pips(initial), levels, levels, self._pips(sl.step)
+
+        if sl.trailing and sl.trailing.enabled:
+            trail = self._pips(sl.trailing.step)
+
+        if sl.type == "fixed":
+            return SL_DISTANCE, self._pips(sl.value), levels, levels, trail
+
+        # Indicator stop: source level -/+ offset, kept at least one pip beyond the entry
+        tf = _tf_key(sl.timeframe)
+        source = self._column(tf, sl.source) if tf in self.frames else None
+        if source is None:
+            raise ValueError(f"Indicator stop loss source '{sl.source}' not found on timeframe {tf}")
+        source = np.where(self._rows[tf] >= 0, source.astype(np.float64), np.nan)
+        offset = np.abs(source * sl.offset) if abs(sl.offset) < 0.01 else abs(sl.offset)
+        pip = 1.0 / self.pip_value
+        long_levels = source - offset
+        short_levels = source + offset
+        long_levels = np.where(long_levels >= close, close - pip, long_levels)
+        short_levels = np.where(short_levels <= close, close + pip, short_levels)
+        return SL_INDICATOR, 0.0, long_levels, short_levels, trail
+
+    def _take_profit_parameters(self):
+        """Per target: absolute distance, percent-of-price distance, size fraction, move-stop flag."""
+        tp = self.strategy.risk.tp
+        if tp.type == "fixed":
+            return (
+                np.array([tp.value / self.pip_value]), np.zeros(1),
+                np.ones(1), np.zeros(1, dtype=np.bool_),
+            )
+        if tp.type == "multi_target":
+            targets = tp.targets
+            return (
+                np.zeros(len(targets)),
+                np.array([t.value for t in targets], dtype=np.float64),
+                np.array([t.percent / 100.0 for t in targets], dtype=np.float64),
+                np.array([t.move_stop for t in targets], dtype=np.bool_),
+            )
+        # EntryManager has no calculator for indicator take profits either
+        raise ValueError(f"Unsupported take profit type: {tp.type}")
+
+    def _pips(self, value: float) -> float:
+        """Convert a configured distance to price, as the fixed/trailing calculators do."""
+        return value / self.pip_value if value >= 10 else value
+
+    def _trades_frame(self, fills: np.ndarray, count: int, offset: int = 0) -> pd.DataFrame:
+        """Turn the fill records of the numba loop into a DataFrame (bar indices relative to offset)."""
+        fills = fills[:count]
+        entry_index = fills[:, 0].astype(np.int64) + offset
+        exit_index = fills[:, 1].astype(np.int64) + offset
+        return pd.DataFrame({
+            "entry_time": self.times[entry_index],
+            "exit_time": self.times[exit_index],
+            "direction": np.where(fills[:, 2] > 0, "long", "short"),
+            "entry_price": fills[:, 3],
+            "exit_price": fills[:, 4],
+            "units": fills[:, 5],
+            "pnl": fills[:, 6],
+            "reason": [EXIT_REASONS[int(code)] for code in fills[:, 7]],
+        })
+
+    # ------------------------------------------------------------------
+    # Parity with the event-driven path
+    # ------------------------------------------------------------------
+
+    def check_parity(
+        self,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        max_bars: int = 500
+    ) -> ParityReport:
+        """
+        Re-evaluate a window bar by bar through StrategyExecutor and compare signals.
+
+        Each base bar gets the recent_rows the event-driven path would hold
+        (the last closed rows of every timeframe, with their ``previous_*``
+        columns, as many as the strategy's lookback_depths() needs) and runs
+        check_entry/check_exit. Exits are compared without an open position,
+        as the engine evaluates them.
+
+        Args:
+            start: First bar time to check (default: first bar)
+            end: Last bar time to check (default: last bar)
+            max_bars: Upper bound on bars checked; the window is sampled evenly beyond it
+
+        Returns:
+            ParityReport listing every mismatch
+        """
+        signals = self.signals()
+        lo = 0 if start is None else int(self.times.searchsorted(pd.Timestamp(start)))
+        hi = self.bars if end is None else int(self.times.searchsorted(pd.Timestamp(end), side="right"))
+        positions = np.arange(lo, hi)
+        if len(positions) > max_bars:
+            positions = np.unique(np.linspace(lo, hi - 1, max_bars).astype(np.int64))
+
+        exit_gated = self._time_exit_parameters()[0]
+        factory = DefaultEvaluatorFactory(self._null_logger)
+        report = ParityReport(bars_checked=len(positions))
+        depths = lookback_depths([self.strategy])
+
+        for i in positions:
+            recent_rows = {}
+            for tf, frame in self.frames.items():
+                row = self._rows[tf][i]
+                if row >= 0:
+                    first = max(row - depths.get(tf, 1) + 1, 0)
+                    recent_rows[tf] = deque(frame.iloc[index] for index in range(first, row + 1))
+            executor = create_strategy_executor(self.strategy, recent_rows, factory)
+            entry = executor.check_entry()
+            exits = executor.check_exit()
+            expected = {
+                "entry_long": bool(entry.long),
+                "entry_short": bool(entry.short),
+                "exit_long": bool(exits.long),
+                "exit_short": bool(exits.short),
+            }
+            if self.strategy.activation and not self.strategy.activation.enabled:
+                expected = {name: False for name in expected}
+
+            for name in SIGNAL_NAMES:
+                actual = bool(signals[name][i])
+                if name == "exit_long" and exit_gated[0] or name == "exit_short" and exit_gated[1]:
+                    # Without a position, time-gated exits never fire in the event-driven path
+                    actual = False
+                if actual != expected[name]:
+                    report.mismatches.append(ParityMismatch(self.times[i], name, actual, expected[name]))
+
+        if report.ok:
+            self.logger.info(f"✓ Parity check passed on {report.bars_checked} bars")
+        else:
+            self.logger.warning(f"✗ Parity check: {len(report.mismatches)} mismatches on {report.bars_checked} bars")
+        return report
+
+
+def _tf_key(timeframe) -> str:
+    """Timeframe enum or string as the plain string key used for frames."""
+    return getattr(timeframe, "value", timeframe)
+
+
+def _prepare_frame(bars: pd.DataFrame, indicator_config: Optional[dict]) -> pd.DataFrame:
+    """Bulk-compute indicators and add ``previous_*`` columns."""
+    frame = bars.reset_index(drop=True)
+    if indicator_config:
+        frame = IndicatorManager(frame, indicator_config, is_bulk=True).get_historical_data()
+        frame = frame.reset_index(drop=True)
+
+    current = [c for c in frame.columns if not str(c).startswith(PREVIOUS_PREFIX)]
+    previous = frame[current].shift(1)
+    previous.columns = [f"{PREVIOUS_PREFIX}{c}" for c in current]
+    return pd.concat([frame, previous], axis=1)
+
+
+def _close_ns(frame: pd.DataFrame, timeframe: str) -> np.ndarray:
+    """Bar close times in nanoseconds."""
+    return (pd.DatetimeIndex(frame["time"]) + timeframe_delta(timeframe)).asi8
+
+
+def _is_numeric(values) -> bool:
+    """True for int/float arrays or scalars (booleans excluded)."""
+    dtype = getattr(values, "dtype", None)
+    if dtype is None:
+        return False
+    return np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.floating)
+
+
+def _is_number(value) -> bool:
+    """True for int/float literals (booleans excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parse_duration(duration: str) -> pd.Timedelta:
+    """Parse a time_based duration such as '4h' or '2d'."""
+    amount, unit = int(duration[:-1]), duration[-1].lower()
+    return pd.Timedelta(amount, unit=_DURATION_UNITS[unit])
+
+
+@njit
+def _record(fills, row, entry_index, exit_index, sign, entry_price, exit_price, units, pnl, reason):
+    """Write one fill row."""
+    fills[row, 0] = entry_index
+    fills[row, 1] = exit_index
+    fills[row, 2] = sign
+    fills[row, 3] = entry_price
+    fills[row, 4] = exit_price
+    fills[row, 5] = units
+    fills[row, 6] = pnl
+    fills[row, 7] = reason
+
+
+@njit
+def _simulate(
+    open_, high, low, close, time_ns,
+    entry_long, entry_short, exit_long, exit_short,
+    exit_and_time, max_duration,
+    sizing_mode, sizing_value, volatility,
+    sl_mode, sl_value, sl_long, sl_short, trail,
+    tp_absolute, tp_percent, tp_fraction, tp_move_stop,
+    contract_size, initial_balance, max_fills
+):
+    """
+    Bar loop over positions. Returns (equity, fills, fill_count).
+
+    Fill rows: entry index, exit index, direction (+1/-1), entry price,
+    exit price, units, pnl, exit reason.
+    """
+    n = len(close)
+    targets = len(tp_fraction)
+    equity = np.empty(n)
+    fills = np.zeros((max_fills, 8))
+    count = 0
+    balance = initial_balance
+
+    is_open = np.zeros(2, dtype=np.bool_)
+    entry_index = np.zeros(2, dtype=np.int64)
+    entry_price = np.zeros(2)
+    units_initial = np.zeros(2)
+    units_left = np.zeros(2)
+    stop = np.zeros(2)
+    next_target = np.zeros(2, dtype=np.int64)
+    target_levels = np.zeros((2, targets))
+
+    for i in range(n):
+        for d in range(2):
+            if not is_open[d] or i <= entry_index[d]:
+                continue
+            sign = 1.0 if d == 0 else -1.0
+
+            # Stop loss (checked first; gaps fill at the open)
+            hit = np.nan
+            if d == 0:
+                if open_[i] <= stop[d]:
+                    hit = open_[i]
+                elif low[i] <= stop[d]:
+                    hit = stop[d]
+            else:
+                if open_[i] >= stop[d]:
+                    hit = open_[i]
+                elif high[i] >= stop[d]:
+                    hit = stop[d]
+            if not np.isnan(hit):
+                pnl = (hit - entry_price[d]) * sign * units_left[d] * contract_size
+                _record(fills, count, entry_index[d], i, sign, entry_price[d], hit, units_left[d], pnl, 1)
+                count += 1
+                balance += pnl
+                is_open[d] = False
+                continue
+
+            # Take profit targets, in order
+            while next_target[d] < targets:
+                level = target_levels[d, next_target[d]]
+                if d == 0:
+                    if high[i] < level:
+                        break
+                    price = max(level, open_[i])
+                else:
+                    if low[i] > level:
+                        break
+                    price = min(level, open_[i])
+                quantity = units_initial[d] * tp_fraction[next_target[d]]
+                if next_target[d] == targets - 1 or quantity > units_left[d]:
+                    quantity = units_left[d]
+                pnl = (price - entry_price[d]) * sign * quantity * contract_size
+                _record(fills, count, entry_index[d], i, sign, entry_price[d], price, quantity, pnl, 2)
+                count += 1
+                balance += pnl
+                units_left[d] -= quantity
+                if tp_move_stop[next_target[d]]:
+                    stop[d] = entry_price[d]
+                next_target[d] += 1
+            if units_left[d] <= 1e-12:
+                is_open[d] = False
+                continue
+
+            # Exit rules and time-based exit at the close
+            signal = exit_long[i] if d == 0 else exit_short[i]
+            timed = max_duration[d] > 0 and time_ns[i] - time_ns[entry_index[d]] >= max_duration[d]
+            if exit_and_time[d]:
+                leave = signal and timed
+            else:
+                leave = signal or timed
+            if leave:
+                reason = 3 if signal else 4
+                pnl = (close[i] - entry_price[d]) * sign * units_left[d] * contract_size
+                _record(fills, count, entry_index[d], i, sign, entry_price[d], close[i], units_left[d], pnl, reason)
+                count += 1
+                balance += pnl
+                is_open[d] = False
+                continue
+
+            if trail > 0:
+                if d == 0:
+                    stop[d] = max(stop[d], close[i] - trail)
+                else:
+                    stop[d] = min(stop[d], close[i] + trail)
+
+        # Entries at the close
+        for d in range(2):
+            wants = entry_long[i] if d == 0 else entry_short[i]
+            if is_open[d] or not wants:
+                continue
+            sign = 1.0 if d == 0 else -1.0
+            price = close[i]
+
+            if sizing_mode == 0:
+                units = sizing_value
+            elif sizing_mode == 1:
+                units = balance * sizing_value / 100.0 / price
+            else:
+                if not volatility[i] > 0:
+                    continue
+                units = balance * sizing_value / 100.0 / (volatility[i] * 2.0) / price
+            if not units > 0:
+                continue
+
+            if sl_mode == 0:
+                level = price - sign * sl_value
+            elif sl_mode == 1:
+                level = sl_long[i] if d == 0 else sl_short[i]
+                if np.isnan(level):
+                    continue
+            else:
+                level = price - sign * sl_value / units
+
+            is_open[d] = True
+            entry_index[d] = i
+            entry_price[d] = price
+            units_initial[d] = units
+            units_left[d] = units
+            stop[d] = level
+            next_target[d] = 0
+            for t in range(targets):
+                target_levels[d, t] = price + sign * (tp_absolute[t] + price * tp_percent[t] / 100.0)
+
+        open_profit = 0.0
+        for d in range(2):
+            if is_open[d]:
+                sign = 1.0 if d == 0 else -1.0
+                open_profit += (close[i] - entry_price[d]) * sign * units_left[d] * contract_size
+        equity[i] = balance + open_profit
+
+    # Close what is left at the last close
+    for d in range(2):
+        if is_open[d]:
+            sign = 1.0 if d == 0 else -1.0
+            pnl = (close[n - 1] - entry_price[d]) * sign * units_left[d] * contract_size
+            _record(fills, count, entry_index[d], n - 1, sign, entry_price[d], close[n - 1], units_left[d], pnl, 5)
+            count += 1
+
+    return equity, fills, count
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m app.backtest.vectorized ./data --config ./config --symbol xauusd --pip-value 100
+        python -m app.backtest.vectorized ./data --config ./config --symbol xauusd --pip-value 100 --parity 1000
+    """
+    from app.data.backtest_data import BacktestDataSource
+    from app.utils.multi_symbol_loader import load_indicators_for_symbol, load_strategies_for_symbol
+
+    parser = argparse.ArgumentParser(description="Vectorized backtest of the YAML strategies of a symbol")
+    parser.add_argument("data_path", help="Folder with {symbol}_{tf}.parquet files")
+    parser.add_argument("--config", required=True, help="Configuration folder (strategies/ and indicators/)")
+    parser.add_argument("--symbol", required=True)
+    parser.add_argument("--pip-value", type=float, required=True)
+    parser.add_argument("--strategy", action="append", dest="strategies", help="Strategy name (repeatable)")
+    parser.add_argument("--balance", type=float, default=10000.0)
+    parser.add_argument("--contract-size", type=float, default=1.0)
+    parser.add_argument("--parity", type=int, default=0, help="Bars to check against the event-driven path")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger('vectorized-backtest')
+
+    engine = load_strategies_for_symbol(args.config, args.symbol, logger)
+    indicator_configs = load_indicators_for_symbol(args.config, args.symbol, logger)
+    names = args.strategies or engine.list_available_strategies()
+
+    source = BacktestDataSource(args.data_path, args.symbol)
+    loaded = set()
+    for name in names:
+        strategy = engine.get_strategy_info(name)
+        timeframes = [_tf_key(tf) for tf in strategy.timeframes]
+        source.load_data([tf for tf in timeframes if tf not in loaded])
+        loaded.update(timeframes)
+        data = {tf: source.get_historical_data(args.symbol, tf) for tf in timeframes}
+
+        backtester = VectorizedBacktester(
+            strategy, data, args.pip_value,
+            indicator_configs=indicator_configs,
+            initial_balance=args.balance,
+            contract_size=args.contract_size,
+            logger=logger,
+        )
+        result = backtester.run()
+        print(
+            f"{name}: {result.bars} bars  {len(result.trades)} fills  "
+            f"net {result.net_profit:.2f}  {result.bars_per_second:,.0f} bars/s"
+        )
+        if args.parity:
+            report = backtester.check_parity(max_bars=args.parity)
+            print(f"  parity: {report.bars_checked} bars, {len(report.mismatches)} mismatches")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,465 @@
+"""
+Walk-forward optimisation of a strategy YAML.
+
+The history is cut into rolling (or anchored) windows: each window optimises
+the parameter space on its in-sample span, then trades the best parameter set
+on the out-of-sample span that follows. The out-of-sample runs are chained,
+each starting from the balance the previous one ended with, into one stitched
+equity curve.
+
+Work is shared across windows instead of repeated per window:
+
+- Base columns and every distinct indicator configuration are computed once
+  over the full span and placed in shared memory (as in ParameterSweep);
+  windows are time ranges over those arrays, so indicators keep their
+  warm-up history at every window start
+- Rules are compiled once per parameter set over the full span; each window
+  only runs the trade loop on its slice of the signals
+- Parameter sets are split across a process pool together with chunks of
+  windows, so windows are evaluated in parallel
+- Each task builds one backtester for its parameter set and runs every
+  in-sample range of its chunk of windows on it, and the out-of-sample pass
+  keeps the backtester of each selected parameter set, so windows selecting
+  the same parameters reuse compiled signals
+
+Example:
+    ```python
+    space = ParameterSpace.grid({"indicators.1.ema.period": [10, 20, 50]})
+    optimizer = WalkForwardOptimizer(
+        strategy_config, data, space, pip_value=100.0,
+        in_sample="90D", out_of_sample="30D", indicator_configs=indicators,
+    )
+    result = optimizer.run()
+    print(result.windows[["out_of_sample_start", "indicators.1.ema.period", "net_profit"]])
+    result.equity.plot()
+    ```
+
+Command line:
+
+    python -m app.backtest.walk_forward strategy.yaml ./data --symbol xauusd --config ./config \\
+        --space space.yaml --pip-value 100 --in-sample 90D --out-of-sample 30D --workers 4
+"""
+
+import argparse
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from app.backtest.sweep import (
+    _WORKER,
+    ParameterSpace,
+    ParameterSweep,
+    _assemble_frames,
+    _init_worker,
+)
+from app.backtest.vectorized import VectorizedBacktester
+from app.data.bar_cache import timeframe_delta
+from app.strategy_builder.core.domain.models import TradingStrategy
+
+
+@dataclass
+class WalkForwardWindow:
+    """
+    One optimisation window.
+
+    Ranges are half-open: bars at or after a range end belong to the next range.
+    """
+    index: int
+    in_sample_start: pd.Timestamp
+    in_sample_end: pd.Timestamp
+    out_of_sample_start: pd.Timestamp
+    out_of_sample_end: pd.Timestamp
+
+
+def walk_forward_windows(
+    times: pd.DatetimeIndex,
+    in_sample: Any,
+    out_of_sample: Any,
+    step: Any = None,
+    anchored: bool = False
+) -> List[WalkForwardWindow]:
+    """
+    Cut a bar history into walk-forward windows.
+
+    Args:
+        times: Base timeframe bar times
+        in_sample: In-sample length (Timedelta or string such as "90D")
+        out_of_sample: Out-of-sample length
+        step: Shift between windows (default: the out-of-sample length, so
+            out-of-sample ranges tile the history without overlap)
+        anchored: Keep every in-sample range starting at the first bar
+
+    Returns:
+        Windows whose out-of-sample range contains at least one bar
+    """
+    in_sample = pd.Timedelta(in_sample)
+    out_of_sample = pd.Timedelta(out_of_sample)
+    step = pd.Timedelta(step) if step is not None else out_of_sample
+    if in_sample <= pd.Timedelta(0) or out_of_sample <= pd.Timedelta(0) or step <= pd.Timedelta(0):
+        raise ValueError("Walk-forward lengths must be positive")
+    if step < out_of_sample:
+        raise ValueError("Step must be at least the out-of-sample length so out-of-sample ranges do not overlap")
+    if len(times) == 0:
+        return []
+
+    first, last = times[0], times[-1]
+    windows: List[WalkForwardWindow] = []
+    while True:
+        shift = step * len(windows)
+        in_sample_end = first + shift + in_sample
+        if in_sample_end > last:
+            break
+        windows.append(WalkForwardWindow(
+            index=len(windows),
+            in_sample_start=first if anchored else first + shift,
+            in_sample_end=in_sample_end,
+            out_of_sample_start=in_sample_end,
+            out_of_sample_end=in_sample_end + out_of_sample,
+        ))
+    return windows
+
+
+@dataclass
+class WalkForwardResult:
+    """
+    Result of a walk-forward optimisation.
+
+    Attributes:
+        windows: One row per window: ranges, selected run_id and parameters,
+            the in-sample objective and the out-of-sample summary metrics
+        evaluations: In-sample summary of every (window, parameter set)
+        equity: Out-of-sample equity of all windows, stitched in time order
+        initial_balance: Balance the first out-of-sample window started with
+    """
+    windows: pd.DataFrame
+    evaluations: pd.DataFrame
+    equity: pd.Series
+    initial_balance: float
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def final_balance(self) -> float:
+        """Balance after the last out-of-sample window."""
+        if self.windows.empty or self.windows["end_balance"].isna().all():
+            return self.initial_balance
+        return float(self.windows["end_balance"].dropna().iloc[-1])
+
+    @property
+    def net_profit(self) -> float:
+        """Realized out-of-sample profit over all windows."""
+        return self.final_balance - self.initial_balance
+
+
+def _run_window_task(task: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Evaluate one parameter set on the in-sample range of several windows."""
+    started = time.perf_counter()
+    rows = []
+    try:
+        backtester = _window_backtester(task)
+        for window in task["windows"]:
+            summary = backtester.run(start=window.in_sample_start, end=window.in_sample_end).summary()
+            rows.append({"window": window.index, "run_id": task["run_id"], **task["params"], **summary, "error": None})
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        rows = [
+            {"window": window.index, "run_id": task["run_id"], **task["params"], "error": error}
+            for window in task["windows"]
+        ]
+    elapsed = time.perf_counter() - started
+    for row in rows:
+        row["seconds"] = elapsed / len(rows)
+    return rows
+
+
+def _window_backtester(task: Dict[str, Any]) -> VectorizedBacktester:
+    """Backtester over the full mapped span for one parameter set."""
+    data = _assemble_frames(_WORKER["views"], _WORKER["layout"], task["columns"])
+    return VectorizedBacktester(
+        TradingStrategy(**task["strategy"]),
+        data,
+        _WORKER["pip_value"],
+        initial_balance=_WORKER["initial_balance"],
+        contract_size=_WORKER["contract_size"],
+    )
+
+
+class WalkForwardOptimizer(ParameterSweep):
+    """Rolling in-sample optimisation with chained out-of-sample evaluation"""
+
+    def __init__(
+        self,
+        strategy_config: Dict[str, Any],
+        data: Dict[str, pd.DataFrame],
+        space: ParameterSpace,
+        pip_value: float,
+        in_sample: Any,
+        out_of_sample: Any,
+        step: Any = None,
+        anchored: bool = False,
+        objective: str = "net_profit",
+        maximize: bool = True,
+        indicator_configs: Optional[Dict[str, dict]] = None,
+        workers: Optional[int] = None,
+        initial_balance: float = 10000.0,
+        contract_size: float = 1.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            strategy_config: Strategy YAML as a dictionary
+            data: OHLC bars per timeframe over the full span
+            space: Parameter sets optimised in every window
+            pip_value: Pips-to-price divisor for SL/TP distances
+            in_sample: In-sample length (e.g. "90D")
+            out_of_sample: Out-of-sample length (e.g. "30D")
+            step: Shift between windows (default: out_of_sample)
+            anchored: Grow the in-sample range from the first bar instead of rolling it
+            objective: Summary metric ranking parameter sets in-sample
+            maximize: Whether a larger objective is better
+            indicator_configs: Indicator configuration per timeframe
+            workers: Process count (default: CPU count); 0 or 1 runs inline
+            initial_balance: Balance of in-sample runs and of the first out-of-sample window
+            contract_size: Account currency per unit per price point
+            logger: Optional logger
+        """
+        super().__init__(
+            strategy_config, data, space, pip_value,
+            indicator_configs=indicator_configs,
+            workers=workers,
+            initial_balance=initial_balance,
+            contract_size=contract_size,
+            logger=logger or logging.getLogger('walk-forward'),
+        )
+        self.in_sample = in_sample
+        self.out_of_sample = out_of_sample
+        self.step = step
+        self.anchored = anchored
+        self.objective = objective
+        self.maximize = maximize
+
+    def windows(self) -> List[WalkForwardWindow]:
+        """Windows over the base (smallest) timeframe of the strategy."""
+        timeframes = [str(tf) for tf in self.strategy_config["timeframes"]]
+        base = min(timeframes, key=timeframe_delta)
+        times = pd.DatetimeIndex(self.data[base]["time"])
+        return walk_forward_windows(times, self.in_sample, self.out_of_sample, self.step, self.anchored)
+
+    def run(self) -> WalkForwardResult:
+        """
+        Optimise every window in-sample, then chain the out-of-sample runs.
+
+        Returns:
+            WalkForwardResult with the per-window table and the stitched equity
+        """
+        if not len(self.space):
+            raise ValueError("Parameter space is empty")
+        windows = self.windows()
+        if not windows:
+            raise ValueError("History is shorter than one in-sample range")
+
+        tasks, store = self._plan({})
+        tasks = self._split(tasks, windows)
+        self.logger.info(
+            f"Walk-forward: {len(windows)} windows x {len(self.space)} parameter sets, "
+            f"{len(tasks)} tasks on {max(self.workers, 1)} worker(s)"
+        )
+
+        timings: Dict[str, float] = {}
+        try:
+            context = {
+                "layout": self._layout,
+                "pip_value": self.pip_value,
+                "initial_balance": self.initial_balance,
+                "contract_size": self.contract_size,
+            }
+            spec = store.publish()
+
+            started = time.perf_counter()
+            rows = [row for chunk in self._execute(tasks, spec, context, _run_window_task) for row in chunk]
+            timings["in_sample"] = time.perf_counter() - started
+            evaluations = self._evaluations_frame(rows)
+            selected = self._select(evaluations)
+
+            started = time.perf_counter()
+            _init_worker(spec, context)
+            try:
+                table, equity = self._out_of_sample(windows, selected, {task["run_id"]: task for task in tasks})
+            finally:
+                _WORKER.pop("shm").close()
+                _WORKER.clear()
+            timings["out_of_sample"] = time.perf_counter() - started
+        finally:
+            store.close()
+
+        result = WalkForwardResult(
+            windows=table,
+            evaluations=evaluations,
+            equity=equity,
+            initial_balance=self.initial_balance,
+            timings=timings,
+        )
+        self.logger.info(
+            f"✓ Walk-forward finished: out-of-sample net {result.net_profit:.2f} over {len(windows)} windows "
+            f"(in-sample {timings['in_sample']:.1f}s, out-of-sample {timings['out_of_sample']:.1f}s)"
+        )
+        return result
+
+    def _split(self, tasks: List[Dict[str, Any]], windows: List[WalkForwardWindow]) -> List[Dict[str, Any]]:
+        """Attach windows to each parameter set, chunked so every worker gets work."""
+        chunks = min(len(windows), max(1, math.ceil(self.workers / max(len(tasks), 1))))
+        size = math.ceil(len(windows) / chunks)
+        return [
+            {**task, "windows": windows[i:i + size]}
+            for task in tasks
+            for i in range(0, len(windows), size)
+        ]
+
+    def _evaluations_frame(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        """In-sample results ordered by window, then parameter space order."""
+        evaluations = pd.DataFrame(rows)
+        failed = evaluations[evaluations["error"].notna()].drop_duplicates("run_id")
+        for row in failed.to_dict("records"):
+            self.logger.warning(f"✗ {row['run_id']}: {row['error']}")
+        order = {rid: position for position, rid in enumerate(self._run_ids)}
+        evaluations["_order"] = evaluations["run_id"].map(order)
+        return evaluations.sort_values(["window", "_order"]).drop(columns="_order").reset_index(drop=True)
+
+    def _select(self, evaluations: pd.DataFrame) -> Dict[int, Dict[str, Any]]:
+        """Best parameter set per window; ties keep the earlier parameter set."""
+        if self.objective not in evaluations.columns:
+            return {}
+        valid = evaluations[evaluations["error"].isna() & evaluations[self.objective].notna()]
+        ranked = valid.sort_values(["window", self.objective], ascending=[True, not self.maximize], kind="stable")
+        return {int(row["window"]): row for row in ranked.drop_duplicates("window").to_dict("records")}
+
+    def _out_of_sample(
+        self,
+        windows: List[WalkForwardWindow],
+        selected: Dict[int, Dict[str, Any]],
+        tasks: Dict[str, Dict[str, Any]]
+    ) -> Tuple[pd.DataFrame, pd.Series]:
+        """Run each window's selection out-of-sample, chaining balances, in the parent process."""
+        paths = list(self.space.parameter_sets[0]) if len(self.space) else []
+        balance = self.initial_balance
+        backtesters: Dict[str, VectorizedBacktester] = {}
+        rows, pieces = [], []
+        try:
+            for window in windows:
+                row = {
+                    "window": window.index,
+                    "in_sample_start": window.in_sample_start,
+                    "in_sample_end": window.in_sample_end,
+                    "out_of_sample_start": window.out_of_sample_start,
+                    "out_of_sample_end": window.out_of_sample_end,
+                }
+                choice = selected.get(window.index)
+                if choice is None:
+                    self.logger.warning(f"✗ Window {window.index}: no valid in-sample result, skipped")
+                    rows.append({**row, "run_id": None, "start_balance": balance, "end_balance": balance})
+                    continue
+
+                rid = choice["run_id"]
+                reused = rid in backtesters
+                if not reused:
+                    backtesters[rid] = _window_backtester(tasks[rid])
+                result = backtesters[rid].run(
+                    start=window.out_of_sample_start, end=window.out_of_sample_end, initial_balance=balance
+                )
+                # Copy out of shared memory: the block is unmapped after this pass
+                pieces.append(pd.Series(
+                    result.equity.to_numpy(copy=True), index=result.equity.index.copy(deep=True), name="equity"
+                ))
+                rows.append({
+                    **row,
+                    "run_id": rid,
+                    **{path: choice[path] for path in paths},
+                    f"in_sample_{self.objective}": choice[self.objective],
+                    **result.summary(),
+                    "start_balance": balance,
+                    "end_balance": result.final_balance,
+                    "reused": reused,
+                })
+                balance = result.final_balance
+        finally:
+            backtesters.clear()
+
+        equity = pd.concat(pieces) if pieces else pd.Series(dtype=np.float64, name="equity")
+        return pd.DataFrame(rows), equity
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m app.backtest.walk_forward strategy.yaml ./data --symbol xauusd --config ./config \\
+            --space space.yaml --pip-value 100 --in-sample 90D --out-of-sample 30D --output wf.parquet
+    """
+    from app.data.backtest_data import BacktestDataSource
+    from app.utils.multi_symbol_loader import load_indicators_for_symbol
+
+    parser = argparse.ArgumentParser(description="Walk-forward optimisation of a strategy YAML")
+    parser.add_argument("strategy")
+    parser.add_argument("data_path", help="Folder with {symbol}_{tf}.parquet files")
+    parser.add_argument("--symbol", required=True)
+    parser.add_argument("--config", help="Configuration folder with indicators/<symbol>/")
+    parser.add_argument("--space", required=True, help="YAML with a grid or random section")
+    parser.add_argument("--pip-value", type=float, required=True)
+    parser.add_argument("--in-sample", required=True, help="In-sample length, e.g. 90D")
+    parser.add_argument("--out-of-sample", required=True, help="Out-of-sample length, e.g. 30D")
+    parser.add_argument("--step", help="Shift between windows (default: out-of-sample length)")
+    parser.add_argument("--anchored", action="store_true")
+    parser.add_argument("--objective", default="net_profit")
+    parser.add_argument("--minimize", action="store_true", help="Rank the objective ascending")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--balance", type=float, default=10000.0)
+    parser.add_argument("--output", help="Write the per-window table to this parquet file")
+    parser.add_argument("--equity-output", help="Write the stitched out-of-sample equity to this parquet file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger('walk-forward')
+
+    with open(args.space, "r", encoding="utf-8") as f:
+        space = ParameterSpace.from_dict(yaml.safe_load(f))
+    with open(args.strategy, "r", encoding="utf-8") as f:
+        strategy_config = yaml.safe_load(f)
+
+    timeframes = [str(tf) for tf in strategy_config["timeframes"]]
+    source = BacktestDataSource(args.data_path, args.symbol)
+    source.load_data(timeframes)
+    data = {tf: source.get_historical_data(args.symbol, tf) for tf in timeframes}
+    indicator_configs = load_indicators_for_symbol(args.config, args.symbol, logger) if args.config else {}
+    indicator_configs = {tf: config for tf, config in indicator_configs.items() if tf in timeframes}
+
+    optimizer = WalkForwardOptimizer(
+        strategy_config, data, space, args.pip_value,
+        in_sample=args.in_sample,
+        out_of_sample=args.out_of_sample,
+        step=args.step,
+        anchored=args.anchored,
+        objective=args.objective,
+        maximize=not args.minimize,
+        indicator_configs=indicator_configs,
+        workers=args.workers,
+        initial_balance=args.balance,
+        logger=logger,
+    )
+    result = optimizer.run()
+    if args.output:
+        result.windows.to_parquet(args.output, index=False)
+    if args.equity_output:
+        result.equity.to_frame().to_parquet(args.equity_output)
+    print(result.windows.to_string(index=False))
+    print(f"\nOut-of-sample net profit: {result.net_profit:.2f} (final balance {result.final_balance:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
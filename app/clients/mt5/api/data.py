@@ -2,14 +2,23 @@
 Data client for MT5 API - historical data and market data.
 """
 
-from datetime import datetime
-from typing import  Dict, List, Optional
+from datetime import datetime, timezone
+from typing import  Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
 
 from app.clients.mt5.base import BaseClient
+from app.clients.mt5.exceptions import MT5ValidationError
 from app.clients.mt5.models.response import HistoricalBar
 from app.clients.mt5.utils import validate_symbol, format_datetime, parse_datetime
 
 
+BAR_PRICE_FIELDS = ("open", "high", "low", "close")
+BAR_VOLUME_FIELDS = ("tick_volume", "spread", "real_volume")
+BAR_OPTIONAL_FIELDS = ("spread", "real_volume")
+
+
 class DataClient(BaseClient):
     """Client for retrieving historical and market data from MT5."""
 
@@ -20,13 +29,17 @@ class DataClient(BaseClient):
             num_bars: Optional[int] = 10,
             start: Optional[datetime] = None,
             end: Optional[datetime] = None,
+            since: Optional[datetime] = None,
     ) -> List[HistoricalBar]:
         """
         Fetch historical price bars for a symbol.
 
-        This method can be used in two ways:
+        This method can be used in three ways:
         1. **Latest bars** mode: Provide `num_bars` to fetch the most recent bars.
         2. **Time range** mode: Provide `start` and `end` timestamps to fetch bars in that range.
+        3. **Cursor** mode: Provide `since` (the last bar time already seen) to fetch only
+           newer bars. The request uses `since` as `start`; bars at or before `since` and
+           duplicate times are dropped on the client, and the result is sorted by time.
 
         Args:
             symbol: Symbol name to fetch data for
@@ -34,6 +47,7 @@ class DataClient(BaseClient):
             num_bars: Number of bars to fetch (default: 10)
             start: Start datetime
             end: End datetime
+            since: Cursor datetime; only bars strictly after it are returned
 
         Returns:
             List of price bars with time, open, high, low, close, and volume data
@@ -42,11 +56,166 @@ class DataClient(BaseClient):
             MT5APIError: If parameters are invalid or data fetching fails
         """
         symbol = validate_symbol(symbol)
+        params = self._bars_params(timeframe, num_bars, start, end, since)
+
+        data = self.get(f"symbols/{symbol}/bars", params=params)
+
+        bars = []
+        if data:
+            for bar_data in data:
+                # Parse datetime if it's a string
+                if 'time' in bar_data and isinstance(bar_data['time'], str):
+                    bar_data['time'] = parse_datetime(bar_data['time'])
+                bars.append(HistoricalBar(**bar_data))
+
+        if since is not None:
+            bars = self._bars_after(bars, since)
+
+        return bars
+
+    def fetch_bars_frame(
+            self,
+            symbol: str,
+            timeframe: str = "M1",
+            num_bars: Optional[int] = 10,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+            since: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Fetch historical price bars as a DataFrame, decoded column by column.
+
+        Same request modes as `fetch_bars`, but the response is decoded straight
+        into NumPy arrays (time as int64 epoch nanoseconds, prices and volumes as
+        float64) and validated with array operations instead of building one
+        `HistoricalBar` per row. Use it for large history requests; `fetch_bars`
+        remains the better fit for a handful of bars.
+
+        Args:
+            symbol: Symbol name to fetch data for
+            timeframe: Timeframe for the data (e.g., M1, M5, H1)
+            num_bars: Number of bars to fetch (default: 10)
+            start: Start datetime
+            end: End datetime
+            since: Cursor datetime; only bars strictly after it are returned
+
+        Returns:
+            DataFrame with time, open, high, low, close, tick_volume, spread and
+            real_volume columns (empty if no bars). Timezone-aware times are
+            returned in UTC.
+
+        Raises:
+            MT5APIError: If parameters are invalid or data fetching fails
+            MT5ValidationError: If the response contains malformed bars
+        """
+        symbol = validate_symbol(symbol)
+        params = self._bars_params(timeframe, num_bars, start, end, since)
+
+        data = self.get(f"symbols/{symbol}/bars", params=params)
+        df = self.decode_bars(data)
+
+        if since is not None and not df.empty:
+            cursor = pd.Timestamp(since)
+            if df["time"].dt.tz is not None and cursor.tzinfo is None:
+                cursor = cursor.tz_localize(timezone.utc)
+            elif df["time"].dt.tz is None and cursor.tzinfo is not None:
+                cursor = cursor.tz_convert(timezone.utc).tz_localize(None)
+
+            df = df[df["time"] > cursor]
+            df = df.drop_duplicates(subset="time", keep="last")
+            df = df.sort_values("time", kind="stable").reset_index(drop=True)
+
+        return df
+
+    @staticmethod
+    def decode_bars(data: Optional[List[Dict[str, Any]]]) -> pd.DataFrame:
+        """
+        Decode a raw bar response into a DataFrame in one pass per column.
+
+        Args:
+            data: List of bar dicts as returned by the API
+
+        Returns:
+            DataFrame of bars (empty if data is empty)
+
+        Raises:
+            MT5ValidationError: If a required field is missing or a value is invalid
+        """
+        if not data:
+            return pd.DataFrame()
+
+        count = len(data)
+        columns: Dict[str, np.ndarray] = {}
+
+        try:
+            times = pd.to_datetime(pd.Index([bar["time"] for bar in data]), format="ISO8601")
+        except KeyError:
+            raise MT5ValidationError("Malformed bar response: missing field 'time'")
+        except (ValueError, TypeError):
+            try:
+                # Mixed UTC offsets - normalize everything to UTC
+                times = pd.to_datetime(pd.Index([bar["time"] for bar in data]), format="ISO8601", utc=True)
+            except (ValueError, TypeError) as e:
+                raise MT5ValidationError(f"Malformed bar response: invalid time ({e})")
+
+        epoch_ns = times.asi8
+        tz = times.tz
+
+        for name in BAR_PRICE_FIELDS + BAR_VOLUME_FIELDS:
+            optional = name in BAR_OPTIONAL_FIELDS
+            try:
+                values = (bar.get(name) for bar in data) if optional else (bar[name] for bar in data)
+                columns[name] = np.fromiter(
+                    (np.nan if v is None else v for v in values), dtype=np.float64, count=count
+                )
+            except KeyError:
+                raise MT5ValidationError(f"Malformed bar response: missing field '{name}'")
+            except (ValueError, TypeError) as e:
+                raise MT5ValidationError(f"Malformed bar response: invalid '{name}' value ({e})")
 
+        # Vectorized validation
+        errors = []
+        if (epoch_ns == np.iinfo(np.int64).min).any():
+            errors.append("time: unparseable value")
+        for name in BAR_PRICE_FIELDS + ("tick_volume",):
+            if not np.isfinite(columns[name]).all():
+                errors.append(f"{name}: missing or non-finite value")
+        for name in BAR_VOLUME_FIELDS:
+            values = columns[name][~np.isnan(columns[name])]
+            if (values < 0).any() or (values != np.floor(values)).any():
+                errors.append(f"{name}: negative or non-integer volume")
+        if errors:
+            raise MT5ValidationError("Malformed bar response", validation_errors=errors)
+
+        df = pd.DataFrame({
+            "time": pd.to_datetime(epoch_ns, unit="ns", utc=tz is not None),
+            **{name: columns[name] for name in BAR_PRICE_FIELDS},
+        })
+
+        # Volumes are integers in HistoricalBar; keep that dtype unless values are missing
+        for name in BAR_VOLUME_FIELDS:
+            values = columns[name]
+            df[name] = values if np.isnan(values).any() else values.astype(np.int64)
+
+        return df
+
+    @staticmethod
+    def _bars_params(
+            timeframe: str,
+            num_bars: Optional[int],
+            start: Optional[datetime],
+            end: Optional[datetime],
+            since: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """Build the query parameters for a bars request."""
         params = {
             'timeframe': timeframe,
         }
 
+        if since is not None:
+            # Cursor mode - the server range starts at the cursor, the client drops what was seen
+            start = since
+
         if start or end:
             # Time range mode
             if start:
@@ -57,17 +226,28 @@ class DataClient(BaseClient):
             # Latest bars mode
             params['num_bars'] = num_bars
 
-        data = self.get(f"symbols/{symbol}/bars", params=params)
+        return params
 
-        bars = []
-        if data:
-            for bar_data in data:
-                # Parse datetime if it's a string
-                if 'time' in bar_data and isinstance(bar_data['time'], str):
-                    bar_data['time'] = parse_datetime(bar_data['time'])
-                bars.append(HistoricalBar(**bar_data))
+    @staticmethod
+    def _bars_after(bars: List[HistoricalBar], since: datetime) -> List[HistoricalBar]:
+        """
+        Keep bars strictly after `since`, sorted by time with one bar per time.
 
-        return bars
+        When the server returns the same time twice, the later entry wins (it carries
+        the most recent values of a still-forming bar).
+        """
+        by_time: Dict[datetime, HistoricalBar] = {}
+        for bar in bars:
+            cursor = since
+            if bar.time.tzinfo is not None and cursor.tzinfo is None:
+                cursor = cursor.replace(tzinfo=timezone.utc)
+            elif bar.time.tzinfo is None and cursor.tzinfo is not None:
+                cursor = cursor.astimezone(timezone.utc).replace(tzinfo=None)
+
+            if bar.time > cursor:
+                by_time[bar.time] = bar
+
+        return [by_time[t] for t in sorted(by_time)]
 
     def get_latest_bars(
             self,
@@ -27,6 +27,16 @@ class PositionsClient(BaseClient):
         data = self.get("positions")
         return [Position(**pos) for pos in data] if data else []
 
+    def get_all_positions(self) -> List[Dict[str, Any]]:
+        """
+        Get all currently open trading positions as raw dictionaries.
+
+        Returns:
+            List of position dictionaries as returned by the API.
+        """
+        data = self.get("positions")
+        return list(data) if data else []
+
     def get_positions_by_symbol(self, symbol: str) -> List[Position]:
         """
         Get all open positions filtered by trading symbol.
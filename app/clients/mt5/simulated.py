@@ -0,0 +1,756 @@
+"""
+In-process simulated MT5 broker.
+
+SimulatedBroker keeps an MT5-like trading account in memory (positions,
+pending limit/stop orders, SL/TP, partial closes, commission, swaps and the
+closed-position history) and fills it against a replayed bar stream with a
+configurable spread and slippage. It answers the same REST routes as the MT5
+API server (``positions``, ``orders/create``, ``account``, ...).
+
+SimulatedMT5Client is an MT5Client whose endpoint clients send those requests
+to a SimulatedBroker instead of over HTTP. The request building, validation
+and response models of the real endpoint clients are reused unchanged, so
+LiveTrader, PositionMonitorService, RestrictionManager and
+AccountStopLossManager run against it as they do against a live terminal,
+with no network and at CPU speed.
+
+Fill model (bars are bid prices; ask = bid + spread):
+- Market orders fill at the current ask (buy) or bid (sell), moved against
+  the trader by the slippage
+- Pending orders trigger when the bar range crosses their price; limits fill
+  at their price (or the open, if the bar gaps through it), stops at their
+  price or the gapped open plus slippage
+- SL and TP of positions opened before the bar are then checked; when a bar
+  touches both, the stop loss wins
+- Commission is charged per lot on each fill; swap is charged per lot at
+  every day rollover of the simulated clock (triple on the configured weekday)
+
+Example:
+    ```python
+    broker = SimulatedBroker(
+        symbols={"XAUUSD": SymbolSpec(contract_size=100, spread=0.2, commission_per_lot=3.5)},
+        balance=10000.0,
+    )
+    client = SimulatedMT5Client(broker)
+    broker.attach(event_bus, timeframe="1")      # before the trading services subscribe
+    trader = LiveTrader(client)
+    engine = BarReplayEngine(event_bus, streams)
+    engine.run()
+    print(broker.account_info())
+    ```
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from app.clients.mt5.api.account import AccountClient
+from app.clients.mt5.api.data import DataClient
+from app.clients.mt5.api.history import HistoryClient
+from app.clients.mt5.api.orders import OrdersClient
+from app.clients.mt5.api.positions import PositionsClient
+from app.clients.mt5.api.symbols import SymbolsClient
+from app.clients.mt5.base import BaseClient
+from app.clients.mt5.client import MT5Client
+from app.clients.mt5.exceptions import MT5APIError
+from app.events.data_events import NewCandleEvent
+
+
+# MT5 constants used in responses
+TRADE_RETCODE_DONE = 10009
+ORDER_TYPES = {
+    "BUY": 0, "SELL": 1, "BUY_LIMIT": 2, "SELL_LIMIT": 3,
+    "BUY_STOP": 4, "SELL_STOP": 5, "BUY_STOP_LIMIT": 6, "SELL_STOP_LIMIT": 7,
+}
+DEAL_ENTRY_OUT = 1
+DEAL_REASON_EXPERT = 3
+DEAL_REASON_SL = 4
+DEAL_REASON_TP = 5
+
+SIMULATED_URL = "simulated://broker"
+
+
+@dataclass
+class SymbolSpec:
+    """
+    Trading conditions of one simulated symbol.
+
+    Attributes:
+        contract_size: Units per lot (profit = price change x volume x contract_size)
+        spread: Ask minus bid, in price units
+        slippage: Adverse price move on market, stop, SL and close fills, in price units
+        commission_per_lot: Account currency charged per lot on every fill
+        swap_long: Account currency per lot per rollover for buy positions (negative = charge)
+        swap_short: Account currency per lot per rollover for sell positions
+        digits: Price decimals
+        volume_min: Smallest tradable volume
+        volume_step: Volume granularity
+    """
+    contract_size: float = 1.0
+    spread: float = 0.0
+    slippage: float = 0.0
+    commission_per_lot: float = 0.0
+    swap_long: float = 0.0
+    swap_short: float = 0.0
+    digits: int = 5
+    volume_min: float = 0.01
+    volume_step: float = 0.01
+
+
+@dataclass
+class SimulatedPosition:
+    """An open position."""
+    ticket: int
+    symbol: str
+    type: int
+    volume: float
+    price_open: float
+    time: datetime
+    sl: Optional[float] = None
+    tp: Optional[float] = None
+    comment: str = ""
+    magic: int = 0
+    swap: float = 0.0
+    commission: float = 0.0
+
+    @property
+    def is_buy(self) -> bool:
+        return self.type == ORDER_TYPES["BUY"]
+
+
+@dataclass
+class SimulatedOrder:
+    """A pending limit or stop order."""
+    ticket: int
+    symbol: str
+    type: int
+    volume: float
+    price: float
+    time_setup: datetime
+    sl: Optional[float] = None
+    tp: Optional[float] = None
+    comment: str = ""
+    magic: int = 0
+
+    @property
+    def is_buy(self) -> bool:
+        return self.type in (ORDER_TYPES["BUY_LIMIT"], ORDER_TYPES["BUY_STOP"])
+
+
+@dataclass
+class _Quote:
+    """Last bar of a symbol, in bid prices."""
+    open: float
+    high: float
+    low: float
+    close: float
+
+
+class SimulatedBroker:
+    """In-memory MT5 account filled against replayed bars"""
+
+    def __init__(
+        self,
+        symbols: Optional[Dict[str, SymbolSpec]] = None,
+        balance: float = 10000.0,
+        leverage: int = 100,
+        currency: str = "USD",
+        triple_swap_weekday: int = 2,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            symbols: Trading conditions per symbol (others use SymbolSpec defaults)
+            balance: Starting balance
+            leverage: Account leverage used for margin
+            currency: Account currency reported by the account routes
+            triple_swap_weekday: Weekday (Monday=0) whose rollover charges three days of swap
+            logger: Optional logger
+        """
+        self.specs = {name.upper(): spec for name, spec in (symbols or {}).items()}
+        self.balance = balance
+        self.leverage = leverage
+        self.currency = currency
+        self.triple_swap_weekday = triple_swap_weekday
+        self.logger = logger or logging.getLogger('simulated-broker')
+
+        self.positions: Dict[int, SimulatedPosition] = {}
+        self.orders: Dict[int, SimulatedOrder] = {}
+        self.history: List[Dict[str, Any]] = []
+        self.now: Optional[datetime] = None
+
+        self._quotes: Dict[str, _Quote] = {}
+        self._next_ticket = 1000
+        self._subscription: Optional[Tuple[Any, str]] = None
+        self._routes: List[Tuple[str, re.Pattern, Callable[..., Any]]] = [
+            ("GET", re.compile(r"health"), lambda **_: {"status": "ok", "broker": "simulated"}),
+            ("GET", re.compile(r"account"), lambda **_: self.account_info()),
+            ("GET", re.compile(r"account/balance"), lambda **_: {"balance": self.balance}),
+            ("GET", re.compile(r"account/equity"), lambda **_: {"equity": self.equity()}),
+            ("GET", re.compile(r"account/margin"), self._route_margin),
+            ("GET", re.compile(r"account/leverage"), lambda **_: {"leverage": self.leverage}),
+            ("GET", re.compile(r"positions"), lambda **_: [self._position_dict(p) for p in self.positions.values()]),
+            ("POST", re.compile(r"positions/close_all"), self._route_close_all),
+            ("GET", re.compile(r"positions/(?P<symbol>[^/]+)"), self._route_symbol_positions),
+            ("GET", re.compile(r"position/(?P<ticket>\d+)"), self._route_position),
+            ("POST", re.compile(r"positions/(?P<symbol>[^/]+)/update/(?P<ticket>\d+)"), self._route_modify_position),
+            ("POST", re.compile(r"positions/(?P<symbol>[^/]+)/close/(?P<ticket>\d+)"), self._route_close_position),
+            ("GET", re.compile(r"orders"), self._route_orders),
+            ("POST", re.compile(r"orders/create"), self._route_create_order),
+            ("PUT", re.compile(r"orders/update"), self._route_update_order),
+            ("DELETE", re.compile(r"orders/delete"), self._route_delete_order),
+            ("GET", re.compile(r"symbols"), lambda **_: sorted(set(self.specs) | set(self._quotes))),
+            ("GET", re.compile(r"symbols/(?P<symbol>[^/]+)/info"), self._route_symbol_info),
+            ("GET", re.compile(r"symbols/(?P<symbol>[^/]+)/tick"), self._route_tick),
+            ("GET", re.compile(r"symbols/(?P<symbol>[^/]+)/tradable"), self._route_tradable),
+            ("POST", re.compile(r"symbols/select"), self._route_select),
+            ("GET", re.compile(r"history/closed_positions"), self._route_history),
+            ("GET", re.compile(r"history/closed_positions/(?P<ticket>\d+)"), self._route_history_ticket),
+        ]
+
+    # ------------------------------------------------------------------
+    # Market data
+    # ------------------------------------------------------------------
+
+    def attach(self, event_bus: Any, timeframe: str) -> str:
+        """
+        Fill against every NewCandleEvent of one timeframe.
+
+        Subscribe before the trading services so that orders resting during a
+        bar are filled before strategies react to that bar's close.
+
+        Args:
+            event_bus: EventBus the bar replay publishes on
+            timeframe: Timeframe whose bars drive fills (normally the smallest one)
+
+        Returns:
+            Subscription ID
+        """
+        def on_candle(event: NewCandleEvent) -> None:
+            if event.timeframe == timeframe:
+                self.on_bar(event.symbol, event.bar, event.timestamp)
+
+        subscription_id = event_bus.subscribe(NewCandleEvent, on_candle)
+        self._subscription = (event_bus, subscription_id)
+        return subscription_id
+
+    def detach(self) -> None:
+        """Stop following the event bus."""
+        if self._subscription is not None:
+            event_bus, subscription_id = self._subscription
+            event_bus.unsubscribe(subscription_id)
+            self._subscription = None
+
+    def on_bar(self, symbol: str, bar: Any, timestamp: Optional[datetime] = None) -> None:
+        """
+        Advance the simulation by one closed bar of a symbol.
+
+        Args:
+            symbol: Symbol of the bar
+            bar: Mapping or Series with open/high/low/close (bid prices)
+            timestamp: Bar close time (default: the bar's ``time``)
+        """
+        symbol = symbol.upper()
+        now = pd.Timestamp(timestamp if timestamp is not None else bar["time"]).to_pydatetime()
+        self._advance_clock(now)
+
+        quote = _Quote(float(bar["open"]), float(bar["high"]), float(bar["low"]), float(bar["close"]))
+        existing = [p for p in self.positions.values() if p.symbol == symbol]
+        self._trigger_orders(symbol, quote)
+        for position in existing:
+            self._check_exits(position, quote)
+        self._quotes[symbol] = quote
+
+    def set_price(self, symbol: str, bid: float, timestamp: Optional[datetime] = None) -> None:
+        """Set the current price of a symbol without triggering orders (initial state, tests)."""
+        if timestamp is not None:
+            self._advance_clock(pd.Timestamp(timestamp).to_pydatetime())
+        self._quotes[symbol.upper()] = _Quote(bid, bid, bid, bid)
+
+    def spec(self, symbol: str) -> SymbolSpec:
+        """Trading conditions of a symbol."""
+        return self.specs.setdefault(symbol.upper(), SymbolSpec())
+
+    def bid(self, symbol: str) -> float:
+        """Current bid (last close)."""
+        quote = self._quotes.get(symbol.upper())
+        if quote is None:
+            raise MT5APIError(f"No price for {symbol}", status_code=404)
+        return quote.close
+
+    def ask(self, symbol: str) -> float:
+        """Current ask (last close plus spread)."""
+        return self.bid(symbol) + self.spec(symbol).spread
+
+    def _advance_clock(self, now: datetime) -> None:
+        """Move the simulated clock, charging swap at each day rollover passed."""
+        previous, self.now = self.now, now
+        if previous is None or now.date() <= previous.date():
+            return
+        day = previous.date() + timedelta(days=1)
+        while day <= now.date():
+            rolled = day - timedelta(days=1)
+            multiplier = 3 if rolled.weekday() == self.triple_swap_weekday else 1
+            for position in self.positions.values():
+                spec = self.spec(position.symbol)
+                position.swap += (spec.swap_long if position.is_buy else spec.swap_short) * position.volume * multiplier
+            day += timedelta(days=1)
+
+    # ------------------------------------------------------------------
+    # Fills
+    # ------------------------------------------------------------------
+
+    def _trigger_orders(self, symbol: str, quote: _Quote) -> None:
+        """Fill pending orders whose price the bar crossed."""
+        spec = self.spec(symbol)
+        spread, slippage = spec.spread, spec.slippage
+        for order in [o for o in self.orders.values() if o.symbol == symbol]:
+            if order.type == ORDER_TYPES["BUY_LIMIT"] and quote.low + spread <= order.price:
+                price = min(order.price, quote.open + spread)
+            elif order.type == ORDER_TYPES["SELL_LIMIT"] and quote.high >= order.price:
+                price = max(order.price, quote.open)
+            elif order.type == ORDER_TYPES["BUY_STOP"] and quote.high + spread >= order.price:
+                price = max(order.price, quote.open + spread) + slippage
+            elif order.type == ORDER_TYPES["SELL_STOP"] and quote.low <= order.price:
+                price = min(order.price, quote.open) - slippage
+            else:
+                continue
+            del self.orders[order.ticket]
+            self._open_position(
+                symbol, ORDER_TYPES["BUY"] if order.is_buy else ORDER_TYPES["SELL"], order.volume, price,
+                order.sl, order.tp, order.comment, order.magic, ticket=order.ticket,
+            )
+
+    def _check_exits(self, position: SimulatedPosition, quote: _Quote) -> None:
+        """Close a position whose SL or TP the bar reached (stop loss first)."""
+        spec = self.spec(position.symbol)
+        spread, slippage = spec.spread, spec.slippage
+        if position.is_buy:
+            if position.sl and quote.low <= position.sl:
+                self._close(position, position.volume, min(position.sl, quote.open) - slippage, DEAL_REASON_SL)
+            elif position.tp and quote.high >= position.tp:
+                self._close(position, position.volume, max(position.tp, quote.open), DEAL_REASON_TP)
+        else:
+            if position.sl and quote.high + spread >= position.sl:
+                self._close(position, position.volume, max(position.sl, quote.open + spread) + slippage, DEAL_REASON_SL)
+            elif position.tp and quote.low + spread <= position.tp:
+                self._close(position, position.volume, min(position.tp, quote.open + spread), DEAL_REASON_TP)
+
+    def _open_position(
+        self,
+        symbol: str,
+        order_type: int,
+        volume: float,
+        price: float,
+        sl: Optional[float],
+        tp: Optional[float],
+        comment: str,
+        magic: int,
+        ticket: Optional[int] = None
+    ) -> SimulatedPosition:
+        """Open a position and charge the entry commission."""
+        spec = self.spec(symbol)
+        position = SimulatedPosition(
+            ticket=ticket or self._ticket(),
+            symbol=symbol,
+            type=order_type,
+            volume=volume,
+            price_open=round(price, spec.digits),
+            time=self.now,
+            sl=sl or None,
+            tp=tp or None,
+            comment=comment,
+            magic=magic,
+            commission=-spec.commission_per_lot * volume,
+        )
+        self.balance += position.commission
+        self.positions[position.ticket] = position
+        self.logger.debug(f"Opened {position.ticket} {symbol} {'BUY' if position.is_buy else 'SELL'} {volume} @ {position.price_open}")
+        return position
+
+    def _close(self, position: SimulatedPosition, volume: float, price: float, reason: int) -> Dict[str, Any]:
+        """Close all or part of a position and record the exit deal."""
+        spec = self.spec(position.symbol)
+        volume = min(volume, position.volume)
+        price = round(price, spec.digits)
+        direction = 1.0 if position.is_buy else -1.0
+        profit = (price - position.price_open) * direction * volume * spec.contract_size
+        share = volume / position.volume
+        swap = position.swap * share
+        commission = -spec.commission_per_lot * volume
+        entry_commission = position.commission * share
+
+        self.balance += profit + swap + commission
+        position.swap -= swap
+        position.commission -= entry_commission
+        position.volume = round(position.volume - volume, 8)
+        if position.volume <= 0:
+            del self.positions[position.ticket]
+
+        deal = self._ticket()
+        self.history.append({
+            "ticket": deal,
+            "symbol": position.symbol,
+            "price": price,
+            "volume": volume,
+            "profit": profit,
+            "time": self.now.isoformat() if self.now else None,
+            "time_open": position.time.isoformat() if position.time else None,
+            "price_open": position.price_open,
+            "order": deal,
+            "position_id": position.ticket,
+            "external_id": "",
+            "type": ORDER_TYPES["SELL"] if position.is_buy else ORDER_TYPES["BUY"],
+            "comment": position.comment,
+            "commission": entry_commission + commission,
+            "swap": swap,
+            "fee": 0.0,
+            "reason": reason,
+            "entry": DEAL_ENTRY_OUT,
+            "magic": position.magic,
+            "time_msc": int(self.now.timestamp() * 1000) if self.now else 0,
+        })
+        self.logger.debug(f"Closed {volume} of {position.ticket} @ {price}: {profit:+.2f}")
+        return {
+            "retcode": TRADE_RETCODE_DONE, "success": True, "deal": deal, "order": deal,
+            "volume": volume, "price": price, "profit": profit, "comment": "Request executed",
+        }
+
+    def _ticket(self) -> int:
+        self._next_ticket += 1
+        return self._next_ticket
+
+    # ------------------------------------------------------------------
+    # Account
+    # ------------------------------------------------------------------
+
+    def floating_profit(self) -> float:
+        """Open profit of every position at the current price, swaps included."""
+        total = 0.0
+        for position in self.positions.values():
+            spec = self.spec(position.symbol)
+            current = self._close_price(position)
+            direction = 1.0 if position.is_buy else -1.0
+            total += (current - position.price_open) * direction * position.volume * spec.contract_size + position.swap
+        return total
+
+    def equity(self) -> float:
+        """Balance plus open profit."""
+        return self.balance + self.floating_profit()
+
+    def margin(self) -> float:
+        """Used margin at the current prices."""
+        total = 0.0
+        for position in self.positions.values():
+            spec = self.spec(position.symbol)
+            total += position.volume * spec.contract_size * self._close_price(position) / self.leverage
+        return total
+
+    def account_info(self) -> Dict[str, Any]:
+        """Account state as returned by the ``account`` route."""
+        equity, margin = self.equity(), self.margin()
+        return {
+            "login": 0,
+            "server": "simulated",
+            "currency": self.currency,
+            "leverage": self.leverage,
+            "balance": self.balance,
+            "equity": equity,
+            "profit": equity - self.balance,
+            "margin": margin,
+            "margin_free": equity - margin,
+            "margin_level": equity / margin * 100 if margin else 0.0,
+        }
+
+    def _close_price(self, position: SimulatedPosition) -> float:
+        """Price a position would close at now (bid for buys, ask for sells)."""
+        if position.symbol not in self._quotes:
+            return position.price_open
+        return self.bid(position.symbol) if position.is_buy else self.ask(position.symbol)
+
+    # ------------------------------------------------------------------
+    # REST routes
+    # ------------------------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Answer one MT5 API request.
+
+        Args:
+            method: HTTP method
+            path: Route path, e.g. ``positions/XAUUSD/close/1001``
+            params: Query parameters
+            json_data: Request body
+
+        Returns:
+            The ``data`` payload the API server would return
+
+        Raises:
+            MT5APIError: For unknown routes, unknown tickets and rejected requests
+        """
+        path = path.strip("/")
+        for route_method, pattern, handler in self._routes:
+            if route_method != method:
+                continue
+            match = pattern.fullmatch(path)
+            if match:
+                return handler(params=params or {}, body=json_data or {}, **match.groupdict())
+        raise MT5APIError(f"Route not supported by the simulated broker: {method} {path}", status_code=404)
+
+    def _route_margin(self, **_) -> Dict[str, float]:
+        info = self.account_info()
+        return {key: info[key] for key in ("margin", "margin_free", "margin_level")}
+
+    def _route_symbol_positions(self, symbol: str, **_) -> List[Dict[str, Any]]:
+        symbol = symbol.upper()
+        return [self._position_dict(p) for p in self.positions.values() if p.symbol == symbol]
+
+    def _route_position(self, ticket: str, **_) -> Optional[Dict[str, Any]]:
+        position = self.positions.get(int(ticket))
+        return self._position_dict(position) if position else None
+
+    def _route_modify_position(self, symbol: str, ticket: str, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        position = self._find_position(int(ticket))
+        if body.get("stop_loss") is not None:
+            position.sl = body["stop_loss"] or None
+        if body.get("take_profit") is not None:
+            position.tp = body["take_profit"] or None
+        return {"retcode": TRADE_RETCODE_DONE, "success": True, "ticket": position.ticket, "comment": "Request executed"}
+
+    def _route_close_position(self, symbol: str, ticket: str, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        position = self._find_position(int(ticket))
+        volume = body.get("volume") or position.volume
+        return self._close(position, volume, self._market_close_price(position), DEAL_REASON_EXPERT)
+
+    def _route_close_all(self, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        symbol = (body.get("symbol") or "").upper()
+        closed = [
+            self._close(p, p.volume, self._market_close_price(p), DEAL_REASON_EXPERT)
+            for p in list(self.positions.values())
+            if not symbol or p.symbol == symbol
+        ]
+        return {"retcode": TRADE_RETCODE_DONE, "success": True, "closed": len(closed), "comment": "Request executed"}
+
+    def _route_orders(self, params: Dict[str, Any], **_) -> List[Dict[str, Any]]:
+        symbol = (params.get("symbol") or "").upper()
+        return [self._order_dict(o) for o in self.orders.values() if not symbol or o.symbol == symbol]
+
+    def _route_create_order(self, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        symbol = body["symbol"].upper()
+        requested = getattr(body["order_type"], "value", body["order_type"])   # OrderType enum in-process, str over HTTP
+        order_type = ORDER_TYPES.get(str(requested).upper())
+        volume = float(body["volume"])
+        sl, tp = body.get("sl"), body.get("tp")
+        comment, magic = body.get("comment") or "", body.get("magic") or 0
+        spec = self.spec(symbol)
+
+        if order_type in (ORDER_TYPES["BUY"], ORDER_TYPES["SELL"]):
+            buy = order_type == ORDER_TYPES["BUY"]
+            price = self.ask(symbol) + spec.slippage if buy else self.bid(symbol) - spec.slippage
+            position = self._open_position(symbol, order_type, volume, price, sl, tp, comment, magic)
+            return {
+                "retcode": TRADE_RETCODE_DONE, "success": True, "order": position.ticket, "deal": position.ticket,
+                "volume": volume, "price": position.price_open, "comment": "Request executed",
+            }
+
+        if order_type not in (ORDER_TYPES["BUY_LIMIT"], ORDER_TYPES["SELL_LIMIT"], ORDER_TYPES["BUY_STOP"], ORDER_TYPES["SELL_STOP"]):
+            raise MT5APIError(f"Order type {requested} not supported by the simulated broker", status_code=400)
+
+        price = float(body["price"])
+        if symbol in self._quotes:
+            ask, bid = self.ask(symbol), self.bid(symbol)
+            invalid = (
+                (order_type == ORDER_TYPES["BUY_LIMIT"] and price > ask)
+                or (order_type == ORDER_TYPES["SELL_LIMIT"] and price < bid)
+                or (order_type == ORDER_TYPES["BUY_STOP"] and price < ask)
+                or (order_type == ORDER_TYPES["SELL_STOP"] and price > bid)
+            )
+            if invalid:
+                raise MT5APIError(
+                    f"Invalid price {price} for {requested} (bid {bid}, ask {ask})",
+                    status_code=400, error_code="10015",
+                )
+        order = SimulatedOrder(
+            ticket=self._ticket(), symbol=symbol, type=order_type, volume=volume, price=price,
+            time_setup=self.now, sl=sl or None, tp=tp or None, comment=comment, magic=magic,
+        )
+        self.orders[order.ticket] = order
+        return {"retcode": TRADE_RETCODE_DONE, "success": True, "order": order.ticket, "volume": volume,
+                "price": price, "comment": "Request executed"}
+
+    def _route_update_order(self, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        order = self._find_order(int(body["ticket"]))
+        if body.get("price") is not None:
+            order.price = float(body["price"])
+        if body.get("sl") is not None:
+            order.sl = body["sl"] or None
+        if body.get("tp") is not None:
+            order.tp = body["tp"] or None
+        if body.get("comment"):
+            order.comment = body["comment"]
+        return {"retcode": TRADE_RETCODE_DONE, "success": True, "order": order.ticket, "comment": "Request executed"}
+
+    def _route_delete_order(self, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        order = self._find_order(int(body["ticket"]))
+        del self.orders[order.ticket]
+        return {"retcode": TRADE_RETCODE_DONE, "success": True, "order": order.ticket, "comment": "Request executed"}
+
+    def _route_symbol_info(self, symbol: str, **_) -> Dict[str, Any]:
+        spec = self.spec(symbol)
+        info = {
+            "name": symbol.upper(),
+            "digits": spec.digits,
+            "point": 10 ** -spec.digits,
+            "trade_contract_size": spec.contract_size,
+            "volume_min": spec.volume_min,
+            "volume_step": spec.volume_step,
+            "swap_long": spec.swap_long,
+            "swap_short": spec.swap_short,
+        }
+        if symbol.upper() in self._quotes:
+            info.update(bid=self.bid(symbol), ask=self.ask(symbol), spread=round(spec.spread * 10 ** spec.digits))
+        return info
+
+    def _route_tick(self, symbol: str, **_) -> Dict[str, Any]:
+        bid = self.bid(symbol)
+        return {"bid": bid, "ask": self.ask(symbol), "last": bid, "time": self.now.isoformat() if self.now else None}
+
+    def _route_tradable(self, symbol: str, **_) -> Dict[str, Any]:
+        return {"symbol": symbol.upper(), "is_tradable": symbol.upper() in self._quotes}
+
+    def _route_select(self, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        symbol = body["symbol"].upper()
+        if body.get("enable", True):
+            self.spec(symbol)
+        return {"symbol": symbol, "success": True, "action": "added" if body.get("enable", True) else "removed"}
+
+    def _route_history(self, params: Dict[str, Any], **_) -> List[Dict[str, Any]]:
+        start = pd.Timestamp(params["start"]) if params.get("start") else None
+        end = pd.Timestamp(params["end"]) if params.get("end") else None
+        deals = []
+        for deal in self.history:
+            closed = pd.Timestamp(deal["time"])
+            if (start is None or closed >= start) and (end is None or closed <= end):
+                deals.append(dict(deal))
+        return deals
+
+    def _route_history_ticket(self, ticket: str, **_) -> Optional[Dict[str, Any]]:
+        ticket = int(ticket)
+        for deal in self.history:
+            if deal["ticket"] == ticket or deal["position_id"] == ticket:
+                return dict(deal)
+        return None
+
+    def _find_position(self, ticket: int) -> SimulatedPosition:
+        if ticket not in self.positions:
+            raise MT5APIError(f"Position {ticket} not found", status_code=404)
+        return self.positions[ticket]
+
+    def _find_order(self, ticket: int) -> SimulatedOrder:
+        if ticket not in self.orders:
+            raise MT5APIError(f"Order {ticket} not found", status_code=404)
+        return self.orders[ticket]
+
+    def _market_close_price(self, position: SimulatedPosition) -> float:
+        """Closing fill of a market close: bid/ask moved against the trader by the slippage."""
+        slippage = self.spec(position.symbol).slippage
+        return self._close_price(position) - slippage if position.is_buy else self._close_price(position) + slippage
+
+    def _position_dict(self, position: SimulatedPosition) -> Dict[str, Any]:
+        spec = self.spec(position.symbol)
+        current = self._close_price(position)
+        direction = 1.0 if position.is_buy else -1.0
+        return {
+            "ticket": position.ticket,
+            "symbol": position.symbol,
+            "volume": position.volume,
+            "type": position.type,
+            "price_open": position.price_open,
+            "price_current": current,
+            "profit": (current - position.price_open) * direction * position.volume * spec.contract_size,
+            "swap": position.swap,
+            "commission": position.commission,
+            "comment": position.comment,
+            "magic": position.magic,
+            "time": position.time.isoformat() if position.time else None,
+            "sl": position.sl,
+            "tp": position.tp,
+        }
+
+    def _order_dict(self, order: SimulatedOrder) -> Dict[str, Any]:
+        current = None
+        if order.symbol in self._quotes:
+            current = self.ask(order.symbol) if order.is_buy else self.bid(order.symbol)
+        return {
+            "ticket": order.ticket,
+            "symbol": order.symbol,
+            "volume": order.volume,
+            "volume_initial": order.volume,
+            "volume_current": order.volume,
+            "type": order.type,
+            "price_open": order.price,
+            "price_current": current,
+            "sl": order.sl,
+            "tp": order.tp,
+            "comment": order.comment,
+            "magic": order.magic,
+            "time_setup": order.time_setup.isoformat() if order.time_setup else None,
+            "state": 1,
+        }
+
+
+class _BrokerTransport:
+    """Sends an endpoint client's requests to a SimulatedBroker instead of over HTTP."""
+
+    broker: SimulatedBroker
+
+    def _request_sync(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        return self.broker.request(method, path, params=params, json_data=json_data)
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self._request_sync("GET", path, params=params)
+
+
+def _endpoint(client_class: type, broker: SimulatedBroker) -> BaseClient:
+    """Instantiate a real endpoint client bound to the broker."""
+    simulated = type(f"Simulated{client_class.__name__}", (_BrokerTransport, client_class), {})
+    endpoint = simulated(SIMULATED_URL)
+    endpoint.broker = broker
+    return endpoint
+
+
+class SimulatedMT5Client(_BrokerTransport, MT5Client):
+    """MT5Client backed by an in-process SimulatedBroker"""
+
+    def __init__(self, broker: Optional[SimulatedBroker] = None):
+        """
+        Args:
+            broker: Simulated account to trade on (default: a new SimulatedBroker)
+        """
+        BaseClient.__init__(self, SIMULATED_URL)
+        self.broker = broker or SimulatedBroker()
+        self._positions = _endpoint(PositionsClient, self.broker)
+        self._orders = _endpoint(OrdersClient, self.broker)
+        self._symbols = _endpoint(SymbolsClient, self.broker)
+        self._data = _endpoint(DataClient, self.broker)
+        self._account = _endpoint(AccountClient, self.broker)
+        self._history = _endpoint(HistoryClient, self.broker)
+
+    def __repr__(self) -> str:
+        return f"SimulatedMT5Client(balance={self.broker.balance:.2f}, positions={len(self.broker.positions)})"
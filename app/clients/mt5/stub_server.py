@@ -0,0 +1,713 @@
+"""
+Local stand-in for the MT5 API server, for load and latency testing.
+
+MT5StubServer is a small threaded HTTP server answering the routes the MT5
+client uses, so the real network path (BaseClient._request_sync, retry_sync,
+the six endpoint clients, httpx connection handling) can be exercised without
+a broker bridge:
+
+- ``symbols/{symbol}/bars`` is served from a BarFeed of synthetic or recorded
+  bars, revealing only the bars that have opened by the current clock time
+- every other route (positions, orders, history, account, symbols) is
+  answered by a SimulatedBroker, whose prices follow the feed's smallest
+  timeframe
+
+Network conditions are configurable per server:
+- LatencyProfile: constant, uniform, normal, lognormal or exponential delay
+  added to every request (real sleeps; this models the wire, not the market)
+- FaultProfile: share of requests answered with HTTP 500 or HTTP 429
+  (with Retry-After), optionally only on matching paths
+- max_concurrency: requests beyond the limit queue for a slot, like a bridge
+  with a fixed worker pool; queueing time is reported in the stats
+
+Bar visibility follows the process-wide clock (app.utils.clock), so a
+SimulatedClock advanced between rounds makes new candles appear without
+waiting for them.
+
+Example:
+    ```python
+    feed = BarFeed.synthetic(["XAUUSD", "EURUSD"], ["1", "5"], history_days=3)
+    with MT5StubServer(feed=feed, latency=LatencyProfile("lognormal", 20, 10)) as server:
+        client = MT5Client(server.url)
+        bars = client.data.fetch_bars("XAUUSD", "M1", num_bars=3)
+        print(server.stats())
+    ```
+
+Run standalone (serves until Ctrl+C):
+
+    python -m app.clients.mt5.stub_server --symbol XAUUSD --symbol EURUSD --latency lognormal:20:10 --port 8000
+"""
+
+import argparse
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from app.clients.mt5.exceptions import MT5APIError
+from app.clients.mt5.simulated import SimulatedBroker, SymbolSpec
+from app.data.bar_cache import timeframe_delta
+from app.strategy_builder.core.domain.enums import TimeFrameEnum
+from app.utils.clock import Clock, get_clock
+
+
+TIMEFRAME_VALUES = {tf.name: tf.value for tf in TimeFrameEnum}
+BAR_COLUMNS = ("open", "high", "low", "close", "tick_volume", "spread", "real_volume")
+LATENCY_DISTRIBUTIONS = ("none", "constant", "uniform", "normal", "lognormal", "exponential")
+
+
+@dataclass
+class LatencyProfile:
+    """
+    Delay added to every request.
+
+    Attributes:
+        distribution: none, constant, uniform, normal, lognormal or exponential
+        mean_ms: Mean delay in milliseconds
+        jitter_ms: Spread in milliseconds (uniform half-width, normal and
+            lognormal standard deviation; ignored by constant and exponential)
+        seed: Optional random seed
+    """
+    distribution: str = "none"
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{self.distribution}' (use one of {LATENCY_DISTRIBUTIONS})")
+        if self.mean_ms < 0 or self.jitter_ms < 0:
+            raise ValueError("Latency mean and jitter must not be negative")
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        """
+        Parse ``distribution[:mean_ms[:jitter_ms]]``, e.g. ``lognormal:20:10``.
+
+        Args:
+            spec: Profile specification
+
+        Returns:
+            LatencyProfile
+        """
+        parts = spec.split(":")
+        values = [float(p) for p in parts[1:3]]
+        return cls(parts[0], *values)
+
+    def sample(self) -> float:
+        """Draw one delay, in seconds."""
+        mean, jitter = self.mean_ms, self.jitter_ms
+        if self.distribution == "none" or mean == 0:
+            return 0.0
+        if self.distribution == "constant":
+            return mean / 1000.0
+
+        with self._lock:
+            if self.distribution == "uniform":
+                delay = self._rng.uniform(mean - jitter, mean + jitter)
+            elif self.distribution == "normal":
+                delay = self._rng.gauss(mean, jitter)
+            elif self.distribution == "lognormal":
+                sigma = math.sqrt(math.log1p((jitter / mean) ** 2))
+                delay = self._rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)
+            else:
+                delay = self._rng.expovariate(1.0 / mean)
+        return max(delay, 0.0) / 1000.0
+
+
+@dataclass
+class FaultProfile:
+    """
+    Injected failures.
+
+    Attributes:
+        error_rate: Share of requests answered with HTTP 500
+        throttle_rate: Share of requests answered with HTTP 429
+        retry_after: Retry-After seconds sent with 429 responses
+        path_pattern: Only inject on paths matching this regex (default: all)
+        seed: Optional random seed
+    """
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    path_pattern: Optional[str] = None
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if not 0 <= self.error_rate + self.throttle_rate <= 1:
+            raise ValueError("error_rate + throttle_rate must be between 0 and 1")
+        self._pattern = re.compile(self.path_pattern) if self.path_pattern else None
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    def draw(self, path: str) -> Optional[int]:
+        """Return the HTTP status to inject for a request (None for no fault)."""
+        if self.error_rate == 0 and self.throttle_rate == 0:
+            return None
+        if self._pattern is not None and not self._pattern.search(path):
+            return None
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.error_rate:
+            return 500
+        if roll < self.error_rate + self.throttle_rate:
+            return 429
+        return None
+
+
+class BarFeed:
+    """
+    Bars per (symbol, timeframe), revealed as the clock passes their open time.
+
+    The latest visible bar is the one still forming at the clock time, as the
+    live API returns it. Bar times are naive UTC-labelled broker times; an
+    aware clock time is converted to naive UTC before comparing.
+    """
+
+    def __init__(self, frames: Dict[Tuple[str, str], pd.DataFrame], clock: Optional[Clock] = None):
+        """
+        Initialize the feed.
+
+        Args:
+            frames: Bars per (symbol, timeframe value) with a ``time`` column
+                of open times and open/high/low/close/tick_volume columns
+            clock: Clock deciding which bars are visible (default: the process-wide clock)
+        """
+        self.clock = clock
+        self._streams: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+        for (symbol, timeframe), bars in frames.items():
+            self._streams[(symbol.upper(), timeframe)] = self._build_stream(bars)
+
+    @classmethod
+    def synthetic(
+        cls,
+        symbols: Sequence[str],
+        timeframes: Sequence[str],
+        history_days: float = 5.0,
+        horizon: timedelta = timedelta(days=1),
+        base_price: float = 100.0,
+        volatility: float = 0.0005,
+        seed: int = 0,
+        clock: Optional[Clock] = None
+    ) -> "BarFeed":
+        """
+        Generate random-walk bars around the current clock time.
+
+        Each timeframe gets ``history_days`` of bars before now and ``horizon``
+        of bars after it, so new candles keep appearing while the clock runs.
+
+        Args:
+            symbols: Symbols to generate
+            timeframes: Timeframe values (e.g. "1", "5", "60")
+            history_days: Days of history before the current time
+            horizon: Bars generated beyond the current time
+            base_price: Starting price of the first symbol (others are offset)
+            volatility: Log-return standard deviation per minute
+            seed: Random seed
+            clock: Clock for the current time and bar visibility
+
+        Returns:
+            BarFeed
+        """
+        now = pd.Timestamp(_naive_utc((clock or get_clock()).now()))
+        rng = np.random.default_rng(seed)
+        frames = {}
+        for i, symbol in enumerate(symbols):
+            price = base_price * (1 + i)
+            for timeframe in timeframes:
+                length = timeframe_delta(timeframe)
+                first = (now - pd.Timedelta(days=history_days)).floor(length)
+                times = pd.date_range(first, now + pd.Timedelta(horizon), freq=length, inclusive="left")
+                steps = rng.normal(0.0, volatility * math.sqrt(length / pd.Timedelta(minutes=1)), len(times))
+                close = price * np.exp(np.cumsum(steps))
+                open_ = np.r_[price, close[:-1]]
+                wick = np.abs(rng.normal(0.0, volatility * price, len(times)))
+                frames[(symbol, timeframe)] = pd.DataFrame({
+                    "time": times,
+                    "open": open_,
+                    "high": np.maximum(open_, close) + wick,
+                    "low": np.minimum(open_, close) - wick,
+                    "close": close,
+                    "tick_volume": rng.integers(1, 500, len(times)),
+                    "spread": 2,
+                    "real_volume": 0,
+                })
+        return cls(frames, clock=clock)
+
+    @classmethod
+    def recorded(
+        cls,
+        data_path: str,
+        symbols: Sequence[str],
+        timeframes: Sequence[str],
+        data_format: str = "parquet",
+        clock: Optional[Clock] = None
+    ) -> "BarFeed":
+        """
+        Load recorded bars with the backtest data source.
+
+        Args:
+            data_path: Backtest data directory
+            symbols: Symbols to load
+            timeframes: Timeframe values to load
+            data_format: "parquet" or "arrow"
+            clock: Clock for bar visibility
+
+        Returns:
+            BarFeed
+        """
+        from app.data.data_manger import DataSourceManager
+
+        frames = {}
+        for symbol in symbols:
+            manager = DataSourceManager(mode="backtest", data_path=data_path, symbol=symbol, data_format=data_format)
+            manager.load_backtest_data(list(timeframes))
+            for timeframe in timeframes:
+                frames[(symbol, timeframe)] = manager.get_historical_data(symbol, timeframe)
+        return cls(frames, clock=clock)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols in the feed."""
+        return sorted({symbol for symbol, _ in self._streams})
+
+    def timeframes(self, symbol: str) -> List[str]:
+        """Timeframe values of a symbol, shortest first."""
+        return sorted((tf for s, tf in self._streams if s == symbol.upper()), key=timeframe_delta)
+
+    def bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        num_bars: Optional[int] = None,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Visible bars of a stream, in the API's bar format.
+
+        Args:
+            symbol: Symbol
+            timeframe: Timeframe value ("5") or MT5 name ("M5")
+            num_bars: Latest-bars mode: number of bars ending at the forming bar
+            start: Range mode: first open time (inclusive)
+            end: Range mode: last open time (inclusive)
+
+        Returns:
+            List of bar dicts with ISO time strings
+
+        Raises:
+            MT5APIError: If the symbol or timeframe is not in the feed
+        """
+        stream = self._stream(symbol, timeframe)
+        hi = self._visible(stream)
+        if start is not None or end is not None:
+            lo = 0 if start is None else int(np.searchsorted(stream["time_ns"], _bound_ns(start), side="left"))
+            if end is not None:
+                hi = min(hi, int(np.searchsorted(stream["time_ns"], _bound_ns(end), side="right")))
+        else:
+            lo = max(hi - int(num_bars or 10), 0)
+
+        columns = {name: stream[name][lo:hi].tolist() for name in ("time", *BAR_COLUMNS)}
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def last_closed(self, symbol: str) -> Optional[Tuple[Dict[str, float], datetime]]:
+        """
+        Latest closed bar of the symbol's shortest timeframe.
+
+        Returns:
+            (bar, close time), or None before the first bar closes
+        """
+        timeframe = self.timeframes(symbol)[0]
+        stream = self._stream(symbol, timeframe)
+        now_ns = self._now_ns()
+        index = int(np.searchsorted(stream["close_ns"], now_ns, side="right")) - 1
+        if index < 0:
+            return None
+        bar = {name: float(stream[name][index]) for name in ("open", "high", "low", "close")}
+        return bar, pd.Timestamp(int(stream["close_ns"][index])).to_pydatetime()
+
+    def _stream(self, symbol: str, timeframe: str) -> Dict[str, np.ndarray]:
+        key = (symbol.upper(), TIMEFRAME_VALUES.get(timeframe, timeframe))
+        if key not in self._streams:
+            raise MT5APIError(f"No bars for {symbol} {timeframe}", status_code=404)
+        return self._streams[key]
+
+    def _now_ns(self) -> int:
+        return pd.Timestamp(_naive_utc((self.clock or get_clock()).now())).value
+
+    def _visible(self, stream: Dict[str, np.ndarray]) -> int:
+        """Number of bars open at the current time."""
+        return int(np.searchsorted(stream["time_ns"], self._now_ns(), side="right"))
+
+    @staticmethod
+    def _build_stream(bars: pd.DataFrame) -> Dict[str, np.ndarray]:
+        bars = bars.sort_values("time", kind="stable").reset_index(drop=True)
+        times = pd.DatetimeIndex(pd.to_datetime(bars["time"]))
+        if times.tz is not None:
+            times = times.tz_convert("UTC").tz_localize(None)
+        length = times[1] - times[0] if len(times) > 1 else pd.Timedelta(minutes=1)
+
+        stream = {
+            "time_ns": times.asi8,
+            "close_ns": (times + length).asi8,
+            "time": np.array([t.isoformat() for t in times], dtype=object),
+        }
+        for name in BAR_COLUMNS:
+            if name in bars:
+                values = bars[name].to_numpy()
+            else:
+                values = np.zeros(len(bars), dtype=np.int64)
+            stream[name] = values.astype(np.float64 if name in ("open", "high", "low", "close") else np.int64)
+        return stream
+
+
+@dataclass
+class StubServerStats:
+    """
+    Request counters of a stub server.
+
+    Attributes:
+        requests: Requests received
+        by_route: Requests per ``METHOD route`` (symbols and tickets as placeholders)
+        status_codes: Responses per HTTP status
+        injected_errors: HTTP 500 responses injected by the fault profile
+        throttled: HTTP 429 responses injected by the fault profile
+        max_in_flight: Highest number of requests handled at once
+        queue_seconds: Total time requests waited for a concurrency slot
+        latency_seconds: Total injected latency
+    """
+    requests: int = 0
+    by_route: Dict[str, int] = field(default_factory=dict)
+    status_codes: Dict[int, int] = field(default_factory=dict)
+    injected_errors: int = 0
+    throttled: int = 0
+    max_in_flight: int = 0
+    queue_seconds: float = 0.0
+    latency_seconds: float = 0.0
+
+
+class MT5StubServer:
+    """Threaded HTTP stand-in for the MT5 API server."""
+
+    def __init__(
+        self,
+        broker: Optional[SimulatedBroker] = None,
+        feed: Optional[BarFeed] = None,
+        latency: Optional[LatencyProfile] = None,
+        faults: Optional[FaultProfile] = None,
+        max_concurrency: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the server (call start() to listen).
+
+        Args:
+            broker: Account answering trading routes (default: a new SimulatedBroker
+                with a default SymbolSpec for every feed symbol)
+            feed: Bars for ``symbols/{symbol}/bars`` (default: no bars)
+            latency: Delay added to every request (default: none)
+            faults: Injected 500/429 responses (default: none)
+            max_concurrency: Requests handled at once (default: unlimited)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            logger: Optional logger
+        """
+        self.feed = feed
+        self.broker = broker or SimulatedBroker({symbol: SymbolSpec() for symbol in (feed.symbols if feed else [])})
+        self.latency = latency or LatencyProfile()
+        self.faults = faults or FaultProfile()
+        self.max_concurrency = max_concurrency
+        self.host = host
+        self.port = port
+        self.logger = logger or logging.getLogger('mt5-stub-server')
+
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._broker_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = StubServerStats()
+        self._in_flight = 0
+        self._synced: Dict[str, datetime] = {}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to MT5Client."""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "MT5StubServer":
+        """Start serving on a background thread."""
+        if self._httpd is not None:
+            return self
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _handler_class(self))
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mt5-stub-server", daemon=True)
+        self._thread.start()
+        self.logger.info(f"✓ MT5 stub server listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = self._thread = None
+        self.logger.info("MT5 stub server stopped")
+
+    def __enter__(self) -> "MT5StubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def stats(self) -> StubServerStats:
+        """Snapshot of the request counters."""
+        with self._stats_lock:
+            return StubServerStats(
+                requests=self._stats.requests,
+                by_route=dict(self._stats.by_route),
+                status_codes=dict(self._stats.status_codes),
+                injected_errors=self._stats.injected_errors,
+                throttled=self._stats.throttled,
+                max_in_flight=self._stats.max_in_flight,
+                queue_seconds=self._stats.queue_seconds,
+                latency_seconds=self._stats.latency_seconds,
+            )
+
+    def reset_stats(self) -> None:
+        """Zero the request counters."""
+        with self._stats_lock:
+            self._stats = StubServerStats()
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+        """
+        Answer one request (transport independent).
+
+        Args:
+            method: HTTP method
+            path: Request path without the query string
+            params: Query parameters
+            body: JSON body
+
+        Returns:
+            (HTTP status, extra headers, JSON payload)
+        """
+        path = path.strip("/")
+        delay = 0.0
+        queued = time.perf_counter()
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            waited = time.perf_counter() - queued
+            with self._stats_lock:
+                self._in_flight += 1
+                self._stats.max_in_flight = max(self._stats.max_in_flight, self._in_flight)
+                self._stats.queue_seconds += waited
+
+            delay = self.latency.sample()
+            if delay > 0:
+                time.sleep(delay)
+
+            status, headers, payload = self._respond(method, path, params or {}, body or {})
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+        with self._stats_lock:
+            stats = self._stats
+            stats.requests += 1
+            stats.latency_seconds += delay
+            route = f"{method} {_route_key(path)}"
+            stats.by_route[route] = stats.by_route.get(route, 0) + 1
+            stats.status_codes[status] = stats.status_codes.get(status, 0) + 1
+            stats.injected_errors += status == 500 and payload.get("error_code") == "INJECTED"
+            stats.throttled += status == 429
+        return status, headers, payload
+
+    def _respond(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, Any],
+        body: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+        fault = self.faults.draw(path)
+        if fault == 429:
+            return 429, {"Retry-After": str(self.faults.retry_after)}, {
+                "success": False, "message": "Too many requests", "error_code": "RATE_LIMITED"}
+        if fault == 500:
+            return 500, {}, {"success": False, "message": "Injected server error", "error_code": "INJECTED"}
+
+        try:
+            bars = re.fullmatch(r"symbols/(?P<symbol>[^/]+)/bars", path)
+            if method == "GET" and bars:
+                if self.feed is None:
+                    raise MT5APIError("No bar feed configured", status_code=404)
+                data = self.feed.bars(
+                    bars["symbol"],
+                    params.get("timeframe", "M1"),
+                    num_bars=int(params["num_bars"]) if params.get("num_bars") else None,
+                    start=params.get("start"),
+                    end=params.get("end"),
+                )
+            else:
+                with self._broker_lock:
+                    self._sync_prices()
+                    data = self.broker.request(method, path, params=params, json_data=body)
+        except MT5APIError as e:
+            return e.status_code or 400, {}, {"success": False, "message": str(e), "error_code": e.error_code}
+        except (KeyError, TypeError, ValueError) as e:
+            return 400, {}, {"success": False, "message": f"Bad request: {e}"}
+        return 200, {}, {"success": True, "data": data}
+
+    def _sync_prices(self) -> None:
+        """Feed each symbol's newly closed bar to the broker (fills pending orders, SL/TP)."""
+        if self.feed is None:
+            return
+        for symbol in self.feed.symbols:
+            closed = self.feed.last_closed(symbol)
+            if closed is None or self._synced.get(symbol) == closed[1]:
+                continue
+            bar, close_time = closed
+            self.broker.on_bar(symbol, bar, close_time)
+            self._synced[symbol] = close_time
+
+
+def _handler_class(server: MT5StubServer) -> type:
+    """Request handler class bound to a stub server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _dispatch(self) -> None:
+            url = urlsplit(self.path)
+            params = dict(parse_qsl(url.query))
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+
+            status, headers, payload = server.handle(self.command, url.path, params, body)
+
+            content = json.dumps(payload, default=_json_default).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+        def log_message(self, format: str, *args: Any) -> None:
+            server.logger.debug(format % args)
+
+    return Handler
+
+
+def _route_key(path: str) -> str:
+    """Route with symbols and tickets replaced by placeholders (for per-route counts)."""
+    path = re.sub(r"^(symbols|positions)/(?!close_all$|select$)[^/]+", r"\1/{symbol}", path)
+    return re.sub(r"/\d+(?=/|$)", "/{ticket}", path)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return pd.Timestamp(value).tz_convert("UTC").tz_localize(None).to_pydatetime()
+
+
+def _bound_ns(value: Any) -> int:
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m app.clients.mt5.stub_server --symbol XAUUSD --timeframe 1 --timeframe 5 --port 8000
+        python -m app.clients.mt5.stub_server --symbol XAUUSD --data ./data --latency lognormal:20:10 --error-rate 0.01
+    """
+    parser = argparse.ArgumentParser(description="Local MT5 API stand-in server")
+    parser.add_argument("--symbol", action="append", dest="symbols", required=True)
+    parser.add_argument("--timeframe", action="append", dest="timeframes")
+    parser.add_argument("--data", help="Serve recorded bars from this backtest data directory")
+    parser.add_argument("--history-days", type=float, default=5.0)
+    parser.add_argument("--latency", type=LatencyProfile.parse, default=LatencyProfile())
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int)
+    parser.add_argument("--balance", type=float, default=10000.0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    timeframes = args.timeframes or ["1", "5", "15"]
+    if args.data:
+        feed = BarFeed.recorded(args.data, args.symbols, timeframes)
+    else:
+        feed = BarFeed.synthetic(args.symbols, timeframes, history_days=args.history_days)
+
+    server = MT5StubServer(
+        broker=SimulatedBroker({symbol.upper(): SymbolSpec() for symbol in args.symbols}, balance=args.balance),
+        feed=feed,
+        latency=args.latency,
+        faults=FaultProfile(error_rate=args.error_rate, throttle_rate=args.throttle_rate),
+        max_concurrency=args.max_concurrency,
+        host=args.host,
+        port=args.port,
+    )
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(server.stats())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,560 @@
+"""
+Local historical bar cache.
+
+Stores fetched OHLCV bars on disk as Parquet so that a restart only has to
+download the bars after the last cached one instead of the full
+HISTORY_DAYS_LOOKUP window.
+
+On-disk layout (partitioned by symbol / timeframe / month):
+
+    <root>/XAUUSD/240/2024-01.parquet            compacted month
+    <root>/XAUUSD/240/2024-02.parquet
+    <root>/XAUUSD/240/2024-02.1718000000123.parquet   appended segment
+    ...
+
+Appends never rewrite existing data: each append writes one new segment per
+month it touches. ``compact()`` merges a month's segments back into a single
+de-duplicated file, and runs automatically once a month has more than
+``compact_threshold`` segments. Files are written to a temporary name and
+renamed into place, so a crash mid-write never leaves a torn partition.
+
+Gaps the broker has no bars for (holidays, trading halts) are recorded with
+``mark_empty_gaps()`` in an ``empty_gaps.json`` file next to the partitions
+and are no longer reported as gaps afterwards.
+
+Example:
+    ```python
+    cache = BarCache("data/bar_cache")
+
+    cached = cache.load("XAUUSD", "240", start=pd.Timestamp("2024-01-01"))
+    cache.append("XAUUSD", "240", new_bars)
+
+    report = cache.check_integrity("XAUUSD", "240")
+    if not report.ok:
+        print(report.gaps)
+
+    cache.compact()
+    ```
+"""
+
+EMPTY_GAPS_FILE = "empty_gaps.json"
+
+import argparse
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+def timeframe_delta(timeframe: str) -> pd.Timedelta:
+    """
+    Get the bar length of a timeframe value.
+
+    Args:
+        timeframe: Timeframe value (e.g., "5", "240", "1d")
+
+    Returns:
+        Bar length as a Timedelta
+
+    Raises:
+        ValueError: If the timeframe is unknown
+    """
+    if timeframe == "1d":
+        return pd.Timedelta(days=1)
+    if timeframe.isdigit():
+        return pd.Timedelta(minutes=int(timeframe))
+    raise ValueError(f"Invalid timeframe value: {timeframe}")
+
+
+def align_timestamp(value: Any, reference: pd.Series) -> pd.Timestamp:
+    """Convert value to a Timestamp comparable with the reference time column."""
+    ts = pd.Timestamp(value)
+    ref_tz = getattr(reference.dt, "tz", None)
+    if ref_tz is not None and ts.tzinfo is None:
+        return ts.tz_localize(ref_tz)
+    if ref_tz is None and ts.tzinfo is not None:
+        return ts.tz_convert("UTC").tz_localize(None)
+    return ts
+
+
+def normalize_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse times, keep the last copy of each bar and sort by time."""
+    df = df.copy()
+    df["time"] = pd.to_datetime(df["time"])
+    df = df.drop_duplicates(subset="time", keep="last")
+    return df.sort_values("time", kind="stable").reset_index(drop=True)
+
+
+@dataclass
+class CacheGap:
+    """A run of missing bars between two cached bars."""
+
+    after: pd.Timestamp
+    before: pd.Timestamp
+    missing_bars: int
+
+
+@dataclass
+class CacheIntegrityReport:
+    """Result of a cache integrity check for one symbol/timeframe."""
+
+    symbol: str
+    timeframe: str
+    rows: int = 0
+    segments: int = 0
+    duplicate_rows: int = 0
+    unreadable_files: List[str] = field(default_factory=list)
+    gaps: List[CacheGap] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True when there are no gaps or unreadable files (duplicates are resolved on read)."""
+        return not (self.gaps or self.unreadable_files)
+
+
+class BarCache:
+    """
+    Parquet-backed bar cache partitioned by symbol, timeframe and month.
+
+    Bars are keyed by their ``time`` column. When the same bar is stored more
+    than once, the most recently appended copy wins.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        compact_threshold: int = 16,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the bar cache.
+
+        Args:
+            root: Cache root directory (created if missing)
+            compact_threshold: Compact a month once it has more segments than this
+            logger: Optional logger
+        """
+        if compact_threshold < 1:
+            raise ValueError("compact_threshold must be at least 1")
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compact_threshold = compact_threshold
+        self.logger = logger or logging.getLogger('bar-cache')
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None
+    ) -> pd.DataFrame:
+        """
+        Load cached bars, de-duplicated and sorted by time.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe value (e.g., "240")
+            start: Optional inclusive lower bound on bar time
+            end: Optional exclusive upper bound on bar time
+
+        Returns:
+            DataFrame of cached bars (empty if nothing is cached)
+        """
+        months = self._month_files(symbol, timeframe)
+        if start is not None:
+            first_month = pd.Timestamp(start).strftime("%Y-%m")
+            months = {m: files for m, files in months.items() if m >= first_month}
+        if end is not None:
+            last_month = pd.Timestamp(end).strftime("%Y-%m")
+            months = {m: files for m, files in months.items() if m <= last_month}
+
+        frames = []
+        for month in sorted(months):
+            for path in months[month]:
+                df = self._read_file(path)
+                if df is not None and not df.empty:
+                    frames.append(df)
+
+        if not frames:
+            return pd.DataFrame()
+
+        df = normalize_bars(pd.concat(frames, ignore_index=True))
+        if start is not None:
+            df = df[df["time"] >= align_timestamp(start, df["time"])]
+        if end is not None:
+            df = df[df["time"] < align_timestamp(end, df["time"])]
+        return df.reset_index(drop=True)
+
+    def last_bar_time(self, symbol: str, timeframe: str) -> Optional[pd.Timestamp]:
+        """
+        Get the time of the latest cached bar.
+
+        Only the newest month is read.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe value
+
+        Returns:
+            Latest cached bar time, or None if nothing is cached
+        """
+        months = self._month_files(symbol, timeframe)
+        for month in sorted(months, reverse=True):
+            df = self.load(symbol, timeframe, start=f"{month}-01")
+            if not df.empty:
+                return df["time"].iloc[-1]
+        return None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, symbol: str, timeframe: str, bars: pd.DataFrame) -> int:
+        """
+        Store bars in the cache.
+
+        Writes one new segment per month touched. Bars already in the cache
+        are replaced by the new copy when read back.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe value
+            bars: DataFrame with at least a ``time`` column
+
+        Returns:
+            Number of bars written
+        """
+        if bars is None or bars.empty:
+            return 0
+
+        df = normalize_bars(bars)
+        directory = self._series_dir(symbol, timeframe)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        stamp = time.time_ns()
+        months = df["time"].dt.strftime("%Y-%m")
+        for month, month_df in df.groupby(months, sort=True):
+            self._write_file(directory / f"{month}.{stamp}.parquet", month_df)
+
+            segments = len(self._month_files(symbol, timeframe).get(month, []))
+            if segments > self.compact_threshold:
+                self._compact_month(symbol, timeframe, month)
+
+        self.logger.debug(f"Cached {len(df)} bars for {symbol} {timeframe}")
+        return len(df)
+
+    def compact(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> Dict[str, int]:
+        """
+        Merge every month's segments into a single de-duplicated file.
+
+        Args:
+            symbol: Limit to one symbol (default: all)
+            timeframe: Limit to one timeframe (default: all)
+
+        Returns:
+            Dictionary with months compacted, files removed and rows kept
+        """
+        stats = {"months": 0, "files_removed": 0, "rows": 0}
+        for sym, tf in self.series(symbol, timeframe):
+            for month, files in self._month_files(sym, tf).items():
+                if len(files) < 2:
+                    continue
+                removed, rows = self._compact_month(sym, tf, month)
+                stats["months"] += 1
+                stats["files_removed"] += removed
+                stats["rows"] += rows
+
+        if stats["months"]:
+            self.logger.info(
+                f"✓ Compacted {stats['months']} month(s), removed {stats['files_removed']} segment(s)"
+            )
+        return stats
+
+    # ------------------------------------------------------------------
+    # Integrity
+    # ------------------------------------------------------------------
+
+    def check_integrity(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        skip_weekends: bool = True
+    ) -> CacheIntegrityReport:
+        """
+        Check cached bars for unreadable files, duplicates and missing bars.
+
+        A gap is any step between consecutive bars longer than one bar. With
+        ``skip_weekends`` (default), gaps that span a Saturday or Sunday are
+        treated as market closures and not reported.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe value
+            start: Optional inclusive lower bound on bar time
+            end: Optional exclusive upper bound on bar time
+            skip_weekends: Ignore gaps that include a weekend day and gaps
+                recorded with ``mark_empty_gaps()``
+
+        Returns:
+            CacheIntegrityReport
+        """
+        report = CacheIntegrityReport(symbol=symbol, timeframe=timeframe)
+
+        frames = []
+        for files in self._month_files(symbol, timeframe).values():
+            for path in files:
+                report.segments += 1
+                df = self._read_file(path)
+                if df is None:
+                    report.unreadable_files.append(str(path))
+                elif not df.empty:
+                    frames.append(df[["time"]])
+
+        if not frames:
+            return report
+
+        times = pd.concat(frames, ignore_index=True)["time"]
+        times = pd.to_datetime(times)
+        if start is not None:
+            times = times[times >= align_timestamp(start, times)]
+        if end is not None:
+            times = times[times < align_timestamp(end, times)]
+
+        report.duplicate_rows = int(times.duplicated().sum())
+        times = times.drop_duplicates().sort_values().reset_index(drop=True)
+        report.rows = len(times)
+        report.gaps = self.find_gaps(
+            times, timeframe, skip_weekends=skip_weekends,
+            known_empty=self.empty_gaps(symbol, timeframe) if skip_weekends else None,
+        )
+        return report
+
+    @staticmethod
+    def find_gaps(
+        times: pd.Series,
+        timeframe: str,
+        skip_weekends: bool = True,
+        known_empty: Optional[Collection[Tuple[pd.Timestamp, pd.Timestamp]]] = None
+    ) -> List[CacheGap]:
+        """
+        Find runs of missing bars in a sorted series of bar times.
+
+        Args:
+            times: Sorted, de-duplicated bar times
+            timeframe: Timeframe value
+            skip_weekends: Ignore gaps that include a weekend day
+            known_empty: (after, before) ranges the broker has no bars for,
+                as returned by ``empty_gaps()``
+
+        Returns:
+            List of CacheGap, oldest first
+        """
+        if len(times) < 2:
+            return []
+
+        bar = timeframe_delta(timeframe)
+        times = pd.Series(pd.to_datetime(times)).reset_index(drop=True)
+        steps = times.diff()
+
+        skip = {(_naive_utc(after), _naive_utc(before)) for after, before in known_empty or ()}
+
+        gaps = []
+        for i in steps.index[steps > bar]:
+            after, before = times.iloc[i - 1], times.iloc[i]
+            if skip_weekends and _spans_weekend(after, before):
+                continue
+            if (_naive_utc(after), _naive_utc(before)) in skip:
+                continue
+            gaps.append(CacheGap(
+                after=after,
+                before=before,
+                missing_bars=int((before - after) / bar) - 1,
+            ))
+        return gaps
+
+    def empty_gaps(self, symbol: str, timeframe: str) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Get the gaps recorded as having no bars at the broker.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe value
+
+        Returns:
+            List of (after, before) bar times as naive UTC timestamps
+        """
+        path = self._series_dir(symbol, timeframe) / EMPTY_GAPS_FILE
+        if not path.exists():
+            return []
+        try:
+            ranges = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            self.logger.error(f"✗ Unreadable empty gap file {path}: {e}")
+            return []
+        return [(pd.Timestamp(after), pd.Timestamp(before)) for after, before in ranges]
+
+    def mark_empty_gaps(self, symbol: str, timeframe: str, gaps: Sequence[CacheGap]) -> None:
+        """
+        Record gaps the broker returned no bars for, so they are not fetched again.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe value
+            gaps: Gaps whose fetch came back empty
+        """
+        if not gaps:
+            return
+
+        ranges = set(self.empty_gaps(symbol, timeframe))
+        ranges.update((_naive_utc(gap.after), _naive_utc(gap.before)) for gap in gaps)
+
+        directory = self._series_dir(symbol, timeframe)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / EMPTY_GAPS_FILE
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(
+            [[after.isoformat(), before.isoformat()] for after, before in sorted(ranges)], indent=2
+        ))
+        os.replace(tmp_path, path)
+        self.logger.debug(f"Recorded {len(gaps)} empty gap(s) for {symbol} {timeframe}")
+
+    # ------------------------------------------------------------------
+    # Layout helpers
+    # ------------------------------------------------------------------
+
+    def series(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        List cached (symbol, timeframe) pairs.
+
+        Args:
+            symbol: Limit to one symbol
+            timeframe: Limit to one timeframe
+
+        Returns:
+            Sorted list of (symbol, timeframe)
+        """
+        pairs = []
+        for symbol_dir in sorted(p for p in self.root.iterdir() if p.is_dir()):
+            if symbol is not None and symbol_dir.name != symbol.upper():
+                continue
+            for tf_dir in sorted(p for p in symbol_dir.iterdir() if p.is_dir()):
+                if timeframe is not None and tf_dir.name != timeframe:
+                    continue
+                pairs.append((symbol_dir.name, tf_dir.name))
+        return pairs
+
+    def _series_dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / symbol.upper() / timeframe
+
+    def _month_files(self, symbol: str, timeframe: str) -> Dict[str, List[Path]]:
+        """Map month -> partition files, compacted file first then segments in append order."""
+        directory = self._series_dir(symbol, timeframe)
+        if not directory.exists():
+            return {}
+
+        months: Dict[str, List[Tuple[int, Path]]] = {}
+        for path in directory.glob("*.parquet"):
+            parts = path.name.split(".")
+            month = parts[0]
+            order = int(parts[1]) if len(parts) == 3 and parts[1].isdigit() else 0
+            months.setdefault(month, []).append((order, path))
+
+        return {month: [p for _, p in sorted(files)] for month, files in months.items()}
+
+    def _compact_month(self, symbol: str, timeframe: str, month: str) -> Tuple[int, int]:
+        """Merge one month's files into ``<month>.parquet``. Returns (files removed, rows)."""
+        files = self._month_files(symbol, timeframe).get(month, [])
+        frames = [df for df in (self._read_file(p) for p in files) if df is not None and not df.empty]
+        if not frames:
+            return 0, 0
+
+        merged = normalize_bars(pd.concat(frames, ignore_index=True))
+        target = self._series_dir(symbol, timeframe) / f"{month}.parquet"
+        self._write_file(target, merged)
+
+        removed = 0
+        for path in files:
+            if path != target:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed, len(merged)
+
+    def _read_file(self, path: Path) -> Optional[pd.DataFrame]:
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            self.logger.error(f"✗ Unreadable cache file {path}: {e}")
+            return None
+
+    @staticmethod
+    def _write_file(path: Path, df: pd.DataFrame) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        df.to_parquet(tmp_path, engine="pyarrow", index=False)
+        os.replace(tmp_path, path)
+
+
+
+def _naive_utc(ts: Any) -> pd.Timestamp:
+    """Convert a timestamp to naive UTC so cached and recorded bar times compare equal."""
+    ts = pd.Timestamp(ts)
+    return ts.tz_convert("UTC").tz_localize(None) if ts.tzinfo is not None else ts
+
+
+def _spans_weekend(after: pd.Timestamp, before: pd.Timestamp) -> bool:
+    """True if any calendar day from after to before is a Saturday or Sunday."""
+    days = pd.date_range(after.normalize(), before.normalize(), freq="D")
+    return bool((days.dayofweek >= 5).any())
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m app.data.bar_cache check data/bar_cache --symbol XAUUSD
+        python -m app.data.bar_cache compact data/bar_cache
+    """
+    parser = argparse.ArgumentParser(description="Inspect and maintain the local bar cache")
+    parser.add_argument("command", choices=["check", "compact"])
+    parser.add_argument("cache_dir")
+    parser.add_argument("--symbol")
+    parser.add_argument("--timeframe")
+    args = parser.parse_args(argv)
+
+    cache = BarCache(args.cache_dir)
+
+    if args.command == "compact":
+        stats = cache.compact(args.symbol, args.timeframe)
+        print(f"Compacted {stats['months']} month(s), removed {stats['files_removed']} segment(s)")
+        return 0
+
+    failed = 0
+    for symbol, timeframe in cache.series(args.symbol, args.timeframe):
+        report = cache.check_integrity(symbol, timeframe)
+        status = "OK" if report.ok else "ISSUES"
+        print(
+            f"{symbol:<10} {timeframe:>4}  {report.rows:>8} rows  {report.segments:>3} files  "
+            f"{len(report.gaps):>3} gaps  {report.duplicate_rows:>4} dupes  {status}"
+        )
+        for gap in report.gaps:
+            print(f"    gap {gap.after} -> {gap.before} ({gap.missing_bars} bars)")
+        for path in report.unreadable_files:
+            print(f"    unreadable {path}")
+        failed += not report.ok
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
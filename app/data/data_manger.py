@@ -15,20 +15,33 @@ class DataSourceManager:
         Args:
             mode: "live" or "backtest"
             **kwargs: Additional arguments based on mode
-                For live mode: client, date_helper
-                For backtest mode: data_path, symbol
+                For live mode: client, date_helper, optional bar_cache (BarCache)
+                For backtest mode: data_path, symbol, optional data_format
+                    ("parquet" default, or "arrow" for memory-mapped files)
         """
         self.mode = mode
 
         if mode == "live":
             if "client" not in kwargs or "date_helper" not in kwargs:
                 raise ValueError("Live mode requires 'client' and 'date_helper' parameters")
-            self.data_source = LiveDataSource(kwargs["client"], kwargs["date_helper"])
+            self.data_source = LiveDataSource(
+                kwargs["client"],
+                kwargs["date_helper"],
+                bar_cache=kwargs.get("bar_cache")
+            )
 
         elif mode == "backtest":
             if "data_path" not in kwargs or "symbol" not in kwargs:
                 raise ValueError("Backtest mode requires 'data_path' and 'symbol' parameters")
-            self.data_source = BacktestDataSource(kwargs["data_path"], kwargs["symbol"])
+            data_format = kwargs.get("data_format", "parquet")
+            if data_format == "arrow":
+                # pyarrow is only needed for mapped files; live mode must not import it
+                from app.data.mapped_backtest_data import MappedBacktestDataSource
+                self.data_source = MappedBacktestDataSource(kwargs["data_path"], kwargs["symbol"])
+            elif data_format == "parquet":
+                self.data_source = BacktestDataSource(kwargs["data_path"], kwargs["symbol"])
+            else:
+                raise ValueError(f"Invalid data_format: {data_format}. Must be 'parquet' or 'arrow'")
 
         else:
             raise ValueError(f"Invalid mode: {mode}. Must be 'live' or 'backtest'")
@@ -41,6 +54,12 @@ class DataSourceManager:
         """Get streaming data from the appropriate source"""
         return self.data_source.get_stream_data(symbol, timeframe, nbr_bars)
 
+    def get_stream_data_since(self, symbol: str, timeframe: str, since, nbr_bars: int = 3) -> pd.DataFrame:
+        """Get bars after the `since` cursor, or the latest nbr_bars if the source has no cursor support"""
+        if since is not None and hasattr(self.data_source, 'get_stream_data_since'):
+            return self.data_source.get_stream_data_since(symbol, timeframe, since, nbr_bars)
+        return self.data_source.get_stream_data(symbol, timeframe, nbr_bars)
+
     def load_backtest_data(self, timeframes: list):
         """Load backtest data if in backtest mode"""
         if self.mode == "backtest" and hasattr(self.data_source, 'load_data'):
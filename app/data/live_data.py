@@ -1,4 +1,8 @@
+import logging
+from typing import Optional
+
 from app.clients.mt5.client import MT5Client
+from app.data.bar_cache import BarCache, align_timestamp, normalize_bars
 from app.data.data_interface import DataSourceInterface
 from app.strategy_builder.core.domain.enums import TimeFrameEnum
 from app.utils.date_helper import DateHelper
@@ -8,37 +12,131 @@ import pandas as pd
 class LiveDataSource(DataSourceInterface):
     """Data source for live trading using MT5 client"""
 
-    def __init__(self, client: MT5Client, date_helper: DateHelper):
+    HISTORY_DAYS_LOOKUP = { "1": 30, "5": 50, "15": 50, "30": 100, "60": 100, "240": 150 }
+
+    def __init__(
+        self,
+        client: MT5Client,
+        date_helper: DateHelper,
+        bar_cache: Optional[BarCache] = None,
+        max_gap_fills: int = 5
+    ):
+        """
+        Args:
+            client: MT5 API client
+            date_helper: Date helper for the history window
+            bar_cache: Optional local bar cache; when set, history is loaded from
+                disk and only the missing ranges are downloaded
+            max_gap_fills: Maximum cached gaps re-fetched per history load
+        """
         self.client = client
         self.date_helper = date_helper
-        self.HISTORY_DAYS_LOOKUP = { "1": 30, "5": 50, "15": 50, "30": 100, "60": 100, "240": 150 }
+        self.bar_cache = bar_cache
+        self.max_gap_fills = max_gap_fills
+        self.logger = logging.getLogger('live-data')
 
 
     def get_historical_data(self, symbol: str, timeframe: str) -> pd.DataFrame:
-        """Fetch historical data from MT5 client"""
+        """Fetch historical data from MT5 client (through the bar cache when configured)"""
         # Find the corresponding TimeFrameEnum by value and get its name
         tf_name = self._get_timeframe_name(timeframe)
 
         start_date = self.date_helper.get_date_days_ago( self.HISTORY_DAYS_LOOKUP.get(timeframe, 7) )
         end_date = self.date_helper.get_date_days_ago(-1)
 
+        if self.bar_cache is not None:
+            return self._get_cached_historical_data(symbol, timeframe, tf_name, start_date, end_date)
 
-        data = self.client.data.fetch_bars(
-            symbol,
-            timeframe=tf_name,
-            start=f"{start_date}T00:00:00Z",
-            end=f"{end_date}T00:00:00Z"
-        )
-        # Convert list of HistoricalBar objects to list of dictionaries
-        bars_dict = [bar.model_dump() for bar in data]
-        df = pd.DataFrame(bars_dict)
+        df = self._fetch_range(symbol, tf_name, f"{start_date}T00:00:00Z", f"{end_date}T00:00:00Z")
 
         # Handle empty dataframe case
         if df.empty:
             return df
 
-        df["time"] = pd.to_datetime(df["time"])
-
+        return self._drop_forming_bar(df)
+
+    def _get_cached_historical_data(
+        self,
+        symbol: str,
+        timeframe: str,
+        tf_name: str,
+        start_date: str,
+        end_date: str
+    ) -> pd.DataFrame:
+        """
+        Load history from the bar cache and download only what it is missing.
+
+        Missing ranges are: everything (empty cache), the part of the window
+        before the first cached bar, up to ``max_gap_fills`` gaps inside the
+        cached range (gaps the broker had no bars for are recorded in the cache
+        and skipped on later loads), and everything from the last cached bar onwards. The last
+        cached bar is fetched again so a bar cached while still forming is
+        replaced by its final version.
+        """
+        start = pd.Timestamp(start_date)
+        end_param = f"{end_date}T00:00:00Z"
+        cached = self.bar_cache.load(symbol, timeframe, start=start)
+
+        fetched = []
+        if cached.empty:
+            fetched.append(self._fetch_range(symbol, tf_name, f"{start_date}T00:00:00Z", end_param))
+        else:
+            first_time, last_time = cached["time"].iloc[0], cached["time"].iloc[-1]
+
+            if self._naive_utc(first_time) - start > pd.Timedelta(days=1):
+                fetched.append(self._fetch_range(
+                    symbol, tf_name, f"{start_date}T00:00:00Z", self._to_api_time(first_time)
+                ))
+
+            gaps = BarCache.find_gaps(
+                cached["time"], timeframe, known_empty=self.bar_cache.empty_gaps(symbol, timeframe)
+            )
+            empty_gaps = []
+            for gap in gaps[:self.max_gap_fills]:
+                bars = self._fetch_range(
+                    symbol, tf_name, self._to_api_time(gap.after), self._to_api_time(gap.before)
+                )
+                if bars.empty or not self._has_bars_between(bars, gap.after, gap.before):
+                    empty_gaps.append(gap)
+                fetched.append(bars)
+            # Holidays and halts have no bars - don't ask for them again on every boot
+            self.bar_cache.mark_empty_gaps(symbol, timeframe, empty_gaps)
+
+            fetched.append(self._fetch_range(symbol, tf_name, self._to_api_time(last_time), end_param))
+
+            self.logger.info(
+                f"Bar cache {symbol} {timeframe}: {len(cached)} cached bars up to {last_time}, "
+                f"{len(gaps)} gap(s)"
+            )
+
+        new_bars = [df for df in fetched if not df.empty]
+        if not new_bars:
+            return cached
+
+        downloaded = pd.concat(new_bars, ignore_index=True)
+        combined = normalize_bars(pd.concat([cached, downloaded], ignore_index=True))
+        combined = self._drop_forming_bar(combined)
+
+        # Cache only the downloaded bars that survived the forming-bar filter
+        closed = downloaded[downloaded["time"].isin(combined["time"])]
+        self.bar_cache.append(symbol, timeframe, closed)
+        self.logger.info(f"✓ Downloaded {len(closed)} bars for {symbol} {timeframe} (cache hit: {len(cached)})")
+
+        return combined[combined["time"] >= align_timestamp(start, combined["time"])].reset_index(drop=True)
+
+    @staticmethod
+    def _has_bars_between(bars: pd.DataFrame, after: pd.Timestamp, before: pd.Timestamp) -> bool:
+        """True if any fetched bar falls strictly inside a cache gap"""
+        times = pd.to_datetime(bars["time"])
+        return bool(((times > align_timestamp(after, times)) & (times < align_timestamp(before, times))).any())
+
+    def _fetch_range(self, symbol: str, tf_name: str, start: str, end: str) -> pd.DataFrame:
+        """Fetch bars between two API time strings as a DataFrame"""
+        # History requests can be 100k+ bars - decode column-wise instead of per-bar models
+        return self.client.data.fetch_bars_frame(symbol, timeframe=tf_name, start=start, end=end)
+
+    def _drop_forming_bar(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Remove today's latest bar, which is still forming"""
         # Get the row with the max time
         date_today = self.date_helper.get_today()
         max_time = df["time"].max()
@@ -52,6 +150,16 @@ class LiveDataSource(DataSourceInterface):
 
         return df
 
+    @staticmethod
+    def _naive_utc(ts: pd.Timestamp) -> pd.Timestamp:
+        """Drop the timezone of a bar time (converted to UTC first)"""
+        ts = pd.Timestamp(ts)
+        return ts.tz_convert("UTC").tz_localize(None) if ts.tzinfo is not None else ts
+
+    def _to_api_time(self, ts: pd.Timestamp) -> str:
+        """Format a bar time as an API time string"""
+        return self._naive_utc(ts).strftime("%Y-%m-%dT%H:%M:%SZ")
+
     def get_stream_data(self, symbol: str, timeframe: str, nbr_bars: int = 3) -> pd.DataFrame:
         """Get streaming data from MT5 client"""
         tf_name = self._get_timeframe_name(timeframe)
@@ -67,6 +175,26 @@ class LiveDataSource(DataSourceInterface):
 
         return df
 
+    def get_stream_data_since(self, symbol: str, timeframe: str, since, nbr_bars: int = 3) -> pd.DataFrame:
+        """Get only the bars after `since` (cursor fetch); falls back to the latest nbr_bars without a cursor"""
+        if since is None:
+            return self.get_stream_data(symbol, timeframe, nbr_bars)
+
+        tf_name = self._get_timeframe_name(timeframe)
+
+        if isinstance(since, pd.Timestamp):
+            since = since.to_pydatetime()
+
+        data = self.client.data.fetch_bars(symbol, timeframe=tf_name, since=since)
+
+        bars_dict = [bar.model_dump() for bar in data]
+        df = pd.DataFrame(bars_dict)
+
+        if not df.empty:
+            df["time"] = pd.to_datetime(df["time"])
+
+        return df
+
     def _get_timeframe_name(self, timeframe_value: str) -> str:
         """Convert timeframe value to MT5 timeframe name"""
         for tf in TimeFrameEnum:
@@ -0,0 +1,265 @@
+"""
+Memory-mapped backtest data source.
+
+BacktestDataSource reads whole ``{symbol}_{tf}.parquet`` files into pandas and
+copies them on every access. MappedBacktestDataSource instead memory-maps
+Arrow IPC files (``{symbol}_{tf}.arrow``) holding only the columns the
+pipeline needs, and hands out DataFrames built on read-only NumPy views of the
+mapped pages:
+
+- ``get_historical_data`` wraps the full mapping without copying
+- ``get_stream_data`` advances an integer cursor and wraps a view of the next
+  bars, so each step costs the same regardless of file size
+- pages are loaded by the OS on first touch and shared between processes
+  backtesting the same symbol
+
+Convert the existing parquet layout once with ``convert_parquet_to_arrow``
+(reads parquet row group by row group, selected columns only):
+
+    python -m app.data.mapped_backtest_data convert ./data --symbol xauusd
+
+Example:
+    ```python
+    source = MappedBacktestDataSource("./data", "xauusd")
+    source.load_data(["1", "5", "60"])
+
+    history = source.get_historical_data("xauusd", "60")
+    bars = source.get_stream_data("xauusd", "1", nbr_bars=3)
+    ```
+
+Returned DataFrames are read-only views: add columns or copy before
+modifying values in place.
+"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.data.data_interface import DataSourceInterface
+
+
+DEFAULT_COLUMNS = ("time", "open", "high", "low", "close", "tick_volume")
+
+
+def convert_parquet_to_arrow(
+    data_path: str,
+    symbol: str,
+    timeframes: Optional[Sequence[str]] = None,
+    columns: Sequence[str] = DEFAULT_COLUMNS,
+    output_path: Optional[str] = None,
+    logger: Optional[logging.Logger] = None
+) -> Dict[str, int]:
+    """
+    Convert ``{symbol}_{tf}.parquet`` files into memory-mappable Arrow files.
+
+    Parquet files are read one row group at a time and only ``columns`` are
+    decoded. Times are stored as timestamp[ns] and the table is written as a
+    single contiguous record batch so readers can map every column as one
+    NumPy array.
+
+    Args:
+        data_path: Folder containing the parquet files
+        symbol: Symbol name (matched lowercase, as in BacktestDataSource)
+        timeframes: Timeframes to convert (default: every parquet file found)
+        columns: Columns to keep; ``time`` is required
+        output_path: Output folder (default: data_path)
+        logger: Optional logger
+
+    Returns:
+        Dictionary mapping timeframe -> rows written
+    """
+    logger = logger or logging.getLogger('mapped-backtest-data')
+    if "time" not in columns:
+        raise ValueError("columns must include 'time'")
+
+    source_dir = Path(data_path)
+    target_dir = Path(output_path) if output_path else source_dir
+    target_dir.mkdir(parents=True, exist_ok=True)
+    symbol = symbol.lower()
+
+    if timeframes is None:
+        prefix = f"{symbol}_"
+        timeframes = sorted(p.stem[len(prefix):] for p in source_dir.glob(f"{prefix}*.parquet"))
+
+    written = {}
+    for tf in timeframes:
+        source = source_dir / f"{symbol}_{tf}.parquet"
+        if not source.exists():
+            logger.warning(f"Parquet file not found for timeframe {tf}: {source}")
+            continue
+
+        parquet_file = pq.ParquetFile(source)
+        available = set(parquet_file.schema_arrow.names)
+        missing = [c for c in columns if c not in available]
+        if missing:
+            raise ValueError(f"{source} is missing columns {missing}")
+
+        chunks: Dict[str, List[pa.Array]] = {name: [] for name in columns}
+        for index in range(parquet_file.num_row_groups):
+            group = parquet_file.read_row_group(index, columns=list(columns))
+            for name in columns:
+                chunks[name].extend(_normalize_column(name, group.column(name)).chunks)
+
+        arrays = [pa.concat_arrays(chunks[name]) if chunks[name] else pa.array([]) for name in columns]
+        table = pa.Table.from_arrays(arrays, names=list(columns))
+
+        target = target_dir / f"{symbol}_{tf}.arrow"
+        tmp_target = target.with_name(target.name + ".tmp")
+        with pa.OSFile(str(tmp_target), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+        tmp_target.replace(target)
+
+        written[tf] = table.num_rows
+        logger.info(f"✓ Converted {source.name} -> {target.name} ({table.num_rows} rows, {len(columns)} columns)")
+
+    return written
+
+
+def _normalize_column(name: str, column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Cast times to timestamp[ns] and prices to float64."""
+    if name == "time":
+        if pa.types.is_timestamp(column.type):
+            return column.cast(pa.timestamp("ns", tz=column.type.tz))
+        return pa.chunked_array([pa.array(pd.to_datetime(column.to_pandas()), type=pa.timestamp("ns"))])
+    if name in ("open", "high", "low", "close"):
+        return column.cast(pa.float64())
+    return column
+
+
+class MappedBacktestDataSource(DataSourceInterface):
+    """Backtest data source over memory-mapped Arrow files"""
+
+    def __init__(self, data_path: str, symbol: str, logger: Optional[logging.Logger] = None):
+        self.data_path = Path(data_path)
+        self.symbol = symbol.lower()
+        self.logger = logger or logging.getLogger('mapped-backtest-data')
+
+        self.columns: Dict[str, Dict[str, np.ndarray]] = {}
+        self.frames: Dict[str, pd.DataFrame] = {}
+        self.lengths: Dict[str, int] = {}
+        self.current_index: Dict[str, int] = {}
+        self._maps: Dict[str, pa.MemoryMappedFile] = {}
+
+    def load_data(self, timeframes: list):
+        """Memory-map the Arrow file of each timeframe (no data is read yet)"""
+        for tf in timeframes:
+            file_path = self.data_path / f"{self.symbol}_{tf}.arrow"
+
+            if not file_path.exists():
+                self.logger.warning(
+                    f"Arrow file not found for timeframe {tf}: {file_path} "
+                    f"(convert with: python -m app.data.mapped_backtest_data convert {self.data_path})"
+                )
+                continue
+
+            mapped = pa.memory_map(str(file_path), "r")
+            table = pa.ipc.open_file(mapped).read_all()
+
+            views = {}
+            for name in table.column_names:
+                column = table.column(name)
+                if column.num_chunks == 1:
+                    views[name] = column.chunk(0).to_numpy(zero_copy_only=False)
+                else:
+                    # Files written by convert_parquet_to_arrow have one chunk; others are combined once
+                    views[name] = column.combine_chunks().to_numpy(zero_copy_only=False)
+
+            time_type = table.schema.field("time").type
+            tz = time_type.tz if pa.types.is_timestamp(time_type) else None
+            frame_data = dict(views)
+            if tz is not None:
+                # Timezone-aware times need their own (converted) array; prices stay mapped
+                frame_data["time"] = pd.DatetimeIndex(views["time"]).tz_localize("UTC").tz_convert(tz)
+
+            self.columns[tf] = views
+            self.frames[tf] = pd.DataFrame(frame_data, copy=False)
+            self.lengths[tf] = table.num_rows
+            self.current_index[tf] = 0
+            self._maps[tf] = mapped
+
+            self.logger.info(f"Mapped {table.num_rows} rows for timeframe {tf} ({', '.join(table.column_names)})")
+
+    def get_historical_data(self, symbol: str, timeframe: str) -> pd.DataFrame:
+        """Get every bar of a timeframe as a read-only view"""
+        if timeframe not in self.columns:
+            self.logger.warning(f"No data loaded for timeframe {timeframe}")
+            return pd.DataFrame()
+
+        return self._frame(timeframe, 0, self.lengths[timeframe])
+
+    def get_stream_data(self, symbol: str, timeframe: str, nbr_bars: int = 3) -> pd.DataFrame:
+        """Simulate streaming by returning a view of the next bars and advancing the cursor"""
+        if timeframe not in self.columns:
+            return pd.DataFrame()
+
+        current_idx = self.current_index.get(timeframe, 0)
+        end_idx = min(current_idx + nbr_bars, self.lengths[timeframe])
+        self.current_index[timeframe] = end_idx
+
+        return self._frame(timeframe, current_idx, end_idx)
+
+    def reset_index(self, timeframe: Optional[str] = None):
+        """Reset the current index for streaming simulation"""
+        if timeframe:
+            self.current_index[timeframe] = 0
+        else:
+            for tf in self.current_index:
+                self.current_index[tf] = 0
+
+    def close(self):
+        """Release the memory maps"""
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps.clear()
+        self.columns.clear()
+        self.frames.clear()
+        self.lengths.clear()
+        self.current_index.clear()
+
+    def _frame(self, timeframe: str, start: int, end: int) -> pd.DataFrame:
+        """Rows [start, end) as a new DataFrame object over the mapped data (no values copied)"""
+        # Shallow copy detaches the slice so callers can add columns without touching the base frame
+        frame = self.frames[timeframe].iloc[start:end].copy(deep=False)
+        frame.index = pd.RangeIndex(end - start)
+        return frame
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m app.data.mapped_backtest_data convert ./data --symbol xauusd
+        python -m app.data.mapped_backtest_data convert ./data --symbol xauusd --timeframe 1 --timeframe 5
+    """
+    parser = argparse.ArgumentParser(description="Convert backtest parquet files to memory-mappable Arrow files")
+    parser.add_argument("command", choices=["convert"])
+    parser.add_argument("data_path")
+    parser.add_argument("--symbol", required=True)
+    parser.add_argument("--timeframe", action="append", dest="timeframes")
+    parser.add_argument("--column", action="append", dest="columns", help="Column to keep (repeatable)")
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    written = convert_parquet_to_arrow(
+        args.data_path,
+        args.symbol,
+        timeframes=args.timeframes,
+        columns=tuple(args.columns) if args.columns else DEFAULT_COLUMNS,
+        output_path=args.output,
+    )
+    for tf, rows in written.items():
+        print(f"{args.symbol.lower()}_{tf}.arrow  {rows} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
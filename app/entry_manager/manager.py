@@ -19,6 +19,7 @@ from ..strategy_builder.core.domain.enums import TimeFrameEnum
 from ..strategy_builder.data.dtos import EntryDecision, ExitDecision, Trades
 from ..utils.functions_helper import generate_magic_number
 from ..utils.logger import AppLogger
+from ..utils import clock
 
 
 class EntryManager(EntryManagerInterface):
@@ -345,7 +346,7 @@ class EntryManager(EntryManagerInterface):
         exits: List[ExitDecision] = []
         
         # Extract decision time from market data
-        decision_time = datetime.now()
+        decision_time = clock.now()
         if market_data:
             # Try to get time from market data
             for timeframe_data in market_data.values():
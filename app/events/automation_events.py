@@ -11,6 +11,7 @@ from enum import Enum
 from typing import Optional
 
 from app.events.base import Event
+from app.utils import clock
 
 
 class AutomationAction(str, Enum):
@@ -62,4 +63,4 @@ class AutomationStateChangedEvent(Event):
         """Set changed_at to current time if not provided."""
         if self.changed_at is None:
             # Use object.__setattr__ because dataclass is frozen
-            object.__setattr__(self, 'changed_at', datetime.now())
+            object.__setattr__(self, 'changed_at', clock.now())
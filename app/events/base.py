@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Protocol, TypeVar, Optional
 
+from app.utils import clock
+
 
 @dataclass(frozen=True, kw_only=True)
 class Event:
@@ -25,7 +27,7 @@ class Event:
         correlation_id: Correlation ID for tracing event flow (optional)
     """
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=clock.now)
     correlation_id: Optional[str] = field(default=None)
 
     def __repr__(self) -> str:
@@ -1,9 +1,32 @@
 import pandas as pd
-from typing import Dict
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List
 
 from app.indicators.indicator_factory import IndicatorFactory
 
 
+@dataclass
+class HandlerChange:
+    """
+    Result of IndicatorManager.apply_config().
+
+    Attributes:
+        added (List[str]): Handlers created (new, or parameters changed).
+        removed (List[str]): Handlers dropped (removed, or parameters changed).
+        added_values (pd.DataFrame): Output columns of the added handlers over the retained history.
+        removed_columns (List[str]): Output columns no longer produced.
+    """
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    added_values: pd.DataFrame = field(default_factory=pd.DataFrame)
+    removed_columns: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+
 class IndicatorManager:
     """
     Orchestrates the computation of multiple technical indicators over historical or live market data.
@@ -24,7 +47,11 @@ class IndicatorManager:
             is_bulk (bool): Whether to use bulk computation (vectorized) or row-wise.
         """
         self.original_historical = historical_data.copy()
+        self.config = dict(config)
+        self.is_bulk = is_bulk
         self.handlers = IndicatorFactory(config).create_handlers()
+        # Raw rows seen since startup, so handlers added later can be warmed on the same window
+        self._live_rows: deque = deque(maxlen=max(len(historical_data), 1))
         if is_bulk:
             self.historical_data = self.bulk_compute()
         else:
@@ -76,6 +103,114 @@ class IndicatorManager:
         Returns:
             pd.Series: Row with computed indicator values.
         """
+        self._retain(row)
         for handler in self.handlers.values():
             row = handler.compute(row)
         return row
+
+    def retained_history(self) -> pd.DataFrame:
+        """
+        Returns the raw bars available for warming new handlers.
+
+        The startup history followed by the bars processed since, trimmed to
+        the length of the startup history (the window a restart would load).
+
+        Returns:
+            pd.DataFrame: Raw market data, oldest first.
+        """
+        if not self._live_rows:
+            return self.original_historical.copy()
+        live = pd.DataFrame(list(self._live_rows))
+        history = pd.concat([self.original_historical, live], ignore_index=True)
+        return history.tail(len(self.original_historical) or len(live)).reset_index(drop=True)
+
+    def apply_config(self, config: Dict[str, dict]) -> HandlerChange:
+        """
+        Switch to a new indicator configuration in place.
+
+        Handlers whose parameters are unchanged keep their state. New handlers
+        (and handlers whose parameters changed) are warmed on the retained
+        history the same way the manager was built: with the bulk kernels in
+        bulk mode, row by row otherwise, so their values match a restart.
+
+        Args:
+            config (Dict[str, dict]): The new configuration dictionary.
+
+        Returns:
+            HandlerChange: Handlers added and removed, with the added outputs.
+        """
+        created = IndicatorFactory(config).create_handlers()
+        handlers = {}
+        change = HandlerChange()
+        for name, handler in created.items():
+            current = self.handlers.get(name)
+            if current is not None and self.config.get(name) == config.get(name):
+                handlers[name] = current
+            else:
+                handlers[name] = handler
+                change.added.append(name)
+
+        for name, handler in self.handlers.items():
+            if handlers.get(name) is not handler:
+                change.removed.append(name)
+                change.removed_columns.extend(handler.get_output_columns())
+
+        self.config = dict(config)
+        if not change.changed:
+            return change
+
+        added = [handlers[name] for name in change.added]
+        change.added_values = self._warm(added, self.retained_history())
+        change.removed_columns = [
+            column for column in change.removed_columns if column not in change.added_values.columns
+        ]
+        self.handlers = handlers
+
+        data = self.historical_data.drop(columns=change.removed_columns, errors="ignore")
+        self.historical_data = _merge_by_time(data, change.added_values)
+        return change
+
+    def _warm(self, handlers: List, history: pd.DataFrame) -> pd.DataFrame:
+        """Compute the output columns of handlers over history, advancing their state."""
+        if self.is_bulk:
+            data = history
+            for handler in handlers:
+                data = handler.bulk_compute(data)
+        else:
+            rows = []
+            for _, row in history.iterrows():
+                for handler in handlers:
+                    row = handler.compute(row)
+                rows.append(row)
+            data = pd.DataFrame(rows, index=history.index)
+
+        columns = [column for handler in handlers for column in handler.get_output_columns()]
+        keys = ["time"] if "time" in data.columns else []
+        return data[keys + [column for column in columns if column in data.columns]]
+
+    def _retain(self, row: pd.Series) -> None:
+        """Keep a raw row, replacing the last one when it is the same bar again."""
+        if self._live_rows and "time" in row.index and "time" in self._live_rows[-1].index:
+            if pd.Timestamp(self._live_rows[-1]["time"]) == pd.Timestamp(row["time"]):
+                self._live_rows[-1] = row
+                return
+        self._live_rows.append(row)
+
+
+def _merge_by_time(data: pd.DataFrame, values: pd.DataFrame) -> pd.DataFrame:
+    """Add the columns of values to data, matching rows by time (by position without a time column)."""
+    columns = [column for column in values.columns if column != "time"]
+    if not columns:
+        return data
+    data = data.copy()
+    if "time" in data.columns and "time" in values.columns:
+        indexed = values.assign(time=pd.to_datetime(values["time"])).drop_duplicates("time", keep="last")
+        indexed = indexed.set_index("time")
+        times = pd.to_datetime(data["time"])
+        for column in columns:
+            data[column] = times.map(indexed[column]).values
+    else:
+        aligned = values[columns].tail(len(data))
+        for column in columns:
+            data[column] = pd.Series(aligned[column].values, index=data.index[-len(aligned):])
+    return data
@@ -13,6 +13,8 @@ Key Features:
 - Bulk and single-row processing modes
 - Thread-safe operations for live trading
 - Comprehensive error handling and validation
+- In-place configuration reload (only changed indicator handlers are rebuilt)
+- Optional previous_* columns (strategies can read older bars from the buffer)
 
 Architecture:
 - Composition-based design with clear separation of concerns
@@ -24,7 +26,7 @@ from collections import deque
 from typing import Dict, Optional, List
 import pandas as pd
 import logging
-from app.indicators.indicator_manager import IndicatorManager
+from app.indicators.indicator_manager import HandlerChange, IndicatorManager
 from app.indicators.processors.historical_data_processor import HistoricalDataProcessor
 from app.indicators.processors.recent_row_processor import RecentRowsProcessor
 
@@ -70,7 +72,8 @@ class IndicatorProcessor:
                  configs: Dict[str, dict],
                  historicals: Dict[str, pd.DataFrame],
                  is_bulk: bool,
-                 recent_rows_limit: int = DEFAULT_RECENT_ROWS_LIMIT):
+                 recent_rows_limit: int = DEFAULT_RECENT_ROWS_LIMIT,
+                 materialize_previous: bool = True):
         """
         Initialize the IndicatorProcessor.
 
@@ -81,6 +84,9 @@ class IndicatorProcessor:
                         Format: {'1m': DataFrame, '5m': DataFrame}
             is_bulk: Whether to use bulk processing mode for indicators
             recent_rows_limit: Maximum number of recent rows to keep per timeframe
+            materialize_previous: Store recent rows with previous_* columns
+                (default: True); strategy conditions do not need them, as
+                they read older bars from the recent rows by offset
 
         Raises:
             ValueError: If configs and historicals don't have matching timeframes
@@ -94,6 +100,7 @@ class IndicatorProcessor:
         # Store configuration
         self._is_bulk = is_bulk
         self._recent_rows_limit = recent_rows_limit
+        self._materialize_previous = materialize_previous
         self._timeframes = set(configs.keys())
 
         # Setup logging
@@ -104,7 +111,8 @@ class IndicatorProcessor:
         self._managers = self._create_managers(configs, historicals)
         self._recent_rows_manager = RecentRowsProcessor(
             list(configs.keys()),
-            max_rows=recent_rows_limit
+            max_rows=recent_rows_limit,
+            materialize_previous=materialize_previous
         )
 
         # Initialize historical data
@@ -193,7 +201,7 @@ class IndicatorProcessor:
                 row_with_indicators['is_transition'] = regime_data.get('is_transition', False)
 
             # Step 3: Process the row with previous values and store it
-            # This will add previous_* columns from the last stored row
+            # This will add previous_* columns from the last stored row (if materialized)
             processed_row = self._recent_rows_manager.process_backtest_with_indicators_row(
                 timeframe, row_with_indicators
             )
@@ -246,6 +254,50 @@ class IndicatorProcessor:
         self._logger.debug(f"Successfully processed MTF data for {len(results)} timeframes")
         return results
 
+    def reload_configs(self, configs: Dict[str, dict]) -> Dict[str, HandlerChange]:
+        """
+        Apply new indicator configurations without rebuilding the processor.
+
+        For every supported timeframe, handlers whose parameters are unchanged
+        keep their state; added or changed handlers are warmed on the retained
+        history (see IndicatorManager.apply_config) and their values, current
+        and previous_* when materialized, are filled into the recent rows. Columns of removed
+        handlers are dropped from the recent rows. Recent rows that change are
+        replaced by new Series objects, so consumers comparing rows by
+        identity see them as updated.
+
+        Timeframes that are not already processed are ignored (adding a
+        timeframe needs its history fetched); timeframes missing from configs
+        keep their current configuration.
+
+        Args:
+            configs: Dictionary mapping timeframe to indicator configuration
+
+        Returns:
+            Dict[str, HandlerChange]: Changes by timeframe (only changed timeframes)
+
+        Raises:
+            TypeError: If configs is not a dictionary
+        """
+        if not isinstance(configs, dict):
+            raise TypeError("configs must be a dictionary")
+
+        ignored = sorted(set(configs) - self._timeframes)
+        if ignored:
+            self._logger.warning(f"Ignoring indicator configs for unprocessed timeframes: {ignored}")
+
+        changes = {}
+        for tf in sorted(set(configs) & self._timeframes):
+            change = self._managers[tf].apply_config(configs[tf])
+            if not change.changed:
+                continue
+            self._refresh_recent_rows(tf, change)
+            changes[tf] = change
+            self._logger.info(
+                f"Reloaded indicators for timeframe {tf}: added {change.added}, removed {change.removed}"
+            )
+        return changes
+
     def get_recent_rows(self) ->  dict[str, deque]:
         """
         Get recent processed rows for a specific timeframe.
@@ -451,6 +503,35 @@ class IndicatorProcessor:
 
         return managers
 
+    def _refresh_recent_rows(self, timeframe: str, change: HandlerChange) -> None:
+        """Apply a handler change to the stored recent rows of a timeframe."""
+        rows = self._recent_rows_manager.get_recent_rows()[timeframe]
+        prefix = RecentRowsProcessor.PREVIOUS_PREFIX
+        dropped = change.removed_columns + [f"{prefix}{column}" for column in change.removed_columns]
+
+        values = change.added_values
+        columns = [column for column in values.columns if column != "time"]
+        current = previous = None
+        if columns and "time" in values.columns:
+            indexed = values.assign(time=pd.to_datetime(values["time"])).drop_duplicates("time", keep="last")
+            current = indexed.set_index("time")[columns]
+            previous = current.shift(1)
+
+        for position, row in enumerate(list(rows)):
+            updated = row.drop(labels=dropped, errors="ignore")
+            time = pd.to_datetime(row["time"]) if "time" in row.index else None
+            if current is not None and time in current.index:
+                for column in columns:
+                    updated[column] = current.at[time, column]
+                    if self._materialize_previous:
+                        updated[f"{prefix}{column}"] = previous.at[time, column]
+            elif columns:
+                self._logger.warning(
+                    f"No warmed values for recent row {time} of timeframe {timeframe}; "
+                    f"{columns} left unset until the next bar"
+                )
+            rows[position] = updated
+
     def _initialize_historical_data(self) -> None:
         """Initialize historical data in recent rows manager."""
         try:
@@ -466,7 +547,8 @@ class IndicatorProcessor:
             f"IndicatorProcessor("
             f"timeframes={sorted(list(self._timeframes))}, "
             f"is_bulk={self._is_bulk}, "
-            f"recent_rows_limit={self._recent_rows_limit})"
+            f"recent_rows_limit={self._recent_rows_limit}, "
+            f"materialize_previous={self._materialize_previous})"
         )
 
     def __len__(self) -> int:
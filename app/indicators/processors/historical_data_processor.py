@@ -16,7 +16,27 @@ class HistoricalDataProcessor:
     def initialize_from_historical(self, managers: Dict[str, IndicatorManager]) -> None:
         """Initialize recent rows from historical data with computed indicators"""
         for tf, manager in managers.items():
-            self._initialize_timeframe_with_clean_previous(tf, manager)
+            if self.recent_rows_manager.materialize_previous:
+                self._initialize_timeframe_with_clean_previous(tf, manager)
+            else:
+                self._initialize_timeframe(tf, manager)
+
+    def _initialize_timeframe(self, tf: str, manager: IndicatorManager) -> None:
+        """
+        Initialize recent rows for a single timeframe with the last max_rows
+        rows as computed (for a RecentRowsProcessor without previous_* columns).
+        """
+        indicator_data = manager.get_historical_data()
+
+        if indicator_data.empty:
+            self.logger.warning(f"No indicator data available for timeframe {tf}")
+            return
+
+        self.logger.info(f"Initializing {self.max_rows} rows for timeframe {tf}")
+        for _, row in indicator_data.tail(self.max_rows).iterrows():
+            self.recent_rows_manager._recent_rows[tf].append(row)
+
+        self.logger.info(f"Successfully initialized {len(self.recent_rows_manager._recent_rows[tf])} rows for {tf}")
     
     def _create_clean_row_with_previous(self, current_row: pd.Series, previous_row: pd.Series) -> pd.Series:
         """
@@ -25,6 +25,8 @@ class RecentRowsProcessor:
     - Efficient circular buffer storage using deque
     - Automatic duplicate detection and updates based on timestamps
     - Support for backtesting with previous row data
+    - Optional previous_* columns: strategy conditions can read older bars from
+      the buffer by offset, so rows may be stored as computed
     - Thread-safe operations for live trading
     - Memory-efficient with configurable row limits
 
@@ -44,13 +46,16 @@ class RecentRowsProcessor:
     TIME_COLUMN = "time"
     PREVIOUS_PREFIX = "previous_"
 
-    def __init__(self, timeframes: List[str], max_rows: int = DEFAULT_MAX_ROWS):
+    def __init__(self, timeframes: List[str], max_rows: int = DEFAULT_MAX_ROWS,
+                 materialize_previous: bool = True):
         """
         Initialize the RecentRowsProcessor.
 
         Args:
             timeframes: List of timeframe identifiers (e.g., ['1m', '5m', '1h'])
             max_rows: Maximum number of rows to keep per timeframe (default: 6)
+            materialize_previous: Store each row with previous_* copies of the
+                row before it (default: True); without them rows are stored as given
 
         Raises:
             ValueError: If timeframes is empty or max_rows is less than 1
@@ -61,13 +66,17 @@ class RecentRowsProcessor:
 
         self._timeframes = list(timeframes)  # Create defensive copy
         self._max_rows = max_rows
+        self._materialize_previous = materialize_previous
         self._recent_rows: Dict[str, deque] = {
             tf: deque(maxlen=max_rows) for tf in timeframes
         }
 
         # Setup logging
         self._logger = logging.getLogger(self.__class__.__name__)
-        self._logger.debug(f"Initialized RecentRowsProcessor for timeframes: {timeframes}, max_rows: {max_rows}")
+        self._logger.debug(
+            f"Initialized RecentRowsProcessor for timeframes: {timeframes}, max_rows: {max_rows}, "
+            f"materialize_previous: {materialize_previous}"
+        )
 
     def add_or_update_row(self, timeframe: str, row: pd.Series) -> bool:
         """
@@ -102,12 +111,12 @@ class RecentRowsProcessor:
             self._logger.debug(f"Updated existing row at index {existing_idx} for timeframe {timeframe}")
             return True
         else:
-            if not self._recent_rows[timeframe]:
+            if self._materialize_previous and not self._recent_rows[timeframe]:
                 # First row: add previous_* columns with NaN
                 prev_columns = [col for col in row_copy.index if not col.startswith(self.PREVIOUS_PREFIX)]
                 nan_prefixed = pd.Series({f"{self.PREVIOUS_PREFIX}{col}": pd.NA for col in prev_columns})
                 row_copy = pd.concat([row_copy, nan_prefixed])
-            else:
+            elif self._materialize_previous:
                 # Combine with previous row using helper
                 prev_row = self._recent_rows[timeframe][-1]
                 row_copy = self._combine_with_previous_row(row_copy, prev_row)
@@ -235,7 +244,7 @@ class RecentRowsProcessor:
         self._validate_timeframe(timeframe)
         self._validate_row_input(row)
 
-        previous_row = self.get_latest_row(timeframe)
+        previous_row = self.get_latest_row(timeframe) if self._materialize_previous else None
 
         # Combine if previous row exists
         if previous_row is not None:
@@ -273,6 +282,11 @@ class RecentRowsProcessor:
     def get_recent_rows(self) ->  dict[str, deque]:
         return self._recent_rows
 
+    @property
+    def materialize_previous(self) -> bool:
+        """Whether stored rows carry previous_* columns."""
+        return self._materialize_previous
+
     def _validate_initialization_params(self, timeframes: List[str], max_rows: int) -> None:
         """Validate initialization parameters."""
         if not timeframes:
@@ -384,7 +398,7 @@ class RecentRowsProcessor:
     def __repr__(self) -> str:
         """String representation of the processor."""
         return (f"RecentRowsProcessor(timeframes={self._timeframes}, "
-                f"max_rows={self._max_rows})")
+                f"max_rows={self._max_rows}, materialize_previous={self._materialize_previous})")
 
     def __len__(self) -> int:
         """Total number of rows across all timeframes."""
@@ -20,6 +20,7 @@ from app.events.automation_events import (
     AutomationStateChangedEvent,
 )
 from app.infrastructure.event_bus import EventBus
+from app.utils.clock import get_clock
 
 
 class AutomationStateManager:
@@ -122,9 +123,9 @@ class AutomationStateManager:
                     self._last_changed = datetime.fromisoformat(last_changed_str)
                 except ValueError:
                     self.logger.warning(f"Invalid timestamp in state file: {last_changed_str}")
-                    self._last_changed = datetime.now()
+                    self._last_changed = get_clock().now()
             else:
-                self._last_changed = datetime.now()
+                self._last_changed = get_clock().now()
 
             self.logger.info(
                 f"Loaded automation state from file: enabled={self._enabled}, "
@@ -160,7 +161,7 @@ class AutomationStateManager:
             "last_changed": self._last_changed.isoformat() if self._last_changed else None,
             "reason": self._last_reason,
             "requested_by": self._last_requested_by,
-            "saved_at": datetime.now().isoformat(),
+            "saved_at": get_clock().now().isoformat(),
         }
 
         # Ensure parent directory exists
@@ -246,7 +247,7 @@ class AutomationStateManager:
 
             # Update state
             self._enabled = new_enabled
-            self._last_changed = datetime.now()
+            self._last_changed = get_clock().now()
             self._last_reason = event.reason
             self._last_requested_by = event.requested_by
 
@@ -277,7 +278,7 @@ class AutomationStateManager:
             enabled=self._enabled,
             previous_state=previous_state,
             reason=self._last_reason,
-            changed_at=self._last_changed or datetime.now(),
+            changed_at=self._last_changed or get_clock().now(),
         )
 
         self.event_bus.publish(event)
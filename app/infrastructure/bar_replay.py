@@ -0,0 +1,392 @@
+"""
+Event-time bar replay engine for backtests.
+
+Merges every symbol x timeframe bar stream by bar close time and publishes one
+NewCandleEvent per bar, in exact chronological order, straight into an
+EventBus. There is no polling and no sleeping: the pipeline runs as fast as
+the subscribed services can process candles.
+
+Ordering:
+- Bars are ordered by close time (open time + timeframe length)
+- Bars closing at the same instant are published shortest timeframe first
+  (an M1 bar closing at 10:00 comes before the H1 bar closing at 10:00),
+  then in symbol order
+- The merge is a k-way heap merge over per-stream cursors, so memory stays
+  at one heap entry per stream whatever the history length
+
+Each event's ``timestamp`` is the bar close time, so downstream consumers
+(journals, logs, metrics) see simulated time rather than wall-clock time.
+Given a SimulatedClock, the engine also sets it to each bar's close before
+publishing, so anything reading the clock (sessions, news windows,
+time-based exits, event defaults) sees the same simulated time.
+
+Example:
+    ```python
+    engine = BarReplayEngine.from_data_sources(
+        event_bus=orchestrator.event_bus,
+        data_sources={"XAUUSD": xau_source, "EURUSD": eur_source},
+        timeframes=["1", "5", "60"],
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 7, 1),
+    )
+    stats = engine.run()
+    print(f"{stats.bars_published} bars at {stats.bars_per_second:,.0f} bars/s")
+    ```
+
+Benchmark from the command line (replays into a bare EventBus):
+
+    python -m app.infrastructure.bar_replay ./data --symbol xauusd --timeframe 1 --timeframe 5
+"""
+
+import argparse
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.data.bar_cache import timeframe_delta
+from app.events.data_events import NewCandleEvent
+from app.infrastructure.event_bus import EventBus
+from app.utils.clock import SimulatedClock
+
+
+@dataclass
+class ReplayProgress:
+    """
+    Progress snapshot of a running replay.
+
+    Attributes:
+        bars_published: Bars published so far
+        bars_total: Bars in the replay window
+        elapsed_seconds: Wall-clock time since the replay started
+        sim_time: Close time of the last published bar
+    """
+    bars_published: int
+    bars_total: int
+    elapsed_seconds: float
+    sim_time: Optional[pd.Timestamp]
+
+    @property
+    def fraction(self) -> float:
+        """Share of the window replayed (0.0 - 1.0)."""
+        return self.bars_published / self.bars_total if self.bars_total else 1.0
+
+    @property
+    def bars_per_second(self) -> float:
+        """Replay throughput so far."""
+        return self.bars_published / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass
+class BarReplayStats:
+    """
+    Result of a bar replay.
+
+    Attributes:
+        bars_total: Bars in the replay window
+        bars_published: NewCandleEvents published
+        elapsed_seconds: Wall-clock duration of the replay
+        first_close: Close time of the first published bar
+        last_close: Close time of the last published bar
+        bars_by_stream: Published bars per (symbol, timeframe)
+        stopped: True if the replay was stopped before the end
+    """
+    bars_total: int
+    bars_published: int
+    elapsed_seconds: float
+    first_close: Optional[pd.Timestamp] = None
+    last_close: Optional[pd.Timestamp] = None
+    bars_by_stream: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    stopped: bool = False
+
+    @property
+    def bars_per_second(self) -> float:
+        """Replay throughput."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bars_published / self.elapsed_seconds
+
+
+@dataclass
+class _BarStream:
+    """One symbol/timeframe stream with its close times and replay cursor."""
+    symbol: str
+    timeframe: str
+    bars: pd.DataFrame
+    close_ns: np.ndarray
+    close_times: pd.DatetimeIndex
+    position: int
+    end: int
+
+
+class BarReplayEngine:
+    """
+    Replays bar streams as NewCandleEvents in event-time order.
+
+    Streams are DataFrames with a ``time`` column holding the bar open time,
+    as returned by the data sources' get_historical_data().
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        streams: Dict[Tuple[str, str], pd.DataFrame],
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        progress_interval: float = 5.0,
+        progress_callback: Optional[Callable[[ReplayProgress], None]] = None,
+        clock: Optional[SimulatedClock] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the replay engine.
+
+        Args:
+            event_bus: EventBus to publish NewCandleEvents on
+            streams: Bars per (symbol, timeframe)
+            start: Only replay bars closing at or after this time
+            end: Only replay bars closing before this time
+            progress_interval: Seconds between progress reports (0 disables)
+            progress_callback: Called with a ReplayProgress at each report
+            clock: Optional SimulatedClock to move to each bar's close time
+            logger: Optional logger
+        """
+        self.event_bus = event_bus
+        self.clock = clock
+        self.progress_interval = progress_interval
+        self.progress_callback = progress_callback
+        self.logger = logger or logging.getLogger('bar-replay')
+
+        self._stop_requested = False
+        self._streams: List[_BarStream] = []
+
+        # Deterministic stream order (the heap tie-break): timeframe length, then symbol
+        ordered = sorted(streams.items(), key=lambda item: (timeframe_delta(item[0][1]), item[0][0]))
+        for (symbol, timeframe), bars in ordered:
+            stream = self._build_stream(symbol, timeframe, bars, start, end)
+            if stream is not None:
+                self._streams.append(stream)
+
+        self.bars_total = sum(s.end - s.position for s in self._streams)
+
+    @classmethod
+    def from_data_sources(
+        cls,
+        event_bus: EventBus,
+        data_sources: Dict[str, Any],
+        timeframes: Sequence[str],
+        **kwargs
+    ) -> "BarReplayEngine":
+        """
+        Build an engine from per-symbol data sources.
+
+        Each source only needs ``get_historical_data(symbol, timeframe)``
+        (BacktestDataSource, MappedBacktestDataSource, DataSourceManager, ...).
+
+        Args:
+            event_bus: EventBus to publish NewCandleEvents on
+            data_sources: Data source per symbol
+            timeframes: Timeframes to replay for every symbol
+            **kwargs: Passed to the constructor (start, end, progress_interval, ...)
+
+        Returns:
+            BarReplayEngine
+        """
+        streams = {}
+        for symbol, source in data_sources.items():
+            for tf in timeframes:
+                bars = source.get_historical_data(symbol, tf)
+                if bars is not None and not bars.empty:
+                    streams[(symbol, tf)] = bars
+        return cls(event_bus, streams, **kwargs)
+
+    def stop(self) -> None:
+        """Ask a running replay to stop after the current bar."""
+        self._stop_requested = True
+
+    def run(self) -> BarReplayStats:
+        """
+        Replay every bar in the window.
+
+        A replay ended with stop() resumes from the next bar on the following call.
+
+        Returns:
+            BarReplayStats
+        """
+        self._stop_requested = False
+        streams = self._streams
+        counts = {(s.symbol, s.timeframe): 0 for s in streams}
+
+        # Heap entries: (close_ns, stream_index). Stream order already encodes the tie-break.
+        heap = [(int(s.close_ns[s.position]), i) for i, s in enumerate(streams) if s.position < s.end]
+        heapq.heapify(heap)
+
+        published = 0
+        first_close = last_close = None
+        started = time.perf_counter()
+        next_report = started + self.progress_interval if self.progress_interval > 0 else None
+
+        self.logger.info(f"Replaying {self.bars_total} bars from {len(streams)} streams")
+
+        while heap and not self._stop_requested:
+            _, index = heap[0]
+            stream = streams[index]
+            row = stream.position
+            close_time = stream.close_times[row]
+            timestamp = close_time.to_pydatetime()
+
+            if self.clock is not None:
+                self.clock.set(timestamp)
+            self.event_bus.publish(NewCandleEvent(
+                symbol=stream.symbol,
+                timeframe=stream.timeframe,
+                bar=stream.bars.iloc[row],
+                timestamp=timestamp,
+            ))
+
+            stream.position += 1
+            if stream.position < stream.end:
+                heapq.heapreplace(heap, (int(stream.close_ns[stream.position]), index))
+            else:
+                heapq.heappop(heap)
+
+            published += 1
+            counts[(stream.symbol, stream.timeframe)] += 1
+            if first_close is None:
+                first_close = close_time
+            last_close = close_time
+
+            if next_report is not None and published % 1024 == 0:
+                now = time.perf_counter()
+                if now >= next_report:
+                    self._report(published, now - started, last_close)
+                    next_report = now + self.progress_interval
+
+        elapsed = time.perf_counter() - started
+        stats = BarReplayStats(
+            bars_total=self.bars_total,
+            bars_published=published,
+            elapsed_seconds=elapsed,
+            first_close=first_close,
+            last_close=last_close,
+            bars_by_stream=counts,
+            stopped=bool(heap),
+        )
+
+        if self.progress_callback is not None:
+            self.progress_callback(ReplayProgress(published, self.bars_total, elapsed, last_close))
+
+        status = "stopped" if stats.stopped else "✓ Replay complete"
+        self.logger.info(
+            f"{status}: {published}/{self.bars_total} bars in {elapsed:.3f}s "
+            f"({stats.bars_per_second:,.0f} bars/s), {first_close} -> {last_close}"
+        )
+        return stats
+
+    def _report(self, published: int, elapsed: float, sim_time: pd.Timestamp) -> None:
+        """Log and forward a progress snapshot."""
+        progress = ReplayProgress(published, self.bars_total, elapsed, sim_time)
+        self.logger.info(
+            f"Replay {progress.fraction:6.1%} | {published}/{self.bars_total} bars | "
+            f"{progress.bars_per_second:,.0f} bars/s | sim time {sim_time}"
+        )
+        if self.progress_callback is not None:
+            self.progress_callback(progress)
+
+    @staticmethod
+    def _build_stream(
+        symbol: str,
+        timeframe: str,
+        bars: pd.DataFrame,
+        start: Optional[Any],
+        end: Optional[Any]
+    ) -> Optional[_BarStream]:
+        """Compute close times and the [start, end) row range of one stream."""
+        if bars is None or bars.empty:
+            return None
+
+        opens = pd.DatetimeIndex(pd.to_datetime(bars["time"]))
+        if not opens.is_monotonic_increasing:
+            order = np.argsort(opens.asi8, kind="stable")
+            bars = bars.iloc[order].reset_index(drop=True)
+            opens = opens[order]
+
+        close_times = opens + timeframe_delta(timeframe)
+        close_ns = close_times.asi8
+
+        position, stop = 0, len(bars)
+        if start is not None:
+            position = int(close_times.searchsorted(_as_bound(start, close_times), side="left"))
+        if end is not None:
+            stop = int(close_times.searchsorted(_as_bound(end, close_times), side="left"))
+
+        return _BarStream(
+            symbol=symbol,
+            timeframe=timeframe,
+            bars=bars,
+            close_ns=close_ns,
+            close_times=close_times,
+            position=position,
+            end=max(stop, position),
+        )
+
+
+def _as_bound(value: Any, times: pd.DatetimeIndex) -> pd.Timestamp:
+    """Convert a window bound to a Timestamp comparable with the stream times."""
+    ts = pd.Timestamp(value)
+    if times.tz is not None and ts.tzinfo is None:
+        return ts.tz_localize(times.tz)
+    if times.tz is None and ts.tzinfo is not None:
+        return ts.tz_convert("UTC").tz_localize(None)
+    return ts
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m app.infrastructure.bar_replay ./data --symbol xauusd --timeframe 1 --timeframe 5
+        python -m app.infrastructure.bar_replay ./data --symbol xauusd --timeframe 1 --format arrow --start 2024-01-01
+    """
+    from app.data.data_manger import DataSourceManager
+
+    parser = argparse.ArgumentParser(description="Benchmark event-time bar replay")
+    parser.add_argument("data_path")
+    parser.add_argument("--symbol", action="append", dest="symbols", required=True)
+    parser.add_argument("--timeframe", action="append", dest="timeframes", required=True)
+    parser.add_argument("--format", choices=["parquet", "arrow"], default="parquet")
+    parser.add_argument("--start", type=datetime.fromisoformat)
+    parser.add_argument("--end", type=datetime.fromisoformat)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    sources = {}
+    for symbol in args.symbols:
+        manager = DataSourceManager(mode="backtest", data_path=args.data_path, symbol=symbol, data_format=args.format)
+        manager.load_backtest_data(args.timeframes)
+        sources[symbol] = manager
+
+    engine = BarReplayEngine.from_data_sources(
+        EventBus(event_history_limit=0),
+        sources,
+        args.timeframes,
+        start=args.start,
+        end=args.end,
+    )
+    stats = engine.run()
+    print(
+        f"Replayed {stats.bars_published} bars in {stats.elapsed_seconds:.3f}s "
+        f"({stats.bars_per_second:,.0f} bars/s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
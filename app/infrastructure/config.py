@@ -22,6 +22,13 @@ class DataFetchingConfig(BaseModel):
     retry_attempts: int = Field(default=3, ge=0, le=10)
     candle_index: int = Field(default=1, ge=1)
     nbr_bars: int = Field(default=3, ge=1)
+    cursor_fetch: bool = False
+    fetch_mode: Literal["serial", "concurrent", "scheduled"] = "serial"
+    max_workers: int = Field(default=8, ge=1)
+    round_deadline: float = Field(default=10.0, gt=0)
+    schedule_close_delay: float = Field(default=0.5, ge=0)
+    schedule_retry_interval: float = Field(default=1.0, gt=0)
+    schedule_retry_window: float = Field(default=30.0, ge=0)
 
 
 class IndicatorCalculationConfig(BaseModel):
@@ -69,6 +76,9 @@ class EventBusConfig(BaseModel):
     mode: Literal["synchronous", "asynchronous"] = "synchronous"
     event_history_limit: int = Field(default=1000, ge=0)
     log_all_events: bool = False
+    journal_enabled: bool = False
+    journal_dir: str = "journal"
+    journal_segment_mb: int = Field(default=64, ge=1)
 
 
 class OrchestratorConfig(BaseModel):
@@ -77,6 +87,12 @@ class OrchestratorConfig(BaseModel):
     enable_auto_restart: bool = True
     health_check_interval: int = Field(default=60, ge=10)
     status_log_interval: int = Field(default=10, ge=1)
+    sharded: bool = False
+    shard_count: Optional[int] = Field(default=None, ge=1)
+    shard_tick_timeout: float = Field(default=30.0, gt=0)
+    shard_start_method: Literal["spawn", "fork", "forkserver"] = "spawn"
+    hot_reload: bool = False
+    hot_reload_interval: float = Field(default=5.0, gt=0)
 
 
 class LoggingConfig(BaseModel):
@@ -177,10 +193,27 @@ class SystemConfig(BaseModel):
             "timeframes": self.trading.timeframes,
             "enable_auto_restart": self.orchestrator.enable_auto_restart,
             "health_check_interval": self.orchestrator.health_check_interval,
+            "shard_count": self.orchestrator.shard_count,
+            "shard_tick_timeout": self.orchestrator.shard_tick_timeout,
+            "shard_start_method": self.orchestrator.shard_start_method,
+            "hot_reload": self.orchestrator.hot_reload,
+            "hot_reload_interval": self.orchestrator.hot_reload_interval,
             "event_history_limit": self.event_bus.event_history_limit,
             "log_all_events": self.event_bus.log_all_events,
+            "journal": {
+                "enabled": self.event_bus.journal_enabled,
+                "dir": self.event_bus.journal_dir,
+                "segment_mb": self.event_bus.journal_segment_mb,
+            },
             "candle_index": self.services.data_fetching.candle_index,
             "nbr_bars": self.services.data_fetching.nbr_bars,
+            "cursor_fetch": self.services.data_fetching.cursor_fetch,
+            "fetch_mode": self.services.data_fetching.fetch_mode,
+            "fetch_max_workers": self.services.data_fetching.max_workers,
+            "fetch_round_deadline": self.services.data_fetching.round_deadline,
+            "schedule_close_delay": self.services.data_fetching.schedule_close_delay,
+            "schedule_retry_interval": self.services.data_fetching.schedule_retry_interval,
+            "schedule_retry_window": self.services.data_fetching.schedule_retry_window,
             "track_regime_changes": self.services.indicator_calculation.track_regime_changes,
             "min_rows_required": self.services.strategy_evaluation.min_rows_required,
             "execution_mode": self.services.trade_execution.execution_mode,
@@ -208,6 +241,7 @@ class SystemConfig(BaseModel):
             "timeframes": self.trading.timeframes,
             "candle_index": self.services.data_fetching.candle_index,
             "nbr_bars": self.services.data_fetching.nbr_bars,
+            "cursor_fetch": self.services.data_fetching.cursor_fetch,
         }
 
     def get_indicator_calculation_config(self, symbol: str) -> Dict[str, Any]:
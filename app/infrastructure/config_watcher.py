@@ -0,0 +1,226 @@
+"""
+Config Watcher for hot-reloading strategy and indicator configurations.
+
+Polls the per-symbol strategy and indicator folders of the configuration
+tree and applies edited files to the running services, without restarting
+the process or refetching history:
+
+- indicators: IndicatorCalculationService.reload_indicators() keeps the state
+  of unchanged indicators and warms new ones on the retained history
+- strategies: StrategyEvaluationService.reload_strategies() recompiles only
+  added and edited strategies
+
+Unlike AutomationFileWatcher it runs no thread: poll() is called from the
+orchestrator loop between fetch rounds, so a reload never overlaps an
+evaluation. A folder whose files fail to load or validate is logged and keeps
+its previous configuration until the files change again.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.clock import get_clock
+
+
+# Folder kinds under CONF_FOLDER_PATH and the service each one is applied to.
+# Indicators come first: an edited strategy may use a column added alongside it.
+WATCHED_KINDS = {
+    "indicators": "indicator_calculation",
+    "strategies": "strategy_evaluation",
+}
+
+# path -> (mtime_ns, size, sha256 of the content)
+_Snapshot = Dict[str, Tuple[int, int, str]]
+
+
+@dataclass
+class ConfigReload:
+    """
+    Outcome of applying one changed configuration folder.
+
+    Attributes:
+        symbol: Trading symbol whose services were reloaded
+        kind: "indicators" or "strategies"
+        files: Files added, edited or removed since the previous poll
+        ok: Whether the new configuration is in use
+        error: Error message when the previous configuration was kept
+        changes: What the service reported as changed
+    """
+    symbol: str
+    kind: str
+    files: List[str]
+    ok: bool
+    error: Optional[str] = None
+    changes: Any = None
+
+
+class ConfigWatcher:
+    """
+    Applies edited strategy and indicator files to running services.
+
+    Files are compared by content, so saving a file without changes (or
+    touching it) does not trigger a reload.
+
+    Example:
+        ```python
+        watcher = ConfigWatcher(
+            conf_folder_path="config",
+            services=orchestrator.services,
+            poll_interval=5.0
+        )
+
+        # In the trading loop, between fetch rounds
+        for reload in watcher.poll():
+            print(reload.symbol, reload.kind, reload.ok)
+        ```
+    """
+
+    def __init__(
+        self,
+        conf_folder_path: str,
+        services: Dict[str, Dict[str, Any]],
+        config_symbols: Optional[Dict[str, str]] = None,
+        poll_interval: float = 5.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize ConfigWatcher and record the current files as the baseline.
+
+        Args:
+            conf_folder_path: Base configuration folder (CONF_FOLDER_PATH)
+            services: Services registry (symbol -> service_name -> service)
+            config_symbols: Optional symbol -> config folder symbol mapping
+            poll_interval: Minimum seconds between two scans
+            logger: Optional logger instance
+        """
+        self.conf_folder_path = Path(conf_folder_path)
+        self.services = services
+        self.config_symbols = dict(config_symbols or {})
+        self.poll_interval = poll_interval
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._last_poll: Optional[float] = None
+        self._snapshots: Dict[Tuple[str, str], _Snapshot] = {
+            (symbol, kind): self._snapshot(self.folder(symbol, kind), {})
+            for symbol, kind in self._watched()
+        }
+        self.reload_count = 0
+        self.error_count = 0
+
+        self.logger.info(
+            f"ConfigWatcher initialized - conf_folder={self.conf_folder_path}, "
+            f"{len(self._snapshots)} folders, poll_interval={self.poll_interval}s"
+        )
+
+    def folder(self, symbol: str, kind: str) -> Path:
+        """
+        Configuration folder of a symbol.
+
+        Args:
+            symbol: Trading symbol
+            kind: "indicators" or "strategies"
+
+        Returns:
+            Path of the folder (it may not exist)
+        """
+        return self.conf_folder_path / kind / self._config_symbol(symbol).lower()
+
+    def poll(self, force: bool = False) -> List[ConfigReload]:
+        """
+        Scan the watched folders and reload those whose files changed.
+
+        Args:
+            force: Scan even if poll_interval has not elapsed
+
+        Returns:
+            One ConfigReload per reloaded folder (empty when nothing changed)
+        """
+        now = get_clock().monotonic()
+        if not force and self._last_poll is not None and now - self._last_poll < self.poll_interval:
+            return []
+        self._last_poll = now
+
+        reloads = []
+        for symbol, kind in self._watched():
+            key = (symbol, kind)
+            previous = self._snapshots.get(key, {})
+            snapshot = self._snapshot(self.folder(symbol, kind), previous)
+            # Recorded even if the reload fails: a broken file is retried once it is edited again
+            self._snapshots[key] = snapshot
+            files = _changed_files(previous, snapshot)
+            if files:
+                reloads.append(self._apply(symbol, kind, files))
+        return reloads
+
+    def _apply(self, symbol: str, kind: str, files: List[str]) -> ConfigReload:
+        """Load a changed folder and hand it to the symbol's service."""
+        from app.utils.functions_helper import list_files_in_folder
+        from app.utils.multi_symbol_loader import load_indicators_for_symbol
+
+        self.logger.info(f"🔄 [RELOAD] {symbol} {kind} changed: {[Path(f).name for f in files]}")
+        service = self.services[symbol][WATCHED_KINDS[kind]]
+        try:
+            if kind == "indicators":
+                configs = load_indicators_for_symbol(
+                    str(self.conf_folder_path), self._config_symbol(symbol), self.logger
+                )
+                changes = service.reload_indicators(configs)
+            else:
+                folder = self.folder(symbol, kind)
+                paths = list_files_in_folder(str(folder)) if folder.is_dir() else []
+                changes = service.reload_strategies(paths)
+        except Exception as e:
+            self.error_count += 1
+            self.logger.error(
+                f"❌ [RELOAD] {symbol} {kind} reload failed, keeping previous configuration: {e}",
+                exc_info=True
+            )
+            return ConfigReload(symbol, kind, files, ok=False, error=str(e))
+
+        self.reload_count += 1
+        return ConfigReload(symbol, kind, files, ok=True, changes=changes)
+
+    def _watched(self) -> List[Tuple[str, str]]:
+        """(symbol, kind) pairs whose service exists."""
+        return [
+            (symbol, kind)
+            for symbol, services in self.services.items()
+            for kind, service_name in WATCHED_KINDS.items()
+            if services.get(service_name) is not None
+        ]
+
+    def _config_symbol(self, symbol: str) -> str:
+        return self.config_symbols.get(symbol, symbol)
+
+    @staticmethod
+    def _snapshot(folder: Path, previous: _Snapshot) -> _Snapshot:
+        """Stat the files of a folder, hashing only those whose stat changed."""
+        snapshot: _Snapshot = {}
+        if not folder.is_dir():
+            return snapshot
+        for path in sorted(folder.iterdir()):
+            try:
+                stat = path.stat()
+                if not path.is_file():
+                    continue
+                key = str(path)
+                known = previous.get(key)
+                if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                    snapshot[key] = known
+                else:
+                    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+                    snapshot[key] = (stat.st_mtime_ns, stat.st_size, digest)
+            except OSError:
+                continue                  # deleted while scanning: seen as removed
+        return snapshot
+
+
+def _changed_files(previous: _Snapshot, current: _Snapshot) -> List[str]:
+    """Files added, removed or whose content differs."""
+    return sorted(
+        path for path in set(previous) | set(current)
+        if previous.get(path, (0, 0, None))[2] != current.get(path, (0, 0, None))[2]
+    )
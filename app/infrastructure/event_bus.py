@@ -11,6 +11,7 @@ from typing import Type, Callable, Dict, List, Optional, Any, Deque
 from datetime import datetime
 
 from app.events.base import Event, EventHandler
+from app.utils import clock
 
 
 class EventBus:
@@ -20,6 +21,7 @@ class EventBus:
     The EventBus maintains subscriptions and delivers events to registered handlers.
     It supports:
     - Event subscription by event type
+    - Catch-all subscriptions (e.g. for journaling every event)
     - Synchronous event delivery
     - Event history for debugging
     - Handler error isolation (one handler's error doesn't affect others)
@@ -64,6 +66,9 @@ class EventBus:
         # Subscriptions: event_type -> list of (subscription_id, handler)
         self._subscriptions: Dict[Type[Event], List[tuple[str, EventHandler]]] = defaultdict(list)
 
+        # Catch-all subscriptions: list of (subscription_id, handler)
+        self._all_subscriptions: List[tuple[str, EventHandler]] = []
+
         # Event history: deque of (timestamp, event)
         self._event_history: Deque[tuple[datetime, Event]] = deque(maxlen=event_history_limit)
 
@@ -112,6 +117,28 @@ class EventBus:
 
         return subscription_id
 
+    def subscribe_all(self, handler: EventHandler) -> str:
+        """
+        Subscribe to every event regardless of type.
+
+        Catch-all handlers are invoked before type-specific handlers, so they
+        observe events in publish order even when handlers publish nested events.
+
+        Args:
+            handler: Callable that will be invoked for every published event
+
+        Returns:
+            Subscription ID for later unsubscription
+        """
+        self._subscription_counter += 1
+        subscription_id = f"sub_{self._subscription_counter}_*"
+
+        self._all_subscriptions.append((subscription_id, handler))
+
+        self.logger.debug(f"Subscribed: {subscription_id} to all events")
+
+        return subscription_id
+
     def unsubscribe(self, subscription_id: str) -> bool:
         """
         Unsubscribe from events.
@@ -129,6 +156,12 @@ class EventBus:
                     self.logger.debug(f"Unsubscribed: {subscription_id}")
                     return True
 
+        for i, (sub_id, handler) in enumerate(self._all_subscriptions):
+            if sub_id == subscription_id:
+                self._all_subscriptions.pop(i)
+                self.logger.debug(f"Unsubscribed: {subscription_id}")
+                return True
+
         self.logger.warning(f"Subscription not found: {subscription_id}")
         return False
 
@@ -155,11 +188,23 @@ class EventBus:
             self.logger.debug(f"Publishing: {event_type.__name__} - {event}")
 
         # Add to history
-        self._event_history.append((datetime.now(), event))
+        self._event_history.append((clock.now(), event))
 
         # Update metrics
         self._metrics["events_published"] += 1
 
+        # Deliver to catch-all subscribers first
+        for subscription_id, handler in self._all_subscriptions:
+            try:
+                handler(event)
+            except Exception as e:
+                self._metrics["handler_errors"] += 1
+                self.logger.error(
+                    f"Error in event handler {subscription_id} "
+                    f"for {event_type.__name__}: {e}",
+                    exc_info=True
+                )
+
         # Get subscribers for this event type
         subscribers = self._subscriptions.get(event_type, [])
 
@@ -253,13 +298,14 @@ class EventBus:
             "event_history_size": len(self._event_history),
             "subscription_count": sum(
                 len(handlers) for handlers in self._subscriptions.values()
-            ),
+            ) + len(self._all_subscriptions),
             "event_types_subscribed": len(self._subscriptions),
         }
 
     def clear_subscriptions(self) -> None:
         """Clear all subscriptions. Useful for testing."""
         self._subscriptions.clear()
+        self._all_subscriptions.clear()
         self.logger.debug("All subscriptions cleared")
 
     def __repr__(self) -> str:
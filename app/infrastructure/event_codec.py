@@ -0,0 +1,479 @@
+"""
+Binary codec for events.
+
+Encodes Event dataclasses into a compact, self-describing binary form and
+decodes them back into equivalent Event instances. Used by the event journal
+and by any component that needs to move events across process boundaries.
+
+Pandas payloads (NewCandleEvent.bar, DataFetchedEvent.bars, recent rows) are
+encoded column by column: numeric, boolean and datetime columns are written
+as raw NumPy buffers, and only object columns fall back to per-value tags.
+Values the codec does not know natively are pickled.
+"""
+
+import dataclasses
+import importlib
+import pickle
+import struct
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Dict, Type
+
+import numpy as np
+import pandas as pd
+
+from app.events.base import Event
+
+
+# Value tags
+_NONE = ord("N")
+_TRUE = ord("T")
+_FALSE = ord("F")
+_INT = ord("i")
+_BIGINT = ord("I")
+_FLOAT = ord("f")
+_STR = ord("s")
+_BYTES = ord("b")
+_DATETIME = ord("d")
+_DATE = ord("y")
+_TIMEDELTA = ord("g")
+_TIMESTAMP = ord("p")
+_LIST = ord("l")
+_TUPLE = ord("u")
+_DICT = ord("m")
+_DEQUE = ord("q")
+_ENUM = ord("e")
+_NDARRAY = ord("a")
+_SERIES = ord("S")
+_FRAME = ord("D")
+_PICKLE = ord("P")
+_REPR = ord("r")
+
+# Column layouts
+_COL_RAW = ord("a")
+_COL_TZ = ord("z")
+_COL_OBJECT = ord("o")
+
+# Index layouts
+_IDX_RANGE = ord("R")
+_IDX_VALUES = ord("V")
+
+_RAW_KINDS = frozenset("biufcmM")
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_I64x3 = struct.Struct("<qqq")
+
+
+class EventCodecError(Exception):
+    """Raised when a payload cannot be decoded."""
+
+
+def datetime_to_us(value: datetime) -> int:
+    """
+    Convert a datetime to microseconds since the Unix epoch.
+
+    Naive datetimes are treated as wall-clock values (no timezone conversion),
+    aware datetimes are converted to UTC first.
+    """
+    if value.tzinfo is None:
+        return (value - _EPOCH) // _ONE_US
+    return (value - _EPOCH_UTC) // _ONE_US
+
+
+def us_to_datetime(value: int, aware: bool = False) -> datetime:
+    """Inverse of datetime_to_us."""
+    if aware:
+        return _EPOCH_UTC + timedelta(microseconds=value)
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def type_key(cls: type) -> str:
+    """Return the importable 'module:QualName' key for a class."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+_class_cache: Dict[str, type] = {}
+
+
+def resolve_type(key: str) -> type:
+    """Import and return the class identified by a 'module:QualName' key."""
+    cls = _class_cache.get(key)
+    if cls is None:
+        module_name, _, qualname = key.partition(":")
+        obj: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+        cls = obj
+        _class_cache[key] = cls
+    return cls
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+def _write_str(buf: bytearray, value: str) -> None:
+    raw = value.encode("utf-8")
+    buf += _U32.pack(len(raw))
+    buf += raw
+
+
+def _write_array(buf: bytearray, array: np.ndarray) -> None:
+    array = np.ascontiguousarray(array)
+    _write_str(buf, array.dtype.str)
+    buf += _U32.pack(len(array))
+    buf += array.tobytes()
+
+
+def _write_column(buf: bytearray, values: Any) -> None:
+    """Write a 1-D pandas/NumPy column using the most compact layout."""
+    dtype = getattr(values, "dtype", None)
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        buf.append(_COL_TZ)
+        _write_str(buf, str(dtype.tz))
+        _write_str(buf, dtype.unit)
+        _write_array(buf, np.asarray(values.asi8 if hasattr(values, "asi8") else values.array.asi8))
+        return
+
+    if isinstance(dtype, np.dtype) and dtype.kind in _RAW_KINDS:
+        buf.append(_COL_RAW)
+        _write_array(buf, np.asarray(values))
+        return
+
+    buf.append(_COL_OBJECT)
+    items = list(values)
+    buf += _U32.pack(len(items))
+    for item in items:
+        encode_value(buf, item)
+
+
+def _write_index(buf: bytearray, index: pd.Index) -> None:
+    if isinstance(index, pd.RangeIndex):
+        buf.append(_IDX_RANGE)
+        buf += _I64x3.pack(index.start, index.stop, index.step)
+    else:
+        buf.append(_IDX_VALUES)
+        _write_column(buf, index)
+    encode_value(buf, index.name)
+
+
+def encode_value(buf: bytearray, value: Any) -> None:
+    """
+    Append the tagged encoding of a value to a buffer.
+
+    Args:
+        buf: Output buffer
+        value: Value to encode
+    """
+    if value is None:
+        buf.append(_NONE)
+    elif value is True or value is np.True_:
+        buf.append(_TRUE)
+    elif value is False or value is np.False_:
+        buf.append(_FALSE)
+    elif isinstance(value, Enum):
+        buf.append(_ENUM)
+        _write_str(buf, type_key(type(value)))
+        encode_value(buf, value.value)
+    elif isinstance(value, (int, np.integer)):
+        value = int(value)
+        if -(1 << 63) <= value < (1 << 63):
+            buf.append(_INT)
+            buf += _I64.pack(value)
+        else:
+            buf.append(_BIGINT)
+            _write_str(buf, str(value))
+    elif isinstance(value, (float, np.floating)):
+        buf.append(_FLOAT)
+        buf += _F64.pack(float(value))
+    elif isinstance(value, str):
+        buf.append(_STR)
+        _write_str(buf, value)
+    elif isinstance(value, (bytes, bytearray)):
+        buf.append(_BYTES)
+        buf += _U32.pack(len(value))
+        buf += value
+    elif isinstance(value, pd.Timestamp):
+        buf.append(_TIMESTAMP)
+        buf += _I64.pack(value.value)
+        _write_str(buf, str(value.tz) if value.tz is not None else "")
+    elif isinstance(value, datetime):
+        buf.append(_DATETIME)
+        buf += _I64.pack(datetime_to_us(value))
+        buf += _U8.pack(1 if value.tzinfo is not None else 0)
+    elif isinstance(value, date):
+        buf.append(_DATE)
+        buf += _I64.pack(value.toordinal())
+    elif isinstance(value, timedelta):
+        buf.append(_TIMEDELTA)
+        buf += _I64.pack(value // _ONE_US)
+    elif isinstance(value, pd.DataFrame):
+        buf.append(_FRAME)
+        buf += _U32.pack(value.shape[1])
+        _write_index(buf, value.index)
+        for name, column in value.items():
+            encode_value(buf, name)
+            _write_column(buf, column)
+    elif isinstance(value, pd.Series):
+        buf.append(_SERIES)
+        encode_value(buf, value.name)
+        _write_index(buf, value.index)
+        _write_column(buf, value)
+    elif isinstance(value, np.ndarray) and value.dtype.kind in _RAW_KINDS and value.ndim == 1:
+        buf.append(_NDARRAY)
+        _write_array(buf, value)
+    elif isinstance(value, dict):
+        buf.append(_DICT)
+        buf += _U32.pack(len(value))
+        for key, item in value.items():
+            encode_value(buf, key)
+            encode_value(buf, item)
+    elif isinstance(value, deque):
+        buf.append(_DEQUE)
+        encode_value(buf, value.maxlen)
+        buf += _U32.pack(len(value))
+        for item in value:
+            encode_value(buf, item)
+    elif isinstance(value, list):
+        buf.append(_LIST)
+        buf += _U32.pack(len(value))
+        for item in value:
+            encode_value(buf, item)
+    elif type(value) is tuple:
+        buf.append(_TUPLE)
+        buf += _U32.pack(len(value))
+        for item in value:
+            encode_value(buf, item)
+    else:
+        try:
+            raw = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            buf.append(_REPR)
+            _write_str(buf, repr(value))
+            return
+        buf.append(_PICKLE)
+        buf += _U32.pack(len(raw))
+        buf += raw
+
+
+def encode_event(event: Event) -> bytes:
+    """
+    Encode an event into bytes.
+
+    Layout: event type key, field count, then (field name, tagged value) pairs.
+
+    Args:
+        event: Event to encode
+
+    Returns:
+        Encoded payload
+    """
+    buf = bytearray()
+    _write_str(buf, type_key(type(event)))
+    fields = [f for f in dataclasses.fields(event) if f.init]
+    buf += _U32.pack(len(fields))
+    for f in fields:
+        _write_str(buf, f.name)
+        encode_value(buf, getattr(event, f.name))
+    return bytes(buf)
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+class _Reader:
+    """Sequential reader over a bytes-like payload."""
+
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: Any, pos: int = 0):
+        self.data = memoryview(data)
+        self.pos = pos
+
+    def u8(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def u32(self) -> int:
+        value = _U32.unpack_from(self.data, self.pos)[0]
+        self.pos += 4
+        return value
+
+    def i64(self) -> int:
+        value = _I64.unpack_from(self.data, self.pos)[0]
+        self.pos += 8
+        return value
+
+    def f64(self) -> float:
+        value = _F64.unpack_from(self.data, self.pos)[0]
+        self.pos += 8
+        return value
+
+    def raw(self, size: int) -> memoryview:
+        chunk = self.data[self.pos:self.pos + size]
+        if len(chunk) != size:
+            raise EventCodecError("Unexpected end of payload")
+        self.pos += size
+        return chunk
+
+    def str(self) -> str:
+        return bytes(self.raw(self.u32())).decode("utf-8")
+
+
+def _read_array(reader: _Reader) -> np.ndarray:
+    dtype = np.dtype(reader.str())
+    length = reader.u32()
+    chunk = reader.raw(length * dtype.itemsize)
+    return np.frombuffer(chunk, dtype=dtype).copy()
+
+
+def _read_column(reader: _Reader) -> Any:
+    layout = reader.u8()
+    if layout == _COL_RAW:
+        return _read_array(reader)
+    if layout == _COL_TZ:
+        tz = reader.str()
+        unit = reader.str()
+        values = _read_array(reader)
+        return pd.DatetimeIndex(values.view(f"M8[{unit}]")).tz_localize("UTC").tz_convert(tz)
+    if layout == _COL_OBJECT:
+        count = reader.u32()
+        items = [decode_value(reader) for _ in range(count)]
+        return np.array(items, dtype=object) if items else np.empty(0, dtype=object)
+    raise EventCodecError(f"Unknown column layout: {layout!r}")
+
+
+def _read_index(reader: _Reader) -> pd.Index:
+    layout = reader.u8()
+    if layout == _IDX_RANGE:
+        start, stop, step = _I64x3.unpack_from(reader.data, reader.pos)
+        reader.pos += _I64x3.size
+        index = pd.RangeIndex(start, stop, step)
+    elif layout == _IDX_VALUES:
+        index = pd.Index(_read_column(reader))
+    else:
+        raise EventCodecError(f"Unknown index layout: {layout!r}")
+    index.name = decode_value(reader)
+    return index
+
+
+def decode_value(reader: _Reader) -> Any:
+    """Decode one tagged value from a reader."""
+    tag = reader.u8()
+
+    if tag == _NONE:
+        return None
+    if tag == _TRUE:
+        return True
+    if tag == _FALSE:
+        return False
+    if tag == _INT:
+        return reader.i64()
+    if tag == _FLOAT:
+        return reader.f64()
+    if tag == _STR:
+        return reader.str()
+    if tag == _TIMESTAMP:
+        value = reader.i64()
+        tz = reader.str()
+        return pd.Timestamp(value, tz="UTC").tz_convert(tz) if tz else pd.Timestamp(value)
+    if tag == _DATETIME:
+        value = reader.i64()
+        return us_to_datetime(value, aware=bool(reader.u8()))
+    if tag == _SERIES:
+        name = decode_value(reader)
+        index = _read_index(reader)
+        values = _read_column(reader)
+        return pd.Series(values, index=index, name=name)
+    if tag == _FRAME:
+        ncols = reader.u32()
+        index = _read_index(reader)
+        names = []
+        columns = {}
+        for position in range(ncols):
+            names.append(decode_value(reader))
+            columns[position] = _read_column(reader)
+        frame = pd.DataFrame(columns, index=index, copy=False)
+        frame.columns = pd.Index(names) if names else frame.columns
+        return frame
+    if tag == _DICT:
+        count = reader.u32()
+        result = {}
+        for _ in range(count):
+            key = decode_value(reader)
+            result[key] = decode_value(reader)
+        return result
+    if tag == _DEQUE:
+        maxlen = decode_value(reader)
+        count = reader.u32()
+        return deque((decode_value(reader) for _ in range(count)), maxlen=maxlen)
+    if tag == _LIST:
+        count = reader.u32()
+        return [decode_value(reader) for _ in range(count)]
+    if tag == _TUPLE:
+        count = reader.u32()
+        return tuple(decode_value(reader) for _ in range(count))
+    if tag == _ENUM:
+        cls = resolve_type(reader.str())
+        return cls(decode_value(reader))
+    if tag == _NDARRAY:
+        return _read_array(reader)
+    if tag == _BIGINT:
+        return int(reader.str())
+    if tag == _BYTES:
+        return bytes(reader.raw(reader.u32()))
+    if tag == _DATE:
+        return date.fromordinal(reader.i64())
+    if tag == _TIMEDELTA:
+        return timedelta(microseconds=reader.i64())
+    if tag == _PICKLE:
+        return pickle.loads(reader.raw(reader.u32()))
+    if tag == _REPR:
+        return reader.str()
+
+    raise EventCodecError(f"Unknown value tag: {tag!r}")
+
+
+def decode_event(payload: Any) -> Event:
+    """
+    Decode bytes produced by encode_event back into an event.
+
+    Args:
+        payload: Bytes-like payload
+
+    Returns:
+        Reconstructed event (same type, id, timestamp and field values)
+
+    Raises:
+        EventCodecError: If the payload is malformed or its fields no longer
+            match the event class
+    """
+    reader = _Reader(payload)
+    try:
+        cls = resolve_type(reader.str())
+        count = reader.u32()
+        fields = {}
+        for _ in range(count):
+            name = reader.str()
+            fields[name] = decode_value(reader)
+        return cls(**fields)
+    except EventCodecError:
+        raise
+    except Exception as e:
+        raise EventCodecError(f"Malformed event payload: {e}") from e
+
+
+def peek_event_type(payload: Any) -> Type[Event]:
+    """Return the event class of an encoded payload without decoding fields."""
+    return resolve_type(_Reader(payload).str())
+
@@ -0,0 +1,736 @@
+"""
+Append-only binary event journal.
+
+Records every event published on an EventBus into length-prefixed binary
+segment files, and replays them back through a freshly built pipeline
+(replay_journal, or the ``replay`` command, which builds the pipeline with
+LoadTestHarness).
+
+On-disk layout (one directory per journal):
+
+    events-000001.qjl   segment: magic + frames
+    events-000001.qjx   sparse index: (timestamp_us, offset) pairs
+    events-000002.qjl   next segment after rotation
+    ...
+
+Each frame is:
+
+    <u32 body_len> <u32 crc32(body)> body
+    body = <i64 timestamp_us> <u16 symbol_len> symbol <payload>
+
+The payload is produced by app.infrastructure.event_codec. The timestamp and
+symbol live in the frame header so readers can seek and filter without
+decoding payloads. A torn or corrupted tail frame ends the segment.
+
+Example:
+    ```python
+    journal = EventJournal("journal/live")
+    journal.attach(event_bus)
+    ...
+    journal.close()
+
+    # Later: rebuild the pipeline and replay the recorded market data
+    orchestrator.initialize(...)
+    orchestrator.start()
+    stats = replay_journal("journal/live", orchestrator.event_bus, symbols=["XAUUSD"])
+    print(f"{stats.events_per_second:,.0f} events/s")
+    ```
+"""
+
+import argparse
+import logging
+import struct
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Type, Union
+
+import numpy as np
+
+from app.events.base import Event
+from app.events.data_events import DataFetchedEvent, NewCandleEvent
+from app.infrastructure.event_bus import EventBus
+from app.infrastructure.event_codec import (
+    EventCodecError,
+    datetime_to_us,
+    decode_event,
+    encode_event,
+    peek_event_type,
+    us_to_datetime,
+)
+from app.utils.clock import SimulatedClock, use_clock
+
+
+SEGMENT_MAGIC = b"QJL1"
+INDEX_MAGIC = b"QJX1"
+SEGMENT_SUFFIX = ".qjl"
+INDEX_SUFFIX = ".qjx"
+
+_FRAME_HEADER = struct.Struct("<II")
+_BODY_HEADER = struct.Struct("<qH")
+_INDEX_ENTRY = struct.Struct("<qq")
+_INDEX_DTYPE = np.dtype([("timestamp_us", "<i8"), ("offset", "<i8")])
+
+# Events that originate at the data-fetching edge of the pipeline.
+# Replaying only these into a fresh pipeline regenerates everything downstream.
+DEFAULT_REPLAY_EVENT_TYPES = (DataFetchedEvent, NewCandleEvent)
+
+TimeBound = Optional[Union[datetime, int]]
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    """
+    A raw journal frame.
+
+    Attributes:
+        timestamp_us: Event timestamp in microseconds since epoch
+        symbol: Event symbol ("" for account-level events)
+        payload: Encoded event payload
+        segment: Segment file the record came from
+        offset: Byte offset of the frame within the segment
+    """
+    timestamp_us: int
+    symbol: str
+    payload: memoryview
+    segment: Path
+    offset: int
+
+    @property
+    def event_type(self) -> Type[Event]:
+        """Event class of the record (decodes only the type key)."""
+        return peek_event_type(self.payload)
+
+    def decode(self) -> Event:
+        """Decode the full event."""
+        return decode_event(self.payload)
+
+
+@dataclass(frozen=True)
+class ReplayStats:
+    """
+    Result of a journal replay.
+
+    Attributes:
+        events_read: Frames that passed the time/symbol filters
+        events_published: Events published to the EventBus
+        elapsed_seconds: Wall-clock duration of the replay
+        first_timestamp: Timestamp of the first published event
+        last_timestamp: Timestamp of the last published event
+    """
+    events_read: int
+    events_published: int
+    elapsed_seconds: float
+    first_timestamp: Optional[datetime] = None
+    last_timestamp: Optional[datetime] = None
+
+    @property
+    def events_per_second(self) -> float:
+        """Replay throughput."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.events_published / self.elapsed_seconds
+
+
+def _to_us(value: TimeBound) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return datetime_to_us(value)
+    return int(value)
+
+
+def _segment_paths(journal_dir: Path, prefix: str) -> List[Path]:
+    return sorted(journal_dir.glob(f"{prefix}-*{SEGMENT_SUFFIX}"))
+
+
+def _segment_number(path: Path) -> int:
+    return int(path.stem.rsplit("-", 1)[-1])
+
+
+class EventJournal:
+    """
+    Writes events to an append-only, segmented binary journal.
+
+    A new segment is started on open (existing segments are never appended to)
+    and whenever the current segment exceeds max_segment_bytes. Every
+    index_interval-th frame, and the first frame of each segment, gets an
+    entry in the segment's index file for timestamp seeks.
+
+    Example:
+        ```python
+        with EventJournal("journal/live", max_segment_bytes=32 * 1024 * 1024) as journal:
+            journal.attach(event_bus)
+            orchestrator.run(interval_seconds=5)
+        ```
+    """
+
+    def __init__(
+        self,
+        journal_dir: Union[str, Path],
+        prefix: str = "events",
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        index_interval: int = 256,
+        flush_every: int = 1,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the journal writer.
+
+        Args:
+            journal_dir: Directory holding segment and index files
+            prefix: Segment file name prefix
+            max_segment_bytes: Rotate to a new segment beyond this size
+            index_interval: Write an index entry every N frames
+            flush_every: Flush OS buffers every N frames (1 = every frame)
+            logger: Optional logger
+        """
+        if max_segment_bytes <= len(SEGMENT_MAGIC):
+            raise ValueError("max_segment_bytes is too small")
+        if index_interval < 1:
+            raise ValueError("index_interval must be >= 1")
+
+        self.journal_dir = Path(journal_dir)
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.index_interval = index_interval
+        self.flush_every = max(1, flush_every)
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+
+        existing = _segment_paths(self.journal_dir, prefix)
+        self._segment_number = _segment_number(existing[-1]) if existing else 0
+
+        self._segment_file: Optional[BinaryIO] = None
+        self._index_file: Optional[BinaryIO] = None
+        self._segment_path: Optional[Path] = None
+        self._segment_size = 0
+        self._segment_frames = 0
+        self._pending_flush = 0
+
+        self._event_bus: Optional[EventBus] = None
+        self._subscription_id: Optional[str] = None
+
+        self._metrics = {
+            "events_recorded": 0,
+            "bytes_written": 0,
+            "segments_created": 0,
+            "encode_errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # EventBus integration
+    # ------------------------------------------------------------------
+
+    def attach(self, event_bus: EventBus) -> str:
+        """
+        Start recording every event published on an EventBus.
+
+        Args:
+            event_bus: EventBus to record
+
+        Returns:
+            Subscription ID
+        """
+        if self._subscription_id is not None:
+            raise RuntimeError("EventJournal is already attached to an EventBus")
+
+        self._event_bus = event_bus
+        self._subscription_id = event_bus.subscribe_all(self.record)
+        self.logger.info(f"Event journal recording to {self.journal_dir}")
+        return self._subscription_id
+
+    def detach(self) -> None:
+        """Stop recording events."""
+        if self._event_bus is not None and self._subscription_id is not None:
+            self._event_bus.unsubscribe(self._subscription_id)
+        self._event_bus = None
+        self._subscription_id = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def record(self, event: Event) -> None:
+        """
+        Append an event to the journal.
+
+        Encoding failures are logged and counted, never raised, so a bad
+        payload cannot break event delivery.
+
+        Args:
+            event: Event to record
+        """
+        try:
+            payload = encode_event(event)
+        except Exception as e:
+            self._metrics["encode_errors"] += 1
+            self.logger.error(f"Failed to encode {type(event).__name__} for journal: {e}")
+            return
+
+        timestamp_us = datetime_to_us(event.timestamp)
+        symbol = getattr(event, "symbol", None)
+        symbol_raw = symbol.encode("utf-8") if isinstance(symbol, str) else b""
+
+        body = _BODY_HEADER.pack(timestamp_us, len(symbol_raw)) + symbol_raw + payload
+        frame = _FRAME_HEADER.pack(len(body), zlib.crc32(body)) + body
+
+        if self._segment_file is None or (
+            self._segment_frames > 0
+            and self._segment_size + len(frame) > self.max_segment_bytes
+        ):
+            self._rotate()
+
+        offset = self._segment_size
+        self._segment_file.write(frame)
+        self._segment_size += len(frame)
+
+        if self._segment_frames % self.index_interval == 0:
+            self._index_file.write(_INDEX_ENTRY.pack(timestamp_us, offset))
+
+        self._segment_frames += 1
+        self._metrics["events_recorded"] += 1
+        self._metrics["bytes_written"] += len(frame)
+
+        self._pending_flush += 1
+        if self._pending_flush >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush buffered frames and index entries to the OS."""
+        if self._segment_file is not None:
+            self._segment_file.flush()
+            self._index_file.flush()
+        self._pending_flush = 0
+
+    def close(self) -> None:
+        """Detach from the EventBus and close the current segment."""
+        self.detach()
+        self._close_segment()
+
+    def _rotate(self) -> None:
+        self._close_segment()
+
+        self._segment_number += 1
+        stem = f"{self.prefix}-{self._segment_number:06d}"
+        self._segment_path = self.journal_dir / f"{stem}{SEGMENT_SUFFIX}"
+
+        self._segment_file = open(self._segment_path, "wb")
+        self._index_file = open(self.journal_dir / f"{stem}{INDEX_SUFFIX}", "wb")
+        self._segment_file.write(SEGMENT_MAGIC)
+        self._index_file.write(INDEX_MAGIC)
+
+        self._segment_size = len(SEGMENT_MAGIC)
+        self._segment_frames = 0
+        self._metrics["segments_created"] += 1
+
+        self.logger.debug(f"Journal segment opened: {self._segment_path}")
+
+    def _close_segment(self) -> None:
+        if self._segment_file is None:
+            return
+        self.flush()
+        self._segment_file.close()
+        self._index_file.close()
+        self._segment_file = None
+        self._index_file = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get journal metrics."""
+        return {
+            **self._metrics,
+            "current_segment": str(self._segment_path) if self._segment_path else None,
+            "current_segment_bytes": self._segment_size,
+        }
+
+    def __enter__(self) -> "EventJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class JournalReader:
+    """
+    Reads events back from a journal directory.
+
+    Segments are read whole into memory and frames are sliced as memoryviews,
+    so filtering by time or symbol never decodes a payload. Timestamp seeks use
+    the sparse index files and assume events were recorded in publish order.
+
+    Example:
+        ```python
+        reader = JournalReader("journal/live")
+        for event in reader.read(start=datetime(2025, 1, 6), symbols=["XAUUSD"]):
+            print(event)
+        ```
+    """
+
+    def __init__(
+        self,
+        journal_dir: Union[str, Path],
+        prefix: str = "events",
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the reader.
+
+        Args:
+            journal_dir: Directory holding segment and index files
+            prefix: Segment file name prefix
+            logger: Optional logger
+        """
+        self.journal_dir = Path(journal_dir)
+        self.prefix = prefix
+        self.logger = logger or logging.getLogger(__name__)
+
+        if not self.journal_dir.exists():
+            raise FileNotFoundError(f"Journal directory not found: {self.journal_dir}")
+
+    def segments(self) -> List[Path]:
+        """Segment files in recording order."""
+        return _segment_paths(self.journal_dir, self.prefix)
+
+    def load_index(self, segment: Path) -> np.ndarray:
+        """
+        Load the sparse index of a segment.
+
+        Returns:
+            Structured array with 'timestamp_us' and 'offset' fields
+            (empty if the index file is missing or invalid)
+        """
+        index_path = segment.with_suffix(INDEX_SUFFIX)
+        if not index_path.exists():
+            return np.empty(0, dtype=_INDEX_DTYPE)
+
+        raw = index_path.read_bytes()
+        if raw[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            self.logger.warning(f"Ignoring invalid journal index: {index_path}")
+            return np.empty(0, dtype=_INDEX_DTYPE)
+
+        body = raw[len(INDEX_MAGIC):]
+        usable = len(body) - len(body) % _INDEX_DTYPE.itemsize
+        return np.frombuffer(body[:usable], dtype=_INDEX_DTYPE)
+
+    def records(
+        self,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        symbols: Optional[Iterable[str]] = None,
+    ) -> Iterator[JournalRecord]:
+        """
+        Iterate raw frames in recording order.
+
+        Args:
+            start: Inclusive lower bound (datetime or epoch microseconds)
+            end: Inclusive upper bound (datetime or epoch microseconds)
+            symbols: Only yield events for these symbols. Events without a
+                symbol (account-level events) are always yielded.
+
+        Yields:
+            JournalRecord for each matching frame
+        """
+        start_us = _to_us(start)
+        end_us = _to_us(end)
+        symbol_filter = {s.upper() for s in symbols} if symbols else None
+
+        segments = self.segments()
+        indexes = [self.load_index(segment) for segment in segments]
+
+        for position, segment in enumerate(segments):
+            index = indexes[position]
+
+            if start_us is not None:
+                # Whole segment precedes the window if the next one starts before it
+                following = indexes[position + 1] if position + 1 < len(segments) else None
+                if following is not None and len(following) and following["timestamp_us"][0] <= start_us:
+                    continue
+
+            if end_us is not None and len(index) and index["timestamp_us"][0] > end_us:
+                return
+
+            offset = len(SEGMENT_MAGIC)
+            if start_us is not None and len(index):
+                slot = int(np.searchsorted(index["timestamp_us"], start_us, side="right")) - 1
+                if slot >= 0:
+                    offset = int(index["offset"][slot])
+
+            for record in self._scan_segment(segment, offset):
+                if start_us is not None and record.timestamp_us < start_us:
+                    continue
+                if end_us is not None and record.timestamp_us > end_us:
+                    return
+                if symbol_filter is not None and record.symbol and record.symbol.upper() not in symbol_filter:
+                    continue
+                yield record
+
+    def read(
+        self,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        symbols: Optional[Iterable[str]] = None,
+        event_types: Optional[Sequence[Union[Type[Event], str]]] = None,
+    ) -> Iterator[Event]:
+        """
+        Iterate decoded events in recording order.
+
+        Args:
+            start: Inclusive lower bound (datetime or epoch microseconds)
+            end: Inclusive upper bound (datetime or epoch microseconds)
+            symbols: Only yield events for these symbols (see records())
+            event_types: Only yield events of these classes or class names
+
+        Yields:
+            Decoded events
+        """
+        type_names = None
+        if event_types:
+            type_names = {t if isinstance(t, str) else t.__name__ for t in event_types}
+
+        for record in self.records(start=start, end=end, symbols=symbols):
+            if type_names is not None and record.event_type.__name__ not in type_names:
+                continue
+            yield record.decode()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize journal contents.
+
+        Returns:
+            Dictionary with segment count, total events, counts per event type
+            and per symbol, and the first/last timestamps
+        """
+        by_type: Counter = Counter()
+        by_symbol: Counter = Counter()
+        first_us = last_us = None
+        total = 0
+
+        for record in self.records():
+            total += 1
+            by_type[record.event_type.__name__] += 1
+            by_symbol[record.symbol or "-"] += 1
+            first_us = record.timestamp_us if first_us is None else first_us
+            last_us = record.timestamp_us
+
+        return {
+            "segments": len(self.segments()),
+            "events": total,
+            "by_type": dict(by_type),
+            "by_symbol": dict(by_symbol),
+            "first_timestamp": us_to_datetime(first_us) if first_us is not None else None,
+            "last_timestamp": us_to_datetime(last_us) if last_us is not None else None,
+        }
+
+    def _scan_segment(self, segment: Path, offset: int) -> Iterator[JournalRecord]:
+        data = memoryview(segment.read_bytes())
+
+        if bytes(data[:len(SEGMENT_MAGIC)]) != SEGMENT_MAGIC:
+            self.logger.warning(f"Skipping journal segment with bad magic: {segment}")
+            return
+
+        size = len(data)
+        header_size = _FRAME_HEADER.size
+
+        while offset + header_size <= size:
+            body_len, crc = _FRAME_HEADER.unpack_from(data, offset)
+            body_start = offset + header_size
+            body_end = body_start + body_len
+
+            if body_end > size:
+                self.logger.warning(f"Truncated frame at {segment}:{offset}, stopping segment")
+                return
+
+            body = data[body_start:body_end]
+            if zlib.crc32(body) != crc:
+                self.logger.warning(f"Checksum mismatch at {segment}:{offset}, stopping segment")
+                return
+
+            timestamp_us, symbol_len = _BODY_HEADER.unpack_from(body, 0)
+            symbol_end = _BODY_HEADER.size + symbol_len
+            symbol = bytes(body[_BODY_HEADER.size:symbol_end]).decode("utf-8")
+
+            yield JournalRecord(
+                timestamp_us=timestamp_us,
+                symbol=symbol,
+                payload=body[symbol_end:],
+                segment=segment,
+                offset=offset,
+            )
+
+            offset = body_end
+
+
+def replay_journal(
+    journal_dir: Union[str, Path],
+    event_bus: EventBus,
+    start: TimeBound = None,
+    end: TimeBound = None,
+    symbols: Optional[Iterable[str]] = None,
+    event_types: Optional[Sequence[Union[Type[Event], str]]] = DEFAULT_REPLAY_EVENT_TYPES,
+    prefix: str = "events",
+    clock: Optional[SimulatedClock] = None,
+    logger: Optional[logging.Logger] = None,
+) -> ReplayStats:
+    """
+    Replay a journal into an EventBus as fast as the pipeline can consume it.
+
+    Events keep their original event_id, timestamp and correlation_id, so a
+    replay through the same pipeline code is deterministic. There is no
+    pacing: events are published back to back.
+
+    By default only data events (DataFetchedEvent, NewCandleEvent) are
+    replayed, since a fresh pipeline regenerates everything downstream of them.
+    Pass event_types=None to replay every recorded event.
+
+    Args:
+        journal_dir: Journal directory
+        event_bus: EventBus of a freshly built pipeline
+        start: Inclusive lower time bound
+        end: Inclusive upper time bound
+        symbols: Only replay these symbols
+        event_types: Event classes (or names) to replay, None for all
+        prefix: Segment file name prefix
+        clock: Simulated clock set to each event's timestamp before it is
+            published, so components reading the clock see recorded time
+        logger: Optional logger
+
+    Returns:
+        ReplayStats with counts and throughput
+    """
+    logger = logger or logging.getLogger(__name__)
+    reader = JournalReader(journal_dir, prefix=prefix, logger=logger)
+
+    type_names = None
+    if event_types:
+        type_names = {t if isinstance(t, str) else t.__name__ for t in event_types}
+
+    read_count = 0
+    published = 0
+    first_ts = last_ts = None
+
+    started = time.perf_counter()
+    for record in reader.records(start=start, end=end, symbols=symbols):
+        read_count += 1
+        if type_names is not None and record.event_type.__name__ not in type_names:
+            continue
+
+        try:
+            event = record.decode()
+        except EventCodecError as e:
+            logger.error(f"Skipping undecodable frame at {record.segment}:{record.offset}: {e}")
+            continue
+
+        if clock is not None:
+            clock.set(event.timestamp)
+        event_bus.publish(event)
+        published += 1
+        if first_ts is None:
+            first_ts = event.timestamp
+        last_ts = event.timestamp
+    elapsed = time.perf_counter() - started
+
+    stats = ReplayStats(
+        events_read=read_count,
+        events_published=published,
+        elapsed_seconds=elapsed,
+        first_timestamp=first_ts,
+        last_timestamp=last_ts,
+    )
+    logger.info(
+        f"Replayed {published} events from {journal_dir} in {elapsed:.3f}s "
+        f"({stats.events_per_second:,.0f} events/s)"
+    )
+    return stats
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    ``bench`` only measures decoding: it publishes into a bare EventBus with
+    no subscribers. ``replay`` builds the trading pipeline for the journal's
+    symbols (strategies and indicators from --config-dir, a simulated broker
+    behind the MT5 stub server) and replays the journal into it, with a
+    simulated clock following the recorded time.
+
+    Usage:
+        python -m app.infrastructure.event_journal info journal/live
+        python -m app.infrastructure.event_journal bench journal/live --symbol XAUUSD
+        python -m app.infrastructure.event_journal replay journal/live --config-dir config --history-dir ./data
+    """
+    parser = argparse.ArgumentParser(description="Inspect, benchmark and replay event journals")
+    parser.add_argument("command", choices=["info", "bench", "replay"])
+    parser.add_argument("journal_dir")
+    parser.add_argument("--prefix", default="events")
+    parser.add_argument("--symbol", action="append", dest="symbols")
+    parser.add_argument("--start", type=datetime.fromisoformat)
+    parser.add_argument("--end", type=datetime.fromisoformat)
+    parser.add_argument("--all-events", action="store_true", help="bench/replay: replay every event type")
+    parser.add_argument("--config-dir", default="config", help="replay: strategy and indicator configuration")
+    parser.add_argument("--config-symbol", help="replay: configuration folder for every symbol "
+                                                "(default: each symbol's own folder)")
+    parser.add_argument("--history-dir", help="replay: {symbol}_{timeframe}.parquet files for indicator warm-up "
+                                              "(default: synthetic bars before the journal start)")
+    parser.add_argument("--history-days", type=float, default=3.0, help="replay: days of synthetic history")
+    args = parser.parse_args(argv)
+    event_types = None if args.all_events else DEFAULT_REPLAY_EVENT_TYPES
+
+    if args.command == "info":
+        summary = JournalReader(args.journal_dir, prefix=args.prefix).summary()
+        print(f"Segments: {summary['segments']}")
+        print(f"Events:   {summary['events']}")
+        print(f"Range:    {summary['first_timestamp']} -> {summary['last_timestamp']}")
+        for name, count in sorted(summary["by_type"].items()):
+            print(f"  {name:<32} {count}")
+        for symbol, count in sorted(summary["by_symbol"].items()):
+            print(f"  {symbol:<32} {count}")
+        return 0
+
+    if args.command == "bench":
+        # Decode + publish into a bare EventBus: no pipeline behind it
+        stats = replay_journal(
+            args.journal_dir,
+            EventBus(event_history_limit=0),
+            start=args.start,
+            end=args.end,
+            symbols=args.symbols,
+            event_types=event_types,
+            prefix=args.prefix,
+        )
+    else:
+        from app.infrastructure.load_test import LoadTestHarness, LoadTestSettings
+
+        summary = JournalReader(args.journal_dir, prefix=args.prefix).summary()
+        symbols = args.symbols or sorted(symbol for symbol in summary["by_symbol"] if symbol != "-")
+        if not symbols or summary["first_timestamp"] is None:
+            print(f"No symbol events in {args.journal_dir}")
+            return 1
+        harness = LoadTestHarness(
+            symbols=symbols,
+            config_symbol=args.config_symbol,
+            settings=LoadTestSettings(
+                CONF_FOLDER_PATH=args.config_dir,
+                RESTRICTION_CONF_FOLDER_PATH=str(Path(args.config_dir) / "restrictions"),
+            ),
+            history_days=args.history_days,
+            history_dir=args.history_dir,
+        )
+        # History and the broker see the time the journal starts at
+        with use_clock(SimulatedClock(args.start or summary["first_timestamp"])):
+            stats = harness.replay(
+                args.journal_dir, start=args.start, end=args.end, event_types=event_types, prefix=args.prefix
+            )
+
+    print(
+        f"Replayed {stats.events_published}/{stats.events_read} events in "
+        f"{stats.elapsed_seconds:.3f}s ({stats.events_per_second:,.0f} events/s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,447 @@
+"""
+Load and latency test of the multi-symbol pipeline against the MT5 stub server.
+
+Starts an MT5StubServer with synthetic bars for N symbols, builds the real
+components (MT5Client over HTTP, DataSourceManager, strategies, indicators,
+trade executors) for every symbol from one symbol's configuration folder,
+and drives MultiSymbolTradingOrchestrator.run_iteration() for a number of
+rounds. Each round is one fetch/evaluate/execute pass over every symbol.
+
+With a SimulatedClock installed (the default from the command line), the
+clock moves one bar between rounds so every round sees a new candle and
+runs the full indicator/strategy/execution path, without waiting for real
+bars. Request latency, failures and concurrency limits come from the stub
+server's profiles, so the round latency reported is the network-bound
+latency the pipeline would see against a broker bridge.
+
+Report:
+- Round latency (mean, p50, p95, max)
+- API calls per round and per minute, per route and per HTTP status
+- Injected errors and throttled (429) responses, server-side queueing
+
+Example:
+    ```python
+    with use_clock(SimulatedClock(datetime(2024, 3, 4, 9, 0))):
+        harness = LoadTestHarness(
+            symbols=["LOAD01", "LOAD02", "LOAD03"],
+            latency=LatencyProfile("lognormal", 20, 10),
+            faults=FaultProfile(error_rate=0.01),
+        )
+        report = harness.run(rounds=30)
+    print(report.summary())
+    ```
+
+From the command line:
+
+    python -m app.infrastructure.load_test --symbols 8 --rounds 30 --latency lognormal:20:10 --fetch-mode concurrent
+
+The same pipeline can instead be fed a recorded event journal
+(LoadTestHarness.replay, or ``python -m app.infrastructure.event_journal
+replay``), to benchmark an incident or a pipeline change on real data.
+"""
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from app.clients.mt5.client import MT5Client
+from app.clients.mt5.simulated import SimulatedBroker, SymbolSpec
+from app.clients.mt5.stub_server import BarFeed, FaultProfile, LatencyProfile, MT5StubServer, StubServerStats
+from app.data.backtest_data import BacktestDataSource
+from app.data.data_manger import DataSourceManager
+from app.data.live_data import LiveDataSource
+from app.events.base import Event
+from app.infrastructure.event_journal import DEFAULT_REPLAY_EVENT_TYPES, ReplayStats, replay_journal
+from app.infrastructure.multi_symbol_orchestrator import MultiSymbolTradingOrchestrator
+from app.utils.clock import SimulatedClock, get_clock, use_clock
+from app.utils.date_helper import DateHelper
+from app.utils.multi_symbol_loader import load_all_components_for_symbols, load_indicators_for_symbol
+
+
+@dataclass
+class LoadTestSettings:
+    """
+    Per-symbol trading settings for the load test (the subset of
+    LoadEnvironmentVariables the component loader reads).
+    """
+    CONF_FOLDER_PATH: str = "config"
+    RESTRICTION_CONF_FOLDER_PATH: str = "config/restrictions"
+    ACCOUNT_TYPE: str = "swing"
+    DAILY_LOSS_LIMIT: float = 5000.0
+    DEFAULT_CLOSE_TIME: str = "23:00:00"
+    NEWS_RESTRICTION_DURATION: int = 5
+    MARKET_CLOSE_RESTRICTION_DURATION: int = 5
+    PIP_VALUE: int = 100
+    POSITION_SPLIT: int = 1
+    SCALING_TYPE: str = "equal"
+    ENTRY_SPACING: float = 0.1
+    RISK_PER_GROUP: float = 100.0
+    STRATEGY_CACHE_PATH: str = ""
+
+    def get_symbol_config(self, symbol: str) -> Dict[str, Any]:
+        """Same settings for every symbol."""
+        return {
+            'pip_value': self.PIP_VALUE,
+            'position_split': self.POSITION_SPLIT,
+            'scaling_type': self.SCALING_TYPE,
+            'entry_spacing': self.ENTRY_SPACING,
+            'risk_per_group': self.RISK_PER_GROUP,
+        }
+
+
+@dataclass
+class LoadTestReport:
+    """
+    Result of a load test run.
+
+    Attributes:
+        symbols: Symbols driven
+        round_seconds: Wall-clock duration of each round
+        elapsed_seconds: Wall-clock duration of all rounds
+        server: Stub server counters for the rounds (setup requests excluded)
+        setup_seconds: Wall-clock time to build and start the pipeline
+        setup_requests: Requests made while building (history loads)
+    """
+    symbols: List[str]
+    round_seconds: List[float]
+    elapsed_seconds: float
+    server: StubServerStats
+    setup_seconds: float = 0.0
+    setup_requests: int = 0
+
+    @property
+    def rounds(self) -> int:
+        return len(self.round_seconds)
+
+    @property
+    def api_calls(self) -> int:
+        return self.server.requests
+
+    @property
+    def calls_per_round(self) -> float:
+        return self.api_calls / self.rounds if self.rounds else 0.0
+
+    @property
+    def calls_per_minute(self) -> float:
+        return self.api_calls * 60.0 / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def latency(self, percentile: float) -> float:
+        """Round latency percentile, in seconds."""
+        return float(np.percentile(self.round_seconds, percentile)) if self.round_seconds else 0.0
+
+    def summary(self) -> str:
+        """Human-readable report."""
+        mean = statistics.fmean(self.round_seconds) if self.round_seconds else 0.0
+        lines = [
+            f"Load test: {len(self.symbols)} symbols x {self.rounds} rounds in {self.elapsed_seconds:.2f}s "
+            f"(setup {self.setup_seconds:.2f}s, {self.setup_requests} requests)",
+            f"  Round latency: mean {mean * 1000:.1f}ms | p50 {self.latency(50) * 1000:.1f}ms | "
+            f"p95 {self.latency(95) * 1000:.1f}ms | max {max(self.round_seconds, default=0.0) * 1000:.1f}ms",
+            f"  API calls: {self.api_calls} ({self.calls_per_round:.1f}/round, {self.calls_per_minute:,.0f}/min)",
+            f"  Injected: {self.server.injected_errors} errors, {self.server.throttled} throttled | "
+            f"max in flight {self.server.max_in_flight}, queued {self.server.queue_seconds:.2f}s",
+            f"  Status codes: {dict(sorted(self.server.status_codes.items()))}",
+            "  Calls per route:",
+        ]
+        for route, count in sorted(self.server.by_route.items(), key=lambda item: -item[1]):
+            lines.append(f"    {count:6d}  {route}")
+        return "\n".join(lines)
+
+
+class LoadTestHarness:
+    """Drives MultiSymbolTradingOrchestrator against a local MT5 stub server."""
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        latency: Optional[LatencyProfile] = None,
+        faults: Optional[FaultProfile] = None,
+        max_concurrency: Optional[int] = None,
+        config_symbol: Optional[str] = "xauusd",
+        settings: Optional[LoadTestSettings] = None,
+        orchestrator_config: Optional[Dict[str, Any]] = None,
+        bar_step: Optional[timedelta] = timedelta(minutes=1),
+        history_days: Optional[float] = None,
+        history_dir: Optional[str] = None,
+        balance: float = 100000.0,
+        seed: int = 0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the harness.
+
+        Args:
+            symbols: Symbols to trade (any names; bars are synthetic)
+            latency: Stub server latency profile
+            faults: Stub server fault profile
+            max_concurrency: Stub server concurrency limit
+            config_symbol: Configuration folder whose strategies and indicators every
+                symbol uses (None: each symbol uses its own folder, as in production)
+            settings: Trading settings (default: LoadTestSettings())
+            orchestrator_config: Extra orchestrator config (fetch_mode, fetch_max_workers, ...)
+            bar_step: Simulated time advanced between rounds when the clock is a
+                SimulatedClock (None keeps the clock still)
+            history_days: Days of bars before the start time (default: the full
+                window LiveDataSource requests; shorter histories make setup
+                faster at the cost of indicator warm-up)
+            history_dir: Folder of ``{symbol}_{timeframe}.parquet`` files served as
+                history instead of synthetic bars
+            balance: Starting balance of the simulated account
+            seed: Random seed of the synthetic bars
+            logger: Optional logger
+        """
+        self.symbols = [symbol.upper() for symbol in symbols]
+        self.latency = latency
+        self.faults = faults
+        self.max_concurrency = max_concurrency
+        self.config_symbol = config_symbol
+        self.settings = settings or LoadTestSettings()
+        self.orchestrator_config = orchestrator_config or {}
+        self.bar_step = bar_step
+        self.history_days = history_days
+        self.history_dir = history_dir
+        self.balance = balance
+        self.seed = seed
+        self.logger = logger or logging.getLogger('load-test')
+
+        self.server: Optional[MT5StubServer] = None
+        self.orchestrator: Optional[MultiSymbolTradingOrchestrator] = None
+
+    def run(self, rounds: int) -> LoadTestReport:
+        """
+        Build the pipeline, drive it for ``rounds`` rounds and tear it down.
+
+        Args:
+            rounds: Fetch rounds to run
+
+        Returns:
+            LoadTestReport
+        """
+        with self._pipeline() as (setup_seconds, setup_requests):
+            if self.faults is not None:
+                self.server.faults = self.faults           # history loads run fault-free
+            round_seconds = self._drive(rounds)
+            elapsed = sum(round_seconds)
+            stats = self.server.stats()
+
+        report = LoadTestReport(
+            symbols=self.symbols,
+            round_seconds=round_seconds,
+            elapsed_seconds=elapsed,
+            server=stats,
+            setup_seconds=setup_seconds,
+            setup_requests=setup_requests,
+        )
+        self.logger.info(f"✓ Load test complete\n{report.summary()}")
+        return report
+
+    def replay(
+        self,
+        journal_dir: Union[str, Path],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        event_types: Optional[Sequence[Union[Type[Event], str]]] = DEFAULT_REPLAY_EVENT_TYPES,
+        prefix: str = "events",
+    ) -> ReplayStats:
+        """
+        Build the pipeline and replay a recorded event journal into it.
+
+        The harness symbols' events are published back to back into the
+        orchestrator's EventBus, so indicators, strategies and trade execution
+        run on the recorded data against the simulated broker. A SimulatedClock
+        installed by the caller follows each event's timestamp.
+
+        Args:
+            journal_dir: Journal directory
+            start: Inclusive lower time bound
+            end: Inclusive upper time bound
+            event_types: Event classes (or names) to replay, None for all
+            prefix: Segment file name prefix
+
+        Returns:
+            ReplayStats of the replay (pipeline setup excluded)
+        """
+        clock = get_clock()
+        with self._pipeline():
+            return replay_journal(
+                journal_dir,
+                self.orchestrator.event_bus,
+                start=start,
+                end=end,
+                symbols=self.symbols,
+                event_types=event_types,
+                prefix=prefix,
+                clock=clock if isinstance(clock, SimulatedClock) else None,
+                logger=self.logger,
+            )
+
+    @contextmanager
+    def _pipeline(self) -> Iterator[Tuple[float, int]]:
+        """Start the stub server and orchestrator; yields (setup seconds, setup requests)."""
+        started = time.perf_counter()
+        self.orchestrator = None
+        with tempfile.TemporaryDirectory() as state_dir:
+            self.server = self._build_server()
+            self.server.start()
+            try:
+                self.orchestrator = self._build_orchestrator(state_dir)
+                self.orchestrator.start()
+                setup = (time.perf_counter() - started, self.server.stats().requests)
+                self.server.reset_stats()
+                yield setup
+            finally:
+                if self.orchestrator is not None:
+                    self.orchestrator.stop()
+                self.server.stop()
+
+    def _drive(self, rounds: int) -> List[float]:
+        """Run the rounds, moving a simulated clock one bar between them."""
+        clock = get_clock()
+        step = self.bar_step if isinstance(clock, SimulatedClock) else None
+        round_seconds = []
+        for index in range(rounds):
+            if step is not None and index:
+                clock.advance(step)
+            round_start = time.perf_counter()
+            self.orchestrator.run_iteration()
+            round_seconds.append(time.perf_counter() - round_start)
+        return round_seconds
+
+    def _config_symbols(self) -> Dict[str, str]:
+        return {symbol: self.config_symbol or symbol.lower() for symbol in self.symbols}
+
+    def _timeframes(self) -> List[str]:
+        timeframes: Dict[str, None] = {}
+        for config_symbol in dict.fromkeys(self._config_symbols().values()):
+            config = load_indicators_for_symbol(self.settings.CONF_FOLDER_PATH, config_symbol, self.logger)
+            timeframes.update(dict.fromkeys(config))
+        return list(timeframes) or ["1", "5", "15"]
+
+    def _build_server(self) -> MT5StubServer:
+        timeframes = self._timeframes()
+        if self.history_dir is not None:
+            frames = {}
+            for symbol in self.symbols:
+                source = BacktestDataSource(self.history_dir, symbol)
+                source.load_data(timeframes)
+                frames.update({(symbol, tf): bars for tf, bars in source.historical_data.items()})
+            feed = BarFeed(frames)
+        else:
+            # Cover the history window LiveDataSource requests for each timeframe
+            history_days = self.history_days
+            if history_days is None:
+                history_days = max(LiveDataSource.HISTORY_DAYS_LOOKUP.get(tf, 7) for tf in timeframes) + 1
+            feed = BarFeed.synthetic(self.symbols, timeframes, history_days=history_days, seed=self.seed)
+        broker = SimulatedBroker({symbol: SymbolSpec() for symbol in self.symbols}, balance=self.balance)
+        return MT5StubServer(
+            broker=broker,
+            feed=feed,
+            latency=self.latency,
+            max_concurrency=self.max_concurrency,
+        )
+
+    def _build_orchestrator(self, state_dir: str) -> MultiSymbolTradingOrchestrator:
+        client = MT5Client(self.server.url)
+        date_helper = DateHelper()
+        data_source = DataSourceManager(mode="live", client=client, date_helper=date_helper)
+
+        symbol_components = load_all_components_for_symbols(
+            symbols=self.symbols,
+            env_config=self.settings,
+            client=client,
+            data_source=data_source,
+            date_helper=date_helper,
+            logger=self.logger,
+            config_symbols=self._config_symbols(),
+        )
+
+        config = {
+            "symbols": self.symbols,
+            "timeframes": self._timeframes(),
+            "automation": {
+                "state_file": str(Path(state_dir) / "automation_state.json"),
+                "toggle_file": str(Path(state_dir) / "toggle_automation.txt"),
+                "file_watcher_enabled": False,
+            },
+            **self.orchestrator_config,
+        }
+        orchestrator = MultiSymbolTradingOrchestrator(config=config, logger=logging.getLogger('load-test-orchestrator'))
+        orchestrator.initialize(
+            client=client,
+            data_source=data_source,
+            symbol_components=symbol_components,
+            date_helper=date_helper,
+        )
+        return orchestrator
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m app.infrastructure.load_test --symbols 8 --rounds 30
+        python -m app.infrastructure.load_test --symbols 20 --latency lognormal:20:10 --error-rate 0.01 --max-concurrency 4 --fetch-mode concurrent
+        python -m app.infrastructure.load_test --symbol XAUUSD --symbol BTCUSD --real-time --rounds 5
+    """
+    parser = argparse.ArgumentParser(description="Load test the multi-symbol pipeline against a local MT5 stub server")
+    parser.add_argument("--symbols", type=int, default=4, help="Number of generated symbols (LOAD01, LOAD02, ...)")
+    parser.add_argument("--symbol", action="append", dest="symbol_names", help="Explicit symbol names")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--latency", type=LatencyProfile.parse, default=LatencyProfile())
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int)
+    parser.add_argument("--fetch-mode", choices=["serial", "concurrent"], default="serial")
+    parser.add_argument("--fetch-max-workers", type=int, default=8)
+    parser.add_argument("--config-dir", default="config")
+    parser.add_argument("--config-symbol", default="xauusd")
+    parser.add_argument("--history-days", type=float, default=3.0,
+                        help="Days of synthetic history (0 for the full live history window)")
+    parser.add_argument("--start", type=datetime.fromisoformat, default=datetime(2024, 3, 4, 9, 0),
+                        help="Simulated start time (ignored with --real-time)")
+    parser.add_argument("--real-time", action="store_true", help="Use the wall clock instead of a simulated one")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+
+    symbols = args.symbol_names or [f"LOAD{i + 1:02d}" for i in range(args.symbols)]
+    settings = LoadTestSettings(
+        CONF_FOLDER_PATH=args.config_dir,
+        RESTRICTION_CONF_FOLDER_PATH=str(Path(args.config_dir) / "restrictions"),
+    )
+    harness = LoadTestHarness(
+        symbols=symbols,
+        latency=args.latency,
+        faults=FaultProfile(error_rate=args.error_rate, throttle_rate=args.throttle_rate, seed=args.seed),
+        max_concurrency=args.max_concurrency,
+        config_symbol=args.config_symbol,
+        settings=settings,
+        orchestrator_config={"fetch_mode": args.fetch_mode, "fetch_max_workers": args.fetch_max_workers},
+        history_days=args.history_days or None,
+        seed=args.seed,
+    )
+
+    if args.real_time:
+        report = harness.run(args.rounds)
+    else:
+        with use_clock(SimulatedClock(args.start)):
+            report = harness.run(args.rounds)
+
+    print(report.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
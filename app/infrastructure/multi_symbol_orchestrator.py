@@ -13,12 +13,12 @@ Key improvements over single-symbol orchestrator:
 """
 
 import logging
-import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from enum import Enum
 
 from app.infrastructure.event_bus import EventBus
+from app.utils.clock import get_clock
 from app.services.base import EventDrivenService, ServiceStatus, HealthStatus
 from app.infrastructure.config import SystemConfig, ConfigLoader
 from app.risk.account_stop_loss import AccountStopLossManager, AccountStopLossConfig, StopLossStatus
@@ -114,6 +114,10 @@ class MultiSymbolTradingOrchestrator:
         self.account_stop_loss: Optional[AccountStopLossManager] = None
         self.automation_state_manager: Optional[Any] = None  # AutomationStateManager
         self.automation_file_watcher: Optional[Any] = None  # AutomationFileWatcher
+        self.event_journal: Optional[Any] = None  # EventJournal
+        self.concurrent_fetcher: Optional[Any] = None  # ConcurrentDataFetcher
+        self.fetch_scheduler: Optional[Any] = None  # CandleCloseScheduler
+        self.config_watcher: Optional[Any] = None  # ConfigWatcher
 
         # State
         self.status = OrchestratorStatus.INITIALIZING
@@ -225,48 +229,29 @@ class MultiSymbolTradingOrchestrator:
             log_all_events=self.config.get('log_all_events', False)
         )
 
-        # Step 1.5: Create automation control components
-        self.logger.info("Creating automation control components...")
-        try:
-            from app.infrastructure.automation_state_manager import AutomationStateManager
-            from app.infrastructure.automation_file_watcher import AutomationFileWatcher
+        # Step 1.1: Record every event to the binary journal (if enabled)
+        journal_config = self.config.get('journal', {})
+        if journal_config.get('enabled', False):
+            from app.infrastructure.event_journal import EventJournal
 
-            # Get automation config (with defaults)
-            automation_config = self.config.get('automation', {})
-            automation_enabled = automation_config.get('enabled', True)
-            state_file = automation_config.get('state_file', 'config/automation_state.json')
-            toggle_file = automation_config.get('toggle_file', 'config/toggle_automation.txt')
-            file_watcher_enabled = automation_config.get('file_watcher_enabled', True)
-            file_watcher_interval = automation_config.get('file_watcher_interval', 5)
-
-            # Create AutomationStateManager
-            self.automation_state_manager = AutomationStateManager(
-                event_bus=self.event_bus,
-                state_file_path=state_file,
-                default_enabled=automation_enabled,
-                logger=logging.getLogger('automation-state')
+            self.event_journal = EventJournal(
+                journal_dir=journal_config.get('dir', 'journal'),
+                max_segment_bytes=journal_config.get('segment_mb', 64) * 1024 * 1024,
+                logger=logging.getLogger('event-journal')
             )
-            self.logger.info(f"  ✓ AutomationStateManager created (default_enabled={automation_enabled})")
-
-            # Create AutomationFileWatcher (if enabled)
-            if file_watcher_enabled:
-                self.automation_file_watcher = AutomationFileWatcher(
-                    event_bus=self.event_bus,
-                    toggle_file_path=toggle_file,
-                    poll_interval=file_watcher_interval,
-                    logger=logging.getLogger('automation-watcher')
-                )
-                self.logger.info(f"  ✓ AutomationFileWatcher created (poll_interval={file_watcher_interval}s)")
-            else:
-                self.logger.info("  ⊘ AutomationFileWatcher disabled via config")
+            self.event_journal.attach(self.event_bus)
+            self.logger.info(f"  ✓ Event journal recording to {self.event_journal.journal_dir}")
 
-        except Exception as e:
-            self.logger.error(f"  ✗ Failed to initialize automation components: {e}", exc_info=True)
-            self.automation_state_manager = None
-            self.automation_file_watcher = None
+        # Step 1.5: Create automation control components
+        # In shard mode the coordinator process owns automation and account-level risk
+        shard_mode = self.config.get('shard_mode', False)
+        if shard_mode:
+            self.logger.info("Shard mode: automation and account stop loss are owned by the coordinator")
+        else:
+            self._create_automation_components()
 
         # Step 1.6: Create account-level stop loss manager
-        if account_stop_loss_config:
+        if account_stop_loss_config and not shard_mode:
             self.logger.info("Creating account-level stop loss manager...")
             self.account_stop_loss = AccountStopLossManager(
                 config=account_stop_loss_config,
@@ -320,9 +305,79 @@ class MultiSymbolTradingOrchestrator:
                 symbol_timeframes=symbol_timeframes
             )
 
+        # Step 3: Fetch all symbols/timeframes of a round in parallel (if enabled)
+        fetch_mode = self.config.get('fetch_mode', 'serial')
+        if fetch_mode == 'concurrent':
+            from app.services.concurrent_fetcher import ConcurrentDataFetcher
+
+            self.concurrent_fetcher = ConcurrentDataFetcher(
+                services=[self.services[symbol]['data_fetching'] for symbol in self.symbols],
+                max_workers=self.config.get('fetch_max_workers', 8),
+                round_deadline=self.config.get('fetch_round_deadline', 10.0),
+                logger=logging.getLogger('concurrent-fetcher')
+            )
+            self.logger.info(
+                f"  ✓ Concurrent fetching enabled (max_workers={self.concurrent_fetcher.max_workers}, "
+                f"round_deadline={self.concurrent_fetcher.round_deadline}s)"
+            )
+
+        # Step 3 (alternative): Poll each timeframe only around its expected candle close
+        elif fetch_mode == 'scheduled':
+            from app.services.fetch_scheduler import CandleCloseScheduler
+
+            self.fetch_scheduler = CandleCloseScheduler(
+                services=[self.services[symbol]['data_fetching'] for symbol in self.symbols],
+                close_delay=self.config.get('schedule_close_delay', 0.5),
+                retry_interval=self.config.get('schedule_retry_interval', 1.0),
+                retry_window=self.config.get('schedule_retry_window', 30.0),
+                logger=logging.getLogger('fetch-scheduler')
+            )
+            self.logger.info("  ✓ Candle-close fetch scheduling enabled")
+
         total_services = sum(len(services) for services in self.services.values())
         self.logger.info(f"\n=== INITIALIZED {total_services} SERVICES ({len(self.symbols)} symbols x 5 services) ===")
 
+    def _create_automation_components(self):
+        """Create AutomationStateManager and AutomationFileWatcher on the shared EventBus."""
+        self.logger.info("Creating automation control components...")
+        try:
+            from app.infrastructure.automation_state_manager import AutomationStateManager
+            from app.infrastructure.automation_file_watcher import AutomationFileWatcher
+
+            # Get automation config (with defaults)
+            automation_config = self.config.get('automation', {})
+            automation_enabled = automation_config.get('enabled', True)
+            state_file = automation_config.get('state_file', 'config/automation_state.json')
+            toggle_file = automation_config.get('toggle_file', 'config/toggle_automation.txt')
+            file_watcher_enabled = automation_config.get('file_watcher_enabled', True)
+            file_watcher_interval = automation_config.get('file_watcher_interval', 5)
+
+            # Create AutomationStateManager
+            self.automation_state_manager = AutomationStateManager(
+                event_bus=self.event_bus,
+                state_file_path=state_file,
+                default_enabled=automation_enabled,
+                logger=logging.getLogger('automation-state')
+            )
+            self.logger.info(f"  ✓ AutomationStateManager created (default_enabled={automation_enabled})")
+
+            # Create AutomationFileWatcher (if enabled)
+            if file_watcher_enabled:
+                self.automation_file_watcher = AutomationFileWatcher(
+                    event_bus=self.event_bus,
+                    toggle_file_path=toggle_file,
+                    poll_interval=file_watcher_interval,
+                    logger=logging.getLogger('automation-watcher')
+                )
+                self.logger.info(f"  ✓ AutomationFileWatcher created (poll_interval={file_watcher_interval}s)")
+            else:
+                self.logger.info("  ⊘ AutomationFileWatcher disabled via config")
+
+        except Exception as e:
+            self.logger.error(f"  ✗ Failed to initialize automation components: {e}", exc_info=True)
+            self.automation_state_manager = None
+            self.automation_file_watcher = None
+
     def _create_services_for_symbol(
         self,
         symbol: str,
@@ -351,7 +406,8 @@ class MultiSymbolTradingOrchestrator:
             "symbol": symbol,
             "timeframes": symbol_timeframes,  # Use symbol-specific timeframes
             "candle_index": self.config.get('candle_index', 1),
-            "nbr_bars": self.config.get('nbr_bars', 3)
+            "nbr_bars": self.config.get('nbr_bars', 3),
+            "cursor_fetch": self.config.get('cursor_fetch', False)
         }
         data_service = DataFetchingService(
             event_bus=self.event_bus,
@@ -431,7 +487,7 @@ class MultiSymbolTradingOrchestrator:
         """Start all services for all symbols and automation components."""
         self.logger.info("\n=== STARTING ALL SERVICES ===")
         self.status = OrchestratorStatus.RUNNING
-        self.start_time = datetime.now()
+        self.start_time = get_clock().now()
 
         # Start automation file watcher (if enabled)
         if self.automation_file_watcher:
@@ -471,6 +527,10 @@ class MultiSymbolTradingOrchestrator:
                     except Exception as e:
                         self.logger.error(f"  ✗ Error stopping {service_name}: {e}")
 
+        # Stop concurrent fetch workers
+        if self.concurrent_fetcher:
+            self.concurrent_fetcher.shutdown()
+
         # Stop automation file watcher
         if self.automation_file_watcher:
             try:
@@ -479,6 +539,14 @@ class MultiSymbolTradingOrchestrator:
             except Exception as e:
                 self.logger.error(f"  ✗ Error stopping AutomationFileWatcher: {e}")
 
+        # Close event journal
+        if self.event_journal:
+            try:
+                self.event_journal.close()
+                self.logger.info("  ✓ Event journal closed")
+            except Exception as e:
+                self.logger.error(f"  ✗ Error closing event journal: {e}")
+
         self.status = OrchestratorStatus.STOPPED
         self.logger.info("\n=== ALL SERVICES STOPPED ===")
 
@@ -497,7 +565,7 @@ class MultiSymbolTradingOrchestrator:
         try:
             while self.status == OrchestratorStatus.RUNNING:
                 iteration += 1
-                iteration_start = time.time()
+                iteration_start = get_clock().monotonic()
 
                 # Log status periodically
                 if iteration % status_log_interval == 0:
@@ -512,21 +580,7 @@ class MultiSymbolTradingOrchestrator:
 
                 # Fetch data for all symbols (only if trading allowed)
                 if not self.account_stop_loss or self.account_stop_loss.is_trading_allowed():
-                    for symbol in self.symbols:
-                        # Fetch data
-                        data_service = self.services[symbol]['data_fetching']
-                        try:
-                            data_service.fetch_streaming_data()
-                        except Exception as e:
-                            self.logger.error(f"Error fetching data for {symbol}: {e}", exc_info=True)
-
-                        # Check positions for TP management
-                        position_monitor = self.services[symbol].get('position_monitor')
-                        if position_monitor and position_monitor._status == ServiceStatus.RUNNING:
-                            try:
-                                position_monitor.check_positions()
-                            except Exception as e:
-                                self.logger.error(f"Error checking positions for {symbol}: {e}", exc_info=True)
+                    self.run_iteration()
                 else:
                     self.logger.warning("Trading stopped by account stop loss - skipping data fetch")
 
@@ -534,22 +588,106 @@ class MultiSymbolTradingOrchestrator:
                 if self._should_perform_health_check():
                     self._perform_health_check()
 
-                # Sleep to maintain interval
-                elapsed = time.time() - iteration_start
+                # Sleep to maintain interval (or until the next scheduled candle close)
+                elapsed = get_clock().monotonic() - iteration_start
                 sleep_time = max(0, interval_seconds - elapsed)
+                if self.fetch_scheduler:
+                    sleep_time = min(sleep_time, self.fetch_scheduler.seconds_until_next_due())
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    get_clock().sleep(sleep_time)
 
         except KeyboardInterrupt:
             self.logger.info("\nReceived interrupt signal, stopping gracefully...")
             self.stop()
 
+    def enable_hot_reload(
+        self,
+        conf_folder_path: str,
+        config_symbols: Optional[Dict[str, str]] = None,
+        poll_interval: Optional[float] = None
+    ):
+        """
+        Apply edited strategy and indicator files without restarting.
+
+        Must be called after initialize(). The configuration folders are
+        polled at the start of each run_iteration().
+
+        Args:
+            conf_folder_path: Base configuration folder (CONF_FOLDER_PATH)
+            config_symbols: Optional symbol -> config folder symbol mapping
+            poll_interval: Seconds between scans (default: config['hot_reload_interval'] or 5)
+        """
+        from app.infrastructure.config_watcher import ConfigWatcher
+
+        if poll_interval is None:
+            poll_interval = self.config.get('hot_reload_interval', 5.0)
+        self.config_watcher = ConfigWatcher(
+            conf_folder_path=conf_folder_path,
+            services=self.services,
+            config_symbols=config_symbols,
+            poll_interval=poll_interval,
+            logger=logging.getLogger('config-watcher')
+        )
+        self.logger.info(f"Hot reload enabled for {conf_folder_path} (every {poll_interval}s)")
+
+    def run_iteration(self):
+        """
+        Run one fetch round: fetch data, refresh time-sensitive strategies and
+        check positions for every symbol.
+
+        This is the body of the trading loop without pacing, account checks or
+        health checks, so it can also be driven externally (e.g. by a shard
+        coordinator). Edited strategy and indicator files are applied first,
+        when hot reload is enabled, so no reload overlaps an evaluation.
+        """
+        if self.config_watcher:
+            try:
+                self.config_watcher.poll()
+            except Exception as e:
+                self.logger.error(f"Error polling configuration files: {e}", exc_info=True)
+
+        if self.concurrent_fetcher:
+            try:
+                self.concurrent_fetcher.fetch_round()
+            except Exception as e:
+                self.logger.error(f"Error in concurrent fetch round: {e}", exc_info=True)
+        elif self.fetch_scheduler:
+            try:
+                self.fetch_scheduler.run_due()
+            except Exception as e:
+                self.logger.error(f"Error in scheduled fetch: {e}", exc_info=True)
+
+        for symbol in self.symbols:
+            # Fetch data
+            if not self.concurrent_fetcher and not self.fetch_scheduler:
+                data_service = self.services[symbol]['data_fetching']
+                try:
+                    data_service.fetch_streaming_data()
+                except Exception as e:
+                    self.logger.error(f"Error fetching data for {symbol}: {e}", exc_info=True)
+
+            # Refresh time-based exits and activation schedules between bars
+            strategy_service = self.services[symbol].get('strategy_evaluation')
+            if strategy_service and strategy_service._status == ServiceStatus.RUNNING:
+                try:
+                    strategy_service.check_timers()
+                except Exception as e:
+                    self.logger.error(f"Error refreshing strategy timers for {symbol}: {e}", exc_info=True)
+
+            # Check positions for TP management
+            position_monitor = self.services[symbol].get('position_monitor')
+            if position_monitor and position_monitor._status == ServiceStatus.RUNNING:
+                try:
+                    position_monitor.check_positions()
+                except Exception as e:
+                    self.logger.error(f"Error checking positions for {symbol}: {e}", exc_info=True)
+
     def _should_perform_health_check(self) -> bool:
         """Check if it's time for health check."""
         if self.last_health_check is None:
             return True
 
-        elapsed = (datetime.now() - self.last_health_check).total_seconds()
+        elapsed = (get_clock().now() - self.last_health_check).total_seconds()
         return elapsed >= self.health_check_interval
 
     def _should_perform_account_check(self) -> bool:
@@ -557,7 +695,7 @@ class MultiSymbolTradingOrchestrator:
         if self.last_account_check is None:
             return True
 
-        elapsed = (datetime.now() - self.last_account_check).total_seconds()
+        elapsed = (get_clock().now() - self.last_account_check).total_seconds()
         return elapsed >= self.account_check_interval
 
     def _perform_account_check(self) -> bool:
@@ -570,7 +708,7 @@ class MultiSymbolTradingOrchestrator:
         if not self.account_stop_loss:
             return True
 
-        self.last_account_check = datetime.now()
+        self.last_account_check = get_clock().now()
 
         try:
             # Get current account balance
@@ -627,7 +765,7 @@ class MultiSymbolTradingOrchestrator:
 
     def _perform_health_check(self):
         """Perform health check on all services."""
-        self.last_health_check = datetime.now()
+        self.last_health_check = get_clock().now()
 
         unhealthy_services = []
 
@@ -654,7 +792,7 @@ class MultiSymbolTradingOrchestrator:
             try:
                 service = self.services[symbol][service_name]
                 service.stop()
-                time.sleep(1)
+                get_clock().sleep(1)
                 service.start()
                 self.logger.info(f"✓ {symbol}/{service_name} restarted successfully")
             except Exception as e:
@@ -679,14 +817,17 @@ class MultiSymbolTradingOrchestrator:
             "orchestrator": {
                 "status": self.status.value,
                 "symbols": self.symbols,
-                "uptime_seconds": (datetime.now() - self.start_time).total_seconds() if self.start_time else 0,
+                "uptime_seconds": (get_clock().now() - self.start_time).total_seconds() if self.start_time else 0,
                 "total_services": sum(len(services) for services in self.services.values()),
                 "symbols_count": len(self.symbols),
             },
             "automation": self.automation_state_manager.get_state() if self.automation_state_manager else None,
             "account_stop_loss": self.account_stop_loss.get_metrics_summary() if self.account_stop_loss else None,
             "services": {},
-            "event_bus": self.event_bus.get_metrics() if self.event_bus else {}
+            "event_bus": self.event_bus.get_metrics() if self.event_bus else {},
+            "event_journal": self.event_journal.get_metrics() if self.event_journal else None,
+            "concurrent_fetch": self.concurrent_fetcher.get_metrics() if self.concurrent_fetcher else None,
+            "fetch_scheduler": self.fetch_scheduler.get_metrics() if self.fetch_scheduler else None
         }
 
         # Per-symbol service metrics
@@ -701,5 +842,5 @@ class MultiSymbolTradingOrchestrator:
     def get_uptime_seconds(self) -> float:
         """Get orchestrator uptime in seconds."""
         if self.start_time:
-            return (datetime.now() - self.start_time).total_seconds()
+            return (get_clock().now() - self.start_time).total_seconds()
         return 0.0
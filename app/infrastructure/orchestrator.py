@@ -11,12 +11,12 @@ their operation. It's responsible for:
 """
 
 import logging
-import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from enum import Enum
 
 from app.infrastructure.event_bus import EventBus
+from app.utils.clock import get_clock
 from app.services.base import EventDrivenService, ServiceStatus, HealthStatus
 from app.infrastructure.config import SystemConfig, ConfigLoader
 
@@ -405,7 +405,7 @@ class TradingOrchestrator:
                 raise
 
         self.status = OrchestratorStatus.RUNNING
-        self.start_time = datetime.now()
+        self.start_time = get_clock().now()
         self.logger.info("=== ALL SERVICES STARTED ===")
 
     def stop(self):
@@ -460,7 +460,7 @@ class TradingOrchestrator:
                     self._perform_health_check()
 
                 # Sleep
-                time.sleep(interval_seconds)
+                get_clock().sleep(interval_seconds)
 
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt")
@@ -472,7 +472,7 @@ class TradingOrchestrator:
 
     def _perform_health_check(self):
         """Perform health check on all services."""
-        self.last_health_check = datetime.now()
+        self.last_health_check = get_clock().now()
 
         health_status = self.get_service_health()
         unhealthy = [name for name, healthy in health_status.items() if not healthy]
@@ -511,7 +511,7 @@ class TradingOrchestrator:
             self.logger.error(f"Error stopping {service_name}: {e}")
 
         # Wait a bit
-        time.sleep(1)
+        get_clock().sleep(1)
 
         # Start service
         service.start()
@@ -550,7 +550,7 @@ class TradingOrchestrator:
         """
         uptime = 0.0
         if self.start_time:
-            uptime = (datetime.now() - self.start_time).total_seconds()
+            uptime = (get_clock().now() - self.start_time).total_seconds()
 
         return {
             "status": self.status.value,
@@ -0,0 +1,635 @@
+"""
+Sharded Multi-Symbol Trading Orchestrator.
+
+Runs symbol pipelines in worker processes so that adding symbols no longer
+stretches a single GIL-bound loop past ``fetch_interval``.
+
+Architecture:
+    - Coordinator process (this class): owns account-level concerns
+      (AccountStopLossManager, AutomationStateManager, file watcher), drives
+      the trading loop and aggregates health and metrics.
+    - Shard processes: each runs a MultiSymbolTradingOrchestrator in
+      ``shard_mode`` for a subset of symbols, with its own EventBus and
+      components.
+    - Messaging: one duplex ``multiprocessing.Pipe`` per shard. Messages are
+      small ``(command, seq, payload)`` tuples; bar data never crosses the
+      process boundary because every shard fetches its own data.
+
+Ticks are lockstep: the coordinator checks the account stop loss, then
+broadcasts ``tick`` to every shard and waits for the replies. A breach is
+broadcast as ``halt`` before the next tick is sent, so the account-wide stop
+reaches every shard within one tick.
+"""
+
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from app.events.automation_events import AutomationStateChangedEvent
+from app.infrastructure.event_bus import EventBus
+from app.utils.clock import get_clock
+from app.infrastructure.config import SystemConfig
+from app.infrastructure.multi_symbol_orchestrator import (
+    MultiSymbolTradingOrchestrator,
+    OrchestratorStatus,
+)
+from app.risk.account_stop_loss import AccountStopLossManager, AccountStopLossConfig
+
+
+# Builds the per-shard components inside the worker process.
+# Must be picklable (a top-level function or functools.partial of one) and return
+# a dict with: client, data_source, date_helper, symbol_components.
+ComponentFactory = Callable[[List[str]], Dict[str, Any]]
+
+
+@dataclass
+class ShardHandle:
+    """Coordinator-side state for one shard process."""
+    shard_id: int
+    symbols: List[str]
+    process: Optional[Any] = None  # multiprocessing.Process
+    conn: Optional[Connection] = None
+    health: Dict[str, Dict[str, bool]] = field(default_factory=dict)
+    pending: Dict[int, str] = field(default_factory=dict)  # seq -> command
+    ticks_completed: int = 0
+    ticks_missed: int = 0
+    last_tick_seconds: float = 0.0
+    restarts: int = 0
+    halted: bool = False
+
+    def is_alive(self) -> bool:
+        """Check whether the shard process is running."""
+        return self.process is not None and self.process.is_alive()
+
+
+def assign_shards(symbols: List[str], shard_count: Optional[int] = None) -> List[List[str]]:
+    """
+    Distribute symbols across shards round-robin.
+
+    Args:
+        symbols: Symbols to distribute
+        shard_count: Number of shards (default: one per symbol)
+
+    Returns:
+        List of symbol lists, one per non-empty shard
+    """
+    count = min(shard_count or len(symbols), len(symbols))
+    shards: List[List[str]] = [[] for _ in range(count)]
+    for i, symbol in enumerate(symbols):
+        shards[i % count].append(symbol)
+    return shards
+
+
+def _run_shard(
+    shard_id: int,
+    symbols: List[str],
+    config: Dict[str, Any],
+    component_factory: ComponentFactory,
+    conn: Connection,
+    log_level: int
+):
+    """
+    Shard process entry point.
+
+    Builds the symbol pipelines, reports ``ready`` and then serves coordinator
+    commands until ``stop`` is received or the pipe is closed.
+    """
+    logging.basicConfig(
+        level=log_level,
+        format=f"%(asctime)s [shard-{shard_id}] %(name)s %(levelname)s: %(message)s"
+    )
+    logger = logging.getLogger(f"shard-{shard_id}")
+
+    try:
+        components = component_factory(symbols)
+        orchestrator = MultiSymbolTradingOrchestrator(
+            config={**config, 'symbols': symbols, 'shard_mode': True},
+            logger=logger
+        )
+        orchestrator.initialize(
+            client=components['client'],
+            data_source=components['data_source'],
+            symbol_components=components['symbol_components'],
+            date_helper=components['date_helper']
+        )
+        orchestrator.start()
+    except Exception as e:
+        logger.error(f"Shard {shard_id} failed to start: {e}", exc_info=True)
+        conn.send(("error", 0, f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+
+    conn.send(("ready", 0, {"symbols": symbols}))
+
+    while True:
+        try:
+            command, seq, payload = conn.recv()
+        except (EOFError, OSError):
+            # Coordinator went away - shut down
+            orchestrator.stop()
+            break
+
+        try:
+            if command == "tick":
+                tick_start = time.perf_counter()
+                orchestrator.run_iteration()
+                reply = {
+                    "elapsed": time.perf_counter() - tick_start,
+                    "health": orchestrator.get_service_health(),
+                }
+            elif command == "halt":
+                logger.error(f"Halt received from coordinator: {payload}")
+                orchestrator._stop_all_trading_services()
+                reply = {"health": orchestrator.get_service_health()}
+            elif command == "automation":
+                orchestrator.event_bus.publish(payload)
+                reply = {}
+            elif command == "health":
+                reply = {"health": orchestrator.get_service_health()}
+            elif command == "metrics":
+                reply = orchestrator.get_all_metrics()
+            elif command == "stop":
+                orchestrator.stop()
+                conn.send(("ok", seq, {}))
+                break
+            else:
+                raise ValueError(f"Unknown shard command: {command}")
+
+            conn.send(("ok", seq, reply))
+
+        except Exception as e:
+            logger.error(f"Shard {shard_id} failed to handle '{command}': {e}", exc_info=True)
+            conn.send(("error", seq, f"{type(e).__name__}: {e}"))
+
+    conn.close()
+
+
+class ShardedTradingOrchestrator(MultiSymbolTradingOrchestrator):
+    """
+    Coordinator that runs symbol pipelines in worker processes.
+
+    Reuses the MultiSymbolTradingOrchestrator trading loop (``run``): account
+    checks, health-check cadence and pacing are unchanged, while the per-symbol
+    work of each iteration is fanned out to the shards.
+
+    Example:
+        ```python
+        from functools import partial
+        from app.utils.multi_symbol_loader import load_shard_components
+
+        orchestrator = ShardedTradingOrchestrator(
+            config={
+                "symbols": ["XAUUSD", "BTCUSD", "EURUSD"],
+                "timeframes": ["1", "5", "15"],
+                "shard_count": 2,
+            },
+            component_factory=partial(load_shard_components, env_path=".env")
+        )
+
+        orchestrator.initialize(client=mt5_client, account_stop_loss_config=stop_config)
+        orchestrator.start()
+        orchestrator.run(interval_seconds=5)
+        ```
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        component_factory: ComponentFactory,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the sharded orchestrator.
+
+        Args:
+            config: Orchestrator configuration (see MultiSymbolTradingOrchestrator) plus:
+                - shard_count: Optional[int] - Number of shard processes (default: one per symbol)
+                - shard_tick_timeout: float - Seconds to wait for shard replies per tick
+                - shard_startup_timeout: float - Seconds to wait for a shard to become ready
+                - shard_start_method: str - multiprocessing start method ("spawn", "fork", "forkserver")
+            component_factory: Picklable callable building shard components from a symbol list
+            logger: Optional logger
+        """
+        super().__init__(config=config, logger=logger or logging.getLogger('sharded-orchestrator'))
+
+        self.component_factory = component_factory
+        self.client: Optional[Any] = None
+
+        self.tick_timeout = config.get('shard_tick_timeout', 30.0)
+        self.startup_timeout = config.get('shard_startup_timeout', 300.0)
+        self._mp_context = multiprocessing.get_context(config.get('shard_start_method', 'spawn'))
+
+        self.shards: List[ShardHandle] = [
+            ShardHandle(shard_id=i, symbols=symbols)
+            for i, symbols in enumerate(assign_shards(self.symbols, config.get('shard_count')))
+        ]
+        self._seq = 0
+        self._halt_reason: Optional[str] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: SystemConfig,
+        client: Any,
+        component_factory: ComponentFactory,
+        logger: Optional[logging.Logger] = None
+    ) -> "ShardedTradingOrchestrator":
+        """
+        Create sharded orchestrator from SystemConfig.
+
+        Args:
+            config: SystemConfig with all configuration
+            client: MT5 Client used by the coordinator for account checks
+            component_factory: Picklable callable building shard components
+            logger: Optional logger
+
+        Returns:
+            Initialized ShardedTradingOrchestrator (shards are spawned on start)
+        """
+        orchestrator = cls(
+            config=config.to_orchestrator_config(),
+            component_factory=component_factory,
+            logger=logger
+        )
+        orchestrator.initialize(client=client)
+        return orchestrator
+
+    def initialize(
+        self,
+        client: Any = None,
+        account_stop_loss_config: Optional[AccountStopLossConfig] = None
+    ):
+        """
+        Initialize coordinator-owned components.
+
+        Symbol services are not created here; each shard builds its own on start.
+
+        Args:
+            client: MT5 Client used to read the account balance
+            account_stop_loss_config: Optional account-level stop loss configuration
+        """
+        self.logger.info("=== INITIALIZING SHARDED TRADING COORDINATOR ===")
+        for shard in self.shards:
+            self.logger.info(f"  Shard {shard.shard_id}: {shard.symbols}")
+
+        self.client = client
+
+        # Coordinator EventBus carries automation events only
+        self.event_bus = EventBus(
+            event_history_limit=self.config.get('event_history_limit', 1000),
+            log_all_events=self.config.get('log_all_events', False)
+        )
+
+        self._create_automation_components()
+        self.event_bus.subscribe(AutomationStateChangedEvent, self._forward_automation_state)
+
+        if account_stop_loss_config:
+            self.logger.info("Creating account-level stop loss manager...")
+            self.account_stop_loss = AccountStopLossManager(
+                config=account_stop_loss_config,
+                client=client,
+                logger=logging.getLogger('account-stop-loss')
+            )
+            try:
+                current_balance = client.account.get_balance()
+                self.account_stop_loss.initialize(current_balance)
+                self.logger.info(f"  ✓ Account stop loss initialized with balance: ${current_balance:,.2f}")
+            except Exception as e:
+                self.logger.error(f"  ✗ Failed to initialize account stop loss: {e}")
+        else:
+            self.logger.info("Account-level stop loss not configured (skipping)")
+
+    def start(self):
+        """Spawn all shard processes and start automation components."""
+        self.logger.info("\n=== STARTING SHARDS ===")
+        self.status = OrchestratorStatus.RUNNING
+        self.start_time = get_clock().now()
+
+        if self.automation_file_watcher:
+            try:
+                self.automation_file_watcher.start()
+                self.logger.info("  ✓ AutomationFileWatcher started")
+            except Exception as e:
+                self.logger.error(f"  ✗ Failed to start AutomationFileWatcher: {e}", exc_info=True)
+
+        for shard in self.shards:
+            self._spawn_shard(shard)
+        for shard in self.shards:
+            self._await_ready(shard)
+
+        self.logger.info(f"\n=== {len(self.shards)} SHARDS STARTED SUCCESSFULLY ===")
+
+    def stop(self):
+        """Stop all shard processes and automation components."""
+        self.logger.info("\n=== STOPPING SHARDS ===")
+        self.status = OrchestratorStatus.STOPPING
+
+        for shard in self.shards:
+            if shard.is_alive():
+                self._send(shard, "stop")
+        for shard in self.shards:
+            self._collect([shard], timeout=self.tick_timeout)
+            self._terminate_shard(shard)
+
+        if self.automation_file_watcher:
+            try:
+                self.automation_file_watcher.stop()
+                self.logger.info("  ✓ AutomationFileWatcher stopped")
+            except Exception as e:
+                self.logger.error(f"  ✗ Error stopping AutomationFileWatcher: {e}")
+
+        self.status = OrchestratorStatus.STOPPED
+        self.logger.info("\n=== ALL SHARDS STOPPED ===")
+
+    def run_iteration(self):
+        """
+        Broadcast one tick to every shard and wait for the replies.
+
+        Shards still busy with a previous tick are skipped rather than queued,
+        so a slow shard cannot build up a backlog.
+        """
+        targets = []
+        for shard in self.shards:
+            if not shard.is_alive():
+                continue
+            if "tick" in shard.pending.values():
+                # Drain a late reply if it arrived since the last tick
+                self._collect([shard], timeout=0)
+            if "tick" in shard.pending.values():
+                shard.ticks_missed += 1
+                self.logger.warning(f"Shard {shard.shard_id} still busy - skipping tick")
+                continue
+            self._send(shard, "tick")
+            targets.append(shard)
+
+        self._collect(targets, timeout=self.tick_timeout)
+
+        for shard in targets:
+            if "tick" in shard.pending.values():
+                self.logger.warning(
+                    f"Shard {shard.shard_id} did not finish tick within {self.tick_timeout}s"
+                )
+
+    def _perform_account_check(self) -> bool:
+        """Refresh the account balance, then run the account-level stop loss check."""
+        if self.account_stop_loss and self.client is not None:
+            try:
+                self.account_stop_loss.update_account_metrics(
+                    current_balance=self.client.account.get_balance()
+                )
+            except Exception as e:
+                self.logger.error(f"Error refreshing account balance: {e}", exc_info=True)
+
+        return super()._perform_account_check()
+
+    def _stop_all_trading_services(self):
+        """Broadcast halt to every shard before any further tick is sent."""
+        reason = self.account_stop_loss.get_stop_reason() if self.account_stop_loss else None
+        self._halt_reason = reason or "account stop"
+
+        targets = [shard for shard in self.shards if shard.is_alive()]
+        for shard in targets:
+            self._send(shard, "halt", self._halt_reason)
+        self._collect(targets, timeout=self.tick_timeout)
+
+        for shard in targets:
+            if shard.halted:
+                self.logger.info(f"  ✓ Shard {shard.shard_id} halted ({shard.symbols})")
+            else:
+                self.logger.error(f"  ✗ Shard {shard.shard_id} did not acknowledge halt")
+
+    def _perform_health_check(self):
+        """Refresh shard health and restart dead shard processes."""
+        self.last_health_check = get_clock().now()
+
+        dead = [shard for shard in self.shards if not shard.is_alive()]
+        alive = [shard for shard in self.shards if shard.is_alive()]
+
+        for shard in alive:
+            if "health" not in shard.pending.values():
+                self._send(shard, "health")
+        self._collect(alive, timeout=self.tick_timeout)
+
+        unhealthy = [
+            (symbol, service_name)
+            for symbol, services in self.get_service_health().items()
+            for service_name, healthy in services.items()
+            if not healthy
+        ]
+        if unhealthy:
+            self.logger.warning(f"  Found {len(unhealthy)} unhealthy services:")
+            for symbol, service_name in unhealthy:
+                self.logger.warning(f"  - {symbol}/{service_name}")
+
+        if dead and self.enable_auto_restart and self.status == OrchestratorStatus.RUNNING:
+            for shard in dead:
+                self._restart_shard(shard)
+
+    def get_service_health(self) -> Dict[str, Dict[str, bool]]:
+        """Get last reported health for all services; dead shards report unhealthy."""
+        health_status = {}
+        for shard in self.shards:
+            alive = shard.is_alive()
+            for symbol in shard.symbols:
+                reported = shard.health.get(symbol, {})
+                health_status[symbol] = {
+                    service_name: alive and reported.get(service_name, False)
+                    for service_name in self.service_order
+                }
+        return health_status
+
+    def get_all_metrics(self) -> Dict[str, Any]:
+        """Get coordinator metrics merged with metrics collected from every shard."""
+        alive = [shard for shard in self.shards if shard.is_alive()]
+        requests = {shard.shard_id: self._send(shard, "metrics") for shard in alive}
+        replies = self._collect(alive, timeout=self.tick_timeout)
+
+        metrics = {
+            "orchestrator": {
+                "status": self.status.value,
+                "symbols": self.symbols,
+                "uptime_seconds": self.get_uptime_seconds(),
+                "total_services": len(self.symbols) * len(self.service_order),
+                "symbols_count": len(self.symbols),
+                "shard_count": len(self.shards),
+                "halt_reason": self._halt_reason,
+            },
+            "automation": self.automation_state_manager.get_state() if self.automation_state_manager else None,
+            "account_stop_loss": self.account_stop_loss.get_metrics_summary() if self.account_stop_loss else None,
+            "services": {},
+            "event_bus": {},
+            "shards": {},
+        }
+
+        for shard in self.shards:
+            shard_metrics = replies.get((shard.shard_id, requests.get(shard.shard_id)), {})
+            metrics["shards"][shard.shard_id] = {
+                "symbols": shard.symbols,
+                "alive": shard.is_alive(),
+                "pid": shard.process.pid if shard.process else None,
+                "ticks_completed": shard.ticks_completed,
+                "ticks_missed": shard.ticks_missed,
+                "last_tick_seconds": shard.last_tick_seconds,
+                "restarts": shard.restarts,
+                "halted": shard.halted,
+                "event_bus": shard_metrics.get("event_bus", {}),
+                "event_journal": shard_metrics.get("event_journal"),
+            }
+            metrics["services"].update(shard_metrics.get("services", {}))
+
+            # Sum shard EventBus counters into one view
+            for key, value in shard_metrics.get("event_bus", {}).items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    metrics["event_bus"][key] = metrics["event_bus"].get(key, 0) + value
+
+        return metrics
+
+    def _forward_automation_state(self, event: AutomationStateChangedEvent):
+        """Forward automation state changes from the coordinator bus to every shard."""
+        for shard in self.shards:
+            if shard.is_alive():
+                self._send(shard, "automation", event)
+
+    def _spawn_shard(self, shard: ShardHandle):
+        """Start the worker process for a shard."""
+        parent_conn, child_conn = self._mp_context.Pipe(duplex=True)
+        process = self._mp_context.Process(
+            target=_run_shard,
+            args=(
+                shard.shard_id,
+                shard.symbols,
+                self.config,
+                self.component_factory,
+                child_conn,
+                logging.getLogger().getEffectiveLevel()
+            ),
+            name=f"shard-{shard.shard_id}",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+
+        shard.process = process
+        shard.conn = parent_conn
+        shard.pending.clear()
+        shard.health = {}
+        shard.halted = False
+
+    def _await_ready(self, shard: ShardHandle):
+        """Wait for a shard to report ready and sync it with the coordinator state."""
+        if not shard.conn.poll(self.startup_timeout):
+            self._terminate_shard(shard)
+            raise RuntimeError(f"Shard {shard.shard_id} did not start within {self.startup_timeout}s")
+
+        try:
+            status, _, payload = shard.conn.recv()
+        except EOFError:
+            status, payload = "error", "process exited"
+
+        if status != "ready":
+            self._terminate_shard(shard)
+            raise RuntimeError(f"Shard {shard.shard_id} failed to start: {payload}")
+
+        self.logger.info(f"  ✓ Shard {shard.shard_id} ready (pid={shard.process.pid}, symbols={shard.symbols})")
+
+        # Late joiners must see the current automation state and any active halt
+        if self.automation_state_manager:
+            state = self.automation_state_manager.get_state()
+            self._send(shard, "automation", AutomationStateChangedEvent(
+                enabled=state['enabled'],
+                reason=state['reason'] or "coordinator sync"
+            ))
+        if self._halt_reason:
+            self._send(shard, "halt", self._halt_reason)
+        self._collect([shard], timeout=self.tick_timeout)
+
+    def _restart_shard(self, shard: ShardHandle):
+        """Replace a dead shard process."""
+        self.logger.info(f" Restarting shard {shard.shard_id} ({shard.symbols})...")
+        self._terminate_shard(shard)
+        try:
+            self._spawn_shard(shard)
+            self._await_ready(shard)
+            shard.restarts += 1
+            self.logger.info(f"✓ Shard {shard.shard_id} restarted successfully")
+        except Exception as e:
+            self.logger.error(f"✗ Failed to restart shard {shard.shard_id}: {e}")
+
+    def _terminate_shard(self, shard: ShardHandle):
+        """Join or terminate a shard process and close its pipe."""
+        if shard.process is not None:
+            shard.process.join(timeout=5)
+            if shard.process.is_alive():
+                shard.process.terminate()
+                shard.process.join(timeout=5)
+        if shard.conn is not None:
+            shard.conn.close()
+            shard.conn = None
+        shard.pending.clear()
+
+    def _send(self, shard: ShardHandle, command: str, payload: Any = None) -> Optional[int]:
+        """Send a command to a shard and register it as pending."""
+        self._seq += 1
+        try:
+            shard.conn.send((command, self._seq, payload))
+        except (OSError, AttributeError) as e:
+            self.logger.error(f"Failed to send '{command}' to shard {shard.shard_id}: {e}")
+            return None
+        shard.pending[self._seq] = command
+        return self._seq
+
+    def _collect(self, shards: List[ShardHandle], timeout: float) -> Dict[tuple, Any]:
+        """
+        Wait until the given shards have answered all pending commands.
+
+        Args:
+            shards: Shards to wait for
+            timeout: Maximum seconds to wait (0 drains what is already available)
+
+        Returns:
+            Dict mapping (shard_id, seq) -> reply payload for successful replies
+        """
+        replies: Dict[tuple, Any] = {}
+        deadline = time.perf_counter() + timeout
+        waiting = {shard.conn: shard for shard in shards if shard.conn is not None and shard.pending}
+
+        while waiting:
+            remaining = max(0.0, deadline - time.perf_counter())
+            ready = wait(list(waiting), timeout=remaining)
+            if not ready:
+                break
+
+            for conn in ready:
+                shard = waiting[conn]
+                try:
+                    status, seq, payload = conn.recv()
+                except (EOFError, OSError):
+                    self.logger.error(f"Shard {shard.shard_id} pipe closed")
+                    shard.pending.clear()
+                    del waiting[conn]
+                    continue
+
+                command = shard.pending.pop(seq, None)
+                if status == "error":
+                    self.logger.error(f"Shard {shard.shard_id} '{command}' failed: {payload}")
+                elif command is not None:
+                    self._apply_reply(shard, command, payload)
+                    replies[(shard.shard_id, seq)] = payload
+
+                if not shard.pending:
+                    del waiting[conn]
+
+        return replies
+
+    def _apply_reply(self, shard: ShardHandle, command: str, payload: Dict[str, Any]):
+        """Update coordinator-side shard state from a reply."""
+        if "health" in payload:
+            shard.health = payload["health"]
+        if command == "tick":
+            shard.ticks_completed += 1
+            shard.last_tick_seconds = payload.get("elapsed", 0.0)
+        elif command == "halt":
+            shard.halted = True
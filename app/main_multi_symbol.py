@@ -22,16 +22,19 @@ Configuration:
 import os
 import sys
 import logging
+from functools import partial
 from pathlib import Path
 
 from app.clients.mt5.client import create_client_with_retry
+from app.data.bar_cache import BarCache
 from app.data.data_manger import DataSourceManager
 from app.utils.config import LoadEnvironmentVariables
 from app.utils.date_helper import DateHelper
-from app.utils.multi_symbol_loader import load_all_components_for_symbols
+from app.utils.multi_symbol_loader import load_all_components_for_symbols, load_shard_components
 
 # Import the new multi-symbol infrastructure
 from app.infrastructure.multi_symbol_orchestrator import MultiSymbolTradingOrchestrator
+from app.infrastructure.sharded_orchestrator import ShardedTradingOrchestrator
 from app.infrastructure import (
     ConfigLoader,
     LoggingManager,
@@ -116,10 +119,14 @@ def main():
 
         # Data Source Manager (shared)
         logger.info("Initializing data source manager...")
+        bar_cache = BarCache(env_config.BAR_CACHE_PATH) if env_config.BAR_CACHE_PATH else None
+        if bar_cache:
+            logger.info(f"Using local bar cache at {env_config.BAR_CACHE_PATH}")
         data_source = DataSourceManager(
             mode=env_config.TRADE_MODE,
             client=client,
-            date_helper=DateHelper()
+            date_helper=DateHelper(),
+            bar_cache=bar_cache
         )
 
         # Date Helper (shared)
@@ -131,16 +138,6 @@ def main():
 
         logger.info("✓ Shared components initialized")
 
-        # Load components for all symbols
-        symbol_components = load_all_components_for_symbols(
-            symbols=env_config.SYMBOLS,
-            env_config=env_config,
-            client=client,
-            data_source=data_source,
-            date_helper=date_helper,
-            logger=logger
-        )
-
         # Load system configuration
         logger.info(f"\nLoading system configuration from {config_path}...")
         try:
@@ -158,16 +155,38 @@ def main():
                 )
             )
 
-        # Create multi-symbol orchestrator
-        logger.info("\n=== Creating Multi-Symbol Orchestrator ===")
-        orchestrator = MultiSymbolTradingOrchestrator.from_config(
-            config=system_config,
-            client=client,
-            data_source=data_source,
-            symbol_components=symbol_components,
-            date_helper=date_helper,
-            logger=logger
-        )
+        if system_config.orchestrator.sharded:
+            # Each shard process loads its own components for its symbols
+            logger.info("\n=== Creating Sharded Orchestrator ===")
+            orchestrator = ShardedTradingOrchestrator.from_config(
+                config=system_config,
+                client=client,
+                component_factory=partial(load_shard_components, env_path=env_path),
+                logger=logger
+            )
+        else:
+            # Load components for all symbols
+            symbol_components = load_all_components_for_symbols(
+                symbols=env_config.SYMBOLS,
+                env_config=env_config,
+                client=client,
+                data_source=data_source,
+                date_helper=date_helper,
+                logger=logger
+            )
+
+            # Create multi-symbol orchestrator
+            logger.info("\n=== Creating Multi-Symbol Orchestrator ===")
+            orchestrator = MultiSymbolTradingOrchestrator.from_config(
+                config=system_config,
+                client=client,
+                data_source=data_source,
+                symbol_components=symbol_components,
+                date_helper=date_helper,
+                logger=logger
+            )
+            if system_config.orchestrator.hot_reload:
+                orchestrator.enable_hot_reload(env_config.CONF_FOLDER_PATH)
         logger.info("✓ Orchestrator created successfully")
 
         # Start all services
@@ -19,6 +19,8 @@ from datetime import datetime, date, time
 from enum import Enum
 from dataclasses import dataclass
 
+from app.utils import clock
+
 
 class StopLossStatus(Enum):
     """Account stop loss status."""
@@ -157,7 +159,7 @@ class AccountStopLossManager:
         self.starting_balance = starting_balance
         self.peak_balance = starting_balance
         self.current_balance = starting_balance
-        self.last_reset_date = datetime.now().date()
+        self.last_reset_date = clock.now().date()
 
         self.logger.info(f"Initialized with starting balance: ${starting_balance:,.2f}")
 
@@ -214,7 +216,7 @@ class AccountStopLossManager:
             current_drawdown_pct=self.current_drawdown_pct,
             open_positions_count=open_positions_count,
             total_exposure=total_exposure,
-            timestamp=datetime.now()
+            timestamp=clock.now()
         )
 
         # Store in history
@@ -238,7 +240,7 @@ class AccountStopLossManager:
 
     def _check_daily_reset(self):
         """Check if we should reset daily P&L."""
-        current_date = datetime.now().date()
+        current_date = clock.now().date()
 
         if self.last_reset_date is None or current_date > self.last_reset_date:
             # New day - reset daily P&L
@@ -297,7 +299,7 @@ class AccountStopLossManager:
         self.logger.error("=" * 80)
 
         self.status = status
-        self.breach_time = datetime.now()
+        self.breach_time = clock.now()
         self.breach_reason = reason
 
         # Close positions if configured
@@ -322,7 +324,9 @@ class AccountStopLossManager:
 
             for position in positions:
                 try:
-                    result = self.client.positions.close_position(position['ticket'])
+                    result = self.client.positions.close_position(
+                        symbol=position['symbol'], ticket=position['ticket'], volume=position['volume']
+                    )
                     if result.get('success'):
                         closed_count += 1
                         self.logger.info(f"  ✓ Closed position {position['ticket']} ({position['symbol']})")
@@ -377,7 +381,7 @@ class AccountStopLossManager:
         """
         self.logger.warning(f"Manual trading stop: {reason}")
         self.status = StopLossStatus.MANUALLY_STOPPED
-        self.breach_time = datetime.now()
+        self.breach_time = clock.now()
         self.breach_reason = reason
 
         if self.config.close_positions_on_breach:
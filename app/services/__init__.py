@@ -7,6 +7,7 @@ and communicate through the EventBus.
 
 from app.services.base import EventDrivenService, HealthStatus
 from app.services.data_fetching import DataFetchingService
+from app.services.concurrent_fetcher import ConcurrentDataFetcher
 from app.services.indicator_calculation import IndicatorCalculationService
 from app.services.strategy_evaluation import StrategyEvaluationService
 from app.services.trade_execution import TradeExecutionService
@@ -15,6 +16,7 @@ __all__ = [
     "EventDrivenService",
     "HealthStatus",
     "DataFetchingService",
+    "ConcurrentDataFetcher",
     "IndicatorCalculationService",
     "StrategyEvaluationService",
     "TradeExecutionService",
@@ -13,6 +13,7 @@ from typing import Optional, Dict, Any
 
 from app.infrastructure.event_bus import EventBus
 from app.events.base import Event
+from app.utils import clock
 
 
 class ServiceStatus(Enum):
@@ -228,7 +229,7 @@ class EventDrivenService(ABC):
         """
         if self._start_time is None:
             return 0.0
-        return (datetime.now() - self._start_time).total_seconds()
+        return (clock.now() - self._start_time).total_seconds()
 
     def _set_status(self, status: ServiceStatus) -> None:
         """
@@ -241,7 +242,7 @@ class EventDrivenService(ABC):
         self._status = status
 
         if status == ServiceStatus.RUNNING and self._start_time is None:
-            self._start_time = datetime.now()
+            self._start_time = clock.now()
 
         self.logger.debug(f"{self.service_name} status changed: {old_status.value} -> {status.value}")
 
@@ -0,0 +1,221 @@
+"""
+Concurrent Data Fetcher.
+
+Issues every stream request of a fetch round (all symbols x all timeframes) in
+parallel on a bounded thread pool, then publishes the results through each
+DataFetchingService in a deterministic order.
+
+Only the blocking HTTP calls run on worker threads. Event publishing, candle
+detection and all service state updates happen on the calling thread, in
+symbol order then timeframe order, exactly as in the serial loop.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from app.services.base import ServiceStatus
+from app.services.data_fetching import DataFetchingService
+
+
+class ConcurrentDataFetcher:
+    """
+    Runs one fetch round for many DataFetchingServices concurrently.
+
+    A round waits at most ``round_deadline`` seconds. Requests that miss the
+    deadline are left to finish in the background and their results are
+    discarded; the same symbol/timeframe is not re-requested until the late
+    request has completed, so a slow endpoint cannot pile up work in the pool.
+
+    Example:
+        ```python
+        fetcher = ConcurrentDataFetcher(
+            services=[services["EURUSD"]["data_fetching"], services["XAUUSD"]["data_fetching"]],
+            max_workers=8,
+            round_deadline=10.0
+        )
+
+        stats = fetcher.fetch_round()
+        print(f"Round took {stats['round_seconds']:.3f}s (speedup x{stats['speedup']:.1f})")
+
+        fetcher.shutdown()
+        ```
+    """
+
+    def __init__(
+        self,
+        services: List[DataFetchingService],
+        max_workers: int = 8,
+        round_deadline: float = 10.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the concurrent fetcher.
+
+        Args:
+            services: DataFetchingServices to fetch for, in publishing order
+            max_workers: Maximum number of concurrent requests
+            round_deadline: Seconds to wait for a round before moving on
+            logger: Optional logger
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if round_deadline <= 0:
+            raise ValueError("round_deadline must be positive")
+
+        self.services = services
+        self.max_workers = max_workers
+        self.round_deadline = round_deadline
+        self.logger = logger or logging.getLogger('concurrent-fetcher')
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Dict[Tuple[str, str], Future] = {}
+
+        self._metrics: Dict[str, Any] = {
+            "rounds": 0,
+            "requests": 0,
+            "deadline_misses": 0,
+            "skipped_in_flight": 0,
+            "total_round_seconds": 0.0,
+            "total_fetch_seconds": 0.0,
+            "total_serial_seconds": 0.0,
+            "last_round_seconds": 0.0,
+            "last_fetch_seconds": 0.0,
+            "last_process_seconds": 0.0,
+            "last_serial_seconds": 0.0,
+            "last_speedup": 0.0,
+        }
+
+    def fetch_round(self) -> Dict[str, Any]:
+        """
+        Fetch and publish one round for all running services.
+
+        Returns:
+            Round statistics:
+                - requests: Requests issued this round
+                - completed: Requests that finished before the deadline
+                - deadline_misses: Requests still running at the deadline
+                - round_seconds: Wall-clock time of the round (fetch + processing)
+                - fetch_seconds: Wall-clock time until the requests finished
+                  or the deadline passed
+                - process_seconds: Time spent publishing the results,
+                  including the subscribers of the published events
+                - serial_seconds: Sum of individual request latencies
+                - speedup: serial_seconds / fetch_seconds, i.e. fetching
+                  serially vs. concurrently (processing is excluded)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="data-fetch"
+            )
+
+        # Forget late requests that have since completed
+        self._in_flight = {key: f for key, f in self._in_flight.items() if not f.done()}
+
+        round_start = time.perf_counter()
+
+        # Submit every request for the round
+        jobs: List[Tuple[DataFetchingService, str, Future]] = []
+        for service in self.services:
+            if service._status != ServiceStatus.RUNNING:
+                continue
+            for tf in service.timeframes:
+                key = (service.symbol, tf)
+                if key in self._in_flight:
+                    self._metrics["skipped_in_flight"] += 1
+                    self.logger.warning(f"Previous fetch for {service.symbol} {tf} still running - skipping")
+                    continue
+                jobs.append((service, tf, self._executor.submit(self._timed_request, service, tf)))
+
+        done, _ = wait([future for _, _, future in jobs], timeout=self.round_deadline)
+        fetch_seconds = time.perf_counter() - round_start
+
+        # Publish in deterministic order: services first, then timeframes
+        serial_seconds = 0.0
+        completed = 0
+        misses = 0
+        for service, tf, future in jobs:
+            if future not in done:
+                misses += 1
+                self._in_flight[(service.symbol, tf)] = future
+                self.logger.warning(
+                    f"Fetch for {service.symbol} {tf} missed the {self.round_deadline}s round deadline"
+                )
+                continue
+
+            try:
+                df_stream, elapsed = future.result()
+                serial_seconds += elapsed
+                completed += 1
+                service.process_stream_data(tf, df_stream)
+            except Exception as e:
+                service.handle_fetch_exception(tf, e, "concurrent fetch")
+
+        round_seconds = time.perf_counter() - round_start
+        process_seconds = round_seconds - fetch_seconds
+        speedup = serial_seconds / fetch_seconds if fetch_seconds > 0 else 0.0
+
+        self._metrics["rounds"] += 1
+        self._metrics["requests"] += len(jobs)
+        self._metrics["deadline_misses"] += misses
+        self._metrics["total_round_seconds"] += round_seconds
+        self._metrics["total_fetch_seconds"] += fetch_seconds
+        self._metrics["total_serial_seconds"] += serial_seconds
+        self._metrics["last_round_seconds"] = round_seconds
+        self._metrics["last_fetch_seconds"] = fetch_seconds
+        self._metrics["last_process_seconds"] = process_seconds
+        self._metrics["last_serial_seconds"] = serial_seconds
+        self._metrics["last_speedup"] = speedup
+
+        self.logger.debug(
+            f"Fetch round: {completed}/{len(jobs)} requests in {round_seconds:.3f}s "
+            f"(fetch {fetch_seconds:.3f}s vs serial {serial_seconds:.3f}s, speedup x{speedup:.1f}; "
+            f"processing {process_seconds:.3f}s)"
+        )
+
+        return {
+            "requests": len(jobs),
+            "completed": completed,
+            "deadline_misses": misses,
+            "round_seconds": round_seconds,
+            "fetch_seconds": fetch_seconds,
+            "process_seconds": process_seconds,
+            "serial_seconds": serial_seconds,
+            "speedup": speedup,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool without waiting for late requests."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._in_flight.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get cumulative round metrics.
+
+        Returns:
+            Dictionary with round counts, timings and average speedup
+        """
+        rounds = self._metrics["rounds"]
+        total_round = self._metrics["total_round_seconds"]
+        total_fetch = self._metrics["total_fetch_seconds"]
+        return {
+            **self._metrics,
+            "max_workers": self.max_workers,
+            "round_deadline": self.round_deadline,
+            "avg_round_seconds": total_round / rounds if rounds else 0.0,
+            "avg_speedup": self._metrics["total_serial_seconds"] / total_fetch if total_fetch > 0 else 0.0,
+        }
+
+    @staticmethod
+    def _timed_request(service: DataFetchingService, timeframe: str) -> Tuple[pd.DataFrame, float]:
+        """Run one stream request on a worker thread and time it."""
+        start = time.perf_counter()
+        df_stream = service.request_stream_data(timeframe)
+        return df_stream, time.perf_counter() - start
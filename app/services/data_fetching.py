@@ -38,6 +38,8 @@ class DataFetchingService(EventDrivenService):
         timeframes: List of timeframes to monitor (e.g., ["1", "5", "15"])
         candle_index: Bar index for new candle detection (default: 1)
         nbr_bars: Number of bars to fetch for streaming data (default: 3)
+        cursor_fetch: Fetch only bars after the last seen bar and emit every
+            missed closed bar in order (default: False)
 
     Example:
         ```python
@@ -80,6 +82,7 @@ class DataFetchingService(EventDrivenService):
                 - timeframes: List of timeframes (required)
                 - candle_index: Bar index for candle detection (default: 1)
                 - nbr_bars: Number of bars to fetch (default: 3)
+                - cursor_fetch: Request only bars after the last seen bar (default: False)
         """
         super().__init__(
             service_name="DataFetchingService",
@@ -105,16 +108,23 @@ class DataFetchingService(EventDrivenService):
         self.timeframes: List[str] = config["timeframes"]
         self.candle_index = config.get("candle_index", 1)
         self.nbr_bars = config.get("nbr_bars", 3)
+        self.cursor_fetch = config.get("cursor_fetch", False)
 
         # State: Track last known bar for each timeframe
         self.last_known_bars: Dict[str, Optional[pd.Series]] = {
             tf: None for tf in self.timeframes
         }
 
+        # State: Open time of the latest (possibly still forming) bar per timeframe, in broker time
+        self.last_bar_times: Dict[str, Optional[pd.Timestamp]] = {
+            tf: None for tf in self.timeframes
+        }
+
         # Metrics
         self._metrics["data_fetches"] = 0
         self._metrics["new_candles_detected"] = 0
         self._metrics["fetch_errors"] = 0
+        self._metrics["catch_up_bars"] = 0
 
         self.logger.info(
             f"DataFetchingService initialized for {self.symbol} "
@@ -136,6 +146,7 @@ class DataFetchingService(EventDrivenService):
         # Reinitialize last_known_bars for all timeframes
         # This is important when restarting the service
         self.last_known_bars = {tf: None for tf in self.timeframes}
+        self.last_bar_times = {tf: None for tf in self.timeframes}
 
         self._set_status(ServiceStatus.RUNNING)
         self.logger.info(f"{self.service_name} started successfully")
@@ -200,84 +211,195 @@ class DataFetchingService(EventDrivenService):
                 self.logger.info(f" [FETCH START] {self.symbol} {tf} - Requesting {self.nbr_bars} bars...")
 
                 # Fetch streaming data
-                df_stream = self.data_source.get_stream_data(
-                    symbol=self.symbol,
-                    timeframe=tf,
-                    nbr_bars=self.nbr_bars,
-                )
+                df_stream = self.request_stream_data(tf)
 
-                # Validate data
-                if df_stream.empty:
-                    self.logger.warning(f" [FETCH FAILED] {self.symbol} {tf} - Empty data received")
-                    self._publish_fetch_error(tf, "Empty DataFrame received", None)
-                    continue
+                if self.process_stream_data(tf, df_stream):
+                    success_count += 1
 
-                success_count += 1
-                self._metrics["data_fetches"] += 1
+            except Exception as e:
+                self.handle_fetch_exception(tf, e, "fetch_streaming_data")
+
+        return success_count
 
-                # Log fetched data details
-                latest_bar = df_stream.iloc[-1]
+    def request_stream_data(self, timeframe: str) -> pd.DataFrame:
+        """
+        Request streaming bars for a timeframe from the data source.
+
+        This only performs the (blocking) fetch and touches no service state,
+        so it is safe to call from worker threads. Results must be handed to
+        process_stream_data() on the publishing thread.
+
+        Args:
+            timeframe: Timeframe to fetch
+
+        Returns:
+            DataFrame with the latest nbr_bars bars
+        """
+        last_bar = self.last_known_bars.get(timeframe)
+        if self.cursor_fetch and last_bar is not None:
+            return self.data_source.get_stream_data_since(
+                symbol=self.symbol,
+                timeframe=timeframe,
+                since=pd.Timestamp(last_bar['time']),
+                nbr_bars=self.nbr_bars,
+            )
+
+        return self.data_source.get_stream_data(
+            symbol=self.symbol,
+            timeframe=timeframe,
+            nbr_bars=self.nbr_bars,
+        )
+
+    def process_stream_data(self, timeframe: str, df_stream: pd.DataFrame) -> bool:
+        """
+        Publish fetched bars and detect a new candle for one timeframe.
+
+        1. Publish DataFetchedEvent
+        2. Check if new candle has formed
+        3. If new candle, publish NewCandleEvent and update last_known_bar
+
+        Args:
+            timeframe: Timeframe the bars belong to
+            df_stream: Bars returned by request_stream_data()
+
+        Returns:
+            True if data was processed, False if it was empty
+        """
+        tf = timeframe
+
+        # Validate data
+        if df_stream.empty:
+            if self.cursor_fetch and self.last_known_bars[tf] is not None:
+                # Nothing newer than the cursor yet
+                self.logger.debug(f"⏸️  [NO NEW CANDLE] {self.symbol} {tf} - No bars after cursor")
+                return True
+
+            self.logger.warning(f" [FETCH FAILED] {self.symbol} {tf} - Empty data received")
+            self._publish_fetch_error(tf, "Empty DataFrame received", None)
+            return False
+
+        self._metrics["data_fetches"] += 1
+
+        # Log fetched data details
+        latest_bar = df_stream.iloc[-1]
+        self.last_bar_times[tf] = pd.Timestamp(latest_bar['time'])
+        self.logger.info(
+            f" [FETCH SUCCESS] {self.symbol} {tf} - Received {len(df_stream)} bars | "
+            f"Latest: time={latest_bar.name}, open={latest_bar['open']:.5f}, "
+            f"high={latest_bar['high']:.5f}, low={latest_bar['low']:.5f}, "
+            f"close={latest_bar['close']:.5f}, volume={latest_bar.get('tick_volume', 'N/A')}"
+        )
+
+        # Publish DataFetchedEvent
+        data_event = DataFetchedEvent(
+            symbol=self.symbol,
+            timeframe=tf,
+            bars=df_stream,
+            num_bars=len(df_stream),
+        )
+        self.publish_event(data_event)
+        self.logger.debug(f"📤 [EVENT] DataFetchedEvent published for {self.symbol} {tf}")
+
+        if self.cursor_fetch:
+            self._publish_new_candles(tf, df_stream)
+            return True
+
+        # Check for new candle
+        if has_new_candle(df_stream, self.last_known_bars[tf], self.candle_index):
+            # Get the new candle bar
+            new_bar = df_stream.iloc[-self.candle_index]
+
+            # Log old vs new candle comparison
+            old_bar = self.last_known_bars[tf]
+            if old_bar is not None:
                 self.logger.info(
-                    f" [FETCH SUCCESS] {self.symbol} {tf} - Received {len(df_stream)} bars | "
-                    f"Latest: time={latest_bar.name}, open={latest_bar['open']:.5f}, "
-                    f"high={latest_bar['high']:.5f}, low={latest_bar['low']:.5f}, "
-                    f"close={latest_bar['close']:.5f}, volume={latest_bar.get('tick_volume', 'N/A')}"
+                    f" [NEW CANDLE] {self.symbol} {tf} | "
+                    f"Old: time={old_bar.name}, close={old_bar['close']:.5f} → "
+                    f"New: time={new_bar.name}, close={new_bar['close']:.5f}"
                 )
-
-                # Publish DataFetchedEvent
-                data_event = DataFetchedEvent(
-                    symbol=self.symbol,
-                    timeframe=tf,
-                    bars=df_stream,
-                    num_bars=len(df_stream),
+            else:
+                self.logger.info(
+                    f" [NEW CANDLE] {self.symbol} {tf} | "
+                    f"First candle: time={new_bar.name}, close={new_bar['close']:.5f}"
                 )
-                self.publish_event(data_event)
-                self.logger.debug(f"📤 [EVENT] DataFetchedEvent published for {self.symbol} {tf}")
-
-                # Check for new candle
-                if has_new_candle(df_stream, self.last_known_bars[tf], self.candle_index):
-                    # Get the new candle bar
-                    new_bar = df_stream.iloc[-self.candle_index]
-
-                    # Log old vs new candle comparison
-                    old_bar = self.last_known_bars[tf]
-                    if old_bar is not None:
-                        self.logger.info(
-                            f" [NEW CANDLE] {self.symbol} {tf} | "
-                            f"Old: time={old_bar.name}, close={old_bar['close']:.5f} → "
-                            f"New: time={new_bar.name}, close={new_bar['close']:.5f}"
-                        )
-                    else:
-                        self.logger.info(
-                            f" [NEW CANDLE] {self.symbol} {tf} | "
-                            f"First candle: time={new_bar.name}, close={new_bar['close']:.5f}"
-                        )
-
-                    # Update last known bar
-                    self.last_known_bars[tf] = new_bar
-
-                    # Publish NewCandleEvent
-                    candle_event = NewCandleEvent(
-                        symbol=self.symbol,
-                        timeframe=tf,
-                        bar=new_bar,
-                    )
-                    self.publish_event(candle_event)
-                    self.logger.debug(f"📤 [EVENT] NewCandleEvent published for {self.symbol} {tf}")
-
-                    self._metrics["new_candles_detected"] += 1
-                else:
-                    self.logger.debug(f"⏸️  [NO NEW CANDLE] {self.symbol} {tf} - Same as previous")
 
-            except Exception as e:
-                self.logger.error(
-                    f"Error fetching data for {self.symbol} {tf}: {e}",
-                    exc_info=True
-                )
-                self._publish_fetch_error(tf, str(e), e)
-                self._handle_error(e, f"fetch_streaming_data for {tf}")
+            # Update last known bar
+            self.last_known_bars[tf] = new_bar
 
-        return success_count
+            # Publish NewCandleEvent
+            candle_event = NewCandleEvent(
+                symbol=self.symbol,
+                timeframe=tf,
+                bar=new_bar,
+            )
+            self.publish_event(candle_event)
+            self.logger.debug(f"📤 [EVENT] NewCandleEvent published for {self.symbol} {tf}")
+
+            self._metrics["new_candles_detected"] += 1
+        else:
+            self.logger.debug(f"⏸️  [NO NEW CANDLE] {self.symbol} {tf} - Same as previous")
+
+        return True
+
+    def _publish_new_candles(self, timeframe: str, df_stream: pd.DataFrame) -> int:
+        """
+        Publish a NewCandleEvent for every closed bar after the last known bar, in order.
+
+        The last ``candle_index - 1`` rows are still forming and are skipped. On the
+        first fetch only the latest closed bar is published, as in the windowed mode.
+
+        Args:
+            timeframe: Timeframe the bars belong to
+            df_stream: Bars after the cursor (or the latest window on first fetch)
+
+        Returns:
+            Number of NewCandleEvents published
+        """
+        closed = df_stream.iloc[:len(df_stream) - (self.candle_index - 1)]
+        last_bar = self.last_known_bars[timeframe]
+
+        if last_bar is None:
+            closed = closed.iloc[-1:]
+        else:
+            closed = closed[pd.to_datetime(closed['time']) > pd.Timestamp(last_bar['time'])]
+
+        if len(closed) > 1:
+            self.logger.warning(
+                f" [CATCH-UP] {self.symbol} {timeframe} - {len(closed)} closed bars since last fetch"
+            )
+            self._metrics["catch_up_bars"] += len(closed) - 1
+
+        for _, new_bar in closed.iterrows():
+            self.logger.info(
+                f" [NEW CANDLE] {self.symbol} {timeframe} | "
+                f"time={new_bar['time']}, close={new_bar['close']:.5f}"
+            )
+            self.last_known_bars[timeframe] = new_bar
+
+            self.publish_event(NewCandleEvent(
+                symbol=self.symbol,
+                timeframe=timeframe,
+                bar=new_bar,
+            ))
+            self._metrics["new_candles_detected"] += 1
+
+        return len(closed)
+
+    def handle_fetch_exception(self, timeframe: str, error: Exception, context: str) -> None:
+        """
+        Log, publish and record a failed fetch for a timeframe.
+
+        Args:
+            timeframe: Timeframe that failed
+            error: Exception raised by the fetch or processing
+            context: Caller name used in the error record
+        """
+        self.logger.error(
+            f"Error fetching data for {self.symbol} {timeframe}: {error}",
+            exc_info=error
+        )
+        self._publish_fetch_error(timeframe, str(error), error)
+        self._handle_error(error, f"{context} for {timeframe}")
 
     def fetch_single_timeframe(self, timeframe: str) -> bool:
         """
@@ -303,57 +425,11 @@ class DataFetchingService(EventDrivenService):
             return False
 
         try:
-            # Fetch streaming data
-            df_stream = self.data_source.get_stream_data(
-                symbol=self.symbol,
-                timeframe=timeframe,
-                nbr_bars=self.nbr_bars,
-            )
-
-            if df_stream.empty:
-                self.logger.warning(f"Empty data received for {self.symbol} {timeframe}")
-                self._publish_fetch_error(timeframe, "Empty DataFrame received", None)
-                return False
-
-            self._metrics["data_fetches"] += 1
-
-            # Publish DataFetchedEvent
-            data_event = DataFetchedEvent(
-                symbol=self.symbol,
-                timeframe=timeframe,
-                bars=df_stream,
-                num_bars=len(df_stream),
-            )
-            self.publish_event(data_event)
-
-            # Check for new candle
-            if has_new_candle(df_stream, self.last_known_bars[timeframe], self.candle_index):
-                new_bar = df_stream.iloc[-self.candle_index]
-                self.last_known_bars[timeframe] = new_bar
-
-                candle_event = NewCandleEvent(
-                    symbol=self.symbol,
-                    timeframe=timeframe,
-                    bar=new_bar,
-                )
-                self.publish_event(candle_event)
-
-                self._metrics["new_candles_detected"] += 1
-
-                self.logger.info(
-                    f"New candle detected: {self.symbol} {timeframe} "
-                    f"close={candle_event.get_close():.5f}"
-                )
-
-            return True
+            df_stream = self.request_stream_data(timeframe)
+            return self.process_stream_data(timeframe, df_stream)
 
         except Exception as e:
-            self.logger.error(
-                f"Error fetching data for {self.symbol} {timeframe}: {e}",
-                exc_info=True
-            )
-            self._publish_fetch_error(timeframe, str(e), e)
-            self._handle_error(e, f"fetch_single_timeframe {timeframe}")
+            self.handle_fetch_exception(timeframe, e, "fetch_single_timeframe")
             return False
 
     def reset_last_known_bars(self, timeframe: Optional[str] = None) -> None:
@@ -421,4 +497,5 @@ class DataFetchingService(EventDrivenService):
             "data_fetches": self._metrics["data_fetches"],
             "new_candles_detected": self._metrics["new_candles_detected"],
             "fetch_errors": self._metrics["fetch_errors"],
+            "catch_up_bars": self._metrics["catch_up_bars"],
         }
@@ -0,0 +1,379 @@
+"""
+Candle-Close Fetch Scheduler.
+
+Polls each timeframe only around the moment its next bar is expected to close,
+instead of every timeframe on every loop iteration.
+
+For each symbol/timeframe the scheduler:
+1. Computes the next expected close from the latest bar's open time plus the
+   timeframe length, converted to local time with the broker clock offset
+   measured from returned bar times
+2. Waits until just after that moment (``close_delay``)
+3. Polls every ``retry_interval`` seconds for at most ``retry_window`` seconds
+   until the new bar appears
+4. If no bar appears (market closed, no ticks), marks the timeframe idle and
+   checks once per bar boundary, or as soon as another timeframe of the same
+   symbol sees a new bar
+
+Fetching itself goes through DataFetchingService.fetch_single_timeframe(), so
+events and new-candle detection are unchanged.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from app.services.base import ServiceStatus
+from app.services.data_fetching import DataFetchingService
+from app.utils.clock import get_clock
+
+
+# Timeframe value -> length in minutes (values from TimeFrameEnum)
+TIMEFRAME_MINUTES: Dict[str, int] = {
+    "1": 1,
+    "5": 5,
+    "15": 15,
+    "30": 30,
+    "60": 60,
+    "240": 240,
+    "1d": 1440,
+}
+
+
+def timeframe_seconds(timeframe: str) -> int:
+    """
+    Get the length of a timeframe in seconds.
+
+    Args:
+        timeframe: Timeframe value (e.g., "5", "240", "1d")
+
+    Returns:
+        Timeframe length in seconds
+
+    Raises:
+        ValueError: If the timeframe is unknown
+    """
+    if timeframe in TIMEFRAME_MINUTES:
+        return TIMEFRAME_MINUTES[timeframe] * 60
+    if timeframe.isdigit():
+        return int(timeframe) * 60
+    raise ValueError(f"Invalid timeframe value: {timeframe}")
+
+
+def bar_time_to_epoch(bar_time: Any) -> float:
+    """Convert a bar time to epoch seconds, reading naive times as UTC-labelled broker time."""
+    ts = pd.Timestamp(bar_time)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return ts.timestamp()
+
+
+class BrokerClockOffset:
+    """
+    Estimates broker server time minus local time from returned bar times.
+
+    The offset is tracked as an interval [lower, upper] narrowed by two kinds
+    of observation:
+
+    - The latest bar returned is the one still forming, so at fetch time
+      ``open_time <= broker_now < open_time + timeframe``.
+    - A new bar seen at ``seen_at`` after an empty poll at ``not_before``
+      means the previous bar closed between the two polls.
+
+    An observation that contradicts the interval means the broker clock moved
+    (e.g. a DST change) and restarts the estimate.
+    """
+
+    def __init__(self):
+        self.lower: Optional[float] = None
+        self.upper: Optional[float] = None
+        self.observations = 0
+        self.resets = 0
+
+    def observe(self, latest_bar_time: Any, tf_seconds: float, local_now: float, fresh: bool = True) -> None:
+        """
+        Add a forming-bar observation.
+
+        Args:
+            latest_bar_time: Open time of the latest (forming) bar
+            tf_seconds: Timeframe length in seconds
+            local_now: Local epoch time when the bars were received
+            fresh: Whether the bar is known to be current (just detected as new);
+                an older-than-expected bar only resets the estimate if fresh
+        """
+        lo = bar_time_to_epoch(latest_bar_time) - local_now
+        self._merge(lo, lo + tf_seconds, fresh)
+
+    def observe_close(self, close_time: Any, not_before: float, seen_at: float) -> None:
+        """
+        Add a bar-close observation bracketed by an empty poll and a detecting poll.
+
+        Args:
+            close_time: Broker time of the close (open time of the new bar)
+            not_before: Local epoch time of the last poll that did not see the new bar
+            seen_at: Local epoch time of the poll that saw it
+        """
+        close_epoch = bar_time_to_epoch(close_time)
+        self._merge(close_epoch - seen_at, close_epoch - not_before, fresh=True)
+
+    def estimate(self, max_early: float = 0.0) -> float:
+        """
+        Get the offset used to predict closes.
+
+        Leans towards the upper bound (earlier predicted closes) by at most
+        ``max_early`` seconds, so an uncertain estimate polls slightly early
+        and the next bracketing observation can tighten it. Estimating from the
+        lower bound alone would poll late and never learn how late.
+
+        Args:
+            max_early: Maximum seconds to lean towards the upper bound
+
+        Returns:
+            Estimated broker time minus local time in seconds (0 until observed)
+        """
+        if self.lower is None:
+            return 0.0
+        return min(self.upper, self.lower + max_early)
+
+    @property
+    def offset_seconds(self) -> float:
+        """Lower bound of broker time minus local time in seconds (0 until observed)."""
+        return self.lower if self.lower is not None else 0.0
+
+    def _merge(self, lo: float, hi: float, fresh: bool) -> None:
+        """Intersect a new interval with the current one."""
+        if self.lower is None:
+            self.lower, self.upper = lo, hi
+        elif lo > self.upper or (fresh and hi < self.lower):
+            self.lower, self.upper = lo, hi
+            self.resets += 1
+        elif hi >= self.lower:
+            self.lower = max(self.lower, lo)
+            self.upper = min(self.upper, hi)
+        else:
+            # Stale bar (e.g. market closed) - carries no information
+            return
+
+        self.observations += 1
+
+
+@dataclass
+class TimeframeSchedule:
+    """Scheduling state for one symbol/timeframe."""
+    service: DataFetchingService
+    timeframe: str
+    tf_seconds: int
+    next_due: float = 0.0
+    expected_close: Optional[float] = None
+    polls_this_bar: int = 0
+    idle: bool = False
+    last_empty_poll: Optional[float] = None
+    last_empty_bar: Optional[Any] = None
+
+
+class CandleCloseScheduler:
+    """
+    Fetches each timeframe just after its expected candle close.
+
+    Example:
+        ```python
+        scheduler = CandleCloseScheduler(
+            services=[services["EURUSD"]["data_fetching"]],
+            close_delay=0.5,
+            retry_interval=1.0,
+            retry_window=30.0
+        )
+
+        while running:
+            scheduler.run_due()
+            get_clock().sleep(scheduler.seconds_until_next_due())
+        ```
+    """
+
+    def __init__(
+        self,
+        services: List[DataFetchingService],
+        close_delay: float = 0.5,
+        retry_interval: float = 1.0,
+        retry_window: float = 30.0,
+        clock: Optional[Callable[[], float]] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            services: DataFetchingServices to schedule, in fetch order
+            close_delay: Seconds after the expected close before the first poll
+            retry_interval: Seconds between polls while waiting for the new bar
+            retry_window: Seconds after the expected close to keep polling
+            clock: Optional epoch-seconds time source (default: the process-wide Clock)
+            logger: Optional logger
+        """
+        if retry_interval <= 0:
+            raise ValueError("retry_interval must be positive")
+
+        self.close_delay = close_delay
+        self.retry_interval = retry_interval
+        self.retry_window = retry_window
+        self.clock = clock or (lambda: get_clock().time())
+        self.logger = logger or logging.getLogger('fetch-scheduler')
+
+        self.broker_offset = BrokerClockOffset()
+        self.schedules: List[TimeframeSchedule] = [
+            TimeframeSchedule(service=service, timeframe=tf, tf_seconds=timeframe_seconds(tf))
+            for service in services
+            for tf in service.timeframes
+        ]
+
+        self._metrics: Dict[str, Any] = {
+            "polls": 0,
+            "empty_polls": 0,
+            "candles_detected": 0,
+            "idle_transitions": 0,
+            "total_detect_latency": 0.0,
+            "max_detect_latency": 0.0,
+            "latency_samples": 0,
+        }
+
+    def run_due(self) -> int:
+        """
+        Fetch every symbol/timeframe whose poll time has come.
+
+        Returns:
+            Number of fetches made
+        """
+        fetches = 0
+
+        for entry in self.schedules:
+            service = entry.service
+            if service._status != ServiceStatus.RUNNING:
+                continue
+            if entry.next_due > self.clock():
+                continue
+
+            tf = entry.timeframe
+            first_fetch = service.last_bar_times.get(tf) is None
+            candles_before = service._metrics["new_candles_detected"]
+
+            service.fetch_single_timeframe(tf)
+            fetched_at = self.clock()
+            fetches += 1
+            entry.polls_this_bar += 1
+            self._metrics["polls"] += 1
+
+            new_candle = service._metrics["new_candles_detected"] > candles_before
+            bar_time = service.last_bar_times.get(tf)
+
+            if new_candle and bar_time is not None:
+                self.broker_offset.observe(bar_time, entry.tf_seconds, fetched_at, fresh=not first_fetch)
+                if (entry.last_empty_bar is not None
+                        and bar_time_to_epoch(bar_time) == bar_time_to_epoch(entry.last_empty_bar) + entry.tf_seconds):
+                    self.broker_offset.observe_close(bar_time, entry.last_empty_poll, fetched_at)
+
+                if entry.expected_close is not None and not entry.idle:
+                    # Close of the previous bar = open of the new one, in local time
+                    closed_at = bar_time_to_epoch(bar_time) - self.broker_offset.estimate(self.retry_window / 2)
+                    self._record_latency(fetched_at - closed_at)
+                if not first_fetch:
+                    self._metrics["candles_detected"] += 1
+                    self._wake_idle(service, fetched_at)
+
+                self._schedule_next_close(entry, bar_time, fetched_at)
+                continue
+
+            self._metrics["empty_polls"] += 1
+            if not entry.idle and bar_time is not None:
+                entry.last_empty_poll = fetched_at
+                entry.last_empty_bar = bar_time
+            self._schedule_retry(entry, fetched_at)
+
+        return fetches
+
+    def seconds_until_next_due(self) -> float:
+        """Seconds until the earliest scheduled poll (0 if one is due)."""
+        running = [e.next_due for e in self.schedules if e.service._status == ServiceStatus.RUNNING]
+        if not running:
+            return self.retry_interval
+        return max(0.0, min(running) - self.clock())
+
+    def get_next_polls(self) -> Dict[str, Dict[str, float]]:
+        """Get the next scheduled poll time (local epoch seconds) per symbol/timeframe."""
+        next_polls: Dict[str, Dict[str, float]] = {}
+        for entry in self.schedules:
+            next_polls.setdefault(entry.service.symbol, {})[entry.timeframe] = entry.next_due
+        return next_polls
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get scheduler metrics.
+
+        Returns:
+            Dictionary with poll counts, detection latency and broker offset
+        """
+        samples = self._metrics["latency_samples"]
+        candles = self._metrics["candles_detected"]
+        return {
+            **self._metrics,
+            "avg_detect_latency": self._metrics["total_detect_latency"] / samples if samples else 0.0,
+            "polls_per_candle": self._metrics["polls"] / candles if candles else 0.0,
+            "broker_offset_seconds": self.broker_offset.estimate(max_early=self.retry_window / 2),
+            "idle_timeframes": sum(1 for e in self.schedules if e.idle),
+        }
+
+    def _schedule_next_close(self, entry: TimeframeSchedule, bar_time: Any, now: float) -> None:
+        """Schedule the first poll just after the close of the bar that is now forming."""
+        offset = self.broker_offset.estimate(max_early=self.retry_window / 2)
+        close_local = bar_time_to_epoch(bar_time) + entry.tf_seconds - offset
+
+        entry.expected_close = close_local
+        entry.polls_this_bar = 0
+        entry.idle = False
+        entry.last_empty_poll = None
+        entry.last_empty_bar = None
+
+        if close_local + self.retry_window < now:
+            # Latest bar is already stale (market closed) - check again at the next boundary
+            self._go_idle(entry, now)
+        else:
+            entry.next_due = max(now, close_local + self.close_delay)
+
+    def _schedule_retry(self, entry: TimeframeSchedule, now: float) -> None:
+        """Poll again shortly, or go idle once the retry window is exhausted."""
+        if entry.expected_close is None:
+            # Never fetched successfully - keep trying at the retry interval
+            entry.next_due = now + self.retry_interval
+        elif not entry.idle and now < entry.expected_close + self.retry_window:
+            entry.next_due = now + self.retry_interval
+        else:
+            self._go_idle(entry, now)
+
+    def _go_idle(self, entry: TimeframeSchedule, now: float) -> None:
+        """Skip to the next bar boundary after now and poll only once there."""
+        if not entry.idle:
+            entry.idle = True
+            self._metrics["idle_transitions"] += 1
+            self.logger.info(
+                f"{entry.service.symbol} {entry.timeframe}: no new bar within "
+                f"{self.retry_window}s of expected close - idling until next boundary"
+            )
+
+        boundaries = max(1, math.ceil((now - entry.expected_close) / entry.tf_seconds))
+        entry.expected_close += boundaries * entry.tf_seconds
+        entry.next_due = entry.expected_close + self.close_delay
+
+    def _wake_idle(self, service: DataFetchingService, now: float) -> None:
+        """A new bar on one timeframe means the symbol is trading again - poll its idle timeframes."""
+        for entry in self.schedules:
+            if entry.service is service and entry.idle:
+                entry.next_due = min(entry.next_due, now)
+
+    def _record_latency(self, latency: float) -> None:
+        """Track close-to-detect latency."""
+        latency = max(0.0, latency)
+        self._metrics["latency_samples"] += 1
+        self._metrics["total_detect_latency"] += latency
+        self._metrics["max_detect_latency"] = max(self._metrics["max_detect_latency"], latency)
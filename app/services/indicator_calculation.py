@@ -25,6 +25,7 @@ from app.events.indicator_events import (
     RegimeChangedEvent,
     IndicatorCalculationErrorEvent,
 )
+from app.indicators.indicator_manager import HandlerChange
 from app.indicators.indicator_processor import IndicatorProcessor
 from app.regime.regime_manager import RegimeManager
 
@@ -431,6 +432,29 @@ class IndicatorCalculationService(EventDrivenService):
         """
         return self.last_known_regimes.copy()
 
+    def reload_indicators(self, configs: Dict[str, dict]) -> Dict[str, HandlerChange]:
+        """
+        Apply new indicator configurations without restarting the service.
+
+        Unchanged indicators keep their state; added or edited ones are warmed
+        on the retained history (see IndicatorProcessor.reload_configs).
+        Call it between candles (e.g. from the orchestrator loop), not from an
+        event handler.
+
+        Args:
+            configs: Dictionary mapping timeframe to indicator configuration
+
+        Returns:
+            Changes by timeframe (only changed timeframes)
+        """
+        changes = self.indicator_processor.reload_configs(configs)
+        for timeframe, change in changes.items():
+            self.logger.info(
+                f"🔄 [RELOAD] {self.symbol} {timeframe} indicators: "
+                f"added={change.added} removed={change.removed}"
+            )
+        return changes
+
     def get_metrics(self) -> Dict[str, Any]:
         """
         Get service metrics including indicator-specific metrics.
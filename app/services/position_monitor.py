@@ -21,6 +21,7 @@ from app.events.position_events import (
     StopLossMovedEvent,
 )
 from app.events.trade_events import TradesExecutedEvent
+from app.utils import clock
 
 
 class PositionTracker:
@@ -341,7 +342,7 @@ class PositionMonitorService(EventDrivenService):
                     current_price=current_price,
                     percent_to_close=next_tp["percent"],
                     move_stop=next_tp.get("move_stop", False),
-                    timestamp=datetime.now(),
+                    timestamp=clock.now(),
                 )
             )
 
@@ -402,7 +403,7 @@ class PositionMonitorService(EventDrivenService):
                         close_price=close_price,
                         profit=profit,
                         tp_level=tp_target["level"],
-                        timestamp=datetime.now(),
+                        timestamp=clock.now(),
                     )
                 )
 
@@ -463,7 +464,7 @@ class PositionMonitorService(EventDrivenService):
                         old_stop_loss=old_sl,
                         new_stop_loss=new_sl,
                         reason="tp_hit",
-                        timestamp=datetime.now(),
+                        timestamp=clock.now(),
                     )
                 )
 
@@ -528,7 +529,7 @@ class PositionMonitorService(EventDrivenService):
             self.logger.info(f" [RESTORE] Checking for existing open positions for {self.symbol}...")
 
             # Get all open positions from broker
-            all_positions = self.client.positions.get_open_positions()
+            all_positions = self.client.positions.get_all_positions()
 
             # Filter positions for this symbol
             symbol_positions = [
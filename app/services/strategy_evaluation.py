@@ -11,7 +11,7 @@ It is responsible for:
 """
 
 import logging
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from collections import deque
 
 from app.services.base import EventDrivenService, ServiceStatus, HealthStatus
@@ -125,6 +125,9 @@ class StrategyEvaluationService(EventDrivenService):
         # Automation control - start enabled by default
         self._automation_enabled = True
 
+        # Rows of the last evaluation, re-used by the time-sensitive refresh
+        self._last_recent_rows: Optional[Dict[str, deque]] = None
+
         # Metrics
         self._metrics["strategies_evaluated"] = 0
         self._metrics["entry_signals_generated"] = 0
@@ -282,6 +285,7 @@ class StrategyEvaluationService(EventDrivenService):
 
         # Step 1: Evaluate strategies using strategy engine
         strategy_results = self.strategy_engine.evaluate(recent_rows)
+        self._last_recent_rows = recent_rows
 
         self._metrics["strategies_evaluated"] += 1
 
@@ -291,6 +295,44 @@ class StrategyEvaluationService(EventDrivenService):
             f"Evaluated {len(strategy_results.strategies)} strategies"
         )
 
+        self._process_results(strategy_results, recent_rows)
+
+    def check_timers(self) -> None:
+        """
+        Refresh strategies whose signals can change between bars.
+
+        Time-based exits, profit guards and activation schedules depend on the
+        clock rather than on new bars, so they are re-evaluated here (called
+        periodically by the orchestrator) instead of on IndicatorsCalculatedEvent.
+        Only strategies whose result changed are passed to the EntryManager.
+        """
+        if self._last_recent_rows is None:
+            return
+
+        try:
+            strategy_results = self.strategy_engine.refresh_time_sensitive(self._last_recent_rows)
+            if not strategy_results.strategies:
+                return
+
+            self.logger.info(
+                f"⏰ [STRATEGY TIMER] {self.symbol} | "
+                f"{len(strategy_results.strategies)} time-sensitive strategies changed"
+            )
+            self._process_results(strategy_results, self._last_recent_rows)
+
+        except Exception as e:
+            self.logger.error(f"Error refreshing time-sensitive strategies for {self.symbol}: {e}", exc_info=True)
+            self._publish_evaluation_error(e)
+            self._handle_error(e, "check_timers")
+
+    def _process_results(self, strategy_results: Any, recent_rows: Dict[str, deque]) -> None:
+        """
+        Turn strategy results into trade decisions and publish them.
+
+        Args:
+            strategy_results: AllStrategiesEvaluationResult from the strategy engine
+            recent_rows: Dictionary mapping timeframe to deque of enriched rows
+        """
         # Step 2: Get account balance
         account_balance = None
         if self.client:
@@ -461,6 +503,43 @@ class StrategyEvaluationService(EventDrivenService):
             self.logger.error(f"Error getting strategy info for {strategy_name}: {e}")
             return None
 
+    def reload_strategies(self, config_paths: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """
+        Reload strategy configurations without restarting the service.
+
+        The engine recompiles only added and edited strategies, and the entry
+        manager is switched to the reloaded definitions. Changes apply from the
+        next evaluation. Call it between evaluations (e.g. from the
+        orchestrator loop), not from an event handler.
+
+        Args:
+            config_paths: New list of strategy files (default: the current list)
+
+        Returns:
+            Strategy names by change: "added", "changed" and "removed"
+
+        Raises:
+            Exception: If the strategies fail to load or validate; the previous
+                strategies stay in use
+        """
+        previous = self.entry_manager.strategies
+        summary = self.strategy_engine.reload_strategies(config_paths)
+        self.entry_manager.strategies = {
+            name: self.strategy_engine.get_strategy_info(name)
+            for name in self.strategy_engine.list_available_strategies()
+        }
+        try:
+            self.entry_manager._validate_strategies()
+        except Exception:
+            self.entry_manager.strategies = previous
+            raise
+
+        self.logger.info(
+            f"🔄 [RELOAD] {self.symbol} strategies: added={summary['added']} "
+            f"changed={summary['changed']} removed={summary['removed']}"
+        )
+        return summary
+
     def get_metrics(self) -> Dict[str, Any]:
         """
         Get service metrics including strategy-specific metrics and automation state.
@@ -41,6 +41,8 @@ class ConditionOperatorEnum(str, Enum):
     NOT_IN = "not_in"
     CHANGES_TO = "changes_to"
     REMAINS = "remains"
+    RISING = "rising"
+    FALLING = "falling"
 
 
 class LogicModeEnum(str, Enum):
@@ -3,7 +3,7 @@ Core domain models for trading strategies.
 """
 
 from datetime import datetime
-from typing import Annotated, Any, List, Literal, Optional, Union
+from typing import Annotated, Any, List, Literal, NamedTuple, Optional, Union
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -29,6 +29,56 @@ from app.strategy_builder.core.domain.enums import (
 # Core Condition Models
 # ---------------------------
 
+# Series references in a condition's signal or value: "close[-3]" (3 bars
+# before the latest one), "max(high, 20)" and "min(low[-1], 10)" (the lowest
+# low of the 10 bars ending one bar ago)
+_OFFSET_REFERENCE = re.compile(r"^(?P<column>\w+)\[-(?P<offset>\d+)\]$")
+_AGGREGATE_REFERENCE = re.compile(
+    r"^(?P<function>max|min)\(\s*(?P<column>\w+)(?:\[-(?P<offset>\d+)\])?\s*,\s*(?P<window>\d+)\s*\)$"
+)
+_REFERENCE_SYNTAX = re.compile(r"[\[\]()]")
+
+
+class SeriesReference(NamedTuple):
+    """A column read from older rows of a timeframe's buffer."""
+    column: str
+    offset: int = 0
+    function: Optional[str] = None
+    window: int = 1
+
+    @property
+    def depth(self) -> int:
+        """Rows the reference reads, counting the latest one."""
+        return self.offset + self.window
+
+
+def parse_series_reference(text: Any) -> Optional[SeriesReference]:
+    """
+    Parse a series reference.
+
+    Args:
+        text: Signal or value of a condition
+
+    Returns:
+        The reference, or None when text is not a reference (a plain column
+        name or a literal)
+
+    Raises:
+        ValueError: If text uses reference syntax incorrectly
+    """
+    if not isinstance(text, str) or not _REFERENCE_SYNTAX.search(text):
+        return None
+    match = _OFFSET_REFERENCE.match(text.strip())
+    if match:
+        return SeriesReference(match["column"], int(match["offset"]))
+    match = _AGGREGATE_REFERENCE.match(text.strip())
+    if match and int(match["window"]) >= 1:
+        return SeriesReference(match["column"], int(match["offset"] or 0), match["function"], int(match["window"]))
+    raise ValueError(
+        f"Invalid series reference '{text}' (expected 'column[-n]', 'max(column, n)' or 'min(column[-k], n)')"
+    )
+
+
 class Condition(BaseModel):
     """Represents a single trading condition."""
     model_config = ConfigDict(extra="forbid", validate_default=True)
@@ -48,6 +98,13 @@ class Condition(BaseModel):
                 raise ValueError(f"{self.operator.value} operator requires array value")
         elif isinstance(self.value, list):
             raise ValueError(f"Array value not allowed for {self.operator.value} operator")
+        if self.operator in [ConditionOperatorEnum.RISING, ConditionOperatorEnum.FALLING]:
+            if isinstance(self.value, bool) or not isinstance(self.value, float) or not self.value.is_integer() \
+                    or self.value < 1:
+                raise ValueError(f"{self.operator.value} operator requires a whole number of bars (>= 1) as value")
+        parse_series_reference(self.signal)
+        if not isinstance(self.value, list):
+            parse_series_reference(self.value)
         return self
 
 
@@ -80,8 +80,8 @@ class StrategyLoaderInterface(ABC):
         pass
 
     @abstractmethod
-    def reload_strategies(self) -> Dict[str, TradingStrategy]:
-        """Force reload of all strategies."""
+    def reload_strategies(self, config_paths: Optional[List[str]] = None) -> Dict[str, TradingStrategy]:
+        """Force reload of all strategies (optionally from a new list of files)."""
         pass
 
 
@@ -5,10 +5,35 @@ Evaluators module exports.
 from app.strategy_builder.core.evaluators.condition import ConditionEvaluator
 from app.strategy_builder.core.evaluators.logic import LogicEvaluator
 from app.strategy_builder.core.evaluators.factory import DefaultEvaluatorFactory, create_evaluator_factory
+from app.strategy_builder.core.evaluators.compiler import (
+    CompiledStrategy,
+    RowAccessor,
+    StrategyCompiler,
+    create_strategy_compiler,
+    leading_regime_guards,
+    lookback_depths
+)
+from app.strategy_builder.core.evaluators.matrix import StrategyMatrix
+from app.strategy_builder.core.evaluators.activation import ActivationCalendar, is_active_at
+from app.strategy_builder.core.evaluators.regime_index import RegimeIndex
+from app.strategy_builder.core.evaluators.lookback import LookbackTest, condition_depth, uses_lookback
 
 __all__ = [
     "ConditionEvaluator",
     "LogicEvaluator", 
     "DefaultEvaluatorFactory",
-    "create_evaluator_factory"
+    "create_evaluator_factory",
+    "CompiledStrategy",
+    "RowAccessor",
+    "StrategyCompiler",
+    "create_strategy_compiler",
+    "leading_regime_guards",
+    "lookback_depths",
+    "StrategyMatrix",
+    "ActivationCalendar",
+    "is_active_at",
+    "RegimeIndex",
+    "LookbackTest",
+    "condition_depth",
+    "uses_lookback"
 ]
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+Activation calendar: when each strategy is active, indexed by minute of the week.
+
+An activation schedule (days plus an "HH:MM-HH:MM" window) repeats every
+week, so the set of active strategies only changes at a few minutes of the
+week. ActivationCalendar merges the schedules of all strategies into one
+sorted list of those boundaries, with the active set between each pair:
+"which strategies are active at t" is a bisect on t's minute of the week,
+and the answer is cached until the next boundary, so most calls are two
+datetime comparisons.
+
+Schedules are read in the wall-clock time of the datetime passed in (the
+application clock). Hours are inclusive at minute resolution: "09:00-17:00"
+is active from 09:00:00 to 17:00:59, so "00:00-23:59" covers the whole day
+and consecutive days join without a gap. An empty ``days`` list means every
+day.
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from app.strategy_builder.core.domain.enums import DaysEnum, SessionHandlingEnum
+from app.strategy_builder.core.domain.models import Schedule, TradingStrategy
+
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# DaysEnum is declared Monday first, matching datetime.weekday()
+_DAY_INDEX = {day: index for index, day in enumerate(DaysEnum)}
+
+
+def minute_of_week(when: datetime) -> int:
+    """Minutes since Monday 00:00 of the week containing when."""
+    return when.weekday() * MINUTES_PER_DAY + when.hour * 60 + when.minute
+
+
+def schedule_intervals(schedule: Schedule) -> List[Tuple[int, int]]:
+    """
+    Minutes of the week during which a schedule is active.
+
+    Args:
+        schedule: Activation schedule
+
+    Returns:
+        Sorted [start, end) minute-of-week pairs, one per scheduled day
+    """
+    start, end = (_parse_minutes(part) for part in schedule.hours.split("-"))
+    days = schedule.days or list(DaysEnum)
+    offsets = sorted({_DAY_INDEX[DaysEnum(day)] * MINUTES_PER_DAY for day in days})
+    return [(offset + start, offset + end + 1) for offset in offsets]
+
+
+def is_active_at(strategy: TradingStrategy, when: datetime) -> bool:
+    """
+    Whether a strategy is active at a given time.
+
+    Args:
+        strategy: Strategy to check
+        when: Time to check (wall clock of the schedule)
+
+    Returns:
+        False if the strategy is disabled or outside its schedule
+    """
+    activation = strategy.activation
+    if activation is None or activation.schedule is None:
+        return activation is None or activation.enabled
+    if not activation.enabled:
+        return False
+    minute = minute_of_week(when)
+    return any(start <= minute < end for start, end in schedule_intervals(activation.schedule))
+
+
+class ActivationCalendar:
+    """Weekly interval index of the active strategies of an engine."""
+
+    def __init__(self, strategies: Mapping[str, TradingStrategy]):
+        """
+        Build the index.
+
+        Args:
+            strategies: Strategies by name
+        """
+        self.strategies = dict(strategies)
+        always = set()
+        close_all = set()
+        events: Dict[int, List[Tuple[str, int]]] = {}
+        for name, strategy in self.strategies.items():
+            activation = strategy.activation
+            if activation is None or (activation.enabled and activation.schedule is None):
+                always.add(name)
+                continue
+            if not activation.enabled:
+                continue
+            if activation.schedule.session_handling == SessionHandlingEnum.CLOSE_ALL:
+                close_all.add(name)
+            for start, end in schedule_intervals(activation.schedule):
+                events.setdefault(start, []).append((name, 1))
+                events.setdefault(end, []).append((name, -1))
+
+        self.close_all: FrozenSet[str] = frozenset(close_all)
+        # Sweep the week; _segments[i] is active from _boundaries[i] to _boundaries[i + 1]
+        self._boundaries: List[int] = []
+        self._segments: List[FrozenSet[str]] = []
+        open_windows: Dict[str, int] = {}
+        for boundary in sorted(set(events) | {0}):
+            for name, delta in events.get(boundary, ()):
+                open_windows[name] = open_windows.get(name, 0) + delta
+            segment = frozenset(always.union(n for n, count in open_windows.items() if count > 0))
+            if not self._segments or segment != self._segments[-1]:
+                self._boundaries.append(boundary)
+                self._segments.append(segment)
+        self._boundaries.append(MINUTES_PER_WEEK)
+        # The last segment continues into the first one of the next week
+        self._wraps = len(self._segments) > 1 and self._segments[0] == self._segments[-1]
+        self._cached: Optional[Tuple[datetime, datetime, FrozenSet[str]]] = None
+
+    @property
+    def boundary_count(self) -> int:
+        """Number of minutes of the week at which the active set changes."""
+        segments = len(self._segments) - (1 if self._wraps else 0)
+        return segments if segments > 1 else 0
+
+    def covers(self, strategies: Mapping[str, TradingStrategy]) -> bool:
+        """Whether the index was built from exactly these strategy instances."""
+        return len(strategies) == len(self.strategies) and all(
+            self.strategies.get(name) is strategy for name, strategy in strategies.items()
+        )
+
+    def active_at(self, when: datetime) -> FrozenSet[str]:
+        """
+        Names of the strategies active at a given time.
+
+        Args:
+            when: Time to check (wall clock of the schedules)
+
+        Returns:
+            Active strategy names
+        """
+        cached = self._cached
+        if cached is not None:
+            try:
+                if cached[0] <= when < cached[1]:
+                    return cached[2]
+            except TypeError:
+                pass                      # naive vs aware clock: recompute below
+
+        minute = minute_of_week(when)
+        index = bisect_right(self._boundaries, minute) - 1
+        start, end = self._boundaries[index], self._boundaries[index + 1]
+        if self._wraps and index == 0:
+            start = self._boundaries[-2] - MINUTES_PER_WEEK
+        if self._wraps and index == len(self._segments) - 1:
+            end = MINUTES_PER_WEEK + self._boundaries[1]
+        start_of_minute = when.replace(second=0, microsecond=0)
+        self._cached = (
+            start_of_minute - timedelta(minutes=minute - start),
+            start_of_minute + timedelta(minutes=end - minute),
+            self._segments[index],
+        )
+        return self._cached[2]
+
+    def is_active(self, name: str, when: datetime) -> bool:
+        """Whether one strategy is active at a given time."""
+        return name in self.active_at(when)
+
+    def next_change(self, when: datetime) -> datetime:
+        """
+        Earliest time after when at which the active set may change.
+
+        Args:
+            when: Reference time
+
+        Returns:
+            Start of the first minute with a different active set (the end
+            of the week when the active set never changes)
+        """
+        self.active_at(when)
+        return self._cached[1]
+
+
+def _parse_minutes(hours: str) -> int:
+    hour, minute = hours.split(":")
+    return int(hour) * 60 + int(minute)
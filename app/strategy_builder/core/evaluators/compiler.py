@@ -0,0 +1,1136 @@
+"""
+Strategy compiler: rule trees turned into closures once per strategy.
+
+ConditionEvaluator and LogicEvaluator interpret the rule models on every
+evaluation - operator dispatch, ``previous_*`` name formatting, literal casts
+and the tree walk are repeated for every bar although none of it depends on
+the bar. StrategyCompiler does that work once and returns a CompiledStrategy
+whose checks are plain closures over a RowAccessor:
+
+- operators are bound to comparison functions at compile time
+- column names and literal casts (float, lowercased str) are precomputed
+- and/or/not trees short-circuit
+- the latest row of each timeframe is converted to a dict once per
+  evaluation and shared by every strategy
+- identical conditions are interned: every distinct
+  (timeframe, signal, operator, value) across all compiled strategies gets
+  one id, and its result is memoized per bar, keyed by the timeframe's
+  latest row, so it is computed once per bar however many strategies,
+  directions or rule sets use it
+- all/any nodes are AdaptiveNodes that reorder their children by observed
+  cost and selectivity (see AdaptiveNode for why results do not change)
+- lookback conditions (``close[-3]``, ``max(high, 20)``, rising/falling) read
+  older rows of the buffer by offset (see lookback.py), and crosses,
+  changes_to and remains fall back to the row before the latest one when
+  rows carry no previous_* columns
+
+Rows whose values are not plain floats or strings (ints, bools, arrays,
+mixed types) are handed to ConditionEvaluator.evaluate_row for that
+condition, so results always match the interpreter.
+"""
+
+import itertools
+import operator
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from app.strategy_builder.core.domain.enums import ConditionOperatorEnum, LogicModeEnum
+from app.strategy_builder.core.domain.models import (
+    Condition,
+    ConditionTree,
+    EntryRules,
+    ExitRules,
+    TradingStrategy,
+)
+from app.strategy_builder.core.domain.protocols import Logger
+from app.strategy_builder.core.evaluators.condition import ConditionEvaluator
+from app.strategy_builder.core.evaluators.logic import parse_duration
+from app.strategy_builder.core.evaluators.lookback import (
+    PREVIOUS_OPERATORS,
+    PREVIOUS_PREFIX,
+    LookbackTest,
+    condition_depth,
+    row_mapping,
+    uses_lookback,
+    with_previous,
+)
+from app.strategy_builder.data.dtos import SignalResult
+from app.utils.clock import get_clock
+
+
+# A compiled condition or rule set: RowAccessor -> bool
+Check = Callable[["RowAccessor"], bool]
+
+_FLOATS = frozenset({float, np.float64})
+
+_COMPARATORS = {
+    ConditionOperatorEnum.EQ: operator.eq,
+    ConditionOperatorEnum.NE: operator.ne,
+    ConditionOperatorEnum.LT: operator.lt,
+    ConditionOperatorEnum.LTE: operator.le,
+    ConditionOperatorEnum.GT: operator.gt,
+    ConditionOperatorEnum.GTE: operator.ge,
+}
+
+_CROSSES = (ConditionOperatorEnum.CROSSES_ABOVE, ConditionOperatorEnum.CROSSES_BELOW)
+_MEMBERSHIP = (ConditionOperatorEnum.IN, ConditionOperatorEnum.NOT_IN)
+
+# Columns written by RegimeManager that rule sets may be gated on, and the
+# operators whose result depends on the column value alone
+REGIME_SIGNALS = frozenset({"regime", "is_transition"})
+_GUARD_OPERATORS = (ConditionOperatorEnum.EQ, ConditionOperatorEnum.NE) + _MEMBERSHIP
+
+# Fallback memo stamps for rows without a time column (one per RowAccessor)
+_ROUNDS = itertools.count()
+
+# Adaptive ordering: time every Nth call of a node, reorder after N timed calls
+SAMPLE_EVERY = 8
+REORDER_EVERY = 64
+
+
+class InternedCondition(NamedTuple):
+    """A distinct condition shared by every strategy that uses it."""
+    id: int
+    condition: Condition
+    check: Check
+
+
+class RowAccessor:
+    """
+    Latest row of every timeframe, as a dict built on first access.
+
+    One accessor is created per evaluation and shared by all strategies, so
+    each timeframe's Series is converted once instead of being queried with
+    ``Series.get`` for every condition.
+    """
+
+    def __init__(self, recent_rows: Mapping[str, deque]):
+        """
+        Initialize the accessor.
+
+        Args:
+            recent_rows: Market data by timeframe (deques of rows, newest last)
+        """
+        self.recent_rows = recent_rows
+        self.round = next(_ROUNDS)
+        self._rows: Dict[str, Optional[Mapping[str, Any]]] = {}
+        self._stamps: Dict[str, Any] = {}
+        self._older: Dict[Tuple[str, int], Optional[Mapping[str, Any]]] = {}
+        self._with_previous: Dict[str, Optional[Mapping[str, Any]]] = {}
+
+    def latest(self, timeframe: str) -> Optional[Mapping[str, Any]]:
+        """
+        Return the newest row of a timeframe.
+
+        Args:
+            timeframe: Timeframe key
+
+        Returns:
+            Column -> value mapping, or None when the timeframe has no data
+        """
+        try:
+            return self._rows[timeframe]
+        except KeyError:
+            pass
+
+        window = self.recent_rows.get(timeframe)
+        row = stamp = None
+        if window is not None and len(window) > 0:
+            source = window[-1]
+            row = row_mapping(source)
+            bar_time = row.get("time")
+            # The row object is part of the key so a rebuilt row for the same bar is re-evaluated
+            stamp = (bar_time if bar_time is not None else ("round", self.round), source)
+        self._rows[timeframe] = row
+        self._stamps[timeframe] = stamp
+        return row
+
+    def stamp(self, timeframe: str) -> Any:
+        """
+        Memo key of the timeframe's latest bar.
+
+        Args:
+            timeframe: Timeframe key
+
+        Returns:
+            (bar time, row object) - the time is replaced by a per-accessor
+            token for rows without a time column - or None when the timeframe
+            has no data
+        """
+        if timeframe not in self._stamps:
+            self.latest(timeframe)
+        return self._stamps[timeframe]
+
+    def has(self, timeframe: str) -> bool:
+        """Whether the timeframe has at least one row."""
+        return self.latest(timeframe) is not None
+
+    def row(self, timeframe: str, back: int = 0) -> Optional[Mapping[str, Any]]:
+        """
+        Return an older row of a timeframe.
+
+        Args:
+            timeframe: Timeframe key
+            back: Bars before the newest row (0 is the newest row)
+
+        Returns:
+            Column -> value mapping, or None past the start of the buffer
+        """
+        if back == 0:
+            return self.latest(timeframe)
+        key = (timeframe, back)
+        try:
+            return self._older[key]
+        except KeyError:
+            pass
+        window = self.recent_rows.get(timeframe)
+        row = row_mapping(window[-1 - back]) if window is not None and back < len(window) else None
+        self._older[key] = row
+        return row
+
+    def with_previous(self, timeframe: str) -> Optional[Mapping[str, Any]]:
+        """Newest row plus previous_* values from the row before it, for rows stored without them."""
+        try:
+            return self._with_previous[timeframe]
+        except KeyError:
+            pass
+        latest = self.latest(timeframe)
+        row = None if latest is None else with_previous(latest, self.row(timeframe, 1))
+        self._with_previous[timeframe] = row
+        return row
+
+
+class AdaptiveNode:
+    """
+    A commutative all/any node that reorders its children by observed cost
+    and selectivity.
+
+    The node is not called on the hot path: build() returns a plain closure
+    over the children in their current order. Sampled evaluations go through
+    timed(), which times each evaluated child with ``perf_counter_ns`` and
+    counts its outcome; reorder() then sorts the children by mean cost
+    divided by the probability of short-circuiting (Laplace-smoothed), ties
+    broken by authored position, so cheap and selective conditions run first.
+
+    Reordering never changes a rule set's result. A child that raises makes
+    the whole rule set False (StrategyExecutor semantics), so:
+
+    - a "forcing" node, whose short-circuit value already makes the rule set
+      False (an and-node on the rule set's all-spine, an or-node under a
+      not), may move any child first
+    - in other nodes, children that may raise (crosses against a string
+      value, or any child that has raised) stay at their authored position
+      and only the children between them are reordered
+    """
+
+    def __init__(
+        self,
+        children: List[Any],
+        labels: List[str],
+        may_raise: List[bool],
+        short_circuit: bool,
+        forcing: bool,
+        path: str = "",
+    ):
+        """
+        Initialize the node.
+
+        Args:
+            children: Child checks, AdaptiveNodes or negations, in authored order
+            labels: Human-readable label per child (for stats)
+            may_raise: Per child, whether it can raise on some rows
+            short_circuit: Value that stops evaluation (False for all/and, True for any/or)
+            forcing: Whether returning ``short_circuit`` makes the whole rule set False
+            path: Position of the node in its rule set (child indices joined by ".")
+        """
+        self.children = children
+        self.labels = labels
+        self.short_circuit = short_circuit
+        self.forcing = forcing
+        self.path = path
+        self.reorders = 0
+        self.order = list(range(len(children)))
+        self._pinned = [not forcing and bool(flag) for flag in may_raise]
+        self._samples = [0] * len(children)
+        self._passes = [0] * len(children)
+        self._cost_ns = [0] * len(children)
+
+    def build(self) -> Check:
+        """Plain closure evaluating the children in the current order."""
+        checks = [_build(self.children[index]) for index in self.order]
+        return _any_of(checks) if self.short_circuit else _all_of(checks)
+
+    def timed(self, rows: "RowAccessor") -> bool:
+        """Evaluate like build() would, recording each evaluated child's cost and outcome."""
+        clock = time.perf_counter_ns
+        index = None
+        try:
+            for index in self.order:
+                start = clock()
+                value = bool(_timed(self.children[index], rows))
+                self._cost_ns[index] += clock() - start
+                self._samples[index] += 1
+                self._passes[index] += value
+                if value == self.short_circuit:
+                    return value
+            return not self.short_circuit
+        except Exception:
+            if not self.forcing and index is not None:
+                self._pinned[index] = True
+            raise
+
+    def reorder(self) -> bool:
+        """
+        Sort the children between pinned ones by mean cost / short-circuit probability.
+
+        Returns:
+            True if the order changed
+        """
+        known = [self._cost_ns[i] / self._samples[i] for i in self.order if self._samples[i]]
+        default_cost = sum(known) / len(known) if known else 1.0
+        scores = [self._score(index, default_cost) for index in range(len(self.children))]
+
+        order: List[int] = []
+        segment: List[int] = []
+        for index in range(len(self.children)):
+            if self._pinned[index]:
+                order.extend(sorted(segment, key=lambda i: (scores[i], i)))
+                order.append(index)
+                segment = []
+            else:
+                segment.append(index)
+        order.extend(sorted(segment, key=lambda i: (scores[i], i)))
+
+        if order == self.order:
+            return False
+        self.order = order
+        self.reorders += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Observed statistics of the node.
+
+        Returns:
+            Dictionary with the node path and mode, reorder count, current order
+            (authored indices) and per child its label, timed samples, pass
+            rate, mean cost in microseconds and whether it is pinned
+        """
+        children = []
+        for index, label in enumerate(self.labels):
+            samples = self._samples[index]
+            children.append({
+                "label": label,
+                "samples": samples,
+                "pass_rate": self._passes[index] / samples if samples else None,
+                "mean_cost_us": self._cost_ns[index] / samples / 1000 if samples else None,
+                "pinned": self._pinned[index],
+            })
+        return {
+            "path": self.path,
+            "mode": "any" if self.short_circuit else "all",
+            "reorders": self.reorders,
+            "order": list(self.order),
+            "children": children,
+        }
+
+    def _score(self, index: int, default_cost: float) -> float:
+        samples = self._samples[index]
+        cost = self._cost_ns[index] / samples if samples else default_cost
+        decisive = self._passes[index] if self.short_circuit else samples - self._passes[index]
+        return cost * (samples + 2) / (decisive + 1)
+
+
+class _Negation:
+    """A not-node over a check or AdaptiveNode."""
+
+    def __init__(self, child: Any):
+        self.child = child
+
+    def build(self) -> Check:
+        check = _build(self.child)
+        return lambda rows: not check(rows)
+
+    def timed(self, rows: "RowAccessor") -> bool:
+        return not _timed(self.child, rows)
+
+
+class CompiledRules:
+    """
+    One compiled rule set: its current closure plus the adaptive nodes that
+    may reorder it.
+    """
+
+    def __init__(self, root: Any, nodes: List[AdaptiveNode], combine: Callable[[Check], Callable],
+                 reorder_every: int = REORDER_EVERY):
+        """
+        Initialize the rule set.
+
+        Args:
+            root: Root check, AdaptiveNode or negation of the condition part
+            nodes: Every AdaptiveNode under ``root``
+            combine: Turns the condition check into the rule set's callable
+                (adds the time-based part of exit rules)
+            reorder_every: Reorder the nodes after this many sampled evaluations
+        """
+        self.root = root
+        self.nodes = nodes
+        self.combine = combine
+        self.check = combine(_build(root))
+        self._reorder_every = max(1, reorder_every)
+        self._sampled = 0
+
+    def sample(self, *args) -> bool:
+        """Evaluate through AdaptiveNode.timed, reordering the nodes when due."""
+        try:
+            return self.combine(lambda rows: _timed(self.root, rows))(*args)
+        except Exception:
+            self.adapt()                                  # a child may have been pinned
+            raise
+        finally:
+            self._sampled += 1
+            if self._sampled % self._reorder_every == 0:
+                self.adapt()
+
+    def adapt(self) -> None:
+        """Reorder every node and rebuild the closure if any order changed."""
+        if any([node.reorder() for node in self.nodes]):
+            self.check = self.combine(_build(self.root))
+
+
+class CompiledStrategy:
+    """Entry/exit checks of one strategy, compiled to closures."""
+
+    def __init__(
+        self,
+        strategy: TradingStrategy,
+        entry_long: Optional[CompiledRules],
+        entry_short: Optional[CompiledRules],
+        exit_long: Optional[CompiledRules],
+        exit_short: Optional[CompiledRules],
+        condition_ids: Optional[List[int]] = None,
+        sample_every: int = SAMPLE_EVERY,
+        regime_guards: Optional[Dict[str, List[InternedCondition]]] = None,
+    ):
+        """
+        Initialize the compiled strategy.
+
+        Args:
+            strategy: Source strategy (kept to detect reloads)
+            entry_long: Compiled long entry rules (None if not configured)
+            entry_short: Compiled short entry rules
+            exit_long: Compiled long exit rules, taking optional position data
+            exit_short: Compiled short exit rules
+            condition_ids: Interned id of every condition reference in the rules
+            sample_every: Every Nth check_entry/check_exit call is timed for adaptive ordering
+            regime_guards: Leading regime guards by rule set slot (see leading_regime_guards)
+        """
+        self.strategy = strategy
+        self.condition_ids = condition_ids or []
+        self.regime_guards = regime_guards or {}
+        self.name = strategy.name
+        self.timeframes = list(strategy.timeframes)
+        self.dependencies = strategy_timeframes(strategy)
+        self.time_sensitive = is_time_sensitive(strategy)
+        self.active = strategy.activation is None or strategy.activation.enabled
+        self.rule_sets = {
+            slot: rules for slot, rules in (
+                ("entry_long", entry_long), ("entry_short", entry_short),
+                ("exit_long", exit_long), ("exit_short", exit_short),
+            ) if rules is not None
+        }
+        self._entry_long = entry_long
+        self._entry_short = entry_short
+        self._exit_long = exit_long
+        self._exit_short = exit_short
+        self._sample_every = max(1, sample_every)
+        self._entry_calls = 0
+        self._exit_calls = 0
+
+    def validate_data_availability(self, rows: RowAccessor) -> bool:
+        """Whether every timeframe the strategy uses has data."""
+        return all(rows.has(timeframe) for timeframe in self.timeframes)
+
+    def is_strategy_active(self) -> bool:
+        """Whether the strategy is enabled by its activation settings."""
+        return self.active
+
+    def ordering_stats(self) -> List[Dict[str, Any]]:
+        """
+        Statistics of the adaptive all/any nodes, for tuning condition order.
+
+        Returns:
+            AdaptiveNode.stats() of every node, with its rule set under "rule_set"
+        """
+        return [
+            {"rule_set": slot, **node.stats()}
+            for slot, rules in self.rule_sets.items() for node in rules.nodes
+        ]
+
+    def check_entry(self, rows: RowAccessor) -> SignalResult:
+        """
+        Check entry conditions.
+
+        Args:
+            rows: Row accessor for the current evaluation
+
+        Returns:
+            SignalResult with long/short entry signals
+        """
+        self._entry_calls += 1
+        sampled = self._entry_calls % self._sample_every == 0
+        result = SignalResult()
+        if self._entry_long is not None:
+            result.long = _run(self._entry_long, sampled, rows)
+        if self._entry_short is not None:
+            result.short = _run(self._entry_short, sampled, rows)
+        return result
+
+    def check_exit(self, rows: RowAccessor, position_data: Optional[Dict[str, Any]] = None) -> SignalResult:
+        """
+        Check exit conditions.
+
+        Args:
+            rows: Row accessor for the current evaluation
+            position_data: Optional position tracking data for time-based exits
+
+        Returns:
+            SignalResult with long/short exit signals
+        """
+        self._exit_calls += 1
+        sampled = self._exit_calls % self._sample_every == 0
+        result = SignalResult()
+        if self._exit_long is not None:
+            result.long = _run(self._exit_long, sampled, rows, position_data)
+        if self._exit_short is not None:
+            result.short = _run(self._exit_short, sampled, rows, position_data)
+        return result
+
+
+class StrategyCompiler:
+    """
+    Compiles strategies into CompiledStrategy plans.
+
+    The compiler owns the condition intern table and the per-bar memo, so
+    strategies compiled by the same instance share condition results.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        adaptive: bool = True,
+        sample_every: int = SAMPLE_EVERY,
+        reorder_every: int = REORDER_EVERY
+    ):
+        """
+        Initialize the compiler.
+
+        Args:
+            logger: Logger for evaluation warnings (missing data, bad comparisons)
+            adaptive: Compile all/any nodes as AdaptiveNodes (False keeps authored order)
+            sample_every: Time every Nth check_entry/check_exit call of a strategy
+            reorder_every: Reorder a rule set's nodes after N timed evaluations
+        """
+        self.logger = logger
+        self.adaptive = adaptive
+        self.sample_every = sample_every
+        self.reorder_every = reorder_every
+        self._adaptive_nodes: Optional[List[AdaptiveNode]] = None
+        self._fallback = ConditionEvaluator({}, logger)
+        self._interned: Dict[tuple, InternedCondition] = {}
+        self._memo: Dict[int, Tuple[Any, Any, bool]] = {}
+        self._references: Optional[List[int]] = None
+
+    @property
+    def distinct_conditions(self) -> int:
+        """Number of interned (distinct) conditions."""
+        return len(self._interned)
+
+    def interned_conditions(self) -> List[InternedCondition]:
+        """All interned conditions, ordered by id."""
+        return list(self._interned.values())
+
+    def reset(self) -> None:
+        """Drop the intern table and memoized results (e.g. before recompiling after a reload)."""
+        self._interned.clear()
+        self._memo.clear()
+
+    def compile(self, strategy: TradingStrategy) -> CompiledStrategy:
+        """
+        Compile a strategy's entry and exit rules.
+
+        Args:
+            strategy: Strategy to compile
+
+        Returns:
+            CompiledStrategy for the strategy
+        """
+        entry, exit_rules = strategy.entry, strategy.exit
+        slots = {
+            "entry_long": entry.long if entry else None,
+            "entry_short": entry.short if entry else None,
+            "exit_long": exit_rules.long if exit_rules else None,
+            "exit_short": exit_rules.short if exit_rules else None,
+        }
+        self._references = references = []
+        try:
+            plan = CompiledStrategy(
+                strategy,
+                entry_long=self._compile_entry(slots["entry_long"]) if slots["entry_long"] else None,
+                entry_short=self._compile_entry(slots["entry_short"]) if slots["entry_short"] else None,
+                exit_long=self._compile_exit(slots["exit_long"]) if slots["exit_long"] else None,
+                exit_short=self._compile_exit(slots["exit_short"]) if slots["exit_short"] else None,
+                condition_ids=references,
+                sample_every=self.sample_every,
+            )
+        finally:
+            self._references = None
+        plan.regime_guards = {
+            slot: [self.intern(condition) for condition in leading_regime_guards(rules)]
+            for slot, rules in slots.items() if rules is not None
+        }
+        return plan
+
+    def compile_entry_rules(self, rules: EntryRules) -> Check:
+        """
+        Compile entry rules (same semantics as LogicEvaluator.evaluate_entry_rules).
+
+        Args:
+            rules: Entry rules
+
+        Returns:
+            Check returning True when the rules are met
+        """
+        return self._compile_entry(rules).check
+
+    def compile_exit_rules(self, rules: ExitRules) -> Callable[[RowAccessor, Optional[Dict[str, Any]]], bool]:
+        """
+        Compile exit rules (same semantics as LogicEvaluator.evaluate_exit_rules).
+
+        Args:
+            rules: Exit rules
+
+        Returns:
+            Callable(rows, position_data) returning True when the exit triggers
+        """
+        return self._compile_exit(rules).check
+
+    def _compile_entry(self, rules: EntryRules) -> CompiledRules:
+        """Compile entry rules into a CompiledRules."""
+        return self._compile_rule_set(rules, forced=False, combine=lambda basic: basic)
+
+    def _compile_exit(self, rules: ExitRules) -> CompiledRules:
+        """Compile exit rules, combining the conditions with the time-based exit like LogicEvaluator."""
+        guarded = bool(rules.time_based or rules.profit_guard)
+        timed_exit = bool(rules.time_based and rules.time_based.max_duration)
+        timed = self._compile_time_based(rules)
+
+        if rules.mode == LogicModeEnum.ALL and guarded:
+            def combine(basic):
+                return lambda rows, position_data=None: basic(rows) and timed(position_data)
+        elif rules.mode == LogicModeEnum.ALL:
+            def combine(basic):
+                return lambda rows, position_data=None: basic(rows)
+        else:
+            def combine(basic):
+                return lambda rows, position_data=None: basic(rows) or timed(position_data)
+
+        # The conditions returning False make the exit False unless a time-based exit can still fire
+        forced = False if rules.mode == LogicModeEnum.ALL or not timed_exit else None
+        return self._compile_rule_set(rules, forced, combine)
+
+    def _compile_rule_set(self, rules: Union[EntryRules, ExitRules], forced: Optional[bool],
+                          combine: Callable[[Check], Callable]) -> CompiledRules:
+        """Compile the condition part of a rule set and collect its adaptive nodes."""
+        self._adaptive_nodes = nodes = []
+        try:
+            root = self._compile_rules(rules, forced)
+        finally:
+            self._adaptive_nodes = None
+        return CompiledRules(root, nodes, combine, self.reorder_every)
+
+    def compile_condition(self, condition: Condition) -> Check:
+        """
+        Compile a single condition, reusing the interned check of an identical one.
+
+        Args:
+            condition: Condition to compile
+
+        Returns:
+            Check returning True when the condition holds on the latest row
+        """
+        interned = self.intern(condition)
+        if self._references is not None:
+            self._references.append(interned.id)
+        return interned.check
+
+    def intern(self, condition: Condition) -> InternedCondition:
+        """
+        Return the interned entry for a condition, compiling it on first sight.
+
+        Args:
+            condition: Condition to intern
+
+        Returns:
+            InternedCondition shared by all identical conditions
+        """
+        key = _condition_key(condition)
+        interned = self._interned.get(key)
+        if interned is None:
+            condition_id = len(self._interned)
+            interned = InternedCondition(condition_id, condition, self._compile_memoized(condition, condition_id))
+            self._interned[key] = interned
+        return interned
+
+    def _compile_memoized(self, condition: Condition, condition_id: int) -> Check:
+        """Compile a condition whose result is memoized per bar of its timeframe."""
+        timeframe = condition.timeframe
+        read = self._compile_read(condition)
+        logger = self.logger
+        memo = self._memo
+
+        def check(rows: RowAccessor) -> bool:
+            stamp = rows.stamp(timeframe)
+            if stamp is None:
+                logger.warning(
+                    f"ConditionEvaluator: {timeframe} not in recent_rows or recent_rows for {timeframe} is empty"
+                )
+                return False
+
+            token, source = stamp
+            cached = memo.get(condition_id)
+            if cached is not None and cached[1] is source and cached[0] == token:
+                return cached[2]
+
+            result = read(rows)
+            memo[condition_id] = (token, source, result)
+            return result
+
+        return check
+
+    def _compile_read(self, condition: Condition) -> Check:
+        """Unmemoized check of a condition: its row test on the rows it needs."""
+        timeframe = condition.timeframe
+        if uses_lookback(condition):
+            test = LookbackTest(condition, self._fallback.evaluate_row)
+            return lambda rows: test(lambda back: rows.row(timeframe, back))
+
+        row_test = self._compile_row_test(condition)
+        if condition.operator not in PREVIOUS_OPERATORS:
+            return lambda rows: row_test(rows.latest(timeframe))
+
+        previous = f"{PREVIOUS_PREFIX}{condition.signal}"
+
+        def read_with_previous(rows: RowAccessor) -> bool:
+            row = rows.latest(timeframe)
+            return row_test(row if previous in row else rows.with_previous(timeframe))
+
+        return read_with_previous
+
+    def _compile_rules(self, rules: Union[EntryRules, ExitRules], forced: Optional[bool]) -> Any:
+        """
+        Compile the condition part of a rule set (all/any/complex) into a
+        check, AdaptiveNode or negation.
+
+        ``forced`` is the value of the compiled check that makes the whole rule
+        set False (None if no single value does); it decides which adaptive
+        nodes may reorder freely.
+        """
+        if rules.mode == LogicModeEnum.COMPLEX:
+            return self._compile_node(rules.tree, forced, "") if rules.tree else _never
+
+        if rules.mode not in (LogicModeEnum.ALL, LogicModeEnum.ANY):
+            raise ValueError(f"Unsupported logic mode: {rules.mode}")
+        if not rules.conditions:
+            return _never
+
+        return self._combine(rules.mode == LogicModeEnum.ANY, rules.conditions, forced, "")
+
+    def _compile_node(self, node: Union[ConditionTree, Condition], forced: Optional[bool], path: str) -> Any:
+        """Compile a condition tree node recursively."""
+        if isinstance(node, Condition):
+            return self.compile_condition(node)
+        if not isinstance(node, ConditionTree):
+            raise ValueError(f"Invalid node type: {type(node)}")
+
+        if node.operator in ("and", "or"):
+            return self._combine(node.operator == "or", node.conditions, forced, path)
+        if node.operator == "not":
+            if len(node.conditions) != 1:
+                raise ValueError("NOT operator must have exactly one child condition.")
+            child_forced = None if forced is None else not forced
+            return _Negation(self._compile_node(node.conditions[0], child_forced, f"{path}.0".lstrip(".")))
+        raise ValueError(f"Unsupported tree operator: {node.operator}")
+
+    def _combine(self, short_circuit: bool, nodes: List[Union[Condition, ConditionTree]], forced: Optional[bool],
+                 path: str) -> Any:
+        """Compile an all (short-circuit False) or any (short-circuit True) node over its children."""
+        forcing = forced == short_circuit
+        child_forced = short_circuit if forcing else None
+        children = [
+            self._compile_node(child, child_forced, f"{path}.{index}".lstrip("."))
+            for index, child in enumerate(nodes)
+        ]
+        if not self.adaptive or len(children) < 2:
+            checks = [_build(child) for child in children]
+            return _any_of(checks) if short_circuit else _all_of(checks)
+
+        node = AdaptiveNode(
+            children,
+            labels=[_label(child) for child in nodes],
+            may_raise=[_may_raise(child) for child in nodes],
+            short_circuit=short_circuit,
+            forcing=forcing,
+            path=path,
+        )
+        if self._adaptive_nodes is not None:
+            self._adaptive_nodes.append(node)
+        return node
+
+    def _compile_time_based(self, rules: ExitRules) -> Callable[[Optional[Dict[str, Any]]], bool]:
+        """Compile the time-based exit (max_duration) against position data."""
+        if not rules.time_based or not rules.time_based.max_duration:
+            return lambda position_data: False
+
+        max_duration: timedelta = parse_duration(rules.time_based.max_duration)
+
+        def timed(position_data: Optional[Dict[str, Any]]) -> bool:
+            if not position_data or "entry_time" not in position_data:
+                return False
+            return get_clock().now() - position_data["entry_time"] >= max_duration
+
+        return timed
+
+    def _compile_row_test(self, condition: Condition) -> Callable[[Mapping[str, Any]], bool]:
+        """
+        Build the per-row test for a condition.
+
+        The fast paths cover float signals against numeric literals or float
+        columns, and string signals against string literals; any other value
+        types fall through to ConditionEvaluator.evaluate_row.
+        """
+        fallback = self._fallback.evaluate_row
+
+        def slow(row: Mapping[str, Any]) -> bool:
+            return fallback(condition, row)
+
+        signal = condition.signal
+        previous = f"{PREVIOUS_PREFIX}{signal}"
+        op = condition.operator
+        value = condition.value
+
+        if op in _MEMBERSHIP:
+            members = list(value)
+            wanted = op == ConditionOperatorEnum.IN
+            # The interpreter casts the list with type(signal): np.float64 turns a
+            # one-element list into a scalar (and the test then fails), so only
+            # python floats are fast-pathed for single members
+            fast_types = _FLOATS if len(members) != 1 else frozenset({float})
+
+            def membership(row):
+                current = row.get(signal)
+                if type(current) in fast_types:
+                    return (current in members) == wanted
+                return slow(row)
+
+            return membership
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return self._numeric_literal_test(op, signal, previous, float(value), slow)
+
+        if isinstance(value, str):
+            return self._string_value_test(op, signal, previous, value, slow)
+
+        return slow
+
+    @staticmethod
+    def _numeric_literal_test(op, signal: str, previous: str, number: float, slow) -> Callable:
+        """Row test for a numeric literal target."""
+        if op in _COMPARATORS:
+            compare = _COMPARATORS[op]
+
+            def compare_literal(row):
+                current = row.get(signal)
+                if type(current) in _FLOATS:
+                    return compare(current, number)
+                return slow(row)
+
+            return compare_literal
+
+        if op in _CROSSES:
+            above = op == ConditionOperatorEnum.CROSSES_ABOVE
+
+            def cross_literal(row):
+                current, prior = row.get(signal), row.get(previous)
+                if type(current) in _FLOATS and type(prior) in _FLOATS:
+                    if above:
+                        return prior <= number and current > number
+                    return prior >= number and current < number
+                return slow(row)
+
+            return cross_literal
+
+        remains = op == ConditionOperatorEnum.REMAINS
+
+        def state_literal(row):
+            current, prior = row.get(signal), row.get(previous)
+            if type(current) in _FLOATS and type(prior) in _FLOATS:
+                return current == number and (prior == number) == remains
+            return slow(row)
+
+        return state_literal
+
+    @staticmethod
+    def _string_value_test(op, signal: str, previous: str, value: str, slow) -> Callable:
+        """
+        Row test for a string target: a column reference when the row has that
+        column, otherwise a case-insensitive literal.
+        """
+        lowered = value.lower()
+        previous_value = f"{PREVIOUS_PREFIX}{value}"
+
+        if op in _COMPARATORS:
+            compare = _COMPARATORS[op]
+
+            def compare_string(row):
+                current = row.get(signal)
+                if value in row:
+                    target = row[value]
+                    if type(current) in _FLOATS and type(target) in _FLOATS:
+                        return compare(current, target)
+                elif type(current) is str:
+                    return compare(current.lower(), lowered)
+                return slow(row)
+
+            return compare_string
+
+        if op in _CROSSES:
+            above = op == ConditionOperatorEnum.CROSSES_ABOVE
+
+            def cross_column(row):
+                if value in row:
+                    current, prior = row.get(signal), row.get(previous)
+                    target, prior_target = row[value], row.get(previous_value)
+                    if (type(current) in _FLOATS and type(prior) in _FLOATS
+                            and type(target) in _FLOATS and type(prior_target) in _FLOATS):
+                        if above:
+                            return prior <= prior_target and current > target
+                        return prior >= prior_target and current < target
+                return slow(row)
+
+            return cross_column
+
+        remains = op == ConditionOperatorEnum.REMAINS
+
+        def state_string(row):
+            current, prior = row.get(signal), row.get(previous)
+            if value in row:
+                target = row[value]
+                if type(current) in _FLOATS and type(target) in _FLOATS and type(prior) in _FLOATS:
+                    return current == target and (prior == target) == remains
+            elif type(current) is str and type(prior) is str:
+                # The interpreter lowercases the target only, not the signal
+                return current == lowered and (prior == lowered) == remains
+            return slow(row)
+
+        return state_string
+
+
+def create_strategy_compiler(logger: Logger) -> StrategyCompiler:
+    """
+    Factory function to create a strategy compiler.
+
+    Args:
+        logger: Logger instance
+
+    Returns:
+        StrategyCompiler instance
+    """
+    return StrategyCompiler(logger)
+
+
+def strategy_timeframes(strategy: TradingStrategy) -> frozenset:
+    """
+    Timeframes a strategy's evaluation depends on.
+
+    Args:
+        strategy: Strategy to inspect
+
+    Returns:
+        The declared timeframes plus those of every rule condition and of
+        indicator-based SL/TP
+    """
+    timeframes = set(strategy.timeframes)
+    for rules in _rule_sets(strategy):
+        timeframes.update(condition.timeframe for condition in _conditions(rules))
+    for level in (strategy.risk.sl, strategy.risk.tp):
+        timeframe = getattr(level, "timeframe", None)
+        if timeframe is not None:
+            timeframes.add(timeframe)
+    return frozenset(timeframes)
+
+
+def is_time_sensitive(strategy: TradingStrategy) -> bool:
+    """
+    Whether a strategy's result can change with the clock alone.
+
+    Args:
+        strategy: Strategy to inspect
+
+    Returns:
+        True when an exit rule set has a time-based exit or profit guard
+        (activation schedules are applied by the engine's ActivationCalendar)
+    """
+    exit_rules = strategy.exit
+    return any(
+        rules is not None and bool(rules.time_based or rules.profit_guard)
+        for rules in ((exit_rules.long, exit_rules.short) if exit_rules else ())
+    )
+
+
+def lookback_depths(strategies: Iterable[TradingStrategy]) -> Dict[str, int]:
+    """
+    Rows each timeframe's buffer must hold for the strategies' conditions.
+
+    Args:
+        strategies: Strategies to inspect
+
+    Returns:
+        Deepest condition_depth() by timeframe value ("1", "60", ...)
+    """
+    depths: Dict[str, int] = {}
+    for strategy in strategies:
+        for rules in _rule_sets(strategy):
+            for condition in _conditions(rules):
+                timeframe = str(condition.timeframe.value)
+                depths[timeframe] = max(depths.get(timeframe, 1), condition_depth(condition))
+    return depths
+
+
+def leading_regime_guards(rules: Union[EntryRules, ExitRules]) -> List[Condition]:
+    """
+    Regime/transition conditions a rule set opens with.
+
+    Only the leading conditions of an "all" rule set (or of a complex tree
+    whose root is "and") count, and only ==, !=, in and not_in on a
+    REGIME_SIGNALS column. When one of them is False the rule set is False
+    whatever the other conditions give, in any order (a condition that
+    raises also makes it False). Exits are evaluated without position data,
+    so a time-based exit cannot make a guarded exit True.
+
+    Args:
+        rules: Entry or exit rule set
+
+    Returns:
+        The guard conditions, in order (empty if the rule set has none)
+    """
+    if rules.mode == LogicModeEnum.ALL:
+        nodes = rules.conditions or []
+    elif rules.mode == LogicModeEnum.COMPLEX and isinstance(rules.tree, ConditionTree) and rules.tree.operator == "and":
+        nodes = rules.tree.conditions
+    else:
+        return []
+
+    guards = []
+    for node in nodes:
+        if not (isinstance(node, Condition) and node.signal in REGIME_SIGNALS and node.operator in _GUARD_OPERATORS):
+            break
+        guards.append(node)
+    return guards
+
+
+def _condition_key(condition: Condition) -> tuple:
+    """Intern key of a condition; value types are kept apart (1.0, True and "1" cast differently)."""
+    return (
+        str(condition.timeframe.value),
+        condition.signal,
+        condition.operator.value,
+        _freeze(condition.value),
+    )
+
+
+def _freeze(value: Any) -> tuple:
+    if isinstance(value, list):
+        return ("list", tuple(_freeze(item) for item in value))
+    return (type(value).__name__, value)
+
+
+def _rule_sets(strategy: TradingStrategy):
+    """Configured entry/exit rule sets of a strategy."""
+    entry, exit_rules = strategy.entry, strategy.exit
+    candidates = [entry.long, entry.short] if entry else []
+    if exit_rules:
+        candidates += [exit_rules.long, exit_rules.short]
+    return [rules for rules in candidates if rules is not None]
+
+
+def _conditions(rules):
+    """Every condition of a rule set, including those nested in its tree."""
+    stack = list(rules.conditions or [])
+    if rules.tree is not None:
+        stack.append(rules.tree)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ConditionTree):
+            stack.extend(node.conditions)
+        else:
+            yield node
+
+
+def _label(node: Union[Condition, ConditionTree]) -> str:
+    """Short description of a rule node for ordering stats."""
+    if isinstance(node, Condition):
+        timeframe = getattr(node.timeframe, "value", node.timeframe)
+        return f"{node.signal} {node.operator.value} {node.value!r} @{timeframe}"
+    return f"{node.operator}({len(node.conditions)})"
+
+
+def _may_raise(node: Union[Condition, ConditionTree]) -> bool:
+    """Whether evaluating a rule node can raise (crosses against a string that is not a column)."""
+    if isinstance(node, Condition):
+        return node.operator in _CROSSES and isinstance(node.value, str)
+    return any(_may_raise(child) for child in node.conditions)
+
+
+def _run(rules: CompiledRules, sampled: bool, *args) -> bool:
+    """Run a compiled rule set, treating evaluation errors as False like StrategyExecutor."""
+    try:
+        return bool(rules.sample(*args) if sampled else rules.check(*args))
+    except (ValueError, TypeError, KeyError):
+        return False
+
+
+def _build(node: Any) -> Check:
+    """Closure of a check, AdaptiveNode or negation."""
+    return node.build() if isinstance(node, (AdaptiveNode, _Negation)) else node
+
+
+def _timed(node: Any, rows: RowAccessor) -> bool:
+    """Evaluate a check, AdaptiveNode or negation, timing adaptive nodes."""
+    return node.timed(rows) if isinstance(node, (AdaptiveNode, _Negation)) else node(rows)
+
+
+def _never(rows: RowAccessor) -> bool:
+    return False
+
+
+def _all_of(checks: List[Check]) -> Check:
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+        return lambda rows: first(rows) and second(rows)
+    return lambda rows: all(check(rows) for check in checks)
+
+
+def _any_of(checks: List[Check]) -> Check:
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+        return lambda rows: first(rows) or second(rows)
+    return lambda rows: any(check(rows) for check in checks)
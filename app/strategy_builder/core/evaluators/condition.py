@@ -9,6 +9,13 @@ from typing import Dict, Union
 from app.strategy_builder.core.domain.protocols import ConditionEvaluatorInterface, Logger
 from app.strategy_builder.core.domain.models import Condition
 from app.strategy_builder.core.domain.enums import ConditionOperatorEnum
+from app.strategy_builder.core.evaluators.lookback import (
+    PREVIOUS_OPERATORS,
+    PREVIOUS_PREFIX,
+    LookbackTest,
+    uses_lookback,
+    with_previous,
+)
 
 
 class ConditionEvaluator(ConditionEvaluatorInterface):
@@ -44,7 +51,8 @@ class ConditionEvaluator(ConditionEvaluatorInterface):
             )
             return False
         
-        row = self.recent_rows[tf][-1]
+        window = self.recent_rows[tf]
+        row = window[-1]
         
         # Log time and row info for debugging
         time_value = row.get('time', 'N/A')
@@ -63,6 +71,27 @@ class ConditionEvaluator(ConditionEvaluatorInterface):
                 if hasattr(val, '__len__') and not isinstance(val, str):
                     self.logger.info(f"ConditionEvaluator: {col} is array-like with shape: {getattr(val, 'shape', len(val))}")
         
+        # Older bars are read from the buffer by offset
+        if uses_lookback(condition):
+            return LookbackTest(condition, self.evaluate_row)(
+                lambda back: window[-1 - back] if back < len(window) else None
+            )
+        if condition.operator in PREVIOUS_OPERATORS and f"{PREVIOUS_PREFIX}{condition.signal}" not in row:
+            row = with_previous(row, window[-2] if len(window) > 1 else None)
+        
+        return self.evaluate_row(condition, row)
+    
+    def evaluate_row(self, condition: Condition, row) -> bool:
+        """
+        Evaluate a single condition against one row.
+        
+        Args:
+            condition: Condition to evaluate
+            row: Latest row of the condition's timeframe (Series or mapping)
+            
+        Returns:
+            True if condition is met, False otherwise
+        """
         # Get current signal value
         current_signal = row.get(condition.signal)
         if current_signal is None:
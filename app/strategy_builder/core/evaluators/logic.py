@@ -9,6 +9,7 @@ import re
 from app.strategy_builder.core.domain.protocols import LogicEvaluatorInterface, ConditionEvaluatorInterface
 from app.strategy_builder.core.domain.models import ConditionTree, Condition, EntryRules, ExitRules, TimeBasedExit
 from app.strategy_builder.core.domain.enums import LogicModeEnum
+from app.utils.clock import get_clock
 
 
 class LogicEvaluator(LogicEvaluatorInterface):
@@ -161,7 +162,7 @@ class LogicEvaluator(LogicEvaluatorInterface):
             return False  # No position data available
         
         entry_time = self.position_data['entry_time']
-        current_time = datetime.now()
+        current_time = get_clock().now()
         position_duration = current_time - entry_time
         
         # Check maximum duration
@@ -193,23 +194,7 @@ class LogicEvaluator(LogicEvaluatorInterface):
         Raises:
             ValueError: If duration format is invalid
         """
-        match = re.match(r'^(\d+)([mhdw])$', duration_str.lower())
-        if not match:
-            raise ValueError(f"Invalid duration format: {duration_str}")
-        
-        value, unit = match.groups()
-        value = int(value)
-        
-        if unit == 'm':
-            return timedelta(minutes=value)
-        elif unit == 'h':
-            return timedelta(hours=value)
-        elif unit == 'd':
-            return timedelta(days=value)
-        elif unit == 'w':
-            return timedelta(weeks=value)
-        else:
-            raise ValueError(f"Unsupported duration unit: {unit}")
+        return parse_duration(duration_str)
     
     def _evaluate_tree(self, node: Union[ConditionTree, Condition]) -> bool:
         """
@@ -230,15 +215,47 @@ class LogicEvaluator(LogicEvaluatorInterface):
             raise ValueError(f"Invalid node type: {type(node)}")
         
         op = node.operator
-        results = [self._evaluate_tree(child) for child in node.conditions]
         
+        # Generators so and/or stop at the first deciding child
         if op == "and":
-            return all(results)
+            return all(self._evaluate_tree(child) for child in node.conditions)
         elif op == "or":
-            return any(results)
+            return any(self._evaluate_tree(child) for child in node.conditions)
         elif op == "not":
-            if len(results) != 1:
+            if len(node.conditions) != 1:
                 raise ValueError("NOT operator must have exactly one child condition.")
-            return not results[0]
+            return not self._evaluate_tree(node.conditions[0])
         else:
-            raise ValueError(f"Unsupported tree operator: {op}")
\ No newline at end of file
+            raise ValueError(f"Unsupported tree operator: {op}")
+
+
+def parse_duration(duration_str: str) -> timedelta:
+    """
+    Parse duration string into timedelta object.
+    
+    Args:
+        duration_str: Duration string like "4h", "30m", "2d", "1w"
+        
+    Returns:
+        timedelta object
+        
+    Raises:
+        ValueError: If duration format is invalid
+    """
+    match = re.match(r'^(\d+)([mhdw])$', duration_str.lower())
+    if not match:
+        raise ValueError(f"Invalid duration format: {duration_str}")
+    
+    value, unit = match.groups()
+    value = int(value)
+    
+    if unit == 'm':
+        return timedelta(minutes=value)
+    elif unit == 'h':
+        return timedelta(hours=value)
+    elif unit == 'd':
+        return timedelta(days=value)
+    elif unit == 'w':
+        return timedelta(weeks=value)
+    else:
+        raise ValueError(f"Unsupported duration unit: {unit}")
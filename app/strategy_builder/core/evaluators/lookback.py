@@ -0,0 +1,214 @@
+"""
+Lookback conditions: values read from older rows of a timeframe's buffer.
+
+A condition can look past the latest row of its timeframe:
+
+- ``close[-3]`` is the close 3 bars before the latest bar, as the signal or
+  as the value
+- ``max(high, 20)`` and ``min(low[-1], 10)`` aggregate a column over a
+  window of bars ending at the given offset
+- ``rising`` / ``falling`` with value n hold when the signal moved strictly
+  in that direction on each of the last n bars
+
+Operators that compare with the previous bar (crosses, changes_to, remains)
+shift every reference by one more bar, so ``ema_20[-3] crosses_above
+ema_50[-3]`` means "crossed 3 bars ago". Values are read from the
+per-timeframe deque by offset; nothing is copied into the stored rows. Once
+resolved, they are compared by ConditionEvaluator.evaluate_row on a small
+synthetic row, so casts and operator semantics are those of plain
+conditions.
+
+Plain crosses/changes_to/remains conditions read ``previous_<column>`` when
+the latest row carries it and the row before it otherwise (see
+with_previous), so rows do not need materialised previous_* columns.
+"""
+
+import numbers
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import pandas as pd
+
+from app.strategy_builder.core.domain.enums import ConditionOperatorEnum
+from app.strategy_builder.core.domain.models import Condition, SeriesReference, parse_series_reference
+
+
+PREVIOUS_PREFIX = "previous_"
+
+# Operators that also read the previous bar of the signal (and of a column value)
+PREVIOUS_OPERATORS = (
+    ConditionOperatorEnum.CROSSES_ABOVE,
+    ConditionOperatorEnum.CROSSES_BELOW,
+    ConditionOperatorEnum.CHANGES_TO,
+    ConditionOperatorEnum.REMAINS,
+)
+
+# Operators whose value is a number of bars
+TREND_OPERATORS = (ConditionOperatorEnum.RISING, ConditionOperatorEnum.FALLING)
+
+# Bars back from the latest row (0) -> row, or None past the start of the buffer
+RowAt = Callable[[int], Optional[Mapping[str, Any]]]
+
+# Columns of the synthetic row handed to ConditionEvaluator.evaluate_row
+_SIGNAL = "__signal__"
+_VALUE = "__value__"
+
+
+def uses_lookback(condition: Condition) -> bool:
+    """Whether a condition reads series references or uses a trend operator."""
+    return (
+        condition.operator in TREND_OPERATORS
+        or parse_series_reference(condition.signal) is not None
+        or (isinstance(condition.value, str) and parse_series_reference(condition.value) is not None)
+    )
+
+
+def condition_depth(condition: Condition) -> int:
+    """
+    Rows of its timeframe a condition reads.
+
+    Args:
+        condition: Condition to inspect
+
+    Returns:
+        Number of rows, counting the latest one (1 for a plain comparison)
+    """
+    depth = (parse_series_reference(condition.signal) or SeriesReference(condition.signal)).depth
+    if isinstance(condition.value, str):
+        target = parse_series_reference(condition.value)
+        if target is not None:
+            depth = max(depth, target.depth)
+    if condition.operator in PREVIOUS_OPERATORS:
+        return depth + 1
+    if condition.operator in TREND_OPERATORS:
+        return depth + int(condition.value)
+    return depth
+
+
+def resolve(reference: SeriesReference, row_at: RowAt, shift: int = 0) -> Any:
+    """
+    Value of a reference, shift bars before the latest bar.
+
+    Args:
+        reference: Column, offset and optional aggregate
+        row_at: Row lookup by bars back
+        shift: Extra bars back (1 for the previous value of crosses)
+
+    Returns:
+        The value, or None when the buffer is too short, the column is
+        missing, or an aggregated value is not a number
+    """
+    start = shift + reference.offset
+    if reference.function is None:
+        row = row_at(start)
+        return None if row is None else row.get(reference.column)
+
+    values = []
+    for back in range(start, start + reference.window):
+        row = row_at(back)
+        value = None if row is None else row.get(reference.column)
+        if not _is_number(value):
+            return None
+        values.append(value)
+    return max(values) if reference.function == "max" else min(values)
+
+
+class LookbackTest:
+    """A lookback condition with its references parsed once."""
+
+    def __init__(self, condition: Condition, evaluate_row: Callable[[Condition, Mapping[str, Any]], bool]):
+        """
+        Prepare the test.
+
+        Args:
+            condition: Condition using series references or a trend operator
+            evaluate_row: ConditionEvaluator.evaluate_row, used for the comparison
+        """
+        self.condition = condition
+        self.evaluate_row = evaluate_row
+        self.signal = parse_series_reference(condition.signal) or SeriesReference(condition.signal)
+        self.target = parse_series_reference(condition.value) if isinstance(condition.value, str) else None
+        self.shifted = condition.operator in PREVIOUS_OPERATORS
+        self.bars = int(condition.value) if condition.operator in TREND_OPERATORS else 0
+        self.rising = condition.operator == ConditionOperatorEnum.RISING
+        self._against_column = condition.model_copy(update={"signal": _SIGNAL, "value": _VALUE})
+        self._against_literal = condition.model_copy(update={"signal": _SIGNAL})
+
+    def __call__(self, row_at: RowAt) -> bool:
+        """
+        Evaluate the condition.
+
+        Args:
+            row_at: Row lookup by bars back
+
+        Returns:
+            True if the condition holds; False when any reference cannot be
+            resolved (buffer too short, missing column, aggregate over a
+            non-number)
+        """
+        if self.bars:
+            return self._trend(row_at)
+
+        row = {_SIGNAL: resolve(self.signal, row_at)}
+        if self.shifted:
+            row[f"{PREVIOUS_PREFIX}{_SIGNAL}"] = resolve(self.signal, row_at, 1)
+
+        target = self.target
+        value = self.condition.value
+        if target is None and isinstance(value, str):
+            latest = row_at(0)
+            if latest is not None and value in latest:
+                target = SeriesReference(value)            # plain column value, like the interpreter
+        if target is not None:
+            row[_VALUE] = resolve(target, row_at)
+            if self.shifted:
+                row[f"{PREVIOUS_PREFIX}{_VALUE}"] = resolve(target, row_at, 1)
+
+        if any(resolved is None for resolved in row.values()):
+            return False
+        return self.evaluate_row(self._against_literal if target is None else self._against_column, row)
+
+    def _trend(self, row_at: RowAt) -> bool:
+        """Whether the signal rose (fell) strictly on each of the last ``bars`` bars."""
+        values = [resolve(self.signal, row_at, shift) for shift in range(self.bars + 1)]
+        if not all(_is_number(value) for value in values):
+            return False
+        if self.rising:
+            return all(newer > older for newer, older in zip(values, values[1:]))
+        return all(newer < older for newer, older in zip(values, values[1:]))
+
+
+def with_previous(row: Mapping[str, Any], previous: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """
+    Row with ``previous_<column>`` values taken from the row before it.
+
+    Args:
+        row: Latest row
+        previous: Row before it (None when the buffer holds a single row)
+
+    Returns:
+        A dict of the row plus a previous_* entry for every column of
+        previous (columns the row already has are kept), or row itself when
+        there is no previous row
+    """
+    if previous is None:
+        return row
+    merged: Dict[str, Any] = {
+        f"{PREVIOUS_PREFIX}{column}": value
+        for column, value in previous.items() if not column.startswith(PREVIOUS_PREFIX)
+    }
+    merged.update(row)
+    return merged
+
+
+def row_mapping(row) -> Mapping[str, Any]:
+    """Convert a row to a dict, keeping the first of any duplicated columns (like the interpreter)."""
+    if isinstance(row, pd.Series):
+        if not row.index.is_unique:
+            row = row[~row.index.duplicated()]
+        return dict(zip(row.index, row.to_numpy()))
+    return row
+
+
+def _is_number(value: Any) -> bool:
+    """Whether a value is a real number other than a bool or NaN."""
+    return isinstance(value, numbers.Real) and not isinstance(value, bool) and value == value
@@ -0,0 +1,305 @@
+"""
+Matrix backend: every strategy of an engine evaluated in one pass.
+
+StrategyMatrix lays out all interned conditions of the compiled strategies
+as one boolean vector and every rule set (entry/exit, long/short) as a
+gate of a small boolean circuit over it:
+
+- conditions comparing a float signal with a numeric literal (<, >, ==,
+  crosses, ...) are computed per operator as NumPy array comparisons
+- all other conditions, including lookback conditions, use their compiled
+  (memoized) check
+- all/any rule sets become AND/OR gates over condition indices, complex
+  trees become nested AND/OR/NOT gates; identical gates are shared
+- gates are evaluated level by level with ``np.add.reduceat`` over the
+  children's values, so every strategy's signals come out together
+
+A condition that raises leaves the strategies using it out of the result;
+the engine then evaluates them through their CompiledStrategy, which
+reproduces the short-circuit and error handling of the per-strategy path
+exactly.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.strategy_builder.core.domain.enums import ConditionOperatorEnum, LogicModeEnum
+from app.strategy_builder.core.domain.models import Condition, ConditionTree, TradingStrategy
+from app.strategy_builder.core.evaluators.compiler import (
+    PREVIOUS_PREFIX,
+    CompiledStrategy,
+    InternedCondition,
+    RowAccessor,
+    StrategyCompiler,
+)
+from app.strategy_builder.core.evaluators.lookback import uses_lookback
+from app.strategy_builder.data.dtos import SignalResult
+
+
+SLOTS = ("entry_long", "entry_short", "exit_long", "exit_short")
+
+# Gate kinds
+GATE_AND = 0
+GATE_OR = 1
+GATE_NOT = 2
+
+# Slot outputs that are not circuit nodes
+OUTPUT_UNSET = -2       # rule set not configured (signal stays None)
+OUTPUT_FALSE = -1       # rule set that can never fire (no conditions, or needs position data)
+
+_FLOATS = frozenset({float, np.float64})
+
+_BLOCK_OPERATORS = {
+    ConditionOperatorEnum.EQ: np.equal,
+    ConditionOperatorEnum.NE: np.not_equal,
+    ConditionOperatorEnum.LT: np.less,
+    ConditionOperatorEnum.LTE: np.less_equal,
+    ConditionOperatorEnum.GT: np.greater,
+    ConditionOperatorEnum.GTE: np.greater_equal,
+    ConditionOperatorEnum.CROSSES_ABOVE: None,
+    ConditionOperatorEnum.CROSSES_BELOW: None,
+}
+
+
+class _Block:
+    """Numeric-literal conditions sharing one operator."""
+
+    def __init__(self, operator: ConditionOperatorEnum, conditions: List[InternedCondition]):
+        self.operator = operator
+        self.compare = _BLOCK_OPERATORS[operator]
+        self.ids = np.array([c.id for c in conditions], dtype=np.int64)
+        self.fields = [
+            (c.condition.timeframe, c.condition.signal, f"{PREVIOUS_PREFIX}{c.condition.signal}")
+            for c in conditions
+        ]
+        self.thresholds = np.array([float(c.condition.value) for c in conditions], dtype=np.float64)
+        self.crosses = self.compare is None
+
+
+class StrategyMatrix:
+    """All compiled strategies of an engine as a condition vector plus a boolean circuit."""
+
+    def __init__(self, plans: Dict[str, CompiledStrategy], compiler: StrategyCompiler):
+        """
+        Build the condition layout and circuit.
+
+        Args:
+            plans: Compiled strategies by name, all built by ``compiler``
+            compiler: Compiler holding the interned conditions of the plans
+        """
+        self.plans = dict(plans)
+        self.names = list(plans)
+        self.compiler = compiler
+        self.conditions = compiler.interned_conditions()
+        self.size = len(self.conditions)
+
+        self._gates: List[Tuple[int, Tuple[int, ...]]] = []
+        self._gate_index: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+        self._depth: List[int] = []
+        self._users: Dict[int, List[int]] = {}
+
+        self.outputs = np.full((len(self.names), len(SLOTS)), OUTPUT_UNSET, dtype=np.int64)
+        for row, name in enumerate(self.names):
+            for column, (rules, is_exit) in enumerate(_slot_rules(self.plans[name].strategy)):
+                if rules is None:
+                    continue
+                used: List[int] = []
+                self.outputs[row, column] = self._rules_node(rules, is_exit, used)
+                for condition_id in set(used):
+                    self._users.setdefault(condition_id, []).append(row)
+
+        self._unset = (self.outputs == OUTPUT_UNSET).tolist()
+        self._levels = self._build_levels()
+        self._blocks, self._generic = self._build_blocks()
+
+    @property
+    def gate_count(self) -> int:
+        """Number of distinct gates in the circuit."""
+        return len(self._gates)
+
+    def evaluate(self, rows: RowAccessor) -> Dict[str, Tuple[SignalResult, SignalResult]]:
+        """
+        Evaluate every strategy against the latest rows.
+
+        Args:
+            rows: Row accessor for the current evaluation
+
+        Returns:
+            (entry, exit) SignalResults by strategy name; strategies that use a
+            condition which raised are omitted
+        """
+        values = np.zeros(self.size + len(self._gates), dtype=bool)
+        failed = self._fill_conditions(rows, values)
+
+        for gates, children, starts, sizes, kinds in self._levels:
+            counts = np.add.reduceat(values[children].astype(np.int32), starts)
+            values[gates] = np.where(
+                kinds == GATE_AND, counts == sizes, np.where(kinds == GATE_OR, counts > 0, counts == 0)
+            )
+
+        signals = np.where(self.outputs >= 0, values[np.maximum(self.outputs, 0)], False).tolist()
+        skipped = {row for condition_id in failed for row in self._users.get(condition_id, ())}
+
+        results: Dict[str, Tuple[SignalResult, SignalResult]] = {}
+        for row, name in enumerate(self.names):
+            if row in skipped:
+                continue
+            sides: List[Optional[bool]] = [
+                None if unset else signal for unset, signal in zip(self._unset[row], signals[row])
+            ]
+            results[name] = (
+                SignalResult(long=sides[0], short=sides[1]),
+                SignalResult(long=sides[2], short=sides[3]),
+            )
+        return results
+
+    # ------------------------------------------------------------------
+    # Circuit construction
+    # ------------------------------------------------------------------
+
+    def _rules_node(self, rules, is_exit: bool, used: List[int]) -> int:
+        """Circuit node of a rule set (same semantics as CompiledStrategy)."""
+        if is_exit and rules.mode == LogicModeEnum.ALL and (rules.time_based or rules.profit_guard):
+            # "conditions and time-based exit": never true without position data
+            return OUTPUT_FALSE
+        if rules.mode == LogicModeEnum.COMPLEX:
+            return self._node(rules.tree, used) if rules.tree else OUTPUT_FALSE
+        if not rules.conditions:
+            return OUTPUT_FALSE
+
+        children = [self._node(condition, used) for condition in rules.conditions]
+        return self._gate(GATE_AND if rules.mode == LogicModeEnum.ALL else GATE_OR, children)
+
+    def _node(self, node, used: List[int]) -> int:
+        """Circuit node of a condition or tree."""
+        if isinstance(node, Condition):
+            condition_id = self.compiler.intern(node).id
+            if condition_id >= self.size:
+                raise ValueError("StrategyMatrix plans must be compiled by the given compiler")
+            used.append(condition_id)
+            return condition_id
+        if not isinstance(node, ConditionTree):
+            raise ValueError(f"Invalid node type: {type(node)}")
+
+        children = [self._node(child, used) for child in node.conditions]
+        if node.operator == "not":
+            return self._gate(GATE_NOT, children)
+        return self._gate(GATE_AND if node.operator == "and" else GATE_OR, children)
+
+    def _gate(self, kind: int, children: List[int]) -> int:
+        """Node id of a gate, sharing identical gates."""
+        if len(children) == 1 and kind != GATE_NOT:
+            return children[0]
+        key = (kind, tuple(children))
+        index = self._gate_index.get(key)
+        if index is None:
+            index = len(self._gates)
+            self._gates.append(key)
+            self._depth.append(1 + max(self._node_depth(child) for child in children))
+            self._gate_index[key] = index
+        return self.size + index
+
+    def _node_depth(self, node: int) -> int:
+        return 0 if node < self.size else self._depth[node - self.size]
+
+    def _build_levels(self) -> List[Tuple[np.ndarray, ...]]:
+        """Group gates by depth into (ids, children, starts, sizes, kinds) arrays."""
+        levels = []
+        for depth in sorted(set(self._depth)):
+            members = [index for index, d in enumerate(self._depth) if d == depth]
+            children, starts, sizes = [], [], []
+            for index in members:
+                starts.append(len(children))
+                sizes.append(len(self._gates[index][1]))
+                children.extend(self._gates[index][1])
+            levels.append((
+                np.array([self.size + index for index in members], dtype=np.int64),
+                np.array(children, dtype=np.int64),
+                np.array(starts, dtype=np.int64),
+                np.array(sizes, dtype=np.int32),
+                np.array([self._gates[index][0] for index in members], dtype=np.int8),
+            ))
+        return levels
+
+    def _build_blocks(self) -> Tuple[List[_Block], List[InternedCondition]]:
+        """Split the conditions used by the plans into vectorizable numeric blocks and the rest."""
+        grouped: Dict[ConditionOperatorEnum, List[InternedCondition]] = {}
+        generic: List[InternedCondition] = []
+        for interned in self.conditions:
+            if interned.id not in self._users:
+                continue                  # interned for a strategy that was reloaded away
+            value = interned.condition.value
+            numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if numeric and interned.condition.operator in _BLOCK_OPERATORS and not uses_lookback(interned.condition):
+                grouped.setdefault(interned.condition.operator, []).append(interned)
+            else:
+                generic.append(interned)
+        return [_Block(operator, members) for operator, members in grouped.items()], generic
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def _fill_conditions(self, rows: RowAccessor, values: np.ndarray) -> List[int]:
+        """Compute the condition vector; returns the ids of conditions that raised."""
+        pending = list(self._generic)
+        for block in self._blocks:
+            pending.extend(self._fill_block(block, rows, values))
+
+        failed = []
+        for interned in pending:
+            if not rows.has(interned.condition.timeframe):
+                continue                  # strategies using it are skipped by the engine
+            try:
+                values[interned.id] = interned.check(rows)
+            except Exception:
+                failed.append(interned.id)
+        return failed
+
+    def _fill_block(self, block: _Block, rows: RowAccessor, values: np.ndarray) -> List[InternedCondition]:
+        """Vectorized comparison of one block; returns conditions whose values are not floats."""
+        count = len(block.ids)
+        current = np.full(count, np.nan)
+        previous = np.full(count, np.nan) if block.crosses else None
+        fast = np.zeros(count, dtype=bool)
+        pending = []
+
+        for position, (timeframe, signal, previous_signal) in enumerate(block.fields):
+            row = rows.latest(timeframe)
+            if row is None:
+                continue
+            value = row.get(signal)
+            if type(value) in _FLOATS:
+                if block.crosses:
+                    prior = row.get(previous_signal)
+                    if type(prior) not in _FLOATS:
+                        pending.append(self.conditions[block.ids[position]])
+                        continue
+                    previous[position] = prior
+                current[position] = value
+                fast[position] = True
+            else:
+                pending.append(self.conditions[block.ids[position]])
+
+        with np.errstate(invalid="ignore"):
+            if block.operator == ConditionOperatorEnum.CROSSES_ABOVE:
+                result = (previous <= block.thresholds) & (current > block.thresholds)
+            elif block.operator == ConditionOperatorEnum.CROSSES_BELOW:
+                result = (previous >= block.thresholds) & (current < block.thresholds)
+            else:
+                result = block.compare(current, block.thresholds)
+
+        values[block.ids[fast]] = result[fast]
+        return pending
+
+
+def _slot_rules(strategy: TradingStrategy):
+    """(rules, is_exit) for each of SLOTS."""
+    entry, exit_rules = strategy.entry, strategy.exit
+    return [
+        (entry.long if entry else None, False),
+        (entry.short if entry else None, False),
+        (exit_rules.long if exit_rules else None, True),
+        (exit_rules.short if exit_rules else None, True),
+    ]
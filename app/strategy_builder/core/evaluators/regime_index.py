@@ -0,0 +1,143 @@
+"""
+Regime dispatch index: which strategies cannot fire in the current regime.
+
+Many strategies open their rule sets with a guard such as
+``regime in [bull_high, bull_low]`` or ``is_transition == false``, which
+rules them out in most regimes. StrategyCompiler records those leading
+guards on each CompiledStrategy (see leading_regime_guards); RegimeIndex maps
+the regime state of the latest rows (the guarded columns of every guarded
+timeframe) to the strategies whose every rule set is ruled out by a guard.
+
+The guards are evaluated only when the regime state changes; the answer for
+each state seen is kept, so switching back to an earlier regime is a dict
+lookup. Guards are checked with the compiler's own interned checks, so a
+strategy is ruled out exactly when evaluating it would give False for every
+rule set.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from app.strategy_builder.core.evaluators.compiler import CompiledStrategy, InternedCondition, RowAccessor
+
+
+# Regime states remembered before the table is cleared (states are
+# regimes x transition flags, so this is only reached with odd values)
+MAX_STATES = 1024
+
+# State key of NaN values, which are never equal to themselves
+_NAN = ("nan",)
+
+
+class RegimeIndex:
+    """Regime state -> strategies ruled out by their leading regime guards."""
+
+    def __init__(self):
+        """Initialize an empty index; plans are added with update()."""
+        self._slots: Dict[str, List[List[InternedCondition]]] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._states: Dict[tuple, FrozenSet[str]] = {}
+        self._last: Optional[Tuple[RowAccessor, FrozenSet[str]]] = None
+        self.refreshes = 0
+
+    def __len__(self) -> int:
+        """Number of strategies that can be ruled out by a regime."""
+        return len(self._slots)
+
+    def update(self, plan: CompiledStrategy) -> None:
+        """
+        Add or replace a compiled strategy.
+
+        Only strategies whose every rule set opens with a regime guard are
+        indexed; the others can fire in any regime.
+
+        Args:
+            plan: Compiled strategy
+        """
+        guards = list(plan.regime_guards.values())
+        if guards and all(guards):
+            self._slots[plan.name] = guards
+        elif plan.name not in self._slots:
+            return
+        else:
+            del self._slots[plan.name]
+        self._reset()
+
+    def discard(self, name: str) -> None:
+        """Remove a strategy (no-op if it is not indexed)."""
+        if self._slots.pop(name, None) is not None:
+            self._reset()
+
+    def blocked(self, rows: RowAccessor) -> FrozenSet[str]:
+        """
+        Strategies that cannot fire on the current rows.
+
+        Args:
+            rows: Row accessor for the current evaluation
+
+        Returns:
+            Names of the strategies whose every rule set is ruled out
+        """
+        if not self._slots:
+            return frozenset()
+        if self._last is not None and self._last[0] is rows:
+            return self._last[1]
+
+        state = tuple(_state_value(rows.latest(timeframe), signal) for timeframe, signal in self._keys)
+        try:
+            blocked = self._states.get(state)
+        except TypeError:                 # unhashable column value: evaluate without remembering
+            blocked, state = None, None
+        if blocked is None:
+            blocked = self._evaluate(rows)
+            self.refreshes += 1
+            if state is not None:
+                if len(self._states) >= MAX_STATES:
+                    self._states.clear()
+                self._states[state] = blocked
+        self._last = (rows, blocked)
+        return blocked
+
+    def _evaluate(self, rows: RowAccessor) -> FrozenSet[str]:
+        """Check every guard once and collect the strategies with all rule sets ruled out."""
+        outcomes: Dict[int, Optional[bool]] = {}
+        for slots in self._slots.values():
+            for guards in slots:
+                for interned in guards:
+                    if interned.id not in outcomes:
+                        try:
+                            outcomes[interned.id] = bool(interned.check(rows))
+                        except Exception:
+                            outcomes[interned.id] = None
+
+        return frozenset(
+            name for name, slots in self._slots.items()
+            if all(_ruled_out(guards, outcomes) for guards in slots)
+        )
+
+    def _reset(self) -> None:
+        """Recompute the guarded columns and forget the remembered states."""
+        self._keys = sorted({
+            (str(interned.condition.timeframe.value), interned.condition.signal)
+            for slots in self._slots.values() for guards in slots for interned in guards
+        })
+        self._states.clear()
+        self._last = None
+
+
+def _ruled_out(guards: List[InternedCondition], outcomes: Dict[int, Optional[bool]]) -> bool:
+    """Whether the first guard that does not hold is False (a guard that raised rules nothing out)."""
+    for interned in guards:
+        outcome = outcomes[interned.id]
+        if outcome is not True:
+            return outcome is False
+    return False
+
+
+def _state_value(row: Optional[Dict[str, Any]], signal: str) -> Any:
+    """Value of a guarded column as a state key (None when the timeframe has no row)."""
+    if row is None:
+        return None
+    value = row.get(signal)
+    if isinstance(value, float) and value != value:
+        return _NAN
+    return value
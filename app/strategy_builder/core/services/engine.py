@@ -3,40 +3,191 @@ Main strategy engine with dependency injection.
 """
 
 from collections import deque
-from typing import Dict, List
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 import pandas as pd
 
 from app.strategy_builder.core.domain.protocols import StrategyLoaderInterface, EvaluatorFactory, Logger
 from app.strategy_builder.core.domain.models import TradingStrategy
-from app.strategy_builder.data.dtos import AllStrategiesEvaluationResult, StrategyEvaluationResult
-from app.strategy_builder.core.services.executor import create_strategy_executor
+from app.strategy_builder.core.evaluators.activation import ActivationCalendar, is_active_at
+from app.strategy_builder.core.evaluators.compiler import (
+    CompiledStrategy,
+    RowAccessor,
+    StrategyCompiler,
+    create_strategy_compiler,
+    lookback_depths,
+)
+from app.strategy_builder.core.evaluators.matrix import StrategyMatrix
+from app.strategy_builder.core.evaluators.regime_index import RegimeIndex
+from app.strategy_builder.data.dtos import AllStrategiesEvaluationResult, SignalResult, StrategyEvaluationResult
+from app.utils.clock import get_clock
+
+
+# Evaluation backends: per-strategy compiled closures, or all strategies as one boolean circuit
+BACKENDS = ("compiled", "matrix")
+
+
+class _CachedResult(NamedTuple):
+    """Last result of a strategy (None when it was skipped) and what it depends on."""
+    strategy: TradingStrategy
+    dependencies: frozenset
+    result: Optional[StrategyEvaluationResult]
 
 
 class StrategyEngine:
-    """Main strategy engine that orchestrates strategy evaluation."""
+    """
+    Main strategy engine that orchestrates strategy evaluation.
+    
+    Strategies are compiled into CompiledStrategy plans once (and again only
+    when the loader hands back a different strategy object, e.g. after a
+    reload); each evaluation runs the plans against a single RowAccessor.
+    All plans share the compiler's interned conditions, so a condition used
+    by several strategies is computed once per bar.
+    
+    With ``backend="matrix"`` evaluate() computes every strategy's signals in
+    one pass through a StrategyMatrix (condition vector plus boolean circuit)
+    instead of running the plans one by one; results are identical.
+    
+    Results are cached per strategy: evaluate() re-evaluates only the
+    strategies that reference a timeframe whose latest row changed (rules,
+    declared timeframes and indicator-based SL/TP), and
+    refresh_time_sensitive() covers results that change with the clock.
+    
+    Activation settings are checked up front through an ActivationCalendar:
+    strategies that are disabled or outside their schedule get no per-strategy
+    work at all. While outside its schedule, a strategy whose
+    session_handling is "close_all" reports exit signals on both sides, so
+    its positions are closed at the end of the session.
+    
+    Strategies whose every rule set opens with a regime guard (e.g.
+    ``regime in [bull_high, bull_low]``) are looked up in a RegimeIndex: when
+    the guards rule out all rule sets in the current regime, the strategy's
+    signals are set to False without running its conditions. The guards are
+    only re-checked when the regime columns of the latest rows change.
+    """
     
     def __init__(
         self,
         strategy_loader: StrategyLoaderInterface,
         evaluator_factory: EvaluatorFactory,
-        logger: Logger
+        logger: Logger,
+        compiler: Optional[StrategyCompiler] = None,
+        backend: str = "compiled"
     ):
         """
         Initialize strategy engine with dependencies.
         
         Args:
             strategy_loader: Strategy loader instance
-            evaluator_factory: Factory for creating evaluators
+            evaluator_factory: Factory for creating evaluators (used by StrategyExecutor callers)
             logger: Logger instance
+            compiler: Strategy compiler (default: one using ``logger``)
+            backend: "compiled" (per strategy) or "matrix" (all strategies in one pass)
+            
+        Raises:
+            ValueError: If the backend is unknown
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown strategy engine backend: {backend} (expected one of {BACKENDS})")
         self.strategy_loader = strategy_loader
         self.evaluator_factory = evaluator_factory
         self.logger = logger
+        self.compiler = compiler or create_strategy_compiler(logger)
+        self.backend = backend
+        self._plans: Dict[str, CompiledStrategy] = {}
+        self._matrix: Optional[StrategyMatrix] = None
+        self._results: Dict[str, _CachedResult] = {}
+        self._stamps: Dict[str, Any] = {}
+        self._calendar: Optional[ActivationCalendar] = None
+        self._inactive: frozenset = frozenset()
+        self._regime_index = RegimeIndex()
+    
+    def compile_strategies(self) -> Dict[str, CompiledStrategy]:
+        """
+        Compile every loaded strategy that has no up-to-date plan and log the
+        condition dedup ratio.
+        
+        Returns:
+            Compiled plans by strategy name
+        """
+        strategies = self.strategy_loader.load_strategies()
+        plans = {name: self._plan(name, strategy) for name, strategy in strategies.items()}
+        
+        stats = self.condition_stats()
+        self.logger.info(
+            f"Compiled {len(plans)} strategies: {stats['conditions']} conditions, "
+            f"{stats['distinct']} distinct (dedup ratio {stats['dedup_ratio']:.2f})"
+        )
+        return plans
+    
+    def condition_stats(self) -> Dict[str, float]:
+        """
+        Condition interning statistics over the compiled strategies.
+        
+        Returns:
+            Dictionary with the number of condition references, distinct
+            conditions, and their ratio (references per distinct condition)
+        """
+        ids = [condition_id for plan in self._plans.values() for condition_id in plan.condition_ids]
+        distinct = len(set(ids))
+        return {
+            "conditions": len(ids),
+            "distinct": distinct,
+            "dedup_ratio": len(ids) / distinct if distinct else 1.0,
+        }
+    
+    def ordering_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Adaptive condition ordering statistics of the compiled strategies.
+        
+        Returns:
+            CompiledStrategy.ordering_stats() by strategy name: per all/any node
+            its rule set, current order and each child's pass rate and mean cost
+        """
+        return {name: plan.ordering_stats() for name, plan in self._plans.items()}
+    
+    def lookback_depths(self) -> Dict[str, int]:
+        """
+        Rows each timeframe's buffer must hold for the loaded strategies.
+        
+        Returns:
+            Deepest condition lookback by timeframe, counting the latest row
+            (see lookback.condition_depth)
+        """
+        return lookback_depths(self.strategy_loader.load_strategies().values())
+    
+    def _plan(self, name: str, strategy: TradingStrategy) -> CompiledStrategy:
+        """Return the compiled plan for a strategy, compiling it on first use."""
+        plan = self._plans.get(name)
+        if plan is None or plan.strategy is not strategy:
+            plan = self.compiler.compile(strategy)
+            self._plans[name] = plan
+            self._matrix = None
+            self._regime_index.update(plan)
+        return plan
+    
+    def _matrix_signals(
+        self,
+        strategies: Dict[str, TradingStrategy],
+        rows: RowAccessor
+    ) -> Dict[str, Tuple[SignalResult, SignalResult]]:
+        """Evaluate all strategies through the StrategyMatrix, rebuilding it when plans changed."""
+        plans = {name: self._plan(name, strategy) for name, strategy in strategies.items()}
+        if self._matrix is None or self._matrix.names != list(plans):
+            self._matrix = StrategyMatrix(plans, self.compiler)
+            self.logger.info(
+                f"Built strategy matrix: {self._matrix.size} conditions, {self._matrix.gate_count} gates"
+            )
+        return self._matrix.evaluate(rows)
     
     def evaluate(self, recent_rows: Dict[str, deque[pd.Series]]) -> AllStrategiesEvaluationResult:
         """
         Evaluate all loaded strategies against market data.
         
+        Only strategies whose timeframes have a new (or rebuilt) latest row
+        since the previous call are re-evaluated; the others keep their cached
+        result. Results that can change with the clock alone are refreshed by
+        refresh_time_sensitive().
+        
         Args:
             recent_rows: Market data by timeframe
             
@@ -47,59 +198,202 @@ class StrategyEngine:
         
         try:
             strategies = self.strategy_loader.load_strategies()
+            active = self._update_activation(strategies)
+            rows = RowAccessor(recent_rows)
+            changed = {
+                timeframe for timeframe, stamp in self._stamps.items()
+                if not _same_bar(stamp, rows.stamp(timeframe))
+            }
+            due = {
+                name: strategy for name, strategy in strategies.items()
+                if name in active and self._is_due(name, strategy, changed)
+            }
+            
+            self._evaluate_due(due, strategies, rows)
+            
+            closing = self._inactive & self._calendar.close_all
             results: Dict[str, StrategyEvaluationResult] = {}
+            for name in strategies:
+                cached = self._results.get(name)
+                if name in closing:
+                    results[name] = _session_close_result(name)
+                elif cached is not None and cached.result is not None:
+                    results[name] = cached.result
+            self._results = {name: self._results[name] for name in strategies if name in self._results}
+            self._stamps = {
+                timeframe: rows.stamp(timeframe)
+                for cached in self._results.values() for timeframe in cached.dependencies
+            }
             
-            for name, strategy in strategies.items():
-                try:
-                    self.logger.info(f"Evaluating strategy: {name}")
-                    
-                    # Create executor for this strategy
-                    executor = create_strategy_executor(
-                        strategy,
-                        recent_rows,
-                        self.evaluator_factory
-                    )
-                    
-                    # Validate data availability
-                    if not executor.validate_data_availability():
-                        self.logger.warning(
-                            f"Strategy {name}: Required market data not available"
-                        )
-                        continue
-                    
-                    # Check if strategy is active
-                    if not executor.is_strategy_active():
-                        self.logger.info(f"Strategy {name}: Currently inactive")
-                        continue
-                    
-                    # Evaluate entry and exit signals
-                    entry_signals = executor.check_entry()
-                    exit_signals = executor.check_exit()
-                    
-                    results[name] = StrategyEvaluationResult(
-                        strategy_name=name,
-                        entry=entry_signals,
-                        exit=exit_signals
-                    )
-                    
-                    self.logger.info(
-                        f"Strategy {name} evaluated - "
-                        f"Entry: long={entry_signals.long}, short={entry_signals.short} | "
-                        f"Exit: long={exit_signals.long}, short={exit_signals.short}"
-                    )
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to evaluate strategy {name}: {e}")
-                    # Continue with other strategies instead of failing completely
-                    continue
-            
-            self.logger.info(f"Strategy evaluation completed. Evaluated {len(results)} strategies")
+            self.logger.info(
+                f"Strategy evaluation completed. Evaluated {len(results)} strategies "
+                f"({len(due)} re-evaluated, {len(self._inactive)} inactive, "
+                f"changed timeframes: {sorted(changed)})"
+            )
             return AllStrategiesEvaluationResult(strategies=results)
             
         except Exception as e:
             self.logger.error(f"Strategy evaluation failed: {e}")
             raise
     
+    def refresh_time_sensitive(self, recent_rows: Dict[str, deque[pd.Series]]) -> AllStrategiesEvaluationResult:
+        """
+        Re-evaluate strategies whose result can change without a new bar
+        (time-based exits, profit guards) and apply activation schedules.
+        
+        Meant to be called on a timer between bars; only strategies already
+        handled by evaluate() are refreshed. Strategies whose schedule opened
+        since the last call are evaluated; those whose schedule closed are
+        dropped, and reported with exit signals if they close all positions
+        at the end of the session.
+        
+        Args:
+            recent_rows: Market data by timeframe (the rows of the last evaluation)
+            
+        Returns:
+            Results of the refreshed strategies whose result changed
+        """
+        if not self._results and not self._inactive:
+            return AllStrategiesEvaluationResult(strategies={})
+        
+        strategies = self.strategy_loader.load_strategies()
+        was_inactive = self._inactive
+        active = self._update_activation(strategies)
+        closing = (self._inactive - was_inactive) & self._calendar.close_all
+        due = {
+            name: strategy for name, strategy in strategies.items()
+            if name in active and (
+                name in was_inactive
+                or (name in self._results and self._plan(name, strategy).time_sensitive)
+            )
+        }
+        if not due and not closing:
+            return AllStrategiesEvaluationResult(strategies={})
+        
+        previous = {name: getattr(self._results.get(name), "result", None) for name in due}
+        self._evaluate_due(due, strategies, RowAccessor(recent_rows))
+        
+        changed: Dict[str, StrategyEvaluationResult] = {
+            name: _session_close_result(name) for name in strategies if name in closing
+        }
+        for name in due:
+            cached = self._results.get(name)
+            if cached is not None and cached.result is not None and cached.result != previous[name]:
+                changed[name] = cached.result
+        if changed:
+            self.logger.info(f"Time-sensitive refresh changed {len(changed)} strategies: {sorted(changed)}")
+        return AllStrategiesEvaluationResult(strategies=changed)
+    
+    def _update_activation(self, strategies: Dict[str, TradingStrategy]) -> frozenset:
+        """
+        Look up the strategies active now and drop the cached results of the others.
+        
+        The calendar is rebuilt whenever the loader hands back other strategy
+        objects. A dropped result makes the strategy due again once active.
+        
+        Returns:
+            Names of the active strategies
+        """
+        if self._calendar is None or not self._calendar.covers(strategies):
+            self._calendar = ActivationCalendar(strategies)
+            self.logger.info(
+                f"Built activation calendar: {len(strategies)} strategies, "
+                f"{self._calendar.boundary_count} weekly boundaries"
+            )
+        active = self._calendar.active_at(get_clock().now())
+        self._inactive = frozenset(name for name in strategies if name not in active)
+        for name in self._inactive:
+            self._results.pop(name, None)
+        return active
+    
+    def _is_due(self, name: str, strategy: TradingStrategy, changed: set) -> bool:
+        """Whether a strategy has no valid cached result for the current rows."""
+        cached = self._results.get(name)
+        return cached is None or cached.strategy is not strategy or not cached.dependencies.isdisjoint(changed)
+    
+    def _evaluate_due(
+        self,
+        due: Dict[str, TradingStrategy],
+        strategies: Dict[str, TradingStrategy],
+        rows: RowAccessor
+    ) -> None:
+        """Evaluate the due strategies (out of all loaded ones) and cache their results (None when skipped)."""
+        blocked = self._ruled_out(due, rows)
+        matrix_signals: Dict[str, Tuple[SignalResult, SignalResult]] = {}
+        if self.backend == "matrix" and any(name not in blocked for name in due):
+            try:
+                matrix_signals = self._matrix_signals(strategies, rows)
+            except Exception as e:
+                self.logger.error(f"Strategy matrix evaluation failed, evaluating strategies one by one: {e}")
+        
+        for name, strategy in due.items():
+            try:
+                self.logger.info(f"Evaluating strategy: {name}")
+                
+                plan = self._plan(name, strategy)
+                signals = _ruled_out_signals(plan) if name in blocked else matrix_signals.get(name)
+                result = self._evaluate_plan(plan, rows, signals)
+                self._results[name] = _CachedResult(strategy, plan.dependencies, result)
+                
+            except Exception as e:
+                self.logger.error(f"Failed to evaluate strategy {name}: {e}")
+                self._results.pop(name, None)
+                # Continue with other strategies instead of failing completely
+                continue
+    
+    def _ruled_out(self, due: Dict[str, TradingStrategy], rows: RowAccessor) -> frozenset:
+        """Names of the due strategies that cannot fire in the current regime."""
+        if not due:
+            return frozenset()
+        for name, strategy in due.items():
+            try:
+                self._plan(name, strategy)
+            except Exception:
+                continue                  # reported when the strategy is evaluated
+        blocked = self._regime_index.blocked(rows).intersection(due)
+        if blocked:
+            self.logger.info(f"Regime guards rule out {len(blocked)} of {len(due)} due strategies")
+        return blocked
+    
+    def _evaluate_plan(
+        self,
+        plan: CompiledStrategy,
+        rows: RowAccessor,
+        signals: Optional[Tuple[SignalResult, SignalResult]] = None
+    ) -> Optional[StrategyEvaluationResult]:
+        """Evaluate one compiled strategy; None when its data is missing or it is inactive."""
+        name = plan.name
+        
+        # Validate data availability
+        if not plan.validate_data_availability(rows):
+            self.logger.warning(
+                f"Strategy {name}: Required market data not available"
+            )
+            return None
+        
+        # Check if strategy is active
+        if not plan.is_strategy_active():
+            self.logger.info(f"Strategy {name}: Currently inactive")
+            return None
+        
+        # Evaluate entry and exit signals
+        if signals is not None:
+            entry_signals, exit_signals = signals
+        else:
+            entry_signals = plan.check_entry(rows)
+            exit_signals = plan.check_exit(rows)
+        
+        self.logger.info(
+            f"Strategy {name} evaluated - "
+            f"Entry: long={entry_signals.long}, short={entry_signals.short} | "
+            f"Exit: long={exit_signals.long}, short={exit_signals.short}"
+        )
+        return StrategyEvaluationResult(
+            strategy_name=name,
+            entry=entry_signals,
+            exit=exit_signals
+        )
+    
     def evaluate_single_strategy(
         self,
         strategy_name: str,
@@ -122,24 +416,20 @@ class StrategyEngine:
         
         try:
             strategy = self.strategy_loader.get_strategy(strategy_name)
-            
-            executor = create_strategy_executor(
-                strategy,
-                recent_rows,
-                self.evaluator_factory
-            )
+            plan = self._plan(strategy_name, strategy)
+            rows = RowAccessor(recent_rows)
             
             # Validate data availability
-            if not executor.validate_data_availability():
+            if not plan.validate_data_availability(rows):
                 raise ValueError(f"Required market data not available for strategy {strategy_name}")
             
             # Check if strategy is active
-            if not executor.is_strategy_active():
+            if not is_active_at(strategy, get_clock().now()):
                 self.logger.warning(f"Strategy {strategy_name} is currently inactive")
             
             # Evaluate signals
-            entry_signals = executor.check_entry()
-            exit_signals = executor.check_exit()
+            entry_signals = plan.check_entry(rows)
+            exit_signals = plan.check_exit(rows)
             
             result = StrategyEvaluationResult(
                 strategy_name=strategy_name,
@@ -178,17 +468,63 @@ class StrategyEngine:
         """
         return self.strategy_loader.get_strategy(strategy_name)
     
-    def reload_strategies(self) -> None:
-        """Force reload of all strategies from configuration files."""
+    def reload_strategies(self, config_paths: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """
+        Reload strategies from configuration files and swap in their plans.
+        
+        Only new and changed strategies are compiled: a strategy the loader
+        returns as the same instance keeps its plan (with its adaptive
+        ordering) and cached result. The new plans replace the old ones in
+        one assignment once all of them compiled, so an evaluation never sees
+        a mix of old and new plans.
+        
+        Args:
+            config_paths: New list of strategy files (default: the loader's current list)
+            
+        Returns:
+            Strategy names by change: "added", "changed" and "removed"
+            
+        Raises:
+            ValueError: If a strategy fails to load; the previous strategies stay in use
+        """
         self.logger.info("Reloading strategies")
-        self.strategy_loader.reload_strategies()
-        self.logger.info("Strategies reloaded successfully")
+        if config_paths is None:
+            self.strategy_loader.reload_strategies()
+        else:
+            self.strategy_loader.reload_strategies(config_paths)
+        
+        previous = self._plans
+        plans: Dict[str, CompiledStrategy] = {}
+        for name, strategy in self.strategy_loader.load_strategies().items():
+            plan = previous.get(name)
+            plans[name] = plan if plan is not None and plan.strategy is strategy else self.compiler.compile(strategy)
+        
+        summary = {
+            "added": sorted(set(plans) - set(previous)),
+            "changed": sorted(name for name in plans if name in previous and plans[name] is not previous[name]),
+            "removed": sorted(set(previous) - set(plans)),
+        }
+        self._plans = plans
+        self._matrix = None
+        self._regime_index = RegimeIndex()
+        for plan in plans.values():
+            self._regime_index.update(plan)
+        self._results = {
+            name: cached for name, cached in self._results.items()
+            if name in plans and cached.strategy is plans[name].strategy
+        }
+        self.logger.info(
+            f"Strategies reloaded successfully: {len(summary['added'])} added, "
+            f"{len(summary['changed'])} changed, {len(summary['removed'])} removed"
+        )
+        return summary
 
 
 def create_strategy_engine(
     strategy_loader: StrategyLoaderInterface,
     evaluator_factory: EvaluatorFactory,
-    logger: Logger
+    logger: Logger,
+    backend: str = "compiled"
 ) -> StrategyEngine:
     """
     Factory function to create strategy engine.
@@ -197,8 +533,39 @@ def create_strategy_engine(
         strategy_loader: Strategy loader instance
         evaluator_factory: Evaluator factory instance
         logger: Logger instance
+        backend: Evaluation backend ("compiled" or "matrix")
         
     Returns:
         Strategy engine instance
     """
-    return StrategyEngine(strategy_loader, evaluator_factory, logger)
\ No newline at end of file
+    return StrategyEngine(strategy_loader, evaluator_factory, logger, backend=backend)
+
+def _session_close_result(name: str) -> StrategyEvaluationResult:
+    """Result of a "close_all" strategy outside its schedule: no entries, exit both sides."""
+    return StrategyEvaluationResult(
+        strategy_name=name,
+        entry=SignalResult(long=False, short=False),
+        exit=SignalResult(long=True, short=True)
+    )
+
+
+def _ruled_out_signals(plan: CompiledStrategy) -> Tuple[SignalResult, SignalResult]:
+    """Entry and exit signals of a strategy ruled out by its regime guards: False for every configured rule set."""
+    configured = plan.rule_sets
+    return (
+        SignalResult(
+            long=False if "entry_long" in configured else None,
+            short=False if "entry_short" in configured else None,
+        ),
+        SignalResult(
+            long=False if "exit_long" in configured else None,
+            short=False if "exit_short" in configured else None,
+        ),
+    )
+
+
+def _same_bar(previous: Any, current: Any) -> bool:
+    """Whether two RowAccessor stamps refer to the same row of the same bar."""
+    if previous is None or current is None:
+        return previous is current
+    return previous[1] is current[1] and previous[0] == current[0]
@@ -8,7 +8,9 @@ import pandas as pd
 
 from app.strategy_builder.core.domain.protocols import StrategyExecutorInterface, EvaluatorFactory
 from app.strategy_builder.core.domain.models import TradingStrategy
+from app.strategy_builder.core.evaluators.activation import is_active_at
 from app.strategy_builder.data.dtos import SignalResult
+from app.utils.clock import get_clock
 
 
 class StrategyExecutor(StrategyExecutorInterface):
@@ -110,18 +112,9 @@ class StrategyExecutor(StrategyExecutorInterface):
         Check if strategy is currently active based on activation settings.
         
         Returns:
-            True if strategy should be active
+            True if strategy is enabled and within its schedule (if any)
         """
-        if not self.strategy.activation:
-            return True  # Default to active if no activation settings
-        
-        if not self.strategy.activation.enabled:
-            return False
-        
-        # TODO: Implement schedule-based activation checking
-        # This would require current time context and schedule evaluation
-        
-        return True
+        return is_active_at(self.strategy, get_clock().now())
     
     def validate_data_availability(self) -> bool:
         """
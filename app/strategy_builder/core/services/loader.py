@@ -2,11 +2,13 @@
 Strategy loader with dependency injection.
 """
 
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from app.strategy_builder.core.domain.protocols import StrategyLoaderInterface, Logger
 from app.strategy_builder.core.domain.models import TradingStrategy
 from app.strategy_builder.infrastructure.config import ConfigurationLoader
+from app.strategy_builder.infrastructure.strategy_cache import StrategyCache, content_digest
 
 
 class StrategyLoader(StrategyLoaderInterface):
@@ -17,7 +19,8 @@ class StrategyLoader(StrategyLoaderInterface):
         schema_path: str,
         config_paths: List[str],
         config_loader: ConfigurationLoader,
-        logger: Logger
+        logger: Logger,
+        cache: Optional[StrategyCache] = None
     ):
         """
         Initialize strategy loader.
@@ -27,11 +30,14 @@ class StrategyLoader(StrategyLoaderInterface):
             config_paths: List of strategy configuration file paths
             config_loader: Configuration loader with validation
             logger: Logger instance
+            cache: Optional cache of validated strategies; files whose content
+                and schema are unchanged skip parsing and validation
         """
         self.schema_path = schema_path
         self.config_paths = config_paths
         self.config_loader = config_loader
         self.logger = logger
+        self.cache = cache
         self._strategies: Dict[str, TradingStrategy] = {}
     
     def load_strategies(self) -> Dict[str, TradingStrategy]:
@@ -49,32 +55,44 @@ class StrategyLoader(StrategyLoaderInterface):
             return self._strategies
         
         try:
-            # Load and validate all configurations
+            strategies: Dict[str, TradingStrategy] = {}
+            cached, digests = self._cached_strategies()
+            
+            # Load and validate configurations not found in the cache
+            missing = [path for path in self.config_paths if path not in cached]
             validated_configs = self.config_loader.load_and_validate_configs(
                 self.schema_path,
-                self.config_paths
-            )
+                missing
+            ) if missing or self.cache is None else {}
             
             # Convert to TradingStrategy instances
-            for config_path, config_data in validated_configs.items():
+            for config_path in dict.fromkeys(self.config_paths):
                 try:
-                    strategy = TradingStrategy(**config_data)
+                    strategy = cached.get(config_path)
+                    if strategy is None:
+                        strategy = TradingStrategy(**validated_configs[config_path])
+                        if self.cache is not None:
+                            self.cache.put(digests[config_path], config_path, strategy)
                     strategy_name = strategy.name
                     
                     # Check for duplicate strategy names
-                    if strategy_name in self._strategies:
+                    if strategy_name in strategies:
                         self.logger.warning(
                             f"Duplicate strategy name '{strategy_name}' found in {config_path}. "
                             f"Overwriting previous definition."
                         )
                     
-                    self._strategies[strategy_name] = strategy
+                    strategies[strategy_name] = strategy
                     self.logger.info(f"Successfully loaded strategy: {strategy_name}")
                     
                 except Exception as e:
                     self.logger.error(f"Failed to create strategy from {config_path}: {e}")
                     raise ValueError(f"Failed to create strategy from {config_path}: {e}")
             
+            if self.cache is not None:
+                self.cache.save()
+                self.logger.info(f"Strategy cache: {len(cached)} hit(s), {len(validated_configs)} validated")
+            self._strategies = strategies
             self.logger.info(f"Successfully loaded {len(self._strategies)} strategies")
             return self._strategies
             
@@ -82,6 +100,30 @@ class StrategyLoader(StrategyLoaderInterface):
             self.logger.error(f"Failed to load strategies: {e}")
             raise
     
+    def _cached_strategies(self):
+        """
+        Look up every config file in the cache.
+        
+        Returns:
+            (strategies found by config path, content digest by config path)
+        """
+        if self.cache is None:
+            return {}, {}
+        
+        schema_bytes = Path(self.schema_path).read_bytes()
+        cached: Dict[str, TradingStrategy] = {}
+        digests: Dict[str, str] = {}
+        for config_path in self.config_paths:
+            try:
+                config_bytes = Path(config_path).read_bytes()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Config file not found: {config_path}")
+            digests[config_path] = content_digest(config_bytes, schema_bytes)
+            strategy = self.cache.get(digests[config_path])
+            if strategy is not None:
+                cached[config_path] = strategy
+        return cached, digests
+    
     @property
     def strategies(self) -> Dict[str, TradingStrategy]:
         """
@@ -94,15 +136,38 @@ class StrategyLoader(StrategyLoaderInterface):
             self.load_strategies()
         return self._strategies
     
-    def reload_strategies(self) -> Dict[str, TradingStrategy]:
+    def reload_strategies(self, config_paths: Optional[List[str]] = None) -> Dict[str, TradingStrategy]:
         """
         Force reload of all strategies.
         
+        The previous strategies stay loaded until every file has loaded and
+        validated. Strategies whose definition did not change keep their
+        previous instance, so callers can detect changes by identity.
+        
+        Args:
+            config_paths: New list of configuration file paths (default: keep the current list)
+        
         Returns:
             Dictionary of reloaded strategies
+        
+        Raises:
+            ValueError: If any strategy fails validation (previous strategies are kept)
+            FileNotFoundError: If configuration files are not found (previous strategies are kept)
         """
-        self._strategies.clear()
-        return self.load_strategies()
+        previous, previous_paths = self._strategies, self.config_paths
+        if config_paths is not None:
+            self.config_paths = list(config_paths)
+        self._strategies = {}
+        try:
+            strategies = self.load_strategies()
+        except Exception:
+            self._strategies, self.config_paths = previous, previous_paths
+            raise
+        
+        for name, strategy in strategies.items():
+            if previous.get(name) == strategy:
+                strategies[name] = previous[name]
+        return strategies
     
     def get_strategy(self, name: str) -> TradingStrategy:
         """
@@ -136,7 +201,8 @@ def create_strategy_loader(
     schema_path: str,
     config_paths: List[str],
     config_loader: ConfigurationLoader,
-    logger: Logger
+    logger: Logger,
+    cache: Optional[StrategyCache] = None
 ) -> StrategyLoaderInterface:
     """
     Factory function to create strategy loader.
@@ -146,8 +212,9 @@ def create_strategy_loader(
         config_paths: List of configuration file paths
         config_loader: Configuration loader instance
         logger: Logger instance
+        cache: Optional cache of validated strategies
         
     Returns:
         Strategy loader instance
     """
-    return StrategyLoader(schema_path, config_paths, config_loader, logger)
\ No newline at end of file
+    return StrategyLoader(schema_path, config_paths, config_loader, logger, cache)
\ No newline at end of file
@@ -17,6 +17,7 @@ from app.strategy_builder.infrastructure import (
     create_config_manager,
     create_validation_service, ConfigurationLoader
 )
+from app.strategy_builder.infrastructure.strategy_cache import StrategyCache
 
 def get_default_schema_path() -> str:
     """Get the path to the default schema file, handling both development and installed package scenarios."""
@@ -53,7 +54,9 @@ class StrategyEngineFactory:
     def create_engine(
         schema_path: Optional[str] = None,
         config_paths: List[str] = None,
-        logger_name: str = "stratfactory"
+        logger_name: str = "stratfactory",
+        backend: str = "compiled",
+        cache_path: Optional[str] = None
     ):
         """
         Create a fully configured strategy engine with all dependencies.
@@ -62,6 +65,8 @@ class StrategyEngineFactory:
             schema_path: Path to validation schema file (uses default if None)
             config_paths: List of strategy configuration file paths
             logger_name: Name for the logger instance
+            backend: Evaluation backend ("compiled" or "matrix")
+            cache_path: Validated strategy cache file (None disables the cache)
             
         Returns:
             Configured StrategyEngine instance
@@ -98,19 +103,23 @@ class StrategyEngineFactory:
         # Create api dependencies
         evaluator_factory: EvaluatorFactory = create_evaluator_factory(logger)
         strategy_loader: StrategyLoaderInterface = create_strategy_loader(
-            schema_path, config_paths, config_loader, logger
+            schema_path, config_paths, config_loader, logger,
+            cache=StrategyCache(cache_path) if cache_path else None
         )
         
-        # Load strategies immediately to catch any configuration errors
+        # Load and compile strategies immediately to catch any configuration errors
         strategy_loader.load_strategies()
         
         # Create and return the engine
-        return create_strategy_engine(strategy_loader, evaluator_factory, logger)
+        engine = create_strategy_engine(strategy_loader, evaluator_factory, logger, backend=backend)
+        engine.compile_strategies()
+        return engine
     
     @staticmethod
     def create_engine_for_testing(
         schema_path: Optional[str] = None,
-        config_paths: List[str] = None
+        config_paths: List[str] = None,
+        backend: str = "compiled"
     ):
         """
         Create a strategy engine configured for testing (with null logger).
@@ -118,6 +127,7 @@ class StrategyEngineFactory:
         Args:
             schema_path: Path to validation schema file (uses default if None)
             config_paths: List of strategy configuration file paths
+            backend: Evaluation backend ("compiled" or "matrix")
             
         Returns:
             Configured StrategyEngine instance with null logger
@@ -146,11 +156,13 @@ class StrategyEngineFactory:
             schema_path, config_paths, config_loader, logger
         )
         
-        # Load strategies immediately to catch any configuration errors
+        # Load and compile strategies immediately to catch any configuration errors
         strategy_loader.load_strategies()
         
         # Create and return the engine
-        return create_strategy_engine(strategy_loader, evaluator_factory, logger)
+        engine = create_strategy_engine(strategy_loader, evaluator_factory, logger, backend=backend)
+        engine.compile_strategies()
+        return engine
 
 
 def create_strategy_engine_simple(
@@ -18,6 +18,13 @@ from app.strategy_builder.infrastructure.config import (
     create_configuration_loader
 )
 
+from app.strategy_builder.infrastructure.strategy_cache import (
+    StrategyCache,
+    code_version,
+    content_digest,
+    strategy_files
+)
+
 __all__ = [
     "StrategyLogger",
     "NullLogger",
@@ -28,5 +35,9 @@ __all__ = [
     "ConfigurationLoader",
     "create_config_manager",
     "create_validation_service",
-    "create_configuration_loader"
+    "create_configuration_loader",
+    "StrategyCache",
+    "code_version",
+    "content_digest",
+    "strategy_files"
 ]
\ No newline at end of file
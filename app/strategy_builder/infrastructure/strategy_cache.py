@@ -0,0 +1,332 @@
+"""
+Cache of validated strategy models.
+
+Loading a strategy parses its YAML, validates it against the JSON schema and
+builds the pydantic TradingStrategy, which costs tens of milliseconds per
+file on every start and for every symbol folder. StrategyCache stores the
+resulting models in one binary file so that unchanged files skip all three
+steps.
+
+Entries are keyed by a SHA-256 digest of the YAML bytes and the schema
+bytes, so editing a file (or the schema) invalidates exactly the affected
+entries, and the same file under a different path (e.g. a config volume
+mounted elsewhere than where the cache was built) still hits. The file as a
+whole is tagged with a code version (cache format, model source, pydantic
+and Python versions); a mismatch discards it.
+
+File layout: a pickled ``{"version": str, "entries": {digest: (path,
+TradingStrategy)}}``, zlib-compressed, read in one call and written to a
+temporary name then renamed into place. The file is trusted like the code
+that reads it: only point the cache at a location the deployment controls.
+
+Several processes can share one file (e.g. the shards of a sharded
+orchestrator, each loading its own symbols). save() takes a lock file next
+to the cache, re-reads it and merges the entries other processes wrote
+since this one read it, so no process drops another's entries.
+
+Example:
+    ```python
+    cache = StrategyCache("config/strategies/.strategy_cache")
+    loader = StrategyLoader(schema_path, paths, config_loader, logger, cache=cache)
+    strategies = loader.load_strategies()       # misses are validated and stored
+    ```
+
+    ```bash
+    # Pre-build at image build time (or before mounting a config volume)
+    python -m app.strategy_builder.infrastructure.strategy_cache build \\
+        config/strategies/.strategy_cache config/strategies
+    ```
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import pickle
+import platform
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pydantic
+
+from app.strategy_builder.core.domain import enums, models
+from app.strategy_builder.core.domain.models import TradingStrategy
+
+
+CACHE_FORMAT = 1
+
+STRATEGY_SUFFIXES = (".yaml", ".yml")
+
+# Seconds save() waits for another process's lock, and after which a lock
+# left by a crashed process is taken over
+LOCK_TIMEOUT = 10.0
+LOCK_STALE_SECONDS = 60.0
+
+
+def code_version() -> str:
+    """
+    Version tag of the code that produces cached models.
+
+    Covers the cache format, the source of the domain models and enums, and
+    the pydantic and Python versions (pickled models depend on all of them).
+
+    Returns:
+        Hex digest identifying the current code
+    """
+    digest = hashlib.sha256(f"{CACHE_FORMAT}|{pydantic.VERSION}|{platform.python_version()}".encode())
+    for module in (models, enums):
+        try:
+            digest.update(Path(module.__file__).read_bytes())
+        except (OSError, TypeError):
+            digest.update(module.__name__.encode())     # source not shipped: format/versions only
+    return digest.hexdigest()
+
+
+def content_digest(config_bytes: bytes, schema_bytes: bytes) -> str:
+    """
+    Cache key of one strategy file.
+
+    Args:
+        config_bytes: Raw bytes of the strategy YAML
+        schema_bytes: Raw bytes of the validation schema
+
+    Returns:
+        Hex digest of both
+    """
+    digest = hashlib.sha256(schema_bytes)
+    digest.update(b"\0")
+    digest.update(config_bytes)
+    return digest.hexdigest()
+
+
+def strategy_files(paths: Sequence[str]) -> List[str]:
+    """
+    Expand folders into the strategy files they contain.
+
+    Args:
+        paths: Strategy files and/or folders (folders are searched recursively)
+
+    Returns:
+        File paths, folders expanded in sorted order
+    """
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                str(p) for p in sorted(Path(path).rglob("*")) if p.is_file() and p.suffix in STRATEGY_SUFFIXES
+            )
+        else:
+            files.append(path)
+    return files
+
+
+class StrategyCache:
+    """Binary file of validated TradingStrategy models keyed by content digest."""
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the cache; the file is read lazily on first use.
+
+        Args:
+            path: Cache file path (parent folders are created on save)
+            logger: Logger instance
+        """
+        self.path = Path(path)
+        self.logger = logger or logging.getLogger("strategy-cache")
+        self.version = code_version()
+        self._entries: Optional[Dict[str, Tuple[str, TradingStrategy]]] = None
+        self._added: Dict[str, Tuple[str, TradingStrategy]] = {}
+        self._cleared = False
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def get(self, digest: str) -> Optional[TradingStrategy]:
+        """
+        Look up a cached strategy.
+
+        Args:
+            digest: Key from content_digest()
+
+        Returns:
+            The cached model, or None on a miss
+        """
+        entry = self._load().get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def put(self, digest: str, path: str, strategy: TradingStrategy) -> None:
+        """
+        Store a validated strategy, replacing older entries of the same file.
+
+        Args:
+            digest: Key from content_digest()
+            path: Strategy file the model was loaded from
+            strategy: Validated model
+        """
+        entries = self._load()
+        if entries.get(digest, (None, None))[0] == path:
+            return
+        _replace_file_entry(entries, digest, path, strategy)
+        self._added[digest] = (path, strategy)
+        self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Write the cache file if anything changed.
+
+        Entries stored since the file was read are merged into its current
+        content (after a clear(), they replace it), under a lock shared with
+        other processes using the same file.
+
+        Returns:
+            True if the file was written
+        """
+        if not self._dirty:
+            return False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with self._locked():
+                entries = {} if self._cleared else self._read()
+                for digest, (path, strategy) in self._added.items():
+                    _replace_file_entry(entries, digest, path, strategy)
+                payload = {"version": self.version, "entries": entries}
+                tmp_path.write_bytes(zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)))
+                os.replace(tmp_path, self.path)
+        except (OSError, TimeoutError) as e:
+            tmp_path.unlink(missing_ok=True)
+            self.logger.warning(f"Could not write strategy cache {self.path}: {e}")
+            return False
+        self._entries = entries
+        self._added = {}
+        self._cleared = False
+        self._dirty = False
+        self.logger.info(f"Saved {len(entries)} strategies to cache {self.path}")
+        return True
+
+    def clear(self) -> None:
+        """Drop all entries (the file is rewritten on the next save)."""
+        self._entries = {}
+        self._added = {}
+        self._cleared = True
+        self._dirty = True
+
+    def _load(self) -> Dict[str, Tuple[str, TradingStrategy]]:
+        """Read the cache file once; unreadable or outdated files start empty."""
+        if self._entries is None:
+            self._entries = self._read(log=True)
+        return self._entries
+
+    def _read(self, log: bool = False) -> Dict[str, Tuple[str, TradingStrategy]]:
+        """Entries currently in the file (empty when missing, unreadable or outdated)."""
+        try:
+            payload = pickle.loads(zlib.decompress(self.path.read_bytes()))
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            if log:
+                self.logger.warning(f"Ignoring unreadable strategy cache {self.path}: {e}")
+            return {}
+
+        if not isinstance(payload, dict) or payload.get("version") != self.version:
+            if log:
+                self.logger.info(f"Strategy cache {self.path} was built by other code, rebuilding")
+            return {}
+        return payload["entries"]
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Hold the cache's lock file, shared by every process using the cache.
+
+        Raises:
+            TimeoutError: If another process holds the lock for LOCK_TIMEOUT seconds
+        """
+        lock_path = self.path.with_name(f"{self.path.name}.lock")
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - lock_path.stat().st_mtime > LOCK_STALE_SECONDS:
+                        lock_path.unlink(missing_ok=True)      # left by a crashed process
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"lock {lock_path} held for more than {LOCK_TIMEOUT}s")
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            lock_path.unlink(missing_ok=True)
+
+
+def _path_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _replace_file_entry(
+    entries: Dict[str, Tuple[str, TradingStrategy]], digest: str, path: str, strategy: TradingStrategy
+) -> None:
+    """Store an entry, dropping older entries of the same file."""
+    key = _path_key(path)
+    for stale in [d for d, (p, _) in entries.items() if _path_key(p) == key]:
+        del entries[stale]
+    entries[digest] = (path, strategy)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m app.strategy_builder.infrastructure.strategy_cache build CACHE config/strategies
+        python -m app.strategy_builder.infrastructure.strategy_cache check CACHE config/strategies
+    """
+    from app.strategy_builder.core.services.loader import StrategyLoader
+    from app.strategy_builder.factory import get_default_schema_path
+    from app.strategy_builder.infrastructure.config import create_configuration_loader
+    from app.strategy_builder.infrastructure.logging import create_null_logger
+
+    parser = argparse.ArgumentParser(description="Pre-build or check the validated strategy cache")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("cache_file")
+    parser.add_argument("paths", nargs="+", help="Strategy files or folders (searched recursively)")
+    parser.add_argument("--schema", help="Validation schema (default: the packaged schema)")
+    args = parser.parse_args(argv)
+
+    schema_path = args.schema or get_default_schema_path()
+    files = strategy_files(args.paths)
+    cache = StrategyCache(args.cache_file)
+
+    if args.command == "check":
+        schema_bytes = Path(schema_path).read_bytes()
+        stale = [f for f in files if cache.get(content_digest(Path(f).read_bytes(), schema_bytes)) is None]
+        for path in stale:
+            print(f"    stale {path}")
+        print(f"{len(files) - len(stale)}/{len(files)} strategy files cached in {args.cache_file}")
+        return 1 if stale else 0
+
+    cache.clear()
+    loader = StrategyLoader(schema_path, files, create_configuration_loader(), create_null_logger(), cache=cache)
+    strategies = loader.load_strategies()
+    print(f"Cached {len(strategies)} strategies from {len(files)} files in {args.cache_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,6 +9,7 @@ from typing import List, Optional, Dict, Any
 from decimal import Decimal
 
 from app.strategy_builder.data.dtos import EntryDecision, ExitDecision, StopLossResult, TakeProfitResult
+from app.utils import clock
 
 
 class TradeState(Enum):
@@ -48,7 +49,7 @@ class ScaledPosition:
     position_type: PositionType = PositionType.INITIAL
     
     # Timestamps
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=clock.now)
     filled_at: Optional[datetime] = None
     closed_at: Optional[datetime] = None
     
@@ -89,7 +90,7 @@ class ScaledPosition:
         """Update position with fill information."""
         self.filled_size += filled_size
         self.filled_price = filled_price
-        self.filled_at = datetime.now()
+        self.filled_at = clock.now()
         
         if self.filled_size >= self.position_size:
             self.state = TradeState.ACTIVE
@@ -124,7 +125,7 @@ class PositionGroup:
     total_risk_amount: float = 0.0
     
     # State tracking
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=clock.now)
     last_entry_at: Optional[datetime] = None
     
     # Performance tracking
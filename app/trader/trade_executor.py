@@ -3,7 +3,6 @@ Trade Executor V3 - Simplified and focused on orchestration only.
 """
 
 import logging
-from datetime import datetime
 from typing import Optional
 
 from app.strategy_builder.data.dtos import Trades
@@ -109,7 +108,7 @@ class TradeExecutor:
         self.logger.debug("Updating trading context")
         
         # Update time
-        self.context.current_time = datetime.now()
+        self.context.current_time = date_helper.now()
         
         # Fetch market state
         market_state = self._fetch_market_state(date_helper)
@@ -0,0 +1,186 @@
+"""
+Clock abstraction for wall-clock and simulated time.
+
+Every time read and sleep in the trading pipeline goes through a Clock so the
+same code can run live, against the system clock, or in a replay where time
+jumps from bar to bar without ever sleeping.
+
+- SystemClock reads the wall clock and really sleeps
+- SimulatedClock holds a settable "now"; sleep() advances it instantly
+
+The process-wide clock is the SystemClock until replaced with set_clock() or,
+for a bounded block, use_clock(). Components that need explicit injection
+(DateHelper) take a clock argument and fall back to the process-wide one.
+
+Example:
+    ```python
+    clock = SimulatedClock(datetime(2024, 1, 2, 9, 0))
+    with use_clock(clock):
+        engine = BarReplayEngine(event_bus, streams, clock=clock)
+        engine.run()            # clock follows each bar's close time
+    ```
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional, Union
+
+
+class Clock(ABC):
+    """Source of the current time and of sleeps."""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """Return the current local time as a naive datetime (like datetime.now())."""
+        pass
+
+    @abstractmethod
+    def time(self) -> float:
+        """Return the current time as epoch seconds (like time.time())."""
+        pass
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        """Return a never-decreasing seconds counter for measuring intervals."""
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """Wait for ``seconds``."""
+        pass
+
+
+class SystemClock(Clock):
+    """Wall-clock time with real sleeps."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class SimulatedClock(Clock):
+    """
+    Settable clock for replays and tests.
+
+    ``now()`` returns exactly the datetime last set (naive or tz-aware, as
+    given). ``sleep()`` returns immediately after advancing the clock, so a
+    polling loop runs as fast as the code inside it. Naive times are read as
+    UTC when converted to epoch seconds.
+    """
+
+    def __init__(self, start: Optional[datetime] = None):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial time (default: the current wall-clock time)
+        """
+        self._now = start if start is not None else datetime.now()
+        self._elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        with self._lock:
+            return self._now
+
+    def time(self) -> float:
+        current = self.now()
+        if current.tzinfo is None:
+            current = current.replace(tzinfo=timezone.utc)
+        return current.timestamp()
+
+    def monotonic(self) -> float:
+        with self._lock:
+            return self._elapsed
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.advance(seconds)
+
+    def set(self, value: datetime) -> None:
+        """
+        Jump the clock to ``value``.
+
+        Moving forward also advances monotonic(); moving backward (e.g. when a
+        new replay starts) leaves it where it is.
+
+        Args:
+            value: New current time
+        """
+        with self._lock:
+            try:
+                delta = (value - self._now).total_seconds()
+            except TypeError:
+                delta = 0.0              # naive <-> aware switch: no comparable interval
+            self._elapsed += max(delta, 0.0)
+            self._now = value
+
+    def advance(self, delta: Union[float, timedelta]) -> datetime:
+        """
+        Move the clock forward.
+
+        Args:
+            delta: Seconds or timedelta to advance by
+
+        Returns:
+            The new current time
+        """
+        if not isinstance(delta, timedelta):
+            delta = timedelta(seconds=delta)
+        if delta < timedelta(0):
+            raise ValueError(f"Cannot advance a clock backwards ({delta})")
+        with self._lock:
+            self._now += delta
+            self._elapsed += delta.total_seconds()
+            return self._now
+
+
+_clock: Clock = SystemClock()
+
+
+def get_clock() -> Clock:
+    """Return the process-wide clock."""
+    return _clock
+
+
+def set_clock(clock: Optional[Clock]) -> Clock:
+    """
+    Replace the process-wide clock.
+
+    Args:
+        clock: New clock (None restores the SystemClock)
+
+    Returns:
+        The previous clock
+    """
+    global _clock
+    previous = _clock
+    _clock = clock if clock is not None else SystemClock()
+    return previous
+
+
+@contextmanager
+def use_clock(clock: Clock) -> Iterator[Clock]:
+    """Install ``clock`` as the process-wide clock for the duration of a block."""
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
+
+
+def now() -> datetime:
+    """Current time from the process-wide clock (drop-in for datetime.now())."""
+    return _clock.now()
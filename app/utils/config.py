@@ -55,6 +55,8 @@ class LoadEnvironmentVariables:
 
         self.TRADE_MODE = ""
         self.BACKTEST_DATA_PATH = ""
+        self.BAR_CACHE_PATH = ""
+        self.STRATEGY_CACHE_PATH = ""
         self.DAILY_LOSS_LIMIT = 0.0
 
         self.RESTRICTION_CONF_FOLDER_PATH = ""
@@ -91,6 +93,8 @@ class LoadEnvironmentVariables:
         # Paths
         self.CONF_FOLDER_PATH = os.getenv('CONF_FOLDER_PATH')
         self.BACKTEST_DATA_PATH = os.getenv('BACKTEST_DATA_PATH')
+        self.BAR_CACHE_PATH = os.getenv('BAR_CACHE_PATH', '')  # Empty disables the local bar cache
+        self.STRATEGY_CACHE_PATH = os.getenv('STRATEGY_CACHE_PATH', '')  # Empty disables the strategy cache
         self.RESTRICTION_CONF_FOLDER_PATH = os.getenv('RESTRICTION_CONF_FOLDER_PATH')
 
         # Trading Mode
@@ -6,10 +6,11 @@ Simplifies the main entry point by encapsulating per-symbol component creation l
 """
 
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from app.utils.config import LoadEnvironmentVariables
+from app.data.bar_cache import BarCache
 from app.data.data_manger import DataSourceManager
 from app.entry_manager.manager import EntryManager
 from app.indicators.indicator_processor import IndicatorProcessor
@@ -18,7 +19,12 @@ from app.trader.executor_builder import ExecutorBuilder
 from app.utils.date_helper import DateHelper
 
 
-def load_strategies_for_symbol(folder_path: str, symbol: str, logger: logging.Logger):
+def load_strategies_for_symbol(
+    folder_path: str,
+    symbol: str,
+    logger: logging.Logger,
+    cache_path: Optional[str] = None
+):
     """
     Load strategy engine for a specific symbol.
 
@@ -26,6 +32,7 @@ def load_strategies_for_symbol(folder_path: str, symbol: str, logger: logging.Lo
         folder_path: Base configuration folder path
         symbol: Trading symbol (e.g., "XAUUSD")
         logger: Logger instance
+        cache_path: Validated strategy cache file shared by all symbols (None disables it)
 
     Returns:
         StrategyEngine for the symbol
@@ -55,7 +62,8 @@ def load_strategies_for_symbol(folder_path: str, symbol: str, logger: logging.Lo
 
     engine = StrategyEngineFactory.create_engine(
         config_paths=strategy_paths,
-        logger_name=f"trading-engine-{symbol.lower()}"
+        logger_name=f"trading-engine-{symbol.lower()}",
+        cache_path=cache_path
     )
 
     return engine
@@ -114,7 +122,8 @@ def load_all_components_for_symbols(
     client: Any,
     data_source: DataSourceManager,
     date_helper: DateHelper,
-    logger: logging.Logger
+    logger: logging.Logger,
+    config_symbols: Optional[Dict[str, str]] = None
 ) -> Dict[str, Dict[str, Any]]:
     """
     Load all components for all symbols.
@@ -126,6 +135,9 @@ def load_all_components_for_symbols(
         data_source: DataSourceManager
         date_helper: DateHelper
         logger: Logger instance
+        config_symbols: Optional symbol -> config folder symbol mapping, to run
+            a symbol with another symbol's strategies and indicators (default:
+            each symbol uses its own folder)
 
     Returns:
         Dict mapping symbol -> components dict with:
@@ -162,12 +174,14 @@ def load_all_components_for_symbols(
 
         # Get symbol-specific configuration
         symbol_config = env_config.get_symbol_config(symbol)
+        config_symbol = (config_symbols or {}).get(symbol, symbol)
 
         # Load strategies
         strategy_engine = load_strategies_for_symbol(
             folder_path=env_config.CONF_FOLDER_PATH,
-            symbol=symbol,
-            logger=logger
+            symbol=config_symbol,
+            logger=logger,
+            cache_path=env_config.STRATEGY_CACHE_PATH or None
         )
 
         # Create entry manager
@@ -187,7 +201,7 @@ def load_all_components_for_symbols(
         # Load indicator configuration
         indicator_config = load_indicators_for_symbol(
             folder_path=env_config.CONF_FOLDER_PATH,
-            symbol=symbol,
+            symbol=config_symbol,
             logger=logger
         )
 
@@ -213,12 +227,16 @@ def load_all_components_for_symbols(
                 logger.error(f"    ✗ Failed to load historical data for {symbol} {tf}: {e}")
                 historicals[tf] = None
 
-        # Create indicator processor
-        logger.info(f"  Creating IndicatorProcessor for {symbol}...")
+        # Create indicator processor, keeping as many recent rows as the deepest strategy lookback
+        depths = strategy_engine.lookback_depths()
+        recent_rows_limit = max([IndicatorProcessor.DEFAULT_RECENT_ROWS_LIMIT, *depths.values()])
+        logger.info(f"  Creating IndicatorProcessor for {symbol} ({recent_rows_limit} recent rows)...")
         indicator_processor = IndicatorProcessor(
             configs=indicator_config,
             historicals=historicals,
-            is_bulk=False
+            is_bulk=False,
+            recent_rows_limit=recent_rows_limit,
+            materialize_previous=False
         )
 
         # Create regime manager
@@ -278,3 +296,50 @@ def load_all_components_for_symbols(
     logger.info(f"\n=== Components loaded for {len(symbol_components)} symbols ===")
 
     return symbol_components
+
+
+def load_shard_components(symbols: List[str], env_path: str) -> Dict[str, Any]:
+    """
+    Build everything a shard process needs to run its symbols.
+
+    Used as the component factory for ShardedTradingOrchestrator. It runs inside
+    the shard process, so each shard gets its own MT5 client, data source and
+    per-symbol components. Bind ``env_path`` with ``functools.partial`` to keep
+    the factory picklable.
+
+    Args:
+        symbols: Symbols assigned to the shard
+        env_path: Path to the .env file
+
+    Returns:
+        Dict with client, data_source, date_helper and symbol_components
+    """
+    from app.clients.mt5.client import create_client_with_retry
+
+    logger = logging.getLogger(f"shard-loader-{'-'.join(s.lower() for s in symbols)}")
+
+    env_config = LoadEnvironmentVariables(env_path)
+    client = create_client_with_retry(env_config.API_BASE_URL)
+    date_helper = DateHelper()
+    data_source = DataSourceManager(
+        mode=env_config.TRADE_MODE,
+        client=client,
+        date_helper=date_helper,
+        bar_cache=BarCache(env_config.BAR_CACHE_PATH) if env_config.BAR_CACHE_PATH else None
+    )
+
+    symbol_components = load_all_components_for_symbols(
+        symbols=symbols,
+        env_config=env_config,
+        client=client,
+        data_source=data_source,
+        date_helper=date_helper,
+        logger=logger
+    )
+
+    return {
+        'client': client,
+        'data_source': data_source,
+        'date_helper': date_helper,
+        'symbol_components': symbol_components,
+    }
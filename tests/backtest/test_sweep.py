@@ -0,0 +1,165 @@
+"""
+Tests for the parallel parameter sweep.
+
+These tests verify that:
+- Grid and random parameter spaces are enumerated deterministically
+- Parameter paths are applied to strategy and indicator configurations
+- Shared arrays round-trip through shared memory as read-only views
+- Sweep results match direct VectorizedBacktester runs, inline and on a pool
+- Checkpointed sweeps resume without re-running stored parameter sets
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.backtest.sweep import ParameterSpace, ParameterSweep, SharedArrayStore, apply_parameters
+from app.backtest.vectorized import VectorizedBacktester
+from app.strategy_builder.core.domain.models import TradingStrategy
+
+
+STRATEGY = {
+    "name": "sweep-test",
+    "timeframes": ["1"],
+    "entry": {"long": {"mode": "all", "conditions": [
+        {"signal": "ema", "operator": "crosses_above", "value": "sma", "timeframe": "1"},
+        {"signal": "regime", "operator": "==", "value": "bull", "timeframe": "1"},
+    ]}},
+    "exit": {"long": {"mode": "any", "conditions": [
+        {"signal": "close", "operator": "<", "value": "sma", "timeframe": "1"},
+    ]}},
+    "risk": {
+        "position_sizing": {"type": "fixed", "value": 1.0},
+        "sl": {"type": "fixed", "value": 1.0},
+        "tp": {"type": "fixed", "value": 200.0},
+    },
+}
+
+INDICATORS = {"1": {"ema": {"period": 5}, "sma": {"period": 20}}}
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    """Random-walk M1 bars with a string regime column."""
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 0.3, 2000))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        "time": pd.date_range("2024-01-02", periods=len(close), freq="min"),
+        "open": open_,
+        "high": np.maximum(open_, close) + 0.1,
+        "low": np.minimum(open_, close) - 0.1,
+        "close": close,
+        "tick_volume": rng.integers(1, 100, len(close)),
+        "regime": np.where(np.r_[0, np.diff(close)] > 0, "bull", "bear"),
+    })
+
+
+class TestParameterSpace:
+    """Test parameter set enumeration."""
+
+    def test_grid_is_cartesian_product(self):
+        """Test a grid yields every combination in order."""
+        space = ParameterSpace.grid({"a": [1, 2], "b": ["x", "y", "z"]})
+
+        assert len(space) == 6
+        assert list(space)[:2] == [{"a": 1, "b": "x"}, {"a": 1, "b": "y"}]
+
+    def test_random_is_seeded_and_deduplicated(self):
+        """Test random search repeats with the same seed and drops duplicate draws."""
+        spec = {"random": {"period": {"low": 5, "high": 7}, "mode": ["all"]}, "samples": 50, "seed": 4}
+
+        first = list(ParameterSpace.from_dict(spec))
+        second = list(ParameterSpace.from_dict(spec))
+
+        assert first == second
+        assert sorted(p["period"] for p in first) == [5, 6, 7]
+
+
+class TestApplyParameters:
+    """Test dotted parameter paths."""
+
+    def test_paths_set_strategy_and_indicator_values(self):
+        """Test values land in copies of the strategy and indicator configurations."""
+        strategy, indicators = apply_parameters(STRATEGY, INDICATORS, {
+            "risk.sl.value": 2.5,
+            "entry.long.conditions.1.value": "bear",
+            "indicators.1.ema.period": 9,
+        })
+
+        assert strategy["risk"]["sl"]["value"] == 2.5
+        assert strategy["entry"]["long"]["conditions"][1]["value"] == "bear"
+        assert indicators["1"]["ema"]["period"] == 9
+        assert STRATEGY["risk"]["sl"]["value"] == 1.0
+        assert INDICATORS["1"]["ema"]["period"] == 5
+
+    def test_unknown_path_rejected(self):
+        """Test a path through a missing key raises KeyError."""
+        with pytest.raises(KeyError):
+            apply_parameters(STRATEGY, INDICATORS, {"risk.missing.value": 1})
+
+
+class TestSharedArrayStore:
+    """Test the shared memory block."""
+
+    def test_round_trip_read_only(self):
+        """Test published arrays are attached as equal, read-only views."""
+        store = SharedArrayStore()
+        store.add("1/close", np.linspace(1.0, 2.0, 7))
+        store.add("1/tick_volume", np.arange(5, dtype=np.int64))
+        spec = store.publish()
+        try:
+            shm, views = SharedArrayStore.attach(spec)
+            np.testing.assert_array_equal(views["1/close"], np.linspace(1.0, 2.0, 7))
+            np.testing.assert_array_equal(views["1/tick_volume"], np.arange(5))
+            assert not views["1/close"].flags.writeable
+            del views
+            shm.close()
+        finally:
+            store.close()
+
+
+class TestParameterSweep:
+    """Test sweep execution and checkpoints."""
+
+    def expected_profit(self, bars, params) -> float:
+        """Net profit of a direct backtest for one parameter set."""
+        strategy, indicators = apply_parameters(STRATEGY, INDICATORS, params)
+        backtester = VectorizedBacktester(
+            TradingStrategy(**strategy), {"1": bars}, pip_value=100.0, indicator_configs=indicators
+        )
+        return backtester.run().net_profit
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_match_direct_backtests(self, bars, workers):
+        """Test each row equals a direct VectorizedBacktester run, and indicators are computed once."""
+        space = ParameterSpace.grid({"indicators.1.ema.period": [3, 8], "risk.sl.value": [0.5, 2.0]})
+        sweep = ParameterSweep(STRATEGY, {"1": bars}, space, 100.0, indicator_configs=INDICATORS, workers=workers)
+
+        results = sweep.run()
+
+        assert results["error"].isna().all()
+        assert len(sweep._known_outputs) == 3          # ema(3), ema(8), sma(20)
+        assert results[["indicators.1.ema.period", "risk.sl.value"]].to_dict("records") == list(space)
+        for row in results.to_dict("records"):
+            params = {"indicators.1.ema.period": row["indicators.1.ema.period"], "risk.sl.value": row["risk.sl.value"]}
+            assert row["net_profit"] == pytest.approx(self.expected_profit(bars, params))
+
+    def test_checkpoint_resume(self, bars, tmp_path):
+        """Test a resumed sweep only runs parameter sets missing from the checkpoint."""
+        first_space = ParameterSpace.grid({"risk.sl.value": [0.5, 1.0, 2.0]})
+        ParameterSweep(
+            STRATEGY, {"1": bars}, first_space, 100.0, indicator_configs=INDICATORS,
+            workers=1, checkpoint_dir=str(tmp_path), checkpoint_every=2,
+        ).run()
+        assert len(list(tmp_path.glob("part-*.parquet"))) == 2
+
+        resumed = ParameterSweep(
+            STRATEGY, {"1": bars}, ParameterSpace.grid({"risk.sl.value": [0.5, 1.0, 2.0, 3.0]}), 100.0,
+            indicator_configs=INDICATORS, workers=1, checkpoint_dir=str(tmp_path),
+        )
+        results = resumed.run()
+
+        assert results["risk.sl.value"].tolist() == [0.5, 1.0, 2.0, 3.0]
+        assert len(list(tmp_path.glob("part-*.parquet"))) == 3
+        assert pd.read_parquet(tmp_path / "part-00002.parquet")["risk.sl.value"].tolist() == [3.0]
@@ -0,0 +1,297 @@
+"""
+Tests for the vectorized backtester.
+
+These tests verify that:
+- Higher timeframes are aligned to the base timeframe by last-closed bar
+- Compiled rules match StrategyExecutor bar for bar (parity check), including
+  lookback references and rising/falling read from deeper buffers
+- The trade loop applies stop loss, take profit targets and time-based exits
+- Unsupported risk models and disabled strategies are handled explicitly
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.backtest.vectorized import VectorizedBacktester
+from app.strategy_builder.core.domain.models import TradingStrategy
+
+
+def make_bars(close, start: str = "2024-01-02", freq: str = "min", spread: float = 0.1) -> pd.DataFrame:
+    """Create bars from a close path; each bar opens at the previous close."""
+    close = np.asarray(close, dtype=float)
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        "time": pd.date_range(start, periods=len(close), freq=freq),
+        "open": open_,
+        "high": np.maximum(open_, close) + spread,
+        "low": np.minimum(open_, close) - spread,
+        "close": close,
+        "tick_volume": np.arange(len(close)) % 100,
+    })
+
+
+def resample(bars: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """Aggregate base bars into a higher timeframe."""
+    return bars.set_index("time").resample(rule).agg({
+        "open": "first", "high": "max", "low": "min", "close": "last", "tick_volume": "sum",
+    }).reset_index()
+
+
+def make_strategy(entry_long, exit_long=None, risk=None, timeframes=("1",), **extra) -> TradingStrategy:
+    """Build a long-only strategy from rule dictionaries."""
+    config = {
+        "name": "vectorized-test",
+        "timeframes": list(timeframes),
+        "entry": {"long": entry_long},
+        "risk": risk or {
+            "position_sizing": {"type": "fixed", "value": 1.0},
+            "sl": {"type": "fixed", "value": 5.0},
+            "tp": {"type": "fixed", "value": 500.0},
+        },
+        **extra,
+    }
+    if exit_long:
+        config["exit"] = {"long": exit_long}
+    return TradingStrategy(**config)
+
+
+def enter_at(index: int) -> dict:
+    """Entry rule firing on the bar whose close is exactly 100 + index / 1000."""
+    return {"mode": "all", "conditions": [
+        {"signal": "close", "operator": "==", "value": 100 + index / 1000, "timeframe": "1"},
+    ]}
+
+
+class TestTimeframeAlignment:
+    """Test last-closed-bar alignment."""
+
+    def test_higher_timeframe_visible_after_its_close(self):
+        """Test an M15 bar is only visible from the M1 bar closing with it."""
+        base = make_bars(np.linspace(100, 101, 60))
+        m15 = resample(base, "15min")
+        strategy = make_strategy(enter_at(0), timeframes=("1", "15"))
+
+        backtester = VectorizedBacktester(strategy, {"1": base, "15": m15}, pip_value=100.0)
+        rows = backtester._rows["15"]
+
+        assert (rows[:14] == -1).all()          # M1 bars closing 00:01-00:14
+        assert rows[14] == 0                    # 00:14 bar closes at 00:15 with the first M15 bar
+        assert rows[29] == 1
+        assert rows[-1] == 3
+
+
+class TestRuleCompilation:
+    """Test compiled rules against the event-driven evaluation."""
+
+    def test_parity_with_strategy_executor(self):
+        """Test mixed numeric, string and tree rules give the executor's signals on every bar."""
+        rng = np.random.default_rng(7)
+        base = make_bars(100 + np.cumsum(rng.normal(0, 0.3, 600)))
+        m15 = resample(base, "15min")
+        m15["regime"] = np.where(m15["close"].diff().fillna(0) > 0, "Bull", "bear")
+
+        strategy = TradingStrategy(**{
+            "name": "parity",
+            "timeframes": ["1", "15"],
+            "entry": {
+                "long": {"mode": "complex", "tree": {"operator": "and", "conditions": [
+                    {"signal": "ema", "operator": "crosses_above", "value": "sma", "timeframe": "1"},
+                    {"operator": "or", "conditions": [
+                        {"signal": "regime", "operator": "==", "value": "bull", "timeframe": "15"},
+                        {"operator": "not", "conditions": [
+                            {"signal": "rsi", "operator": "<=", "value": 55, "timeframe": "1"},
+                        ]},
+                    ]},
+                ]}},
+                "short": {"mode": "any", "conditions": [
+                    {"signal": "regime", "operator": "changes_to", "value": "bear", "timeframe": "15"},
+                    {"signal": "tick_volume", "operator": ">", "value": 97.5, "timeframe": "1"},
+                    {"signal": "regime", "operator": "in", "value": ["unknown"], "timeframe": "15"},
+                ]},
+            },
+            "exit": {
+                "long": {"mode": "any", "conditions": [
+                    {"signal": "close", "operator": "<", "value": "previous_close", "timeframe": "15"},
+                ]},
+                "short": {"mode": "all", "conditions": [
+                    {"signal": "rsi", "operator": "crosses_below", "value": 40, "timeframe": "1"},
+                    {"signal": "regime", "operator": "remains", "value": "bear", "timeframe": "15"},
+                ]},
+            },
+            "risk": {
+                "position_sizing": {"type": "percentage", "value": 1.0},
+                "sl": {"type": "fixed", "value": 2.0},
+                "tp": {"type": "fixed", "value": 300.0},
+            },
+        })
+        indicators = {"1": {"ema": {"period": 10}, "sma": {"period": 30}, "rsi": {"period": 14}}}
+
+        backtester = VectorizedBacktester(
+            strategy, {"1": base, "15": m15}, pip_value=100.0, indicator_configs=indicators
+        )
+        signals = backtester.signals()
+        report = backtester.check_parity(max_bars=len(base))
+
+        assert report.bars_checked == len(base)
+        assert report.ok, report.mismatches[:5]
+        assert all(signals[name].any() for name in signals)
+
+    def test_lookback_parity_with_strategy_executor(self):
+        """Test offsets, windows, shifted crosses and trends give the executor's signals on every bar."""
+        rng = np.random.default_rng(11)
+        base = make_bars(100 + np.cumsum(rng.normal(0, 0.3, 600)))
+        m15 = resample(base, "15min")
+        m15["regime"] = np.where(m15["close"].diff().fillna(0) > 0, "bull", "bear")
+
+        strategy = TradingStrategy(**{
+            "name": "lookback-parity",
+            "timeframes": ["1", "15"],
+            "entry": {
+                "long": {"mode": "any", "conditions": [
+                    {"signal": "close", "operator": ">", "value": "max(high[-1], 5)", "timeframe": "1"},
+                    {"signal": "ema[-2]", "operator": "crosses_above", "value": "sma[-2]", "timeframe": "1"},
+                    {"signal": "close", "operator": "rising", "value": 3, "timeframe": "15"},
+                ]},
+                "short": {"mode": "all", "conditions": [
+                    {"signal": "regime[-1]", "operator": "changes_to", "value": "bear", "timeframe": "15"},
+                    {"signal": "tick_volume[-1]", "operator": ">=", "value": 20.5, "timeframe": "1"},
+                ]},
+            },
+            "exit": {
+                "long": {"mode": "any", "conditions": [
+                    {"signal": "close[-1]", "operator": "falling", "value": 2, "timeframe": "1"},
+                    {"signal": "min(low, 30)", "operator": "!=", "value": "min(low[-1], 30)", "timeframe": "1"},
+                ]},
+                "short": {"mode": "all", "conditions": [
+                    {"signal": "rsi", "operator": "crosses_below", "value": "rsi[-3]", "timeframe": "1"},
+                    {"signal": "max(tick_volume, 4)", "operator": ">", "value": 60, "timeframe": "1"},
+                ]},
+            },
+            "risk": {
+                "position_sizing": {"type": "fixed", "value": 1.0},
+                "sl": {"type": "fixed", "value": 2.0},
+                "tp": {"type": "fixed", "value": 300.0},
+            },
+        })
+        indicators = {"1": {"ema": {"period": 10}, "sma": {"period": 30}, "rsi": {"period": 14}}}
+
+        backtester = VectorizedBacktester(
+            strategy, {"1": base, "15": m15}, pip_value=100.0, indicator_configs=indicators
+        )
+        signals = backtester.signals()
+        report = backtester.check_parity(max_bars=len(base))
+
+        assert report.ok, report.mismatches[:5]
+        assert all(signals[name].any() for name in signals)
+        window_changed = backtester.compile_condition(strategy.exit.long.conditions[1])
+        assert not window_changed[:30].any()                 # min(low[-1], 30) needs 31 M1 rows
+        assert window_changed[30:].any()
+
+    def test_lookback_conditions_trade(self):
+        """Test strategies using only lookback conditions produce fills."""
+        rng = np.random.default_rng(3)
+        base = make_bars(100 + np.cumsum(rng.normal(0, 0.3, 400)))
+
+        for condition in [
+            {"signal": "close", "operator": "rising", "value": 2},
+            {"signal": "close", "operator": ">", "value": "close[-1]"},
+            {"signal": "close[-1]", "operator": "<", "value": "close"},
+        ]:
+            strategy = make_strategy({"mode": "all", "conditions": [{**condition, "timeframe": "1"}]})
+
+            result = VectorizedBacktester(strategy, {"1": base}, pip_value=100.0).run()
+
+            assert not result.trades.empty, condition
+
+    def test_disabled_strategy_has_no_signals(self):
+        """Test activation.enabled=false switches every signal off."""
+        base = make_bars(np.full(20, 100.0))
+        strategy = make_strategy(enter_at(0), activation={"enabled": False})
+
+        backtester = VectorizedBacktester(strategy, {"1": base}, pip_value=100.0)
+
+        assert not any(values.any() for values in backtester.signals().values())
+        assert backtester.run().trades.empty
+
+
+class TestTradeSimulation:
+    """Test the numba trade loop."""
+
+    def test_take_profit_and_stop_loss(self):
+        """Test fills at the target and stop levels, with the stop winning a bar that touches both."""
+        # Enter at 100 (bar 0): TP at 101 hit on bar 2; re-enter at 100 (bar 4): SL at 99 hit on bar 6
+        path = [100, 100.5, 101.2, 100.5, 100, 99.5, 98.8, 98.8]
+        base = make_bars(path, spread=0.0)
+        strategy = make_strategy(enter_at(0), risk={
+            "position_sizing": {"type": "fixed", "value": 2.0},
+            "sl": {"type": "fixed", "value": 1.0},
+            "tp": {"type": "fixed", "value": 100.0},
+        })
+
+        trades = VectorizedBacktester(strategy, {"1": base}, pip_value=100.0).run().trades
+
+        assert trades["reason"].tolist() == ["take_profit", "stop_loss"]
+        assert trades["exit_price"].tolist() == [101.0, 99.0]
+        assert trades["pnl"].tolist() == pytest.approx([2.0, -2.0])
+
+    def test_multi_target_partial_fills_move_stop(self):
+        """Test partial take profits and the stop moving to entry after the first target."""
+        path = [100, 100.6, 100.2, 99.9, 99.9]
+        base = make_bars(path, spread=0.0)
+        strategy = make_strategy(enter_at(0), risk={
+            "position_sizing": {"type": "fixed", "value": 1.0},
+            "sl": {"type": "fixed", "value": 2.0},
+            "tp": {"type": "multi_target", "targets": [
+                {"value": 0.5, "percent": 60, "move_stop": True},
+                {"value": 2.0, "percent": 40},
+            ]},
+        })
+
+        trades = VectorizedBacktester(strategy, {"1": base}, pip_value=100.0).run().trades
+
+        assert trades["reason"].tolist() == ["take_profit", "stop_loss"]
+        assert trades["units"].tolist() == pytest.approx([0.6, 0.4])
+        assert trades["exit_price"].tolist() == pytest.approx([100.5, 100.0])
+
+    def test_time_based_exit_uses_bar_time(self):
+        """Test max_duration closes the position after the configured bar time."""
+        base = make_bars(np.full(10, 100.0), freq="h", spread=0.0)
+        strategy = make_strategy(
+            enter_at(0),
+            exit_long={"mode": "any", "time_based": {"max_duration": "3h"}},
+        )
+
+        result = VectorizedBacktester(strategy, {"1": base}, pip_value=100.0).run()
+        first = result.trades.iloc[0]
+
+        assert first["reason"] == "time"
+        assert first["exit_time"] - first["entry_time"] == pd.Timedelta(hours=3)
+        assert len(result.equity) == len(base)
+
+    def test_indicator_take_profit_rejected(self):
+        """Test take profit types EntryManager cannot calculate are rejected."""
+        base = make_bars(np.full(5, 100.0))
+        strategy = make_strategy(enter_at(0), risk={
+            "position_sizing": {"type": "fixed", "value": 1.0},
+            "sl": {"type": "fixed", "value": 1.0},
+            "tp": {"type": "indicator", "source": "ema", "timeframe": "1"},
+        })
+
+        with pytest.raises(ValueError):
+            VectorizedBacktester(strategy, {"1": base}, pip_value=100.0).run()
+
+    def test_window_run_closes_at_window_end(self):
+        """Test a windowed run only trades its bars and closes open positions at the window end."""
+        base = make_bars(np.full(10, 100.0), freq="h", spread=0.0)
+        strategy = make_strategy(enter_at(0))
+        backtester = VectorizedBacktester(strategy, {"1": base}, pip_value=100.0)
+
+        result = backtester.run(start=base["time"][2], end=base["time"][6], initial_balance=500.0)
+
+        assert result.bars == 4
+        assert result.equity.index[0] == base["time"][2]
+        assert result.trades["entry_time"].tolist() == [base["time"][2]]
+        assert result.trades["exit_time"].tolist() == [base["time"][5]]
+        assert result.trades["reason"].tolist() == ["end_of_data"]
+        assert result.initial_balance == 500.0
@@ -0,0 +1,112 @@
+"""
+Tests for walk-forward optimisation.
+
+These tests verify that:
+- Rolling and anchored windows tile the history without overlapping out-of-sample ranges
+- Each window selects the parameter set with the best in-sample objective
+- Out-of-sample runs match direct windowed backtests with chained balances
+- Results are the same inline and on a process pool
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.backtest.sweep import ParameterSpace, apply_parameters
+from app.backtest.vectorized import VectorizedBacktester
+from app.backtest.walk_forward import WalkForwardOptimizer, walk_forward_windows
+from app.strategy_builder.core.domain.models import TradingStrategy
+
+from tests.backtest.test_sweep import INDICATORS, STRATEGY
+
+
+SPACE = ParameterSpace.grid({"indicators.1.ema.period": [3, 8], "risk.sl.value": [0.5, 2.0]})
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    """Five days of random-walk M1 bars with a string regime column."""
+    rng = np.random.default_rng(11)
+    close = 100 + np.cumsum(rng.normal(0, 0.3, 5 * 1440))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        "time": pd.date_range("2024-01-02", periods=len(close), freq="min"),
+        "open": open_,
+        "high": np.maximum(open_, close) + 0.1,
+        "low": np.minimum(open_, close) - 0.1,
+        "close": close,
+        "tick_volume": rng.integers(1, 100, len(close)),
+        "regime": np.where(np.r_[0, np.diff(close)] > 0, "bull", "bear"),
+    })
+
+
+def direct_backtester(bars, params) -> VectorizedBacktester:
+    """Full-span backtester for one parameter set, built without the optimizer."""
+    strategy, indicators = apply_parameters(STRATEGY, INDICATORS, params)
+    return VectorizedBacktester(TradingStrategy(**strategy), {"1": bars}, pip_value=100.0, indicator_configs=indicators)
+
+
+class TestWindows:
+    """Test window generation."""
+
+    def test_rolling_windows(self):
+        """Test in-sample ranges roll by the step and out-of-sample ranges follow them."""
+        times = pd.date_range("2024-01-01", periods=10 * 24, freq="h")
+
+        windows = walk_forward_windows(times, "3D", "2D")
+
+        assert [w.in_sample_start.day for w in windows] == [1, 3, 5, 7]
+        assert all(w.out_of_sample_start == w.in_sample_end for w in windows)
+        assert all(a.out_of_sample_end == b.out_of_sample_start for a, b in zip(windows, windows[1:]))
+
+    def test_anchored_windows_start_at_first_bar(self):
+        """Test anchored in-sample ranges grow from the first bar."""
+        times = pd.date_range("2024-01-01", periods=10 * 24, freq="h")
+
+        windows = walk_forward_windows(times, "3D", "2D", anchored=True)
+
+        assert {w.in_sample_start for w in windows} == {times[0]}
+        assert [w.in_sample_end.day for w in windows] == [4, 6, 8, 10]
+
+    def test_overlapping_out_of_sample_rejected(self):
+        """Test a step shorter than the out-of-sample range is rejected."""
+        times = pd.date_range("2024-01-01", periods=100, freq="h")
+
+        with pytest.raises(ValueError):
+            walk_forward_windows(times, "1D", "12h", step="6h")
+
+
+class TestWalkForwardOptimizer:
+    """Test optimisation and out-of-sample stitching."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_direct_backtests(self, bars, workers):
+        """Test selections and out-of-sample results against direct windowed runs."""
+        result = WalkForwardOptimizer(
+            STRATEGY, {"1": bars}, SPACE, 100.0, "2D", "1D", indicator_configs=INDICATORS, workers=workers,
+        ).run()
+        backtesters = [direct_backtester(bars, params) for params in SPACE]
+
+        assert len(result.windows) == 3
+        assert len(result.evaluations) == 3 * len(SPACE)
+        balance = 10000.0
+        for row in result.windows.to_dict("records"):
+            in_sample = [
+                b.run(start=row["in_sample_start"], end=row["in_sample_end"]).net_profit for b in backtesters
+            ]
+            best = int(np.argmax(in_sample))
+            assert row["indicators.1.ema.period"] == list(SPACE)[best]["indicators.1.ema.period"]
+            assert row["risk.sl.value"] == list(SPACE)[best]["risk.sl.value"]
+            assert row["in_sample_net_profit"] == pytest.approx(in_sample[best])
+
+            expected = backtesters[best].run(
+                start=row["out_of_sample_start"], end=row["out_of_sample_end"], initial_balance=balance
+            )
+            assert row["net_profit"] == pytest.approx(expected.net_profit)
+            assert row["start_balance"] == pytest.approx(balance)
+            balance = expected.final_balance
+
+        assert result.final_balance == pytest.approx(balance)
+        assert result.equity.index.is_monotonic_increasing
+        assert result.equity.index[0] == result.windows["out_of_sample_start"].iloc[0]
+        assert len(result.equity) == result.windows["bars"].sum()
@@ -0,0 +1,145 @@
+"""
+Unit tests for DataClient class.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from app.clients.mt5.api.data import DataClient
+from app.clients.mt5.exceptions import MT5ValidationError
+
+
+def make_bar(hour: int, close: float = 1.1, tz=None) -> dict:
+    """Create a raw bar dict as returned by the API."""
+    return {
+        "time": datetime(2023, 1, 1, hour, 0, 0, tzinfo=tz).isoformat(),
+        "open": 1.1,
+        "high": 1.2,
+        "low": 1.0,
+        "close": close,
+        "tick_volume": 100,
+    }
+
+
+class TestDataClientCursorFetch:
+    """Test fetch_bars cursor (since) mode."""
+
+    @patch('app.clients.mt5.base.BaseClient.get')
+    def test_latest_bars_mode_unchanged(self, mock_get):
+        """Test that num_bars mode still sends num_bars only."""
+        mock_get.return_value = [make_bar(1), make_bar(2)]
+
+        client = DataClient("http://localhost:8000")
+        bars = client.fetch_bars("eurusd", timeframe="H1", num_bars=2)
+
+        mock_get.assert_called_once_with("symbols/EURUSD/bars", params={"timeframe": "H1", "num_bars": 2})
+        assert len(bars) == 2
+
+    @patch('app.clients.mt5.base.BaseClient.get')
+    def test_since_uses_start_parameter(self, mock_get):
+        """Test that the cursor is sent as the existing start parameter."""
+        mock_get.return_value = []
+
+        client = DataClient("http://localhost:8000")
+        client.fetch_bars("EURUSD", timeframe="H1", since=datetime(2023, 1, 1, 1, 0, 0))
+
+        mock_get.assert_called_once_with(
+            "symbols/EURUSD/bars",
+            params={"timeframe": "H1", "start": "2023-01-01T01:00:00"}
+        )
+
+    @patch('app.clients.mt5.base.BaseClient.get')
+    def test_since_drops_seen_bars_and_duplicates(self, mock_get):
+        """Test that bars at/before the cursor are dropped and duplicates collapse in time order."""
+        mock_get.return_value = [
+            make_bar(1),
+            make_bar(3, close=1.13),
+            make_bar(2),
+            make_bar(3, close=1.14),
+        ]
+
+        client = DataClient("http://localhost:8000")
+        bars = client.fetch_bars("EURUSD", timeframe="H1", since=datetime(2023, 1, 1, 1, 0, 0))
+
+        assert [bar.time.hour for bar in bars] == [2, 3]
+        assert bars[-1].close == 1.14
+
+    @patch('app.clients.mt5.base.BaseClient.get')
+    def test_since_naive_cursor_with_aware_bar_times(self, mock_get):
+        """Test that a naive cursor is compared as UTC against timezone-aware bar times."""
+        mock_get.return_value = [make_bar(1, tz=timezone.utc), make_bar(2, tz=timezone.utc)]
+
+        client = DataClient("http://localhost:8000")
+        bars = client.fetch_bars("EURUSD", timeframe="H1", since=datetime(2023, 1, 1, 1, 0, 0))
+
+        assert [bar.time.hour for bar in bars] == [2]
+
+
+class TestDataClientColumnarFetch:
+    """Test the columnar fetch_bars_frame decode path."""
+
+    @patch('app.clients.mt5.base.BaseClient.get')
+    def test_matches_pydantic_path(self, mock_get):
+        """Test that the columnar frame equals the DataFrame built from HistoricalBar models."""
+        raw = [make_bar(hour, close=1.1 + hour / 100, tz=timezone.utc) for hour in range(5)]
+        raw[2]["spread"] = 3
+        mock_get.side_effect = lambda *args, **kwargs: [dict(bar) for bar in raw]
+
+        client = DataClient("http://localhost:8000")
+        frame = client.fetch_bars_frame("EURUSD", timeframe="H1", start=datetime(2023, 1, 1))
+
+        expected = pd.DataFrame([bar.model_dump() for bar in client.fetch_bars(
+            "EURUSD", timeframe="H1", start=datetime(2023, 1, 1)
+        )])
+        expected["time"] = pd.to_datetime(expected["time"])
+
+        pd.testing.assert_series_equal(frame["time"], expected["time"], check_dtype=False)
+        for name in ("open", "high", "low", "close", "tick_volume"):
+            assert frame[name].tolist() == expected[name].tolist()
+        assert frame["tick_volume"].dtype == np.int64
+        assert frame["spread"].isna().sum() == 4
+
+    @patch('app.clients.mt5.base.BaseClient.get')
+    def test_since_filters_and_dedupes(self, mock_get):
+        """Test cursor mode on the columnar path."""
+        mock_get.return_value = [make_bar(1), make_bar(3, close=1.13), make_bar(2), make_bar(3, close=1.14)]
+
+        client = DataClient("http://localhost:8000")
+        frame = client.fetch_bars_frame("EURUSD", timeframe="H1", since=datetime(2023, 1, 1, 1, 0, 0))
+
+        assert frame["time"].dt.hour.tolist() == [2, 3]
+        assert frame["close"].iloc[-1] == 1.14
+
+    @patch('app.clients.mt5.base.BaseClient.get')
+    def test_empty_response(self, mock_get):
+        """Test that no bars gives an empty frame."""
+        mock_get.return_value = []
+
+        client = DataClient("http://localhost:8000")
+
+        assert client.fetch_bars_frame("EURUSD", timeframe="H1", num_bars=5).empty
+
+    @pytest.mark.parametrize("field,value", [
+        ("close", None),
+        ("high", "abc"),
+        ("tick_volume", -1),
+        ("tick_volume", 1.5),
+    ])
+    def test_invalid_values_rejected(self, field, value):
+        """Test that malformed bars raise MT5ValidationError."""
+        raw = [make_bar(1), make_bar(2)]
+        raw[1][field] = value
+
+        with pytest.raises(MT5ValidationError):
+            DataClient.decode_bars(raw)
+
+    def test_missing_field_rejected(self):
+        """Test that a bar without a required field raises MT5ValidationError."""
+        raw = [make_bar(1), make_bar(2)]
+        del raw[0]["open"]
+
+        with pytest.raises(MT5ValidationError, match="open"):
+            DataClient.decode_bars(raw)
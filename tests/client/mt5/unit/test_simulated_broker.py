@@ -0,0 +1,180 @@
+"""
+Tests for the in-process simulated MT5 broker.
+
+These tests verify that:
+- Market orders fill at bid/ask with spread and slippage, and SL/TP close on later bars
+- Pending limit and stop orders trigger on the bar range, including gaps
+- Partial closes, commission and swaps are reflected in balance and closed-position history
+- LiveTrader and AccountStopLossManager work unchanged against SimulatedMT5Client
+- Only the attached timeframe of a bar replay drives fills
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from app.clients.mt5.exceptions import MT5APIError
+from app.clients.mt5.simulated import SimulatedBroker, SimulatedMT5Client, SymbolSpec
+from app.events.data_events import NewCandleEvent
+from app.infrastructure.bar_replay import BarReplayEngine
+from app.infrastructure.event_bus import EventBus
+from app.risk.account_stop_loss import AccountStopLossConfig, AccountStopLossManager
+from app.trader.live_trader import LiveTrader
+
+
+def bar(open_, high, low, close) -> dict:
+    return {"open": open_, "high": high, "low": low, "close": close}
+
+
+@pytest.fixture
+def broker() -> SimulatedBroker:
+    """Gold-like symbol: 100 units per lot, 0.2 spread, 3.5 commission per lot."""
+    broker = SimulatedBroker(
+        {"XAUUSD": SymbolSpec(contract_size=100, spread=0.2, commission_per_lot=3.5, digits=2)},
+        balance=10000.0,
+    )
+    broker.set_price("XAUUSD", 2000.0, datetime(2024, 1, 2, 10, 0))
+    return broker
+
+
+@pytest.fixture
+def client(broker) -> SimulatedMT5Client:
+    return SimulatedMT5Client(broker)
+
+
+class TestFills:
+    """Test order and exit fills."""
+
+    def test_market_order_and_take_profit(self, broker, client):
+        """Test a buy fills at the ask and closes at its TP on a later bar."""
+        result = client.orders.create_buy_order("XAUUSD", 0.1, stop_loss=1990.0, take_profit=2010.0)
+        assert result["retcode"] == 10009
+        assert client.positions.get_open_positions()[0].price_open == 2000.2
+
+        broker.on_bar("XAUUSD", bar(2000, 2005, 1995, 2004), datetime(2024, 1, 2, 10, 1))
+        assert len(broker.positions) == 1
+
+        broker.on_bar("XAUUSD", bar(2004, 2012, 2003, 2011), datetime(2024, 1, 2, 10, 2))
+        closed = client.history.get_closed_positions()
+
+        assert broker.positions == {}
+        assert closed[0]["price"] == 2010.0
+        assert closed[0]["reason"] == 5
+        assert closed[0]["profit"] == pytest.approx((2010.0 - 2000.2) * 0.1 * 100)
+        assert broker.balance == pytest.approx(10000.0 + closed[0]["profit"] - 0.7)
+
+    def test_stop_loss_wins_when_bar_touches_both(self, broker, client):
+        """Test a bar through both SL and TP closes at the stop."""
+        client.orders.create_sell_order("XAUUSD", 0.1, stop_loss=2005.0, take_profit=1995.0)
+
+        broker.on_bar("XAUUSD", bar(2000, 2010, 1990, 2000), datetime(2024, 1, 2, 10, 1))
+
+        assert client.history.get_closed_positions()[0]["reason"] == 4
+        assert client.history.get_closed_positions()[0]["price"] == 2005.0
+
+    def test_pending_orders_trigger_on_range_and_gap(self, broker, client):
+        """Test limits fill at their price, stops at the gapped open plus slippage."""
+        broker.spec("XAUUSD").slippage = 0.1
+        limit = client.orders.create_buy_limit_order("XAUUSD", 0.1, price=1995.0)["order"]
+        stop = client.orders.create_buy_stop_order("XAUUSD", 0.1, price=2003.0)["order"]
+
+        broker.on_bar("XAUUSD", bar(2000, 2001, 1994, 1996), datetime(2024, 1, 2, 10, 1))
+        assert broker.positions[limit].price_open == 1995.0
+        assert stop in broker.orders
+
+        broker.on_bar("XAUUSD", bar(2006, 2008, 2005, 2007), datetime(2024, 1, 2, 10, 2))
+        assert broker.positions[stop].price_open == pytest.approx(2006.3)
+        assert broker.orders == {}
+
+    def test_invalid_pending_price_rejected(self, client):
+        """Test a buy limit above the ask is rejected like MT5 (invalid price)."""
+        with pytest.raises(MT5APIError):
+            client.orders.create_buy_limit_order("XAUUSD", 0.1, price=2010.0)
+
+
+class TestAccounting:
+    """Test partial closes, swaps and history."""
+
+    def test_partial_close_and_swap(self, broker, client):
+        """Test a partial close splits costs and swaps accrue at rollover."""
+        broker.spec("XAUUSD").swap_long = -2.0
+        ticket = client.orders.create_buy_order("XAUUSD", 0.2)["order"]
+
+        broker.on_bar("XAUUSD", bar(2000, 2001, 1999, 2001), datetime(2024, 1, 3, 0, 1))   # Tue -> Wed rollover
+        assert broker.positions[ticket].swap == pytest.approx(-0.4)
+
+        result = client.positions.close_position("XAUUSD", ticket, 0.1)
+        assert result["retcode"] == 10009
+        assert broker.positions[ticket].volume == pytest.approx(0.1)
+
+        deal = client.history.get_closed_positions()[0]
+        assert deal["position_id"] == ticket
+        assert deal["swap"] == pytest.approx(-0.2)
+        assert deal["commission"] == pytest.approx(-0.7)
+        assert broker.balance == pytest.approx(10000.0 - 0.7 + deal["profit"] + deal["swap"] - 0.35)
+
+    def test_triple_swap_weekday(self, broker, client):
+        """Test the Wednesday rollover charges three days of swap."""
+        broker.spec("XAUUSD").swap_long = -1.0
+        ticket = client.orders.create_buy_order("XAUUSD", 1.0)["order"]
+
+        broker.on_bar("XAUUSD", bar(2000, 2000, 2000, 2000), datetime(2024, 1, 4, 0, 1))   # Tue and Wed rollovers
+
+        assert broker.positions[ticket].swap == pytest.approx(-4.0)
+
+
+class TestConsumers:
+    """Test the trading components run unchanged on the simulated client."""
+
+    def test_live_trader_surface(self, broker, client):
+        """Test LiveTrader positions, pending orders, updates and closed history."""
+        trader = LiveTrader(client)
+        client.orders.create_sell_limit_order("XAUUSD", 0.1, price=2005.0)
+        client.orders.create_buy_order("XAUUSD", 0.1)
+
+        assert trader.get_current_price("XAUUSD") == 2000.0
+        assert [o.type for o in trader.get_pending_orders("XAUUSD")] == [3]
+
+        ticket = trader.get_open_positions("XAUUSD")[0].ticket
+        assert trader.update_open_position("XAUUSD", ticket, sl=1990.0)["retcode"] == 10009
+        assert broker.positions[ticket].sl == 1990.0
+
+        trader.cancel_all_pending_orders()
+        trader.close_open_position("XAUUSD", ticket)
+
+        assert trader.get_pending_orders() == []
+        assert trader.get_open_positions() == []
+        assert [p.position_id for p in trader.get_closed_positions("2024-01-01", "2024-01-31")] == [ticket]
+        assert trader.get_account_info()["balance"] == pytest.approx(broker.balance)
+
+    def test_account_stop_loss_closes_everything(self, broker, client):
+        """Test AccountStopLossManager closes all positions through the simulated client."""
+        client.orders.create_buy_order("XAUUSD", 0.1)
+        client.orders.create_sell_order("XAUUSD", 0.2)
+        manager = AccountStopLossManager(AccountStopLossConfig(), client)
+
+        manager.manual_stop("test")
+
+        assert broker.positions == {}
+        assert len(broker.history) == 2
+
+    def test_replay_drives_fills_on_attached_timeframe(self, broker, client):
+        """Test only bars of the attached timeframe move the simulated market."""
+        times = pd.date_range("2024-01-02 10:00", periods=3, freq="min")
+        m1 = pd.DataFrame({"time": times, "open": [2000.0, 2001, 2002], "high": [2001.0, 2002, 2012],
+                           "low": [1999.0, 2000, 2001], "close": [2001.0, 2002, 2011], "tick_volume": 1})
+        m5 = pd.DataFrame({"time": [times[0]], "open": [2000.0], "high": [2100.0], "low": [1900.0],
+                           "close": [2050.0], "tick_volume": 1})
+        event_bus = EventBus()
+        broker.attach(event_bus, timeframe="1")
+        client.orders.create_buy_order("XAUUSD", 0.1, stop_loss=1950.0, take_profit=2010.0)
+        seen = []
+        event_bus.subscribe(NewCandleEvent, lambda e: seen.append(len(broker.positions)))
+
+        BarReplayEngine(event_bus, {("XAUUSD", "1"): m1, ("XAUUSD", "5"): m5}, progress_interval=0).run()
+        broker.detach()
+
+        assert seen == [1, 1, 0, 0]                  # M5 bar (2100/1900) filled nothing
+        assert broker.history[0]["price"] == 2010.0
+        assert broker.now == datetime(2024, 1, 2, 10, 3)         # clock follows the M1 bars only
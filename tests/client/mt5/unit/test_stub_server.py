@@ -0,0 +1,136 @@
+"""
+Tests for the local MT5 API stand-in server.
+
+These tests verify that:
+- Latency profiles parse and draw delays with the configured mean
+- The bar feed only reveals bars that have opened by the clock time
+- MT5Client works unchanged over HTTP against the server, with trading
+  routes answered by the simulated broker
+- Injected 500/429 responses and the concurrency limit are applied and counted
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.clients.mt5.client import MT5Client
+from app.clients.mt5.exceptions import MT5APIError
+from app.clients.mt5.stub_server import BarFeed, FaultProfile, LatencyProfile, MT5StubServer
+from app.utils.clock import SimulatedClock, use_clock
+
+
+@pytest.fixture
+def clock():
+    with use_clock(SimulatedClock(datetime(2024, 1, 2, 10, 0, 30))) as clock:
+        yield clock
+
+
+@pytest.fixture
+def feed(clock) -> BarFeed:
+    return BarFeed.synthetic(["XAUUSD", "EURUSD"], ["1", "5"], history_days=1, horizon=timedelta(hours=2))
+
+
+class TestProfiles:
+    """Test latency and fault profiles."""
+
+    def test_latency_parse_and_mean(self):
+        """Test a lognormal profile parsed from the CLI form draws around its mean."""
+        profile = LatencyProfile.parse("lognormal:20:10")
+        profile._rng.seed(3)
+
+        samples = [profile.sample() for _ in range(4000)]
+
+        assert profile.distribution == "lognormal"
+        assert min(samples) > 0
+        assert sum(samples) / len(samples) == pytest.approx(0.020, rel=0.05)
+        assert LatencyProfile("constant", 5).sample() == 0.005
+        with pytest.raises(ValueError):
+            LatencyProfile("pareto", 5)
+
+    def test_faults_only_on_matching_paths(self):
+        """Test the path filter and the error/throttle split."""
+        faults = FaultProfile(error_rate=0.5, throttle_rate=0.5, path_pattern=r"/bars$", seed=1)
+
+        drawn = {faults.draw("symbols/XAUUSD/bars") for _ in range(200)}
+
+        assert drawn == {500, 429}
+        assert faults.draw("account/balance") is None
+
+
+class TestBarFeed:
+    """Test bar visibility."""
+
+    def test_latest_bars_end_at_forming_bar(self, clock, feed):
+        """Test num_bars mode ends at the bar open at the clock time, and advancing reveals more."""
+        bars = feed.bars("XAUUSD", "M1", num_bars=3)
+        assert [b["time"] for b in bars] == ["2024-01-02T09:58:00", "2024-01-02T09:59:00", "2024-01-02T10:00:00"]
+
+        clock.advance(60)
+        assert feed.bars("XAUUSD", "1", num_bars=1)[0]["time"] == "2024-01-02T10:01:00"
+        assert feed.last_closed("XAUUSD")[1] == datetime(2024, 1, 2, 10, 1)
+
+    def test_range_mode_with_aware_bounds(self, feed):
+        """Test start/end ranges are inclusive and aware bounds are read as UTC."""
+        bars = feed.bars("EURUSD", "M5", start="2024-01-02T09:30:00+00:00", end="2024-01-02T11:00:00Z")
+
+        assert bars[0]["time"] == "2024-01-02T09:30:00"
+        assert bars[-1]["time"] == "2024-01-02T10:00:00"          # later bars have not opened yet
+        with pytest.raises(MT5APIError):
+            feed.bars("EURUSD", "H1")
+
+
+class TestServer:
+    """Test the HTTP server with the real client."""
+
+    def test_client_round_trip(self, clock, feed):
+        """Test bars, orders, positions and history over HTTP, counted per route."""
+        with MT5StubServer(feed=feed) as server:
+            client = MT5Client(server.url)
+
+            assert client.data.fetch_bars("XAUUSD", "M1", num_bars=2)[-1].time == datetime(2024, 1, 2, 10, 0)
+            assert client.data.fetch_bars_frame("XAUUSD", "M5", num_bars=4).shape[0] == 4
+            ticket = client.orders.create_buy_order("XAUUSD", 0.1)["order"]
+            clock.advance(120)
+            assert [p.ticket for p in client.positions.get_positions_by_symbol("XAUUSD")] == [ticket]
+            assert client.account.get_balance() == pytest.approx(10000.0)
+            client.close()
+
+        stats = server.stats()
+        assert stats.requests == 5
+        assert stats.by_route["GET symbols/{symbol}/bars"] == 2
+        assert stats.by_route["GET positions/{symbol}"] == 1
+        assert stats.status_codes == {200: 5}
+
+    def test_injected_throttle_and_broker_errors(self, feed):
+        """Test 429s carry Retry-After and broker errors keep their status."""
+        server = MT5StubServer(feed=feed, faults=FaultProfile(throttle_rate=1.0, retry_after=3, path_pattern="bars"))
+
+        status, headers, payload = server.handle("GET", "/symbols/XAUUSD/bars", {"timeframe": "M1"})
+        assert (status, headers["Retry-After"], payload["success"]) == (429, "3", False)
+
+        with server:
+            client = MT5Client(server.url)
+            with pytest.raises(MT5APIError) as error:
+                client.symbols.get_symbol_tick("GBPJPY")
+            client.close()
+
+        assert error.value.status_code == 404
+        assert server.stats().throttled == 1
+
+    def test_concurrency_limit_queues_requests(self, feed):
+        """Test no more than max_concurrency requests are handled at once."""
+        server = MT5StubServer(feed=feed, latency=LatencyProfile("constant", 30), max_concurrency=2)
+
+        threads = [
+            threading.Thread(target=server.handle, args=("GET", "account/balance")) for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = server.stats()
+        assert stats.requests == 6
+        assert stats.max_in_flight == 2
+        assert stats.queue_seconds > 0.05
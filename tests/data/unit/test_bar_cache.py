@@ -0,0 +1,202 @@
+"""
+Tests for the local historical bar cache.
+
+These tests verify that:
+- BarCache round-trips bars and resolves re-appended bars to the latest copy
+- Compaction merges month segments without losing bars
+- The integrity check reports gaps, ignoring weekend closures
+- LiveDataSource only downloads the bars missing from the cache, and does not
+  re-fetch gaps the broker has no bars for
+"""
+
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from app.data.bar_cache import BarCache
+from app.data.live_data import LiveDataSource
+
+
+def make_bars(start: str, periods: int, freq: str = "h", close: float = 1.1) -> pd.DataFrame:
+    """Create consecutive OHLCV bars."""
+    return pd.DataFrame({
+        "time": pd.date_range(start, periods=periods, freq=freq),
+        "open": 1.1, "high": 1.2, "low": 1.0, "close": close, "tick_volume": 100,
+    })
+
+
+class FakeBroker:
+    """Serves H1 bars from a fixed series for fetch_bars_frame(start=..., end=...)."""
+
+    def __init__(self, bars: pd.DataFrame):
+        self.bars = bars
+        self.calls = []
+
+    def fetch_bars_frame(self, symbol, timeframe, start, end):
+        self.calls.append((start, end))
+        lo = pd.Timestamp(start.rstrip("Z"))
+        hi = pd.Timestamp(end.rstrip("Z"))
+        window = self.bars[(self.bars["time"] >= lo) & (self.bars["time"] < hi)]
+        return window.reset_index(drop=True)
+
+
+def create_live_source(broker: FakeBroker, cache: BarCache) -> LiveDataSource:
+    """Create a LiveDataSource with a 3-day H1 window ending on Friday 2024-01-12."""
+    client = Mock()
+    client.data.fetch_bars_frame.side_effect = broker.fetch_bars_frame
+
+    date_helper = Mock()
+    date_helper.get_date_days_ago.side_effect = lambda n: (
+        pd.Timestamp("2024-01-12") - pd.Timedelta(days=n)
+    ).strftime("%Y-%m-%d")
+    date_helper.get_today.return_value = "2024-01-12"
+
+    source = LiveDataSource(client, date_helper, bar_cache=cache)
+    source.HISTORY_DAYS_LOOKUP = {"60": 3}
+    return source
+
+
+class TestBarCacheStorage:
+    """Test append, load and compaction."""
+
+    def test_round_trip_across_months(self, tmp_path):
+        """Test bars spanning two months are partitioned and loaded back in order."""
+        cache = BarCache(str(tmp_path))
+        bars = make_bars("2024-01-31 20:00", periods=8)
+
+        assert cache.append("xauusd", "60", bars) == 8
+
+        files = sorted(p.name.split(".")[0] for p in (tmp_path / "XAUUSD" / "60").iterdir())
+        assert files == ["2024-01", "2024-02"]
+
+        loaded = cache.load("XAUUSD", "60")
+        pd.testing.assert_series_equal(loaded["time"], bars["time"])
+        assert cache.last_bar_time("XAUUSD", "60") == bars["time"].iloc[-1]
+
+        since = cache.load("XAUUSD", "60", start="2024-02-01 02:00")
+        assert len(since) == 2
+
+    def test_latest_copy_wins_and_compaction_keeps_it(self, tmp_path):
+        """Test a re-appended bar replaces the old copy before and after compaction."""
+        cache = BarCache(str(tmp_path))
+        cache.append("XAUUSD", "60", make_bars("2024-01-02", periods=5, close=1.1))
+        cache.append("XAUUSD", "60", make_bars("2024-01-02 04:00", periods=3, close=1.5))
+
+        before = cache.load("XAUUSD", "60")
+        stats = cache.compact()
+        after = cache.load("XAUUSD", "60")
+
+        assert stats["months"] == 1
+        assert stats["files_removed"] == 2
+        assert list((tmp_path / "XAUUSD" / "60").iterdir())[0].name == "2024-01.parquet"
+        pd.testing.assert_frame_equal(before, after)
+        assert len(after) == 7
+        assert after["close"].tolist() == [1.1] * 4 + [1.5] * 3
+
+    def test_auto_compaction_past_threshold(self, tmp_path):
+        """Test that a month is compacted once it has too many segments."""
+        cache = BarCache(str(tmp_path), compact_threshold=3)
+        for hour in range(5):
+            cache.append("XAUUSD", "60", make_bars(f"2024-01-02 {hour:02d}:00", periods=1))
+
+        assert len(list((tmp_path / "XAUUSD" / "60").iterdir())) <= 3
+        assert len(cache.load("XAUUSD", "60")) == 5
+
+
+class TestBarCacheIntegrity:
+    """Test integrity checking."""
+
+    def test_reports_gap_but_not_weekend(self, tmp_path):
+        """Test missing weekday bars are reported and the weekend closure is not."""
+        cache = BarCache(str(tmp_path))
+        friday = make_bars("2024-01-05 18:00", periods=3)     # Fri 18:00-20:00
+        monday = make_bars("2024-01-08 00:00", periods=3)     # Mon 00:00-02:00
+        later = make_bars("2024-01-08 06:00", periods=2)      # 03:00-05:00 missing
+        cache.append("XAUUSD", "60", pd.concat([friday, monday, later]))
+
+        report = cache.check_integrity("XAUUSD", "60")
+
+        assert not report.ok
+        assert report.rows == 8
+        assert len(report.gaps) == 1
+        assert report.gaps[0].after == pd.Timestamp("2024-01-08 02:00")
+        assert report.gaps[0].missing_bars == 3
+
+    def test_unreadable_file_reported(self, tmp_path):
+        """Test a corrupt partition is reported and skipped on load."""
+        cache = BarCache(str(tmp_path))
+        cache.append("XAUUSD", "60", make_bars("2024-01-02", periods=3))
+        (tmp_path / "XAUUSD" / "60" / "2024-02.parquet").write_bytes(b"not parquet")
+
+        report = cache.check_integrity("XAUUSD", "60")
+
+        assert not report.ok
+        assert len(report.unreadable_files) == 1
+        assert len(cache.load("XAUUSD", "60")) == 3
+
+
+class TestLiveDataSourceWithCache:
+    """Test LiveDataSource history loading through the cache."""
+
+    def test_restart_downloads_only_new_bars(self, tmp_path):
+        """Test a warm cache fetches from the last cached bar and matches a full download."""
+        cache = BarCache(str(tmp_path))
+        broker = FakeBroker(make_bars("2024-01-08", periods=24 * 4 + 8))  # up to Fri 07:00 forming
+        source = create_live_source(broker, cache)
+
+        first = source.get_historical_data("XAUUSD", "60")
+        assert broker.calls == [("2024-01-09T00:00:00Z", "2024-01-13T00:00:00Z")]
+        assert first["time"].iloc[-1] == pd.Timestamp("2024-01-12 06:00")
+
+        # Three more hours pass
+        broker.bars = make_bars("2024-01-08", periods=24 * 4 + 11)
+        broker.calls.clear()
+        second = source.get_historical_data("XAUUSD", "60")
+
+        assert broker.calls == [("2024-01-12T06:00:00Z", "2024-01-13T00:00:00Z")]
+        assert second["time"].iloc[-1] == pd.Timestamp("2024-01-12 09:00")
+
+        uncached = create_live_source(broker, BarCache(str(tmp_path / "cold")))
+        pd.testing.assert_frame_equal(
+            second.reset_index(drop=True),
+            uncached.get_historical_data("XAUUSD", "60").reset_index(drop=True),
+            check_dtype=False,
+        )
+
+    def test_gap_in_cache_is_filled(self, tmp_path):
+        """Test a hole in the cached range is re-fetched and stored."""
+        cache = BarCache(str(tmp_path))
+        full = make_bars("2024-01-09", periods=24 * 3 + 8)
+        cache.append("XAUUSD", "60", full[(full["time"].dt.day != 10) | (full["time"].dt.hour < 12)])
+        assert len(cache.check_integrity("XAUUSD", "60").gaps) == 1
+
+        broker = FakeBroker(full)
+        source = create_live_source(broker, cache)
+        history = source.get_historical_data("XAUUSD", "60")
+
+        assert ("2024-01-10T11:00:00Z", "2024-01-11T00:00:00Z") in broker.calls
+        assert history["time"].diff().dropna().eq(pd.Timedelta(hours=1)).all()
+        assert cache.check_integrity("XAUUSD", "60").ok
+
+    def test_gap_without_broker_bars_is_not_refetched(self, tmp_path):
+        """Test a gap the broker returns no bars for (holiday) is recorded and skipped next load."""
+        cache = BarCache(str(tmp_path))
+        full = make_bars("2024-01-09", periods=24 * 3 + 8)
+        holiday = full[(full["time"].dt.day != 10) | (full["time"].dt.hour < 12)]
+        cache.append("XAUUSD", "60", holiday)
+
+        broker = FakeBroker(holiday)
+        source = create_live_source(broker, cache)
+        gap_call = ("2024-01-10T11:00:00Z", "2024-01-11T00:00:00Z")
+
+        source.get_historical_data("XAUUSD", "60")
+        assert gap_call in broker.calls
+        assert cache.check_integrity("XAUUSD", "60").ok
+
+        broker.calls.clear()
+        history = source.get_historical_data("XAUUSD", "60")
+
+        assert gap_call not in broker.calls
+        assert len(broker.calls) == 1
+        assert len(BarCache.find_gaps(history["time"], "60")) == 1
@@ -0,0 +1,151 @@
+"""
+Tests for the memory-mapped backtest data source and its parquet converter.
+
+These tests verify that:
+- The converter streams parquet row groups and keeps only the selected columns
+- MappedBacktestDataSource returns the same bars as BacktestDataSource
+- Returned frames are views of the mapping, not copies
+- DataSourceManager selects the mapped source with data_format="arrow"
+- Live mode does not import pyarrow
+"""
+
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from app.data.backtest_data import BacktestDataSource
+from app.data.data_manger import DataSourceManager
+from app.data.mapped_backtest_data import MappedBacktestDataSource, convert_parquet_to_arrow
+
+
+def write_parquet(folder, timeframe: str, rows: int = 500, tz=None):
+    """Write a {symbol}_{tf}.parquet file with several row groups and an extra column."""
+    df = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=rows, freq="min", tz=tz),
+        "open": np.linspace(1.0, 2.0, rows),
+        "high": np.linspace(1.1, 2.1, rows),
+        "low": np.linspace(0.9, 1.9, rows),
+        "close": np.linspace(1.05, 2.05, rows),
+        "tick_volume": np.arange(rows, dtype=np.int64),
+        "comment": ["x"] * rows,
+    })
+    df.to_parquet(folder / f"xauusd_{timeframe}.parquet", index=False, row_group_size=64)
+    return df
+
+
+class TestConvertParquetToArrow:
+    """Test the parquet -> Arrow converter."""
+
+    def test_converts_selected_columns(self, tmp_path):
+        """Test every row is converted and unused columns are dropped."""
+        write_parquet(tmp_path, "1")
+        assert pq.ParquetFile(tmp_path / "xauusd_1.parquet").num_row_groups > 1
+
+        written = convert_parquet_to_arrow(str(tmp_path), "XAUUSD")
+
+        assert written == {"1": 500}
+        source = MappedBacktestDataSource(str(tmp_path), "xauusd")
+        source.load_data(["1"])
+        assert list(source.get_historical_data("xauusd", "1").columns) == [
+            "time", "open", "high", "low", "close", "tick_volume"
+        ]
+
+    def test_missing_column_rejected(self, tmp_path):
+        """Test that asking for a column the parquet lacks raises ValueError."""
+        write_parquet(tmp_path, "1")
+
+        with pytest.raises(ValueError):
+            convert_parquet_to_arrow(str(tmp_path), "xauusd", columns=("time", "spread"))
+
+
+class TestMappedBacktestDataSource:
+    """Test the mapped data source against BacktestDataSource."""
+
+    @pytest.fixture
+    def sources(self, tmp_path):
+        write_parquet(tmp_path, "1")
+        write_parquet(tmp_path, "5", rows=100, tz="UTC")
+        convert_parquet_to_arrow(str(tmp_path), "xauusd")
+
+        legacy = BacktestDataSource(str(tmp_path), "xauusd")
+        legacy.load_data(["1", "5"])
+        mapped = MappedBacktestDataSource(str(tmp_path), "xauusd")
+        mapped.load_data(["1", "5"])
+        yield legacy, mapped
+        mapped.close()
+
+    def test_historical_data_matches(self, sources):
+        """Test the full history equals the parquet source, timezone included."""
+        legacy, mapped = sources
+        columns = ["time", "open", "high", "low", "close", "tick_volume"]
+
+        for tf in ("1", "5"):
+            pd.testing.assert_frame_equal(
+                mapped.get_historical_data("xauusd", tf),
+                legacy.get_historical_data("xauusd", tf)[columns],
+            )
+
+    def test_stream_sequence_matches(self, sources):
+        """Test the cursor yields the same slices as the parquet source, through the end."""
+        legacy, mapped = sources
+
+        for _ in range(170):
+            expected = legacy.get_stream_data("xauusd", "1", nbr_bars=3)
+            actual = mapped.get_stream_data("xauusd", "1", nbr_bars=3)
+            pd.testing.assert_frame_equal(actual, expected.drop(columns=["comment"]))
+
+        assert mapped.get_stream_data("xauusd", "1").empty
+
+        mapped.reset_index("1")
+        assert mapped.get_stream_data("xauusd", "1", nbr_bars=1)["time"].iloc[0] == pd.Timestamp("2024-01-01")
+
+    def test_frames_are_views_of_the_mapping(self, sources):
+        """Test that history and stream frames share memory with the mapped columns."""
+        _, mapped = sources
+        close = mapped.columns["1"]["close"]
+
+        history = mapped.get_historical_data("xauusd", "1")
+        bars = mapped.get_stream_data("xauusd", "1", nbr_bars=3)
+
+        assert not close.flags.writeable
+        assert np.shares_memory(history["close"].to_numpy(), close)
+        assert np.shares_memory(bars["close"].to_numpy(), close)
+
+    def test_unknown_timeframe_returns_empty(self, sources):
+        """Test that timeframes without an Arrow file return empty frames."""
+        _, mapped = sources
+
+        assert mapped.get_historical_data("xauusd", "60").empty
+        assert mapped.get_stream_data("xauusd", "60").empty
+
+
+class TestDataSourceManagerFormat:
+    """Test DataSourceManager backtest format selection."""
+
+    def test_arrow_format_selects_mapped_source(self, tmp_path):
+        """Test data_format='arrow' creates MappedBacktestDataSource."""
+        manager = DataSourceManager(mode="backtest", data_path=str(tmp_path), symbol="xauusd", data_format="arrow")
+
+        assert isinstance(manager.data_source, MappedBacktestDataSource)
+
+    def test_invalid_format_rejected(self, tmp_path):
+        """Test an unknown data_format raises ValueError."""
+        with pytest.raises(ValueError):
+            DataSourceManager(mode="backtest", data_path=str(tmp_path), symbol="xauusd", data_format="csv")
+
+    def test_live_mode_does_not_import_pyarrow(self):
+        """Test importing DataSourceManager for live mode works without pyarrow."""
+        code = (
+            "import sys; sys.modules['pyarrow'] = None\n"
+            "from app.data.data_manger import DataSourceManager\n"
+            "from unittest.mock import Mock\n"
+            "DataSourceManager(mode='live', client=Mock(), date_helper=Mock())\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
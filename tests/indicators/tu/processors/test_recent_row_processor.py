@@ -545,6 +545,30 @@ class TestRecentRowsProcessor:
         assert 'previous_close' in result.index
         assert result['previous_close'] == 100.0  # From first row's close
 
+    def test_rows_stored_without_previous_columns(self, sample_timeframes, sample_rows_sequence):
+        """
+        Test a processor that does not materialize previous_* columns.
+
+        Expected Behavior:
+        - Rows are stored and returned with their own columns only
+        - Older rows stay reachable in the buffer by offset
+        - Updates by timestamp still replace the stored row
+        """
+        processor = RecentRowsProcessor(sample_timeframes, max_rows=10, materialize_previous=False)
+        for row in sample_rows_sequence:
+            result = processor.process_backtest_with_indicators_row('1m', row)
+            assert list(result.index) == list(row.index)
+
+        updated = sample_rows_sequence[-1].copy()
+        updated['close'] = 200.0
+        assert processor.add_or_update_row('1m', updated) is True
+
+        stored = processor.get_recent_rows()['1m']
+        assert len(stored) == len(sample_rows_sequence)
+        assert not any(col.startswith('previous_') for row in stored for col in row.index)
+        assert stored[-1]['close'] == 200.0
+        assert stored[-2]['close'] == sample_rows_sequence[-2]['close']
+
     def test_get_row_count(self, processor, sample_rows_sequence):
         """
         Test row count functionality.
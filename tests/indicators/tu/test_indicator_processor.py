@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import pandas as pd
 
@@ -86,4 +87,52 @@ def test_indicator_processor_e2e(sample_configs, sample_historicals):
         'open': 0, 'high': 0, 'low': 0, 'close': 0, 'volume': 0
     })
     result2 = processor.process_new_row('1m', empty_row)
-    assert 'sma_3' in result2.index
\ No newline at end of file
+    assert 'sma_3' in result2.index
+
+def _random_bars(n, start, seed):
+    close = 100 + np.random.default_rng(seed).standard_normal(n).cumsum()
+    return pd.DataFrame({
+        'time': pd.date_range(start, periods=n, freq='1min'),
+        'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+        'volume': 1000.0
+    })
+
+
+@pytest.mark.parametrize('is_bulk', [False, True])
+def test_reload_configs_matches_restart(is_bulk):
+    history = _random_bars(200, '2024-01-01 00:00', seed=0)
+    live = _random_bars(30, '2024-01-01 03:20', seed=1)
+    processor = IndicatorProcessor({'1': {'sma_3': {'period': 3}, 'ema_5': {'period': 5}}},
+                                   {'1': history}, is_bulk=is_bulk)
+    for _, row in live.iloc[:20].iterrows():
+        processor.process_new_row('1', row)
+    kept = processor._managers['1'].handlers['sma_3']
+    rows_before = list(processor.get_recent_rows()['1'])
+
+    new_config = {'1': {'sma_3': {'period': 3}, 'rsi_2': {'period': 2, 'signal_period': 3}}}
+    changes = processor.reload_configs(new_config)
+
+    assert changes['1'].added == ['rsi_2'] and changes['1'].removed == ['ema_5']
+    assert processor._managers['1'].handlers['sma_3'] is kept
+    assert all(a is not b for a, b in zip(processor.get_recent_rows()['1'], rows_before))
+
+    # Same values as a processor started with the new config on the same bars
+    restarted = IndicatorProcessor(new_config, {'1': processor._managers['1'].retained_history()},
+                                   is_bulk=is_bulk)
+    reloaded_rows = pd.DataFrame(list(processor.get_recent_rows()['1']))
+    restarted_rows = pd.DataFrame(list(restarted.get_recent_rows()['1']))
+    assert sorted(reloaded_rows.columns) == sorted(restarted_rows.columns)
+    columns = [c for c in restarted_rows.columns if 'time' not in c]
+    np.testing.assert_allclose(reloaded_rows[columns].astype(float), restarted_rows[columns].astype(float))
+    for _, row in live.iloc[20:].iterrows():
+        reloaded, restarted_row = processor.process_new_row('1', row), restarted.process_new_row('1', row)
+    np.testing.assert_allclose(reloaded[columns].astype(float), restarted_row[columns].astype(float))
+
+
+def test_reload_configs_ignores_unknown_timeframes(sample_configs, sample_historicals):
+    processor = IndicatorProcessor(sample_configs, sample_historicals, is_bulk=False)
+
+    changes = processor.reload_configs({'1m': sample_configs['1m'], '15m': {'sma_2': {'period': 2}}})
+
+    assert changes == {}
+    assert '15m' not in processor.get_recent_rows()
@@ -91,7 +91,8 @@ class TestIndicatorProcessor:
         # Verify recent rows manager was initialized
         mock_recent_proc_class.assert_called_once_with(
             list(self.configs.keys()),
-            max_rows=5
+            max_rows=5,
+            materialize_previous=True
         )
         
         # Verify historical data processor was initialized
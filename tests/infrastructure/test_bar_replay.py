@@ -0,0 +1,161 @@
+"""
+Tests for BarReplayEngine.
+
+These tests verify that BarReplayEngine correctly:
+- Publishes NewCandleEvents in close-time order across symbols and timeframes
+- Breaks close-time ties by timeframe length, then symbol
+- Honours start/end windows on close time
+- Reports progress and throughput
+- Moves a SimulatedClock to each bar's close time
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.events.data_events import NewCandleEvent
+from app.infrastructure.bar_replay import BarReplayEngine
+from app.infrastructure.event_bus import EventBus
+from app.utils.clock import SimulatedClock
+
+
+def make_bars(start: str, periods: int, minutes: int) -> pd.DataFrame:
+    """Create bars with open times every `minutes` minutes."""
+    return pd.DataFrame({
+        "time": pd.date_range(start, periods=periods, freq=f"{minutes}min"),
+        "open": np.arange(periods, dtype=float),
+        "high": np.arange(periods, dtype=float) + 1,
+        "low": np.arange(periods, dtype=float) - 1,
+        "close": np.arange(periods, dtype=float),
+        "tick_volume": 10,
+    })
+
+
+def collect_candles(event_bus: EventBus) -> list:
+    """Subscribe a list collector for NewCandleEvents."""
+    events = []
+    event_bus.subscribe(NewCandleEvent, events.append)
+    return events
+
+
+class TestBarReplayOrdering:
+    """Test event-time ordering."""
+
+    def test_events_in_close_time_order(self):
+        """Test bars from all streams arrive sorted by close time with close-time timestamps."""
+        event_bus = EventBus(event_history_limit=0)
+        events = collect_candles(event_bus)
+        streams = {
+            ("XAUUSD", "1"): make_bars("2024-01-01 00:00", 120, 1),
+            ("XAUUSD", "5"): make_bars("2024-01-01 00:00", 24, 5),
+            ("EURUSD", "15"): make_bars("2024-01-01 00:00", 8, 15),
+        }
+
+        stats = BarReplayEngine(event_bus, streams, progress_interval=0).run()
+
+        assert stats.bars_published == stats.bars_total == 152
+        closes = [pd.Timestamp(e.timestamp) for e in events]
+        assert closes == sorted(closes)
+        for event in events:
+            length = pd.Timedelta(minutes=int(event.timeframe))
+            assert pd.Timestamp(event.timestamp) == event.bar["time"] + length
+        assert stats.bars_by_stream[("EURUSD", "15")] == 8
+
+    def test_ties_shortest_timeframe_then_symbol(self):
+        """Test bars closing together are ordered M1 before M5, then by symbol."""
+        event_bus = EventBus(event_history_limit=0)
+        events = collect_candles(event_bus)
+        streams = {
+            ("XAUUSD", "5"): make_bars("2024-01-01 00:00", 1, 5),
+            ("XAUUSD", "1"): make_bars("2024-01-01 00:04", 1, 1),
+            ("EURUSD", "5"): make_bars("2024-01-01 00:00", 1, 5),
+            ("EURUSD", "1"): make_bars("2024-01-01 00:04", 1, 1),
+        }
+
+        BarReplayEngine(event_bus, streams, progress_interval=0).run()
+
+        assert [(e.symbol, e.timeframe) for e in events] == [
+            ("EURUSD", "1"), ("XAUUSD", "1"), ("EURUSD", "5"), ("XAUUSD", "5"),
+        ]
+
+    def test_unsorted_input_is_sorted(self):
+        """Test a stream with shuffled rows is replayed in time order."""
+        event_bus = EventBus(event_history_limit=0)
+        events = collect_candles(event_bus)
+        bars = make_bars("2024-01-01", 10, 1).sample(frac=1.0, random_state=1)
+
+        BarReplayEngine(event_bus, {("XAUUSD", "1"): bars}, progress_interval=0).run()
+
+        assert [e.bar["close"] for e in events] == list(range(10))
+
+
+class TestBarReplayWindow:
+    """Test start/end windows and progress."""
+
+    def test_window_on_close_time(self):
+        """Test only bars closing in [start, end) are published."""
+        event_bus = EventBus(event_history_limit=0)
+        events = collect_candles(event_bus)
+        streams = {("XAUUSD", "60"): make_bars("2024-01-01 00:00", 24, 60)}
+
+        stats = BarReplayEngine(
+            event_bus, streams, start="2024-01-01 05:00", end="2024-01-01 08:00", progress_interval=0
+        ).run()
+
+        assert stats.bars_total == 3
+        assert [e.bar["time"].hour for e in events] == [4, 5, 6]
+        assert stats.first_close == pd.Timestamp("2024-01-01 05:00")
+
+    def test_progress_and_stop(self):
+        """Test progress callbacks report throughput and stop() ends the replay early."""
+        event_bus = EventBus(event_history_limit=0)
+        reports = []
+        engine = BarReplayEngine(
+            event_bus,
+            {("XAUUSD", "1"): make_bars("2024-01-01", 5000, 1)},
+            progress_interval=1e-9,
+            progress_callback=reports.append,
+        )
+        event_bus.subscribe(
+            NewCandleEvent, lambda e: engine.stop() if e.bar["close"] == 3000 else None
+        )
+
+        stats = engine.run()
+
+        assert stats.stopped
+        assert stats.bars_published == 3001
+        assert len(reports) >= 2
+        assert reports[-1].bars_published == 3001
+        assert reports[0].bars_per_second > 0
+        assert 0 < reports[0].fraction < 1
+
+    def test_from_data_sources(self):
+        """Test building streams from objects exposing get_historical_data."""
+        class Source:
+            def get_historical_data(self, symbol, timeframe):
+                return make_bars("2024-01-01", 6, int(timeframe)) if timeframe == "5" else pd.DataFrame()
+
+        engine = BarReplayEngine.from_data_sources(
+            EventBus(event_history_limit=0), {"XAUUSD": Source()}, ["1", "5"], progress_interval=0
+        )
+
+        assert engine.bars_total == 6
+        assert engine.run().bars_by_stream == {("XAUUSD", "5"): 6}
+
+    def test_drives_simulated_clock(self):
+        """Test the clock reads each bar's close time while its candle is handled."""
+        event_bus = EventBus()
+        clock = SimulatedClock(datetime(2024, 1, 1))
+        seen = []
+        event_bus.subscribe(NewCandleEvent, lambda e: seen.append((clock.now(), e.timestamp)))
+
+        BarReplayEngine(
+            event_bus, {("XAUUSD", "5"): make_bars("2024-01-01", 3, 5)}, progress_interval=0, clock=clock
+        ).run()
+
+        assert [now for now, _ in seen] == [datetime(2024, 1, 1, 0, 5), datetime(2024, 1, 1, 0, 10),
+                                            datetime(2024, 1, 1, 0, 15)]
+        assert all(now == timestamp for now, timestamp in seen)
+        assert clock.monotonic() == 15 * 60
@@ -0,0 +1,122 @@
+"""
+Tests for ConfigWatcher.
+
+These tests verify that the ConfigWatcher correctly:
+- Reloads only the folders whose file contents changed
+- Ignores files that were touched but not changed
+- Applies indicators before strategies
+- Keeps polling after a failed reload and retries once the file changes
+- Respects the poll interval unless forced
+"""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from app.infrastructure.config_watcher import ConfigWatcher
+
+
+@pytest.fixture
+def conf(tmp_path):
+    """Configuration tree with one strategy and one indicator file for XAUUSD."""
+    (tmp_path / "strategies" / "xauusd").mkdir(parents=True)
+    (tmp_path / "indicators" / "xauusd").mkdir(parents=True)
+    (tmp_path / "strategies" / "xauusd" / "trend.yaml").write_text("name: trend\n")
+    (tmp_path / "indicators" / "xauusd" / "xauusd_1.yaml").write_text("sma_3:\n  period: 3\n")
+    return tmp_path
+
+
+@pytest.fixture
+def services():
+    calls = []
+    indicator_service = Mock()
+    indicator_service.reload_indicators.side_effect = lambda configs: calls.append(("indicators", configs))
+    strategy_service = Mock()
+    strategy_service.reload_strategies.side_effect = lambda paths: calls.append(("strategies", paths))
+    registry = {"XAUUSD": {"indicator_calculation": indicator_service, "strategy_evaluation": strategy_service}}
+    return registry, calls
+
+
+class TestConfigWatcherPoll:
+    """Change detection and reload dispatch."""
+
+    def test_no_change_no_reload(self, conf, services):
+        """Test an untouched tree triggers nothing."""
+        registry, calls = services
+        watcher = ConfigWatcher(str(conf), registry)
+
+        assert watcher.poll(force=True) == []
+        assert calls == []
+
+    def test_edited_strategy_reloads_strategies_only(self, conf, services):
+        """Test editing a strategy reloads the strategy folder with its file list."""
+        registry, calls = services
+        watcher = ConfigWatcher(str(conf), registry)
+        path = conf / "strategies" / "xauusd" / "trend.yaml"
+        path.write_text("name: trend\ntimeframes: ['1']\n")
+
+        reloads = watcher.poll(force=True)
+
+        assert [(r.symbol, r.kind, r.ok) for r in reloads] == [("XAUUSD", "strategies", True)]
+        assert calls == [("strategies", [str(path)])]
+
+    def test_touched_file_is_ignored(self, conf, services):
+        """Test a new modification time with the same content is not a change."""
+        registry, calls = services
+        watcher = ConfigWatcher(str(conf), registry)
+        path = conf / "strategies" / "xauusd" / "trend.yaml"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert watcher.poll(force=True) == []
+
+    def test_indicators_applied_before_strategies(self, conf, services):
+        """Test both folders changing reloads indicators first, with the parsed configs."""
+        registry, calls = services
+        watcher = ConfigWatcher(str(conf), registry)
+        (conf / "indicators" / "xauusd" / "xauusd_1.yaml").write_text("sma_3:\n  period: 4\n")
+        (conf / "strategies" / "xauusd" / "range.yaml").write_text("name: range\n")
+
+        watcher.poll(force=True)
+
+        assert [kind for kind, _ in calls] == ["indicators", "strategies"]
+        assert calls[0][1] == {"1": {"sma_3": {"period": 4}}}
+        assert len(calls[1][1]) == 2
+
+    def test_failed_reload_is_retried_after_next_edit(self, conf, services):
+        """Test a failing reload is reported once, then retried when the file changes again."""
+        registry, calls = services
+        strategy_service = registry["XAUUSD"]["strategy_evaluation"]
+        strategy_service.reload_strategies.side_effect = ValueError("invalid strategy")
+        watcher = ConfigWatcher(str(conf), registry)
+        path = conf / "strategies" / "xauusd" / "trend.yaml"
+        path.write_text("name: [broken\n")
+
+        reloads = watcher.poll(force=True)
+        assert not reloads[0].ok and "invalid strategy" in reloads[0].error
+        assert watcher.poll(force=True) == []
+        assert watcher.error_count == 1
+
+        strategy_service.reload_strategies.side_effect = None
+        path.write_text("name: fixed\n")
+        assert [r.ok for r in watcher.poll(force=True)] == [True]
+
+    def test_poll_interval(self, conf, services):
+        """Test scans are skipped until poll_interval has elapsed."""
+        registry, calls = services
+        watcher = ConfigWatcher(str(conf), registry, poll_interval=3600)
+        watcher.poll()
+        (conf / "strategies" / "xauusd" / "trend.yaml").write_text("name: changed\n")
+
+        assert watcher.poll() == []
+        assert len(watcher.poll(force=True)) == 1
+
+    def test_config_symbol_mapping(self, conf, services):
+        """Test a symbol can watch another symbol's configuration folder."""
+        registry, calls = services
+        registry = {"XAUUSD.PRO": registry["XAUUSD"]}
+        watcher = ConfigWatcher(str(conf), registry, config_symbols={"XAUUSD.PRO": "XAUUSD"})
+        (conf / "strategies" / "xauusd" / "trend.yaml").write_text("name: changed\n")
+
+        assert [r.symbol for r in watcher.poll(force=True)] == ["XAUUSD.PRO"]
@@ -279,3 +279,46 @@ class TestEventBusMetrics:
 
         assert metrics["subscription_count"] == 2
         assert metrics["event_types_subscribed"] == 2
+
+
+class TestEventBusCatchAllSubscription:
+    """Test subscribe_all functionality."""
+
+    def test_subscribe_all_receives_every_event_type(self):
+        """Test that a catch-all handler sees events of all types."""
+        event_bus = EventBus()
+        received = []
+
+        event_bus.subscribe_all(received.append)
+
+        event_bus.publish(create_new_candle_event())
+        event_bus.publish(create_entry_signal_event())
+
+        assert [type(e) for e in received] == [NewCandleEvent, EntrySignalEvent]
+
+    def test_subscribe_all_runs_before_typed_handlers(self):
+        """Test that catch-all handlers observe events in publish order."""
+        event_bus = EventBus()
+        received = []
+
+        def on_candle(event):
+            event_bus.publish(create_entry_signal_event())
+
+        event_bus.subscribe(NewCandleEvent, on_candle)
+        event_bus.subscribe_all(received.append)
+
+        event_bus.publish(create_new_candle_event())
+
+        assert [type(e) for e in received] == [NewCandleEvent, EntrySignalEvent]
+
+    def test_unsubscribe_catch_all(self):
+        """Test that catch-all subscriptions can be removed."""
+        event_bus = EventBus()
+        received = []
+
+        sub_id = event_bus.subscribe_all(received.append)
+        assert event_bus.unsubscribe(sub_id) is True
+
+        event_bus.publish(create_new_candle_event())
+
+        assert received == []
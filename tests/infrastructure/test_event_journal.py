@@ -0,0 +1,190 @@
+"""
+Tests for the binary event journal.
+
+These tests verify that the journal correctly:
+- Round-trips events, including pandas payloads, through the codec
+- Records every event published on an EventBus
+- Rotates segments and seeks by timestamp using the index
+- Filters by symbol and event type
+- Replays recorded events into a fresh EventBus
+- Stops cleanly at a torn tail frame
+"""
+
+from collections import deque
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.events.automation_events import AutomationAction, ToggleAutomationEvent
+from app.events.data_events import DataFetchedEvent, NewCandleEvent
+from app.events.indicator_events import IndicatorsCalculatedEvent
+from app.events.strategy_events import EntrySignalEvent
+from app.infrastructure.event_bus import EventBus
+from app.infrastructure.event_codec import EventCodecError, decode_event, encode_event
+from app.infrastructure.event_journal import EventJournal, JournalReader, replay_journal
+from tests.fixtures.market_data import create_mock_bars
+
+
+BASE_TIME = datetime(2025, 1, 6, 9, 0, 0)
+
+
+def make_candle(symbol: str, minute: int) -> NewCandleEvent:
+    """Create a NewCandleEvent with a deterministic timestamp."""
+    bars = create_mock_bars(3, start_time=BASE_TIME + timedelta(minutes=minute))
+    return NewCandleEvent(
+        symbol=symbol,
+        timeframe="1",
+        bar=bars.iloc[-1],
+        timestamp=BASE_TIME + timedelta(minutes=minute),
+    )
+
+
+class TestEventCodec:
+    """Test event encoding and decoding."""
+
+    def test_round_trip_data_fetched_event(self):
+        """Test DataFrame payloads survive encoding with dtypes intact."""
+        bars = create_mock_bars(5)
+        bars["time"] = pd.to_datetime(bars["time"])
+        event = DataFetchedEvent(symbol="XAUUSD", timeframe="5", bars=bars)
+
+        decoded = decode_event(encode_event(event))
+
+        assert isinstance(decoded, DataFetchedEvent)
+        assert decoded.event_id == event.event_id
+        assert decoded.timestamp == event.timestamp
+        assert decoded.num_bars == 5
+        pd.testing.assert_frame_equal(decoded.bars, bars)
+
+    def test_round_trip_new_candle_event(self):
+        """Test a mixed-dtype bar Series survives encoding."""
+        event = make_candle("XAUUSD", 0)
+
+        decoded = decode_event(encode_event(event))
+
+        assert decoded.symbol == "XAUUSD"
+        assert decoded.bar.name == event.bar.name
+        assert decoded.bar["time"] == event.bar["time"]
+        assert decoded.get_close() == event.get_close()
+
+    def test_round_trip_nested_and_enum_values(self):
+        """Test dicts of deques of Series and enum fields survive encoding."""
+        row = pd.Series({"close": 1.5, "regime": "bull_high", "flag": True})
+        event = IndicatorsCalculatedEvent(
+            symbol="BTCUSD",
+            timeframe="1",
+            enriched_data={"close": 1.5, "rsi": np.float64(55.0)},
+            recent_rows={"1": deque([row, row], maxlen=6)},
+        )
+        toggle = ToggleAutomationEvent(action=AutomationAction.DISABLE, reason="test")
+
+        decoded = decode_event(encode_event(event))
+        decoded_toggle = decode_event(encode_event(toggle))
+
+        assert decoded.recent_rows["1"].maxlen == 6
+        assert decoded.recent_rows["1"][1]["regime"] == "bull_high"
+        assert decoded.enriched_data["rsi"] == 55.0
+        assert decoded_toggle.action is AutomationAction.DISABLE
+
+    def test_renamed_field_raises_codec_error(self):
+        """Test a payload whose fields no longer match the event class raises EventCodecError."""
+        payload = encode_event(ToggleAutomationEvent(action=AutomationAction.DISABLE, reason="test"))
+        stale = payload.replace(b"reason", b"reazon")
+
+        with pytest.raises(EventCodecError, match="reazon"):
+            decode_event(stale)
+
+
+class TestEventJournal:
+    """Test recording, seeking and replay."""
+
+    def test_records_every_published_event(self, tmp_path):
+        """Test that an attached journal records all event types."""
+        event_bus = EventBus()
+        journal = EventJournal(tmp_path)
+        journal.attach(event_bus)
+
+        event_bus.publish(make_candle("XAUUSD", 0))
+        event_bus.publish(EntrySignalEvent(strategy_name="s", symbol="XAUUSD", direction="long"))
+        journal.close()
+
+        events = list(JournalReader(tmp_path).read())
+
+        assert [type(e) for e in events] == [NewCandleEvent, EntrySignalEvent]
+        assert journal.get_metrics()["events_recorded"] == 2
+
+    def test_segment_rotation_and_timestamp_seek(self, tmp_path):
+        """Test rotation produces several segments and start bounds seek correctly."""
+        with EventJournal(tmp_path, max_segment_bytes=4096, index_interval=2) as journal:
+            for minute in range(60):
+                journal.record(make_candle("XAUUSD", minute))
+
+        reader = JournalReader(tmp_path)
+        start = BASE_TIME + timedelta(minutes=42)
+        end = BASE_TIME + timedelta(minutes=44)
+
+        events = list(reader.read(start=start, end=end))
+
+        assert len(reader.segments()) > 1
+        assert [e.timestamp for e in events] == [
+            start, start + timedelta(minutes=1), end
+        ]
+
+    def test_symbol_filter(self, tmp_path):
+        """Test filtering by symbol keeps account-level events."""
+        with EventJournal(tmp_path) as journal:
+            journal.record(make_candle("XAUUSD", 0))
+            journal.record(make_candle("BTCUSD", 1))
+            journal.record(ToggleAutomationEvent(action=AutomationAction.ENABLE, reason="r"))
+
+        events = list(JournalReader(tmp_path).read(symbols=["btcusd"]))
+
+        assert [type(e) for e in events] == [NewCandleEvent, ToggleAutomationEvent]
+        assert events[0].symbol == "BTCUSD"
+
+    def test_replay_publishes_data_events_only_by_default(self, tmp_path):
+        """Test replay feeds only data events into a fresh EventBus."""
+        with EventJournal(tmp_path) as journal:
+            for minute in range(5):
+                journal.record(make_candle("XAUUSD", minute))
+                journal.record(EntrySignalEvent(strategy_name="s", symbol="XAUUSD", direction="long"))
+
+        fresh_bus = EventBus()
+        received = []
+        fresh_bus.subscribe(NewCandleEvent, received.append)
+        fresh_bus.subscribe(EntrySignalEvent, received.append)
+
+        stats = replay_journal(tmp_path, fresh_bus)
+
+        assert stats.events_read == 10
+        assert stats.events_published == 5
+        assert all(isinstance(e, NewCandleEvent) for e in received)
+        assert stats.first_timestamp == BASE_TIME
+
+    def test_new_writer_starts_new_segment(self, tmp_path):
+        """Test reopening a journal never appends to an existing segment."""
+        with EventJournal(tmp_path) as journal:
+            journal.record(make_candle("XAUUSD", 0))
+        with EventJournal(tmp_path) as journal:
+            journal.record(make_candle("XAUUSD", 1))
+
+        reader = JournalReader(tmp_path)
+
+        assert len(reader.segments()) == 2
+        assert len(list(reader.read())) == 2
+
+    def test_torn_tail_frame_is_ignored(self, tmp_path):
+        """Test a truncated final frame ends the segment without raising."""
+        with EventJournal(tmp_path) as journal:
+            journal.record(make_candle("XAUUSD", 0))
+            journal.record(make_candle("XAUUSD", 1))
+
+        segment = JournalReader(tmp_path).segments()[0]
+        data = segment.read_bytes()
+        segment.write_bytes(data[:-10])
+
+        events = list(JournalReader(tmp_path).read())
+
+        assert len(events) == 1
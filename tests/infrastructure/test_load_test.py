@@ -0,0 +1,76 @@
+"""
+Smoke test of the load test harness.
+
+These tests verify that:
+- LoadTestHarness builds the real components for a symbol from the
+  repository configuration and drives the orchestrator against the stub
+  server, so settings the component loader reads are covered by
+  LoadTestSettings
+- A journal recorded by one run replays through a freshly built pipeline,
+  which regenerates the downstream events
+"""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from app.events.indicator_events import IndicatorsCalculatedEvent
+from app.infrastructure.event_journal import JournalReader, main as journal_main
+from app.infrastructure.load_test import LoadTestHarness, LoadTestSettings
+from app.utils.clock import SimulatedClock, use_clock
+
+CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
+
+
+class TestLoadTestHarness:
+    """Test the harness end to end."""
+
+    def test_runs_rounds_against_stub_server(self):
+        """Test a short run completes and every round calls the stub server."""
+        settings = LoadTestSettings(
+            CONF_FOLDER_PATH=str(CONFIG_DIR),
+            RESTRICTION_CONF_FOLDER_PATH=str(CONFIG_DIR / "restrictions"),
+        )
+        harness = LoadTestHarness(symbols=["LOAD01"], settings=settings, history_days=1.0)
+
+        with use_clock(SimulatedClock(datetime(2024, 3, 4, 9, 0))):
+            report = harness.run(rounds=2)
+
+        assert report.rounds == 2
+        assert report.api_calls > 0
+        assert report.server.status_codes.get(200, 0) == report.api_calls
+
+    def test_recorded_journal_replays_through_pipeline(self, tmp_path):
+        """Test the replay command feeds a recorded journal into a new pipeline for its symbols."""
+        journal_dir = tmp_path / "journal"
+        settings = LoadTestSettings(
+            CONF_FOLDER_PATH=str(CONFIG_DIR),
+            RESTRICTION_CONF_FOLDER_PATH=str(CONFIG_DIR / "restrictions"),
+        )
+        recorder = LoadTestHarness(
+            symbols=["LOAD01"], settings=settings, history_days=1.0,
+            orchestrator_config={"journal": {"enabled": True, "dir": str(journal_dir)}},
+        )
+        with use_clock(SimulatedClock(datetime(2024, 3, 4, 9, 0))):
+            recorder.run(rounds=3)
+        recorded = JournalReader(journal_dir).summary()["by_type"]
+
+        replayed = []
+        original_replay = LoadTestHarness.replay
+
+        def replay(harness, *args, **kwargs):
+            stats = original_replay(harness, *args, **kwargs)
+            replayed.append((harness, stats))
+            return stats
+
+        with patch.object(LoadTestHarness, "replay", replay), patch("builtins.print"):
+            assert journal_main([
+                "replay", str(journal_dir), "--config-dir", str(CONFIG_DIR),
+                "--config-symbol", "xauusd", "--history-days", "1",
+            ]) == 0
+
+        harness, stats = replayed[0]
+        assert harness.symbols == ["LOAD01"]
+        assert stats.events_published == recorded.get("DataFetchedEvent", 0) + recorded.get("NewCandleEvent", 0) > 0
+        indicators = harness.orchestrator.event_bus.get_event_history(IndicatorsCalculatedEvent)
+        assert len(indicators) == recorded["IndicatorsCalculatedEvent"]
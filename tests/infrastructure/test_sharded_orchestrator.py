@@ -0,0 +1,134 @@
+"""
+Tests for ShardedTradingOrchestrator.
+
+These tests verify that the sharded orchestrator:
+- Distributes symbols across shard processes
+- Drives shards in lockstep ticks and aggregates their health and metrics
+- Propagates the account-wide stop to every shard before the next tick
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from app.infrastructure.sharded_orchestrator import ShardedTradingOrchestrator, assign_shards
+from app.infrastructure.multi_symbol_orchestrator import OrchestratorStatus
+from app.risk.account_stop_loss import AccountStopLossConfig
+from tests.fixtures.market_data import create_mock_bars
+
+
+def build_fake_components(symbols):
+    """Component factory run inside each shard process (must be top-level to pickle)."""
+    data_source = Mock()
+    data_source.get_stream_data.return_value = create_mock_bars(num_bars=3)
+
+    client = Mock()
+    client.positions.get_open_positions.return_value = []
+    client.positions.get_all_positions.return_value = []
+
+    return {
+        'client': client,
+        'data_source': data_source,
+        'date_helper': Mock(),
+        'symbol_components': {
+            symbol: {
+                'indicator_processor': Mock(),
+                'regime_manager': Mock(),
+                'strategy_engine': Mock(),
+                'entry_manager': Mock(),
+                'trade_executor': Mock(),
+                'timeframes': ["1"],
+            }
+            for symbol in symbols
+        },
+    }
+
+
+@pytest.fixture
+def shard_config(tmp_path):
+    """Orchestrator config for two symbols in separate shards."""
+    return {
+        "symbols": ["EURUSD", "XAUUSD"],
+        "timeframes": ["1"],
+        "shard_tick_timeout": 30.0,
+        "shard_startup_timeout": 60.0,
+        "automation": {
+            "enabled": True,
+            "state_file": str(tmp_path / "automation_state.json"),
+            "file_watcher_enabled": False,
+        },
+    }
+
+
+class TestAssignShards:
+    """Test symbol distribution."""
+
+    def test_one_shard_per_symbol_by_default(self):
+        """Test that each symbol gets its own shard by default."""
+        assert assign_shards(["A", "B", "C"]) == [["A"], ["B"], ["C"]]
+
+    def test_round_robin_with_fewer_shards(self):
+        """Test round-robin assignment when shard_count < symbols."""
+        assert assign_shards(["A", "B", "C"], shard_count=2) == [["A", "C"], ["B"]]
+
+    def test_shard_count_capped_by_symbols(self):
+        """Test that empty shards are never created."""
+        assert assign_shards(["A"], shard_count=4) == [["A"]]
+
+
+class TestShardedOrchestrator:
+    """Test coordinator and shard processes end to end."""
+
+    def test_tick_runs_on_every_shard(self, shard_config):
+        """Test that a tick reaches all shards and health/metrics are aggregated."""
+        orchestrator = ShardedTradingOrchestrator(
+            config=shard_config,
+            component_factory=build_fake_components
+        )
+        orchestrator.initialize(client=Mock())
+        orchestrator.start()
+        try:
+            orchestrator.run_iteration()
+
+            assert [shard.ticks_completed for shard in orchestrator.shards] == [1, 1]
+            health = orchestrator.get_service_health()
+            assert set(health) == {"EURUSD", "XAUUSD"}
+            assert all(services["data_fetching"] for services in health.values())
+
+            metrics = orchestrator.get_all_metrics()
+            assert metrics["orchestrator"]["shard_count"] == 2
+            assert metrics["services"]["EURUSD"]["data_fetching"]["data_fetches"] >= 1
+            assert metrics["services"]["XAUUSD"]["data_fetching"]["data_fetches"] >= 1
+        finally:
+            orchestrator.stop()
+
+        assert orchestrator.status == OrchestratorStatus.STOPPED
+        assert not any(shard.is_alive() for shard in orchestrator.shards)
+
+    def test_account_stop_halts_all_shards(self, shard_config):
+        """Test that an account stop loss breach halts every shard."""
+        client = Mock()
+        client.account.get_balance.return_value = 10000.0
+
+        orchestrator = ShardedTradingOrchestrator(
+            config=shard_config,
+            component_factory=build_fake_components
+        )
+        orchestrator.initialize(
+            client=client,
+            account_stop_loss_config=AccountStopLossConfig(daily_loss_limit=100.0)
+        )
+        orchestrator.start()
+        try:
+            assert orchestrator._perform_account_check() is True
+
+            client.account.get_balance.return_value = 9500.0
+            assert orchestrator._perform_account_check() is False
+
+            assert all(shard.halted for shard in orchestrator.shards)
+            health = orchestrator.get_service_health()
+            for symbol in ["EURUSD", "XAUUSD"]:
+                assert health[symbol]["trade_execution"] is False
+                assert health[symbol]["strategy_evaluation"] is False
+                assert health[symbol]["data_fetching"] is True
+        finally:
+            orchestrator.stop()
@@ -0,0 +1,166 @@
+"""
+Tests for ConcurrentDataFetcher.
+
+These tests verify that ConcurrentDataFetcher correctly:
+- Issues all requests of a round in parallel
+- Publishes events in deterministic symbol/timeframe order
+- Moves on at the round deadline without re-requesting in-flight fetches
+- Routes fetch errors through the owning service
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from app.services.concurrent_fetcher import ConcurrentDataFetcher
+from app.services.data_fetching import DataFetchingService
+from app.events.data_events import DataFetchedEvent, DataFetchErrorEvent
+from app.data.data_manger import DataSourceManager
+from tests.fixtures.market_data import create_mock_bars
+from tests.mocks.mock_event_bus import MockEventBus
+
+
+def create_service(event_bus, symbol, timeframes, delays=None, error_timeframes=()):
+    """Create a running DataFetchingService whose data source sleeps per timeframe."""
+    delays = delays or {}
+    data_source = Mock(spec=DataSourceManager)
+
+    def get_stream_data(symbol, timeframe, nbr_bars):
+        time.sleep(delays.get(timeframe, 0.05))
+        if timeframe in error_timeframes:
+            raise ConnectionError("API unavailable")
+        return create_mock_bars(num_bars=nbr_bars)
+
+    data_source.get_stream_data.side_effect = get_stream_data
+
+    service = DataFetchingService(
+        event_bus=event_bus,
+        data_source=data_source,
+        config={"symbol": symbol, "timeframes": timeframes, "nbr_bars": 3},
+    )
+    service.start()
+    return service
+
+
+class TestConcurrentFetchRound:
+    """Test concurrent fetch rounds."""
+
+    def test_round_runs_requests_in_parallel(self):
+        """Test that a round costs about one request latency, not the sum."""
+        mock_bus = MockEventBus()
+        services = [
+            create_service(mock_bus, symbol, ["1", "5", "15"])
+            for symbol in ["EURUSD", "XAUUSD"]
+        ]
+        fetcher = ConcurrentDataFetcher(services, max_workers=6, round_deadline=5.0)
+
+        try:
+            stats = fetcher.fetch_round()
+        finally:
+            fetcher.shutdown()
+
+        assert stats["requests"] == 6
+        assert stats["completed"] == 6
+        assert stats["round_seconds"] < stats["serial_seconds"]
+        assert stats["speedup"] > 2.0
+        assert fetcher.get_metrics()["rounds"] == 1
+
+    def test_speedup_excludes_event_processing(self):
+        """Test that slow subscribers count as processing time, not as fetch time."""
+        mock_bus = MockEventBus()
+        services = [create_service(mock_bus, "EURUSD", ["1", "5"], delays={"1": 0.05, "5": 0.05})]
+        for service in services:
+            process = service.process_stream_data
+
+            def slow_process(timeframe, df_stream, process=process):
+                time.sleep(0.2)
+                return process(timeframe, df_stream)
+
+            service.process_stream_data = slow_process
+        fetcher = ConcurrentDataFetcher(services, max_workers=2, round_deadline=5.0)
+
+        try:
+            stats = fetcher.fetch_round()
+        finally:
+            fetcher.shutdown()
+
+        assert stats["process_seconds"] >= 0.4
+        assert stats["fetch_seconds"] < 0.2
+        assert stats["round_seconds"] == pytest.approx(stats["fetch_seconds"] + stats["process_seconds"])
+        assert stats["speedup"] > 1.0
+
+    def test_events_published_in_deterministic_order(self):
+        """Test that events follow service then timeframe order regardless of completion order."""
+        mock_bus = MockEventBus()
+        services = [
+            create_service(mock_bus, "EURUSD", ["1", "5"], delays={"1": 0.15, "5": 0.01}),
+            create_service(mock_bus, "XAUUSD", ["1", "5"], delays={"1": 0.01, "5": 0.10}),
+        ]
+        fetcher = ConcurrentDataFetcher(services, max_workers=4, round_deadline=5.0)
+
+        try:
+            fetcher.fetch_round()
+        finally:
+            fetcher.shutdown()
+
+        events = mock_bus.get_published_events(DataFetchedEvent)
+        assert [(e.symbol, e.timeframe) for e in events] == [
+            ("EURUSD", "1"), ("EURUSD", "5"), ("XAUUSD", "1"), ("XAUUSD", "5"),
+        ]
+
+    def test_slow_timeframe_does_not_hold_up_round(self):
+        """Test that requests past the deadline are skipped and not re-requested while in flight."""
+        mock_bus = MockEventBus()
+        release = threading.Event()
+        service = create_service(mock_bus, "EURUSD", ["1", "240"])
+
+        fast_fetch = service.data_source.get_stream_data.side_effect
+
+        def get_stream_data(symbol, timeframe, nbr_bars):
+            if timeframe == "240":
+                release.wait(5.0)
+            return fast_fetch(symbol=symbol, timeframe=timeframe, nbr_bars=nbr_bars)
+
+        service.data_source.get_stream_data.side_effect = get_stream_data
+        fetcher = ConcurrentDataFetcher([service], max_workers=2, round_deadline=0.3)
+
+        try:
+            first = fetcher.fetch_round()
+            second = fetcher.fetch_round()
+        finally:
+            release.set()
+            fetcher.shutdown()
+
+        assert first["deadline_misses"] == 1
+        assert first["round_seconds"] < 1.0
+        assert second["requests"] == 1
+        assert fetcher.get_metrics()["skipped_in_flight"] == 1
+
+        events = mock_bus.get_published_events(DataFetchedEvent)
+        assert [e.timeframe for e in events] == ["1", "1"]
+
+    def test_fetch_error_published_by_service(self):
+        """Test that a failing request publishes DataFetchErrorEvent via its service."""
+        mock_bus = MockEventBus()
+        service = create_service(mock_bus, "EURUSD", ["1", "5"], error_timeframes=("5",))
+        fetcher = ConcurrentDataFetcher([service], max_workers=2, round_deadline=5.0)
+
+        try:
+            fetcher.fetch_round()
+        finally:
+            fetcher.shutdown()
+
+        errors = mock_bus.get_published_events(DataFetchErrorEvent)
+        assert len(errors) == 1
+        assert errors[0].timeframe == "5"
+        assert service.get_metrics()["fetch_errors"] == 1
+        assert service.get_metrics()["data_fetches"] == 1
+
+    def test_invalid_configuration_rejected(self):
+        """Test that non-positive workers or deadline raise ValueError."""
+        with pytest.raises(ValueError):
+            ConcurrentDataFetcher([], max_workers=0)
+        with pytest.raises(ValueError):
+            ConcurrentDataFetcher([], round_deadline=0)
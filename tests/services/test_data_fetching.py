@@ -863,3 +863,83 @@ class TestMetrics:
         metrics = service.get_metrics()
 
         assert metrics["timeframes_count"] == 3
+
+
+class TestCursorFetch:
+    """Test cursor-based (since) fetching and catch-up."""
+
+    def _create_service(self, mock_bus, data_source):
+        service = DataFetchingService(
+            event_bus=mock_bus,
+            data_source=data_source,
+            config={
+                "symbol": "EURUSD",
+                "timeframes": ["1"],
+                "candle_index": 2,
+                "nbr_bars": 3,
+                "cursor_fetch": True,
+            },
+        )
+        service.start()
+        return service
+
+    def test_cursor_passed_after_first_fetch(self):
+        """Test first fetch uses the window, later fetches pass the last closed bar time."""
+        mock_bus = MockEventBus()
+        data_source = Mock(spec=DataSourceManager)
+        start = datetime(2024, 1, 1, 10, 0)
+        data_source.get_stream_data.return_value = create_mock_bars(num_bars=3, start_time=start)
+        data_source.get_stream_data_since.return_value = create_mock_bars(
+            num_bars=1, start_time=start + timedelta(minutes=2)
+        )
+
+        service = self._create_service(mock_bus, data_source)
+        service.fetch_streaming_data()
+        service.fetch_streaming_data()
+
+        data_source.get_stream_data.assert_called_once()
+        data_source.get_stream_data_since.assert_called_once_with(
+            symbol="EURUSD",
+            timeframe="1",
+            since=pd.Timestamp(start + timedelta(minutes=1)),
+            nbr_bars=3,
+        )
+        # Only the forming bar came back - no new closed candle
+        assert len(mock_bus.get_published_events(NewCandleEvent)) == 1
+
+    def test_stall_emits_every_missed_bar_in_order(self):
+        """Test that bars missed during a stall are all published in order."""
+        mock_bus = MockEventBus()
+        data_source = Mock(spec=DataSourceManager)
+        start = datetime(2024, 1, 1, 10, 0)
+        data_source.get_stream_data.return_value = create_mock_bars(num_bars=3, start_time=start)
+
+        service = self._create_service(mock_bus, data_source)
+        service.fetch_streaming_data()
+
+        # Stall: five more bars opened (10:02 .. 10:06), 10:06 still forming
+        data_source.get_stream_data_since.return_value = create_mock_bars(
+            num_bars=5, start_time=start + timedelta(minutes=2)
+        )
+        service.fetch_streaming_data()
+
+        events = mock_bus.get_published_events(NewCandleEvent)
+        times = [pd.Timestamp(e.bar['time']) for e in events]
+        assert times == [pd.Timestamp(start + timedelta(minutes=m)) for m in range(1, 6)]
+        assert service.get_metrics()["catch_up_bars"] == 3
+        assert service.get_metrics()["new_candles_detected"] == 5
+
+    def test_empty_result_after_cursor_is_not_an_error(self):
+        """Test that no bars after the cursor is treated as no new data."""
+        mock_bus = MockEventBus()
+        data_source = Mock(spec=DataSourceManager)
+        data_source.get_stream_data.return_value = create_mock_bars(num_bars=3)
+        data_source.get_stream_data_since.return_value = pd.DataFrame()
+
+        service = self._create_service(mock_bus, data_source)
+        service.fetch_streaming_data()
+        success_count = service.fetch_streaming_data()
+
+        assert success_count == 1
+        assert mock_bus.get_published_events(DataFetchErrorEvent) == []
+        assert service.get_metrics()["fetch_errors"] == 0
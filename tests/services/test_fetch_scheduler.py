@@ -0,0 +1,174 @@
+"""
+Tests for CandleCloseScheduler.
+
+These tests verify that CandleCloseScheduler correctly:
+- Polls each timeframe around its expected candle close only
+- Detects new bars shortly after they close
+- Measures the broker clock offset from returned bar times
+- Idles timeframes whose market produces no new bars
+"""
+
+import pandas as pd
+import pytest
+from unittest.mock import Mock
+
+from app.services.data_fetching import DataFetchingService
+from app.services.fetch_scheduler import (
+    BrokerClockOffset,
+    CandleCloseScheduler,
+    timeframe_seconds,
+)
+from app.data.data_manger import DataSourceManager
+from tests.mocks.mock_event_bus import MockEventBus
+
+
+BROKER_OFFSET = 3 * 3600  # broker server runs at UTC+3
+
+
+class FakeBroker:
+    """Simulated clock plus broker returning bars for the simulated broker time."""
+
+    def __init__(self, start: float, market_open: bool = True):
+        self.now = start
+        self.market_open = market_open
+        self.closed_at = start
+        self.calls = {}
+
+    def clock(self) -> float:
+        return self.now
+
+    def get_stream_data(self, symbol, timeframe, nbr_bars):
+        self.calls[timeframe] = self.calls.get(timeframe, 0) + 1
+        tf = timeframe_seconds(timeframe)
+        broker_now = (self.now if self.market_open else self.closed_at) + BROKER_OFFSET
+        forming_open = (broker_now // tf) * tf
+        times = [forming_open - tf * i for i in reversed(range(nbr_bars))]
+        return pd.DataFrame({
+            'time': pd.to_datetime(times, unit='s'),
+            'open': 1.1, 'high': 1.2, 'low': 1.0, 'close': 1.15, 'tick_volume': 10,
+        })
+
+
+def create_scheduler(broker: FakeBroker, timeframes):
+    """Create a running service driven by the fake broker and its scheduler."""
+    data_source = Mock(spec=DataSourceManager)
+    data_source.get_stream_data.side_effect = broker.get_stream_data
+
+    service = DataFetchingService(
+        event_bus=MockEventBus(),
+        data_source=data_source,
+        config={"symbol": "EURUSD", "timeframes": timeframes, "nbr_bars": 2, "candle_index": 2},
+    )
+    service.start()
+
+    scheduler = CandleCloseScheduler(
+        services=[service],
+        close_delay=0.5,
+        retry_interval=1.0,
+        retry_window=30.0,
+        clock=broker.clock,
+    )
+    return service, scheduler
+
+
+def run_for(broker: FakeBroker, scheduler: CandleCloseScheduler, seconds: float):
+    """Run the scheduler loop on simulated time."""
+    end = broker.now + seconds
+    while broker.now < end:
+        scheduler.run_due()
+        broker.now += max(scheduler.seconds_until_next_due(), 0.01)
+
+
+class TestTimeframeSeconds:
+    """Test timeframe length parsing."""
+
+    def test_known_timeframes(self):
+        """Test minute and daily timeframe values."""
+        assert timeframe_seconds("1") == 60
+        assert timeframe_seconds("240") == 14400
+        assert timeframe_seconds("1d") == 86400
+
+    def test_invalid_timeframe_raises(self):
+        """Test unknown timeframe raises ValueError."""
+        with pytest.raises(ValueError):
+            timeframe_seconds("H1")
+
+
+class TestBrokerClockOffset:
+    """Test broker clock offset estimation."""
+
+    def test_offset_converges_from_fresh_bars(self):
+        """Test that a fetch just after a bar opened pins the offset."""
+        offset = BrokerClockOffset()
+        local_now = 1_700_000_000.0
+        bar_open = pd.Timestamp(local_now + BROKER_OFFSET - 20, unit='s')
+
+        offset.observe(bar_open, 60, local_now)
+        offset.observe(pd.Timestamp(local_now + 40 + BROKER_OFFSET, unit='s'), 60, local_now + 40.5)
+
+        assert offset.offset_seconds == pytest.approx(BROKER_OFFSET, abs=1)
+
+    def test_stale_bar_ignored_unless_fresh(self):
+        """Test that an old bar from a closed market does not disturb the estimate."""
+        offset = BrokerClockOffset()
+        local_now = 1_700_000_000.0
+        offset.observe(pd.Timestamp(local_now + BROKER_OFFSET, unit='s'), 60, local_now)
+
+        offset.observe(pd.Timestamp(local_now - 86400, unit='s'), 60, local_now + 10, fresh=False)
+
+        assert offset.offset_seconds == pytest.approx(BROKER_OFFSET)
+        assert offset.resets == 0
+
+
+class TestCandleCloseScheduler:
+    """Test scheduling against a simulated broker."""
+
+    def test_polls_only_around_candle_close(self):
+        """Test that H4 is polled a handful of times, not every interval."""
+        broker = FakeBroker(start=1_700_000_000.0 + 17)
+        service, scheduler = create_scheduler(broker, ["1", "240"])
+
+        run_for(broker, scheduler, 4 * 3600)
+
+        # Fixed 30s polling would make 480 calls per timeframe over 4 hours
+        assert broker.calls["240"] <= 3
+        # About one poll per M1 bar once the broker offset has been learned
+        assert broker.calls["1"] <= 4 * 60 + 15
+        assert service.get_metrics()["new_candles_detected"] >= 4 * 60
+
+    def test_detects_close_quickly_with_broker_offset(self):
+        """Test close-to-detect latency stays near the close delay despite the broker offset."""
+        broker = FakeBroker(start=1_700_000_000.0 + 17)
+        _, scheduler = create_scheduler(broker, ["1", "5"])
+
+        # First few bars are spent learning the offset
+        run_for(broker, scheduler, 600)
+        warmup = scheduler.get_metrics()
+
+        run_for(broker, scheduler, 3000)
+        metrics = scheduler.get_metrics()
+
+        assert metrics["broker_offset_seconds"] == pytest.approx(BROKER_OFFSET, abs=2)
+
+        samples = metrics["latency_samples"] - warmup["latency_samples"]
+        latency = metrics["total_detect_latency"] - warmup["total_detect_latency"]
+        polls = metrics["polls"] - warmup["polls"]
+        candles = metrics["candles_detected"] - warmup["candles_detected"]
+        assert latency / samples <= 1.0
+        assert polls / candles < 1.2
+
+    def test_closed_market_goes_idle(self):
+        """Test that timeframes without new bars back off to one poll per boundary."""
+        broker = FakeBroker(start=1_700_000_000.0 + 17)
+        _, scheduler = create_scheduler(broker, ["1"])
+
+        run_for(broker, scheduler, 120)
+        broker.market_open = False
+        broker.closed_at = broker.now
+        calls_before = broker.calls["1"]
+
+        run_for(broker, scheduler, 3600)
+
+        assert scheduler.get_metrics()["idle_timeframes"] == 1
+        # At most one retry window of polls, then one poll per minute
+        assert broker.calls["1"] - calls_before <= 60 + 32
@@ -840,3 +840,91 @@ class TestMetrics:
         metrics = service.get_metrics()
 
         assert metrics["exit_signals_generated"] == 2
+
+
+class TestTimeSensitiveRefresh:
+    """Test the timer path for time-sensitive strategies."""
+
+    def test_check_timers_before_first_evaluation_is_noop(self):
+        """Test nothing is refreshed before any rows were evaluated."""
+        strategy_engine = Mock()
+        service = StrategyEvaluationService(
+            event_bus=MockEventBus(),
+            strategy_engine=strategy_engine,
+            entry_manager=Mock(),
+            config={"symbol": "EURUSD"},
+        )
+
+        service.check_timers()
+
+        strategy_engine.refresh_time_sensitive.assert_not_called()
+
+    def test_check_timers_passes_changed_results_to_entry_manager(self):
+        """Test only refreshed results reach the EntryManager, with the last evaluated rows."""
+        mock_bus = MockEventBus()
+        strategy_engine = Mock()
+        entry_manager = Mock()
+        strategy_engine.evaluate.return_value = Mock(strategies={"a": Mock(), "b": Mock()})
+        strategy_engine.refresh_time_sensitive.return_value = Mock(strategies={"b": Mock()})
+
+        mock_exit = Mock(strategy_name="b", symbol="EURUSD", direction="long")
+        entry_manager.manage_trades.return_value = Mock(entries=[], exits=[mock_exit])
+
+        service = StrategyEvaluationService(
+            event_bus=mock_bus,
+            strategy_engine=strategy_engine,
+            entry_manager=entry_manager,
+            config={"symbol": "EURUSD", "min_rows_required": 1},
+        )
+        service.start()
+
+        recent_rows = {"1": deque([pd.Series({"close": 1.09})])}
+        service._on_indicators_calculated(IndicatorsCalculatedEvent(
+            symbol="EURUSD", timeframe="1", enriched_data={}, recent_rows=recent_rows,
+        ))
+        service.check_timers()
+
+        strategy_engine.refresh_time_sensitive.assert_called_once_with(recent_rows)
+        strategies, rows = entry_manager.manage_trades.call_args[0]
+        assert list(strategies) == ["b"]
+        assert rows is recent_rows
+        assert len(mock_bus.get_published_events(ExitSignalEvent)) == 2
+
+
+class TestStrategyReload:
+    """Test reloading strategies into a running service."""
+
+    def _service(self, strategies):
+        strategy_engine = Mock()
+        strategy_engine.reload_strategies.return_value = {"added": [], "changed": ["a"], "removed": []}
+        strategy_engine.list_available_strategies.return_value = list(strategies)
+        strategy_engine.get_strategy_info.side_effect = strategies.__getitem__
+        entry_manager = Mock(strategies={"a": "old"})
+        service = StrategyEvaluationService(
+            event_bus=MockEventBus(),
+            strategy_engine=strategy_engine,
+            entry_manager=entry_manager,
+            config={"symbol": "EURUSD"},
+        )
+        return service, strategy_engine, entry_manager
+
+    def test_reload_updates_entry_manager(self):
+        """Test the engine is reloaded with the new files and the EntryManager gets its strategies."""
+        service, strategy_engine, entry_manager = self._service({"a": "new"})
+
+        summary = service.reload_strategies(["a.yaml"])
+
+        strategy_engine.reload_strategies.assert_called_once_with(["a.yaml"])
+        assert summary["changed"] == ["a"]
+        assert entry_manager.strategies == {"a": "new"}
+        entry_manager._validate_strategies.assert_called_once()
+
+    def test_reload_keeps_entry_manager_strategies_when_invalid(self):
+        """Test strategies rejected by the EntryManager are not kept."""
+        service, strategy_engine, entry_manager = self._service({"a": "new"})
+        entry_manager._validate_strategies.side_effect = ValueError("missing risk")
+
+        with pytest.raises(ValueError):
+            service.reload_strategies()
+
+        assert entry_manager.strategies == {"a": "old"}
@@ -0,0 +1,44 @@
+"""
+Small strategies and rows for engine dispatch tests.
+"""
+
+import pandas as pd
+
+from app.strategy_builder.core.domain.models import (
+    Condition,
+    EntryDirectionalRules,
+    EntryRules,
+    FixedStopLoss,
+    FixedTakeProfit,
+    RiskManagement,
+    TradingStrategy,
+)
+
+
+BAR_START = pd.Timestamp("2024-01-02 10:00")
+
+
+def make_strategy(name: str, timeframe: str = "1", long=None, short=None, sl=None, **extra) -> TradingStrategy:
+    """
+    Strategy with a fixed 30 SL / 60 TP risk block.
+
+    Without long or short rules it enters long on ``rsi > 50`` on ``timeframe``.
+    Extra keyword arguments (exit, activation, ...) go to TradingStrategy.
+    """
+    if long is None and short is None:
+        long = EntryRules(conditions=[Condition(signal="rsi", operator=">", value=50.0, timeframe=timeframe)])
+    return TradingStrategy(
+        name=name,
+        timeframes=[timeframe],
+        entry=EntryDirectionalRules(long=long, short=short),
+        risk=RiskManagement(
+            sl=sl or FixedStopLoss(type="fixed", value=30.0),
+            tp=FixedTakeProfit(type="fixed", value=60.0),
+        ),
+        **extra,
+    )
+
+
+def bar(minute: int, start=BAR_START, **values) -> pd.Series:
+    """Row ``minute`` minutes after ``start`` with the given indicator values."""
+    return pd.Series({"time": pd.Timestamp(start) + pd.Timedelta(minutes=minute), **values})
@@ -0,0 +1,92 @@
+"""
+Random strategies and rows for parity tests of the compiled evaluators.
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from app.strategy_builder.core.domain.enums import ConditionOperatorEnum, LogicModeEnum, TimeFrameEnum
+from app.strategy_builder.core.domain.models import (
+    Condition,
+    ConditionTree,
+    EntryDirectionalRules,
+    EntryRules,
+    ExitDirectionalRules,
+    ExitRules,
+    FixedStopLoss,
+    FixedTakeProfit,
+    RiskManagement,
+    TimeBasedExit,
+    TradingStrategy,
+)
+
+
+TIMEFRAMES = [TimeFrameEnum.M1, TimeFrameEnum.H1]
+SIGNALS = ["rsi", "close", "regime"]
+OPERATORS = [ConditionOperatorEnum.GT, ConditionOperatorEnum.LTE, ConditionOperatorEnum.EQ,
+             ConditionOperatorEnum.CROSSES_ABOVE, ConditionOperatorEnum.CROSSES_BELOW,
+             ConditionOperatorEnum.CHANGES_TO, ConditionOperatorEnum.IN]
+
+
+def random_condition(rng: random.Random) -> Condition:
+    """Random condition over SIGNALS, OPERATORS and TIMEFRAMES (some raise: crosses against a string)."""
+    operator = rng.choice(OPERATORS)
+    if operator == ConditionOperatorEnum.IN:
+        value = rng.choice([[40.0, 50.0], ["bull", "range"]])
+    else:
+        value = rng.choice([30.0, 50.0, 70.0, "ma", "bull"])
+    return Condition(signal=rng.choice(SIGNALS), operator=operator, value=value, timeframe=rng.choice(TIMEFRAMES))
+
+
+def random_node(rng: random.Random, depth: int = 0):
+    """Random condition or and/or/not tree, at most two levels deep."""
+    if depth >= 2 or rng.random() < 0.4:
+        return random_condition(rng)
+    operator = rng.choice(["and", "or", "not"])
+    count = 1 if operator == "not" else rng.randint(2, 3)
+    return ConditionTree(operator=operator, conditions=[random_node(rng, depth + 1) for _ in range(count)])
+
+
+def random_rules(rng: random.Random, rules_class):
+    """Random all/any/complex entry or exit rules, exits sometimes with a time-based exit."""
+    mode = rng.choice(list(LogicModeEnum))
+    extra = {}
+    if rules_class is ExitRules and rng.random() < 0.3:
+        extra["time_based"] = TimeBasedExit(max_duration="4h")
+    if mode == LogicModeEnum.COMPLEX:
+        tree = random_node(rng)
+        if isinstance(tree, Condition):
+            tree = ConditionTree(operator="not", conditions=[tree])
+        return rules_class(mode=mode, tree=tree, **extra)
+    return rules_class(mode=mode, conditions=[random_condition(rng) for _ in range(rng.randint(1, 3))], **extra)
+
+
+def random_strategy(rng: random.Random, name: str) -> TradingStrategy:
+    """Random strategy over TIMEFRAMES with optional short entry and exit rules."""
+    return TradingStrategy(
+        name=name,
+        timeframes=TIMEFRAMES,
+        entry=EntryDirectionalRules(
+            long=random_rules(rng, EntryRules),
+            short=random_rules(rng, EntryRules) if rng.random() < 0.7 else None,
+        ),
+        exit=ExitDirectionalRules(long=random_rules(rng, ExitRules)) if rng.random() < 0.8 else None,
+        risk=RiskManagement(sl=FixedStopLoss(type="fixed", value=30.0), tp=FixedTakeProfit(type="fixed", value=60.0)),
+    )
+
+
+def random_row(rng: random.Random) -> pd.Series:
+    """Random mixed-type row (floats, ints, NaN, strings) for SIGNALS."""
+    def number():
+        return rng.choice([rng.uniform(20, 80), np.float64(50.0), 50, np.nan])
+
+    return pd.Series({
+        "time": pd.Timestamp("2024-01-02 10:00") + pd.Timedelta(minutes=rng.randint(0, 10 ** 6)),
+        "rsi": number(), "previous_rsi": number(),
+        "close": number(), "previous_close": number(),
+        "ma": number(), "previous_ma": number(),
+        "regime": rng.choice(["bull", "Bull", "range", 50.0]),
+        "previous_regime": rng.choice(["bull", "range"]),
+    }, dtype=object)
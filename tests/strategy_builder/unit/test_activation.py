@@ -0,0 +1,147 @@
+"""
+Unit tests for schedule-based strategy activation.
+
+These tests verify that:
+- ActivationCalendar gives the same active set as checking every schedule
+  directly, for any minute of the week, and caches it until the next boundary
+- Hours include their last minute, so "00:00-23:59" on consecutive days has no gap
+- StrategyEngine does no per-strategy work for strategies outside their
+  schedule and evaluates them once the schedule opens, even between bars
+- A "close_all" strategy outside its schedule reports exits on both sides
+- StrategyExecutor.is_strategy_active() applies the schedule
+"""
+
+import random
+import unittest
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from app.strategy_builder.core.domain.models import (
+    Activation,
+    Schedule,
+    TradingStrategy,
+)
+from app.strategy_builder.core.evaluators.activation import ActivationCalendar, is_active_at
+from app.strategy_builder.core.evaluators.factory import DefaultEvaluatorFactory
+from app.strategy_builder.core.services.engine import StrategyEngine
+from app.strategy_builder.core.services.executor import StrategyExecutor
+from app.strategy_builder.infrastructure.logging import create_null_logger
+from app.utils.clock import SimulatedClock, use_clock
+from tests.strategy_builder.fixtures.engine_strategies import bar, make_strategy
+
+MONDAY = datetime(2024, 1, 1)
+DAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def scheduled_strategy(name: str, days=None, hours=None, enabled=True, session_handling=None) -> TradingStrategy:
+    schedule = Schedule(days=days or [], hours=hours, session_handling=session_handling) if hours else None
+    return make_strategy(name, activation=Activation(enabled=enabled, schedule=schedule))
+
+
+class TestActivationCalendar(unittest.TestCase):
+    """Weekly interval index against the direct schedule check."""
+
+    def test_matches_direct_check(self):
+        """Test random schedules give the same active set as is_active_at for every probed minute."""
+        rng = random.Random(0)
+        strategies = {
+            "always": scheduled_strategy("always"),
+            "off": scheduled_strategy("off", hours="00:00-23:59", enabled=False),
+        }
+        for index in range(30):
+            start = rng.randrange(0, 23 * 60)
+            end = rng.randrange(start + 1, 24 * 60)
+            hours = f"{start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}"
+            days = rng.sample(DAYS, rng.randrange(0, 8))
+            strategies[f"s{index}"] = scheduled_strategy(f"s{index}", days=days, hours=hours)
+        calendar = ActivationCalendar(strategies)
+
+        for _ in range(2000):
+            when = MONDAY + timedelta(seconds=rng.randrange(0, 14 * 24 * 3600))
+            expected = {name for name, strategy in strategies.items() if is_active_at(strategy, when)}
+            self.assertEqual(calendar.active_at(when), expected, when)
+
+    def test_cached_until_next_boundary(self):
+        """Test the active set is reused until next_change() and then recomputed."""
+        calendar = ActivationCalendar({"a": scheduled_strategy("a", days=["mon"], hours="09:00-17:00")})
+
+        morning = calendar.active_at(MONDAY.replace(hour=10))
+        self.assertIs(calendar.active_at(MONDAY.replace(hour=16, minute=59, second=59)), morning)
+        self.assertEqual(calendar.next_change(MONDAY.replace(hour=10)), MONDAY.replace(hour=17, minute=1))
+        self.assertEqual(calendar.active_at(MONDAY.replace(hour=17, minute=1)), set())
+        self.assertEqual(calendar.next_change(MONDAY.replace(hour=18)), MONDAY + timedelta(days=7, hours=9))
+
+    def test_whole_days_join(self):
+        """Test "00:00-23:59" on consecutive days covers midnight."""
+        calendar = ActivationCalendar({
+            "weekend": scheduled_strategy("weekend", days=["sat", "sun"], hours="00:00-23:59"),
+        })
+
+        saturday_midnight = MONDAY + timedelta(days=6)
+        self.assertTrue(calendar.is_active("weekend", saturday_midnight - timedelta(seconds=1)))
+        self.assertTrue(calendar.is_active("weekend", saturday_midnight))
+        self.assertFalse(calendar.is_active("weekend", MONDAY + timedelta(days=7)))
+
+
+class TestEngineActivation(unittest.TestCase):
+    """StrategyEngine skips inactive strategies up front."""
+
+    def setUp(self):
+        """Set up an engine with an unscheduled strategy and two Monday 09:00-17:00 strategies."""
+        self.strategies = {
+            "always": scheduled_strategy("always"),
+            "office": scheduled_strategy("office", days=["mon"], hours="09:00-17:00"),
+            "closer": scheduled_strategy("closer", days=["mon"], hours="09:00-17:00", session_handling="close_all"),
+        }
+        loader = Mock()
+        loader.load_strategies.return_value = self.strategies
+        self.engine = StrategyEngine(loader, DefaultEvaluatorFactory(create_null_logger()), create_null_logger())
+        self.data = {"1": deque([bar(0, start=MONDAY.replace(hour=8), rsi=60.0)])}
+
+    def test_inactive_strategies_are_not_evaluated(self):
+        """Test strategies outside their schedule are skipped, and close_all ones report exits."""
+        with use_clock(SimulatedClock(MONDAY.replace(hour=8))):
+            results = self.engine.evaluate(self.data).strategies
+
+        self.assertNotIn("office", self.engine._plans)          # not even compiled
+        self.assertEqual(sorted(results), ["always", "closer"])
+        self.assertFalse(results["closer"].entry.long)
+        self.assertTrue(results["closer"].exit.long and results["closer"].exit.short)
+
+    def test_schedule_changes_between_bars(self):
+        """Test refresh_time_sensitive() evaluates opened strategies and closes ended sessions."""
+        with use_clock(SimulatedClock(MONDAY.replace(hour=8, minute=59))) as clock:
+            self.engine.evaluate(self.data)
+
+            clock.advance(timedelta(minutes=1))
+            opened = self.engine.refresh_time_sensitive(self.data).strategies
+            self.assertEqual(sorted(opened), ["closer", "office"])
+            self.assertTrue(opened["office"].entry.long)
+            self.assertEqual(self.engine.refresh_time_sensitive(self.data).strategies, {})
+
+            clock.set(MONDAY.replace(hour=17, minute=1))
+            closed = self.engine.refresh_time_sensitive(self.data).strategies
+            self.assertEqual(list(closed), ["closer"])
+            self.assertTrue(closed["closer"].exit.long)
+            self.assertEqual(sorted(self.engine.evaluate(self.data).strategies), ["always", "closer"])
+
+
+class TestExecutorActivation(unittest.TestCase):
+    """StrategyExecutor.is_strategy_active() with schedules."""
+
+    def test_schedule_is_applied(self):
+        """Test the executor is active only inside the schedule and never when disabled."""
+        factory = DefaultEvaluatorFactory(create_null_logger())
+        office = StrategyExecutor(scheduled_strategy("office", days=["mon"], hours="09:00-17:00"), {}, factory)
+        disabled = StrategyExecutor(scheduled_strategy("off", enabled=False), {}, factory)
+
+        with use_clock(SimulatedClock(MONDAY.replace(hour=12))) as clock:
+            self.assertTrue(office.is_strategy_active())
+            self.assertFalse(disabled.is_strategy_active())
+            clock.set(MONDAY.replace(hour=18))
+            self.assertFalse(office.is_strategy_active())
+
+
+if __name__ == "__main__":
+    unittest.main()
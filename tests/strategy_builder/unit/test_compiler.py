@@ -0,0 +1,320 @@
+"""
+Unit tests for the strategy compiler.
+
+These tests verify that:
+- Compiled conditions match ConditionEvaluator for every operator across
+  float, int, bool, string, missing and column-reference values
+- and/or trees short-circuit and compiled rule sets match LogicEvaluator
+- Time-based exits read the injected clock and the position data
+- Identical conditions are interned across strategies and computed once per bar
+- Adaptive all/any nodes move selective conditions first, keep children
+  that may raise in place, and never change a rule set's result
+- StrategyEngine compiles each strategy once, recompiles after a reload and
+  reports the condition dedup ratio
+"""
+
+import itertools
+import random
+import unittest
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+
+from app.strategy_builder.core.domain.enums import ConditionOperatorEnum, LogicModeEnum, TimeFrameEnum
+from app.strategy_builder.core.domain.models import (
+    Condition,
+    ConditionTree,
+    EntryDirectionalRules,
+    EntryRules,
+    ExitRules,
+    FixedStopLoss,
+    FixedTakeProfit,
+    RiskManagement,
+    TimeBasedExit,
+    TradingStrategy,
+)
+from app.strategy_builder.core.evaluators.compiler import RowAccessor, StrategyCompiler
+from app.strategy_builder.core.evaluators.condition import ConditionEvaluator
+from app.strategy_builder.core.evaluators.factory import DefaultEvaluatorFactory
+from app.strategy_builder.core.services.engine import StrategyEngine
+from app.strategy_builder.core.services.executor import create_strategy_executor
+from app.strategy_builder.infrastructure.logging import create_null_logger
+from app.utils.clock import SimulatedClock, use_clock
+from tests.strategy_builder.fixtures.mock_data import create_mock_market_data
+from tests.strategy_builder.fixtures.mock_strategies import create_complex_strategy, create_simple_strategy
+from tests.strategy_builder.fixtures.random_strategies import TIMEFRAMES, random_row, random_strategy
+
+
+SIGNAL_VALUES = [1.5, 2.0, np.float64(2.0), np.nan, 2, np.int64(3), True, "Bull", "bear", None]
+TARGETS = [2.0, 2, 1.7, "level", "bull", "BULL", "missing", True]
+
+
+def interpreted(condition: Condition, row: pd.Series) -> bool:
+    """Interpreter result, with evaluation errors treated as False like StrategyExecutor."""
+    evaluator = ConditionEvaluator({condition.timeframe: deque([row])}, create_null_logger())
+    try:
+        return bool(evaluator.evaluate(condition))
+    except (ValueError, TypeError, KeyError):
+        return False
+
+
+def compiled(check, row: pd.Series) -> bool:
+    try:
+        return bool(check(RowAccessor({TimeFrameEnum.M1: deque([row])})))
+    except (ValueError, TypeError, KeyError):
+        return False
+
+
+def entry_strategy(rules: EntryRules) -> TradingStrategy:
+    return TradingStrategy(
+        name="s", timeframes=[TimeFrameEnum.M1], entry=EntryDirectionalRules(long=rules),
+        risk=RiskManagement(sl=FixedStopLoss(type="fixed", value=30.0), tp=FixedTakeProfit(type="fixed", value=60.0)),
+    )
+
+
+class TestConditionParity(unittest.TestCase):
+    """Compiled conditions agree with ConditionEvaluator."""
+
+    def setUp(self):
+        """Set up the compiler."""
+        self.compiler = StrategyCompiler(create_null_logger())
+
+    def test_every_operator_and_value_type(self):
+        """Test all operators over mixed-type rows and literal/column targets."""
+        rng = random.Random(7)
+        rows = []
+        for _ in range(150):
+            row = {
+                "sig": rng.choice(SIGNAL_VALUES),
+                "previous_sig": rng.choice(SIGNAL_VALUES),
+                "level": rng.choice([1.8, 2.0, np.float64(1.9), 2, "2.0"]),
+                "previous_level": rng.choice([1.8, 2.0, None]),
+            }
+            rows.append(pd.Series({k: v for k, v in row.items() if v is not None or rng.random() < 0.5},
+                                  dtype=object))
+
+        mismatches = []
+        for operator in ConditionOperatorEnum:
+            if operator in (ConditionOperatorEnum.IN, ConditionOperatorEnum.NOT_IN):
+                values = [[2.0, 1.5], ["bull", "Bear"], [2]]
+            elif operator in (ConditionOperatorEnum.RISING, ConditionOperatorEnum.FALLING):
+                values = [1, 2]
+            else:
+                values = TARGETS
+            for value in values:
+                condition = Condition(signal="sig", operator=operator, value=value, timeframe=TimeFrameEnum.M1)
+                check = self.compiler.compile_condition(condition)
+                for row in rows:
+                    if interpreted(condition, row) != compiled(check, row):
+                        mismatches.append((operator.value, value, row.to_dict()))
+
+        self.assertEqual(mismatches, [])
+
+    def test_float_frame_rows_and_duplicate_columns(self):
+        """Test rows from an all-float frame and rows with duplicated columns."""
+        frame = pd.DataFrame({"sig": [1.0, 3.0], "previous_sig": [2.5, 1.0], "level": [2.0, 2.0],
+                              "previous_level": [2.0, 2.0]})
+        duplicated = pd.Series([3.0, 1.0, 1.0], index=["sig", "sig", "previous_sig"])
+
+        for operator in (ConditionOperatorEnum.GT, ConditionOperatorEnum.CROSSES_ABOVE):
+            for value in (2.0, "level"):
+                condition = Condition(signal="sig", operator=operator, value=value, timeframe=TimeFrameEnum.M1)
+                check = self.compiler.compile_condition(condition)
+                for row in [frame.iloc[0], frame.iloc[1]]:
+                    self.assertEqual(compiled(check, row), interpreted(condition, row))
+
+        condition = Condition(signal="sig", operator=ConditionOperatorEnum.GT, value=2.0, timeframe=TimeFrameEnum.M1)
+        self.assertTrue(compiled(self.compiler.compile_condition(condition), duplicated))
+        self.assertTrue(interpreted(condition, duplicated))
+
+
+class TestRuleSets(unittest.TestCase):
+    """Compiled rule sets and trees."""
+
+    def setUp(self):
+        """Set up the compiler and market data."""
+        self.compiler = StrategyCompiler(create_null_logger())
+        self.rows = RowAccessor(create_mock_market_data())
+
+    def test_or_short_circuits(self):
+        """Test an or-tree stops at its first true child."""
+        true = Condition(signal="rsi", operator=ConditionOperatorEnum.GT, value=60.0, timeframe=TimeFrameEnum.M1)
+        other = Condition(signal="rsi", operator=ConditionOperatorEnum.LT, value=10.0, timeframe=TimeFrameEnum.M1)
+        rules = EntryRules(mode=LogicModeEnum.COMPLEX, tree=ConditionTree(operator="or", conditions=[true, other]))
+        check = self.compiler.compile_entry_rules(rules)
+        rows = Mock(wraps=self.rows)
+
+        self.assertTrue(check(rows))
+        self.assertEqual(rows.latest.call_count, 1)
+
+    def test_strategies_match_executor(self):
+        """Test entry and exit signals of the fixture strategies match StrategyExecutor."""
+        market_data = create_mock_market_data()
+        factory = DefaultEvaluatorFactory(create_null_logger())
+
+        for strategy in (create_simple_strategy(), create_complex_strategy()):
+            plan = self.compiler.compile(strategy)
+            executor = create_strategy_executor(strategy, market_data, factory)
+
+            self.assertEqual(plan.check_entry(self.rows), executor.check_entry())
+            self.assertEqual(plan.check_exit(self.rows), executor.check_exit())
+
+    def test_time_based_exit_uses_clock(self):
+        """Test max_duration against the process clock, and no trigger without position data."""
+        rules = ExitRules(mode=LogicModeEnum.ANY, conditions=[], time_based=TimeBasedExit(max_duration="4h"))
+        check = self.compiler.compile_exit_rules(rules)
+        position = {"entry_time": datetime(2024, 1, 2, 9, 0)}
+
+        with use_clock(SimulatedClock(datetime(2024, 1, 2, 12, 0))) as clock:
+            self.assertFalse(check(self.rows, position))
+            clock.advance(timedelta(hours=1))
+            self.assertTrue(check(self.rows, position))
+            self.assertFalse(check(self.rows, None))
+
+
+class TestInterning(unittest.TestCase):
+    """Shared condition ids and per-bar memoization."""
+
+    def test_condition_computed_once_per_bar(self):
+        """Test two rule sets sharing a condition evaluate it once per bar and again on a new row."""
+        compiler = StrategyCompiler(create_null_logger())
+        evaluate_row = compiler._fallback.evaluate_row = Mock(wraps=compiler._fallback.evaluate_row)
+        rules = EntryRules(mode=LogicModeEnum.ALL, conditions=[
+            Condition(signal="volume", operator=ConditionOperatorEnum.GT, value=1000, timeframe=TimeFrameEnum.M1)
+        ])
+        first = compiler.compile_entry_rules(rules)
+        second = compiler.compile_entry_rules(rules.model_copy(deep=True))
+        bar_time = pd.Timestamp("2024-01-02 10:00")
+        window = deque([pd.Series({"time": bar_time, "volume": 1200}, dtype=object)])   # int: interpreter path
+        data = {TimeFrameEnum.M1: window}
+
+        for _ in range(2):
+            rows = RowAccessor(data)
+            self.assertTrue(first(rows) and second(rows))
+        self.assertEqual(compiler.distinct_conditions, 1)
+        self.assertEqual(evaluate_row.call_count, 1)
+
+        window[-1] = pd.Series({"time": bar_time, "volume": 900}, dtype=object)      # rebuilt row, same bar
+        self.assertFalse(second(RowAccessor(data)))
+        window.append(pd.Series({"time": bar_time + pd.Timedelta(minutes=1), "volume": 1500}, dtype=object))
+        self.assertTrue(first(RowAccessor(data)))
+        self.assertEqual(evaluate_row.call_count, 3)
+
+    def test_value_types_are_not_merged(self):
+        """Test conditions differing only in literal type get separate ids (1 validates to 1.0)."""
+        compiler = StrategyCompiler(create_null_logger())
+        for value in (1, 1.0, True, "1"):
+            compiler.compile_condition(
+                Condition(signal="flag", operator=ConditionOperatorEnum.EQ, value=value, timeframe=TimeFrameEnum.M1)
+            )
+
+        self.assertEqual(compiler.distinct_conditions, 3)
+
+
+class TestAdaptiveOrdering(unittest.TestCase):
+    """Self-reordering all/any nodes."""
+
+    def test_reordering_keeps_results(self):
+        """Test adaptive plans agree with authored-order plans on random strategies and rows."""
+        rng = random.Random(2)
+        strategies = [random_strategy(rng, f"s{i}") for i in range(30)]
+        adaptive = StrategyCompiler(create_null_logger(), sample_every=1, reorder_every=2)
+        authored = StrategyCompiler(create_null_logger(), adaptive=False)
+        pairs = [(adaptive.compile(strategy), authored.compile(strategy)) for strategy in strategies]
+
+        with use_clock(SimulatedClock(datetime(2024, 1, 2, 12, 0))):
+            for _ in range(200):
+                rows = RowAccessor({tf: deque([random_row(rng)]) for tf in TIMEFRAMES})
+                position = {"entry_time": datetime(2024, 1, 2, rng.choice([5, 11]), 0)}
+                for fast, reference in pairs:
+                    self.assertEqual(fast.check_entry(rows), reference.check_entry(rows))
+                    self.assertEqual(fast.check_exit(rows, position), reference.check_exit(rows, position))
+
+        self.assertGreater(sum(stats["reorders"] for fast, _ in pairs for stats in fast.ordering_stats()), 0)
+
+    def test_selective_condition_moves_first(self):
+        """Test an all-node runs the always-false condition first and reports pass rates."""
+        compiler = StrategyCompiler(create_null_logger(), sample_every=1, reorder_every=4)
+        rules = EntryRules(mode=LogicModeEnum.ALL, conditions=[
+            Condition(signal="rsi", operator=ConditionOperatorEnum.GT, value=10.0, timeframe=TimeFrameEnum.M1),
+            Condition(signal="rsi", operator=ConditionOperatorEnum.GT, value=90.0, timeframe=TimeFrameEnum.M1),
+        ])
+        plan = compiler.compile(entry_strategy(rules))
+
+        for minute in range(8):
+            row = pd.Series({"time": pd.Timestamp("2024-01-02") + pd.Timedelta(minutes=minute), "rsi": 50.0})
+            self.assertFalse(plan.check_entry(RowAccessor({TimeFrameEnum.M1: deque([row])})).long)
+
+        [stats] = plan.ordering_stats()
+        self.assertEqual((stats["rule_set"], stats["mode"], stats["order"]), ("entry_long", "all", [1, 0]))
+        self.assertEqual(stats["children"][1]["pass_rate"], 0.0)
+        self.assertEqual(stats["children"][0]["label"], "rsi > 10.0 @1")
+
+        loader = Mock()
+        loader.load_strategies.return_value = {"s": plan.strategy}
+        engine = StrategyEngine(loader, DefaultEvaluatorFactory(create_null_logger()), create_null_logger(),
+                                compiler=compiler)
+        engine.compile_strategies()
+        self.assertEqual(engine.ordering_stats()["s"][0]["rule_set"], "entry_long")
+
+    def test_children_that_may_raise_stay_in_place(self):
+        """Test an any-node keeps a string cross at its position and only reorders around it."""
+        compiler = StrategyCompiler(create_null_logger(), sample_every=1, reorder_every=1)
+        never = Condition(signal="rsi", operator=ConditionOperatorEnum.GT, value=90.0, timeframe=TimeFrameEnum.M1)
+        always = Condition(signal="rsi", operator=ConditionOperatorEnum.GT, value=10.0, timeframe=TimeFrameEnum.M1)
+        cross = Condition(signal="regime", operator=ConditionOperatorEnum.CROSSES_ABOVE, value="up",
+                          timeframe=TimeFrameEnum.M1)
+        plan = compiler.compile(entry_strategy(EntryRules(mode=LogicModeEnum.ANY, conditions=[never, cross, always])))
+        row = pd.Series({"rsi": 50.0, "regime": "bull", "previous_regime": "bear"}, dtype=object)
+
+        for _ in range(6):
+            # float("up") raises before "always" is reached, as in the authored order
+            self.assertFalse(plan.check_entry(RowAccessor({TimeFrameEnum.M1: deque([row])})).long)
+
+        [stats] = plan.ordering_stats()
+        self.assertEqual(stats["order"], [0, 1, 2])
+        self.assertEqual([child["pinned"] for child in stats["children"]], [False, True, False])
+
+
+class TestEngineCompilation(unittest.TestCase):
+    """StrategyEngine plan caching."""
+
+    def test_compiles_once_and_after_reload(self):
+        """Test plans are reused across evaluations and rebuilt for new strategy objects."""
+        loader = Mock()
+        loader.load_strategies.return_value = {"simple": create_simple_strategy()}
+        compiler = StrategyCompiler(create_null_logger())
+        compiler.compile = Mock(wraps=compiler.compile)
+        engine = StrategyEngine(loader, DefaultEvaluatorFactory(create_null_logger()), create_null_logger(),
+                                compiler=compiler)
+
+        for _ in range(3):
+            results = engine.evaluate(create_mock_market_data())
+        self.assertEqual(compiler.compile.call_count, 1)
+        self.assertIn("simple", results.strategies)
+
+        loader.load_strategies.return_value = {"simple": create_simple_strategy()}
+        engine.reload_strategies()
+        engine.evaluate(create_mock_market_data())
+        self.assertEqual(compiler.compile.call_count, 2)
+
+    def test_dedup_ratio(self):
+        """Test strategies with the same conditions share ids and the ratio is reported."""
+        second = create_simple_strategy().model_copy(update={"name": "copy"}, deep=True)
+        loader = Mock()
+        loader.load_strategies.return_value = {"simple": create_simple_strategy(), "copy": second}
+        logger = Mock()
+        engine = StrategyEngine(loader, DefaultEvaluatorFactory(logger), logger)
+
+        plans = engine.compile_strategies()
+
+        self.assertEqual(plans["simple"].condition_ids, plans["copy"].condition_ids)
+        self.assertEqual(engine.condition_stats(), {"conditions": 4, "distinct": 2, "dedup_ratio": 2.0})
+        self.assertIn("dedup ratio 2.00", logger.info.call_args[0][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
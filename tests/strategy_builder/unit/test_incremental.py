@@ -0,0 +1,134 @@
+"""
+Unit tests for incremental strategy re-evaluation.
+
+These tests verify that:
+- Strategies are indexed by the timeframes of their rules, declared
+  timeframes and indicator-based SL/TP
+- StrategyEngine.evaluate() re-evaluates only strategies whose timeframes
+  have a new or rebuilt latest row, and returns the cached result otherwise
+- Strategies skipped for missing data are picked up once the data arrives
+- refresh_time_sensitive() re-evaluates only time-sensitive strategies and
+  returns those whose result changed
+"""
+
+import unittest
+from collections import deque
+from unittest.mock import Mock
+
+from app.strategy_builder.core.domain.models import (
+    Activation,
+    ExitDirectionalRules,
+    ExitRules,
+    IndicatorBasedSlTp,
+    Schedule,
+    TimeBasedExit,
+)
+from app.strategy_builder.core.evaluators.compiler import is_time_sensitive, strategy_timeframes
+from app.strategy_builder.core.evaluators.factory import DefaultEvaluatorFactory
+from app.strategy_builder.core.services.engine import StrategyEngine
+from app.strategy_builder.infrastructure.logging import create_null_logger
+from tests.strategy_builder.fixtures.engine_strategies import bar, make_strategy
+
+ATR_H4_SL = IndicatorBasedSlTp(type="indicator", source="atr", timeframe="240")
+
+
+class TestStrategyIndex(unittest.TestCase):
+    """Timeframe dependencies and time sensitivity of strategies."""
+
+    def test_dependencies_include_indicator_sl(self):
+        """Test an indicator-based SL adds its timeframe to the strategy's dependencies."""
+        self.assertEqual(strategy_timeframes(make_strategy("a", "60", sl=ATR_H4_SL)), {"60", "240"})
+        self.assertEqual(strategy_timeframes(make_strategy("b", "1")), {"1"})
+
+    def test_time_sensitivity(self):
+        """Test time-based exits mark a strategy time-sensitive; schedules are left to the calendar."""
+        timed_exit = ExitDirectionalRules(long=ExitRules(conditions=[], time_based=TimeBasedExit(max_duration="4h")))
+        scheduled = Activation(schedule=Schedule(days=[], hours="08:00-16:00"))
+
+        self.assertFalse(is_time_sensitive(make_strategy("a", "1")))
+        self.assertTrue(is_time_sensitive(make_strategy("b", "1", exit=timed_exit)))
+        self.assertFalse(is_time_sensitive(make_strategy("c", "1", activation=scheduled)))
+
+
+class TestIncrementalEvaluation(unittest.TestCase):
+    """StrategyEngine result caching by timeframe."""
+
+    def setUp(self):
+        """Set up an engine with one M1 and one H1 strategy."""
+        self.strategies = {"fast": make_strategy("fast", "1"), "slow": make_strategy("slow", "60")}
+        loader = Mock()
+        loader.load_strategies.return_value = self.strategies
+        self.engine = StrategyEngine(loader, DefaultEvaluatorFactory(create_null_logger()), create_null_logger())
+        self.engine.compile_strategies()
+        self.plans = self.engine._plans
+        for plan in self.plans.values():
+            plan.check_entry = Mock(wraps=plan.check_entry)
+        self.data = {"1": deque([bar(0, rsi=60.0)]), "60": deque([bar(0, rsi=40.0)])}
+
+    def calls(self):
+        return {name: plan.check_entry.call_count for name, plan in self.plans.items()}
+
+    def test_only_changed_timeframes_are_re_evaluated(self):
+        """Test a new M1 row re-evaluates the M1 strategy only and H1 results come from the cache."""
+        first = self.engine.evaluate(self.data)
+        self.data["1"].append(bar(1, rsi=45.0))
+        second = self.engine.evaluate(self.data)
+
+        self.assertEqual(self.calls(), {"fast": 2, "slow": 1})
+        self.assertTrue(first.strategies["fast"].entry.long)
+        self.assertFalse(second.strategies["fast"].entry.long)
+        self.assertIs(second.strategies["slow"], first.strategies["slow"])
+
+        self.data["60"][-1] = bar(0, rsi=70.0)                     # rebuilt row for the same H1 bar
+        third = self.engine.evaluate(self.data)
+        self.assertEqual(self.calls(), {"fast": 2, "slow": 2})
+        self.assertTrue(third.strategies["slow"].entry.long)
+
+    def test_missing_data_is_picked_up_when_it_arrives(self):
+        """Test a strategy skipped for missing data is evaluated once its timeframe has rows."""
+        del self.data["60"]
+        self.assertNotIn("slow", self.engine.evaluate(self.data).strategies)
+        self.assertNotIn("slow", self.engine.evaluate(self.data).strategies)
+
+        self.data["60"] = deque([bar(0, rsi=70.0)])
+        self.assertTrue(self.engine.evaluate(self.data).strategies["slow"].entry.long)
+
+    def test_reload_invalidates_cache(self):
+        """Test new strategy objects from a reload are always re-evaluated."""
+        self.engine.evaluate(self.data)
+        previous_plan = self.plans["slow"]
+        self.strategies["slow"] = make_strategy("slow", "60")
+        self.engine.strategy_loader.load_strategies.return_value = self.strategies
+
+        result = self.engine.evaluate(self.data)
+
+        self.assertIsNot(self.engine._plans["slow"], previous_plan)
+        self.assertFalse(result.strategies["slow"].entry.long)
+
+
+class TestTimeSensitiveRefresh(unittest.TestCase):
+    """The timer path for time-sensitive strategies."""
+
+    def test_refresh_returns_changed_time_sensitive_results(self):
+        """Test only time-sensitive strategies are re-run and only changed results are returned."""
+        timed_exit = ExitDirectionalRules(long=ExitRules(conditions=[], time_based=TimeBasedExit(max_duration="4h")))
+        strategies = {"plain": make_strategy("plain", "1"), "timed": make_strategy("timed", "1", exit=timed_exit)}
+        loader = Mock()
+        loader.load_strategies.return_value = strategies
+        engine = StrategyEngine(loader, DefaultEvaluatorFactory(create_null_logger()), create_null_logger())
+        data = {"1": deque([bar(0, rsi=60.0)])}
+
+        self.assertFalse(engine.evaluate(data).strategies["timed"].exit.long)
+        self.assertEqual(engine.refresh_time_sensitive(data).strategies, {})
+
+        engine._plans["plain"].check_entry = plain = Mock()
+        engine._plans["timed"].check_exit = Mock(return_value=Mock(long=True, short=None))
+        refreshed = engine.refresh_time_sensitive(data)
+
+        plain.assert_not_called()
+        self.assertEqual(list(refreshed.strategies), ["timed"])
+        self.assertTrue(engine.evaluate(data).strategies["timed"].exit.long)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+Unit tests for lookback conditions served from the recent rows buffer.
+
+These tests verify that:
+- Series references ("close[-3]", "max(high, 20)", "min(low[-1], 10)") and
+  rising/falling values are validated when the strategy is loaded
+- Offsets, windowed aggregates and trends read the right bars, and a
+  crosses on references shifted by n bars is the cross of n bars ago
+- The compiled checks give the same results as ConditionEvaluator, whether
+  or not the rows carry materialised previous_* columns
+- Buffer depth per timeframe is the deepest lookback of the strategies
+- The matrix backend gives the same signals as the per-strategy backend
+"""
+
+import random
+import unittest
+from collections import deque
+from unittest.mock import Mock
+
+import pandas as pd
+from pydantic import ValidationError
+
+from app.strategy_builder.core.domain.models import (
+    Condition,
+    EntryDirectionalRules,
+    EntryRules,
+    FixedTakeProfit,
+    RiskManagement,
+    TradingStrategy,
+)
+from app.strategy_builder.core.evaluators.compiler import RowAccessor, StrategyCompiler, lookback_depths
+from app.strategy_builder.core.evaluators.condition import ConditionEvaluator
+from app.strategy_builder.core.evaluators.factory import DefaultEvaluatorFactory
+from app.strategy_builder.core.services.engine import StrategyEngine
+from app.strategy_builder.infrastructure.logging import create_null_logger
+
+CONDITIONS = [
+    ("close[-2]", ">", "ema"),
+    ("close", ">", "max(high[-1], 3)"),
+    ("low", "<", "min(low[-1], 4)"),
+    ("ema[-2]", "crosses_above", "sma[-2]"),
+    ("ema", "crosses_above", "sma"),
+    ("ema", "crosses_below", 50.0),
+    ("close", "rising", 2),
+    ("close[-1]", "falling", 3),
+    ("regime[-1]", "changes_to", "bull"),
+    ("regime", "remains", "bull"),
+]
+
+
+def condition(signal, operator, value, timeframe="1") -> Condition:
+    return Condition(signal=signal, operator=operator, value=value, timeframe=timeframe)
+
+
+def make_bars(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [
+        {
+            "time": pd.Timestamp("2024-01-02 10:00") + pd.Timedelta(minutes=minute),
+            "close": 50 + rng.gauss(0, 3),
+            "high": 52 + rng.gauss(0, 3),
+            "low": 48 + rng.gauss(0, 3),
+            "ema": 50 + rng.gauss(0, 1),
+            "sma": 50 + rng.gauss(0, 1),
+            "regime": rng.choice(["bull", "bear"]),
+        }
+        for minute in range(count)
+    ]
+
+
+def buffer(bars: list, materialize_previous: bool = False, maxlen: int = 8) -> deque:
+    rows = deque(maxlen=maxlen)
+    for previous, bar in zip([None] + bars, bars):
+        row = pd.Series(bar)
+        if materialize_previous and previous is not None:
+            row = pd.concat([row, pd.Series(previous).add_prefix("previous_")])
+        rows.append(row)
+    return rows
+
+
+class TestLookbackValidation(unittest.TestCase):
+    """Reference syntax and trend values are checked at load time."""
+
+    def test_invalid_references_are_rejected(self):
+        """Test malformed references and non-integer bar counts fail validation."""
+        for signal, operator, value in [
+            ("close[3]", ">", 1.0), ("avg(close, 3)", ">", 1.0), ("close", ">", "max(high, 0)"),
+            ("close", "rising", 1.5), ("close", "falling", 0), ("close", "rising", True),
+        ]:
+            with self.assertRaises(ValidationError, msg=(signal, operator, value)):
+                condition(signal, operator, value)
+
+    def test_depths_per_timeframe(self):
+        """Test the buffer depth of each timeframe is its deepest condition."""
+        strategy = TradingStrategy(
+            name="deep",
+            timeframes=["1", "60"],
+            entry=EntryDirectionalRules(long=EntryRules(conditions=[
+                condition("close", ">", "max(high[-1], 20)"),
+                condition("ema[-3]", "crosses_above", "sma[-3]"),
+                condition("rsi", "rising", 4, timeframe="60"),
+                condition("rsi", ">", 50.0, timeframe="60"),
+            ])),
+            risk=RiskManagement(sl={"type": "fixed", "value": 30.0}, tp=FixedTakeProfit(type="fixed", value=60.0)),
+        )
+
+        self.assertEqual(lookback_depths([strategy]), {"1": 21, "60": 5})
+
+
+class TestLookbackEvaluation(unittest.TestCase):
+    """Lookback semantics and parity between the compiled and interpreted paths."""
+
+    def setUp(self):
+        """Set up a compiler and an interpreter over the same logger."""
+        self.logger = create_null_logger()
+        self.compiler = StrategyCompiler(self.logger)
+
+    def evaluate(self, cond: Condition, rows: deque) -> bool:
+        """Evaluate through the compiled check, asserting the interpreter agrees."""
+        data = {"1": rows}
+        compiled = self.compiler.compile_condition(cond)(RowAccessor(data))
+        self.assertEqual(compiled, ConditionEvaluator(data, self.logger).evaluate(cond), cond)
+        return compiled
+
+    def test_offsets_and_aggregates(self):
+        """Test offsets and windows read the expected bars."""
+        bars = make_bars(6)
+        rows = buffer(bars)
+        highest = max(bar["high"] for bar in bars[-4:-1])
+
+        self.assertEqual(self.evaluate(condition("close[-2]", ">", bars[-3]["close"] - 0.01), rows), True)
+        self.assertEqual(self.evaluate(condition("close[-2]", ">", bars[-3]["close"] + 0.01), rows), False)
+        self.assertEqual(self.evaluate(condition("max(high[-1], 3)", ">=", highest), rows), True)
+        self.assertEqual(self.evaluate(condition("max(high[-1], 3)", ">", highest), rows), False)
+        self.assertEqual(self.evaluate(condition("close", "!=", "max(high[-1], 10)"), rows), False)    # too short
+
+    def test_shifted_cross_is_cross_of_earlier_bar(self):
+        """Test "ema[-n] crosses_above sma[-n]" is the plain cross evaluated n bars earlier."""
+        bars = make_bars(60, seed=3)
+        for end in range(4, len(bars)):
+            shifted = self.evaluate(condition("ema[-2]", "crosses_above", "sma[-2]"), buffer(bars[:end]))
+            earlier = self.evaluate(condition("ema", "crosses_above", "sma"), buffer(bars[:end - 2]))
+            self.assertEqual(shifted, earlier, end)
+
+    def test_trends(self):
+        """Test rising/falling need a strict move on every bar and enough history."""
+        bars = [{"time": pd.Timestamp("2024-01-02") + pd.Timedelta(minutes=i), "close": close}
+                for i, close in enumerate([3.0, 1.0, 2.0, 3.0, 3.0])]
+
+        self.assertTrue(self.evaluate(condition("close[-1]", "rising", 2), buffer(bars)))
+        self.assertFalse(self.evaluate(condition("close", "rising", 2), buffer(bars)))
+        self.assertTrue(self.evaluate(condition("close[-1]", "falling", 1), buffer(bars[:3])))
+        self.assertFalse(self.evaluate(condition("close", "rising", 3), buffer(bars[1:4])))    # too short
+
+    def test_parity_with_and_without_previous_columns(self):
+        """Test every lookback and previous-bar condition matches the interpreter on random buffers."""
+        conditions = [condition(*spec) for spec in CONDITIONS]
+        for materialize_previous in (True, False):
+            bars = make_bars(120, seed=1)
+            for end in range(1, len(bars)):
+                rows = buffer(bars[max(0, end - 8):end], materialize_previous)
+                for cond in conditions:
+                    self.evaluate(cond, rows)
+
+    def test_previous_columns_are_optional(self):
+        """Test plain crosses/changes_to give the same results without materialised previous_* columns."""
+        bars = make_bars(80, seed=2)
+        for spec in [("ema", "crosses_above", "sma"), ("ema", "crosses_below", 50.0), ("regime", "changes_to", "bull")]:
+            cond = condition(*spec)
+            for end in range(2, len(bars)):
+                with_columns = self.evaluate(cond, buffer(bars[:end], materialize_previous=True))
+                from_buffer = self.evaluate(cond, buffer(bars[:end]))
+                self.assertEqual(with_columns, from_buffer, (spec, end))
+
+
+class TestLookbackBackends(unittest.TestCase):
+    """The matrix backend sends lookback conditions to their compiled checks."""
+
+    def test_matrix_matches_compiled(self):
+        """Test both engine backends give the same results for lookback strategies."""
+        strategies = {
+            f"s{index}": TradingStrategy(
+                name=f"s{index}",
+                timeframes=["1"],
+                entry=EntryDirectionalRules(long=EntryRules(conditions=[condition(*spec), condition(*other)])),
+                risk=RiskManagement(sl={"type": "fixed", "value": 30.0},
+                                    tp=FixedTakeProfit(type="fixed", value=60.0)),
+            )
+            for index, (spec, other) in enumerate(zip(CONDITIONS, CONDITIONS[3:] + CONDITIONS[:3]))
+        }
+        loader = Mock()
+        loader.load_strategies.return_value = strategies
+        engines = [
+            StrategyEngine(loader, DefaultEvaluatorFactory(create_null_logger()), create_null_logger(), backend=b)
+            for b in ("compiled", "matrix")
+        ]
+
+        bars = make_bars(60, seed=4)
+        for end in range(1, len(bars)):
+            data = {"1": buffer(bars[max(0, end - 8):end])}
+            compiled, matrix = (engine.evaluate(data).strategies for engine in engines)
+            self.assertEqual(compiled, matrix, end)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the matrix evaluation backend.
+
+These tests verify that:
+- The matrix backend returns the same AllStrategiesEvaluationResult as the
+  compiled backend over random strategies, trees and mixed-type rows
+- Identical rule sets share gates, and unconfigured sides stay None
+- Strategies using a condition that raises are evaluated through their
+  compiled plan, keeping its short-circuit result
+"""
+
+import random
+import unittest
+from collections import deque
+from unittest.mock import Mock
+
+import pandas as pd
+
+from app.strategy_builder.core.domain.enums import LogicModeEnum
+from app.strategy_builder.core.domain.models import (
+    Condition,
+    ConditionTree,
+    EntryDirectionalRules,
+    EntryRules,
+    FixedStopLoss,
+    FixedTakeProfit,
+    RiskManagement,
+    TradingStrategy,
+)
+from app.strategy_builder.core.evaluators.compiler import RowAccessor
+from app.strategy_builder.core.evaluators.factory import DefaultEvaluatorFactory
+from app.strategy_builder.core.services.engine import StrategyEngine
+from app.strategy_builder.infrastructure.logging import create_null_logger
+from tests.strategy_builder.fixtures.random_strategies import TIMEFRAMES, random_row, random_strategy
+
+
+def engine_for(strategies, backend: str) -> StrategyEngine:
+    loader = Mock()
+    loader.load_strategies.return_value = strategies
+    logger = create_null_logger()
+    return StrategyEngine(loader, DefaultEvaluatorFactory(logger), logger, backend=backend)
+
+
+class TestMatrixBackend(unittest.TestCase):
+    """Matrix backend parity and structure."""
+
+    def test_matches_compiled_backend(self):
+        """Test random strategies give identical results on random rows."""
+        rng = random.Random(11)
+        strategies = {f"s{i}": random_strategy(rng, f"s{i}") for i in range(40)}
+        compiled, matrix = engine_for(strategies, "compiled"), engine_for(strategies, "matrix")
+
+        for _ in range(60):
+            data = {tf: deque([random_row(rng)]) for tf in TIMEFRAMES}
+            self.assertEqual(matrix.evaluate(data), compiled.evaluate(data))
+
+        self.assertIsNotNone(matrix._matrix)
+
+    def test_shared_gates_and_unset_sides(self):
+        """Test two strategies with the same rules share gates and missing sides stay None."""
+        rules = EntryRules(mode=LogicModeEnum.ALL, conditions=[
+            Condition(signal="rsi", operator=">", value=50.0, timeframe="1"),
+            Condition(signal="close", operator="<", value="ma", timeframe="1"),
+        ])
+        strategies = {
+            name: TradingStrategy(
+                name=name, timeframes=["1"], entry=EntryDirectionalRules(long=rules),
+                risk=RiskManagement(sl=FixedStopLoss(type="fixed", value=30.0),
+                                    tp=FixedTakeProfit(type="fixed", value=60.0)),
+            )
+            for name in ("a", "b")
+        }
+        engine = engine_for(strategies, "matrix")
+        data = {"1": deque([pd.Series({"rsi": 60.0, "close": 1.0, "ma": 2.0})])}
+
+        result = engine.evaluate(data)
+
+        self.assertEqual(engine._matrix.gate_count, 1)
+        self.assertTrue(result.strategies["a"].entry.long)
+        self.assertIsNone(result.strategies["b"].entry.short)
+        self.assertIsNone(result.strategies["b"].exit.long)
+
+    def test_raising_condition_uses_compiled_plan(self):
+        """Test an or-tree whose second child raises still fires through its first child."""
+        raising = Condition(signal="regime", operator="crosses_above", value="up", timeframe="1")   # float("up")
+        tree = ConditionTree(operator="or", conditions=[
+            Condition(signal="rsi", operator=">", value=50.0, timeframe="1"), raising,
+        ])
+        strategy = TradingStrategy(
+            name="s", timeframes=["1"], entry=EntryDirectionalRules(long=EntryRules(mode="complex", tree=tree)),
+            risk=RiskManagement(sl=FixedStopLoss(type="fixed", value=30.0), tp=FixedTakeProfit(type="fixed", value=60.0)),
+        )
+        engine = engine_for({"s": strategy}, "matrix")
+        data = {"1": deque([pd.Series({"rsi": 60.0, "regime": "bull", "previous_regime": "bear"}, dtype=object)])}
+
+        self.assertEqual(engine._matrix_signals({"s": strategy}, RowAccessor(data)), {})
+        self.assertTrue(engine.evaluate(data).strategies["s"].entry.long)
+
+    def test_unknown_backend(self):
+        """Test an unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            engine_for({}, "gpu")
+
+
+if __name__ == "__main__":
+    unittest.main()
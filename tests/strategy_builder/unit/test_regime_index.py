@@ -0,0 +1,139 @@
+"""
+Unit tests for regime-guarded strategy dispatch.
+
+These tests verify that:
+- Leading regime/transition conditions of "all" rule sets are detected as
+  guards; later conditions and "any" rule sets are not
+- Only strategies whose every rule set is guarded are indexed
+- Strategies ruled out in the current regime get the same result as a full
+  evaluation without running their conditions
+- Guards are re-checked only when the regime state changes, and a guard that
+  cannot be evaluated rules nothing out
+"""
+
+import unittest
+from collections import deque
+from unittest.mock import Mock
+
+from app.strategy_builder.core.domain.models import (
+    Condition,
+    EntryRules,
+    ExitDirectionalRules,
+    ExitRules,
+)
+from app.strategy_builder.core.evaluators.compiler import StrategyCompiler, leading_regime_guards
+from app.strategy_builder.core.evaluators.factory import DefaultEvaluatorFactory
+from app.strategy_builder.core.evaluators.regime_index import RegimeIndex
+from app.strategy_builder.core.services.engine import StrategyEngine
+from app.strategy_builder.infrastructure.logging import create_null_logger
+from tests.strategy_builder.fixtures.engine_strategies import bar, make_strategy
+
+BULL = Condition(signal="regime", operator="in", value=["bull_high", "bull_low"], timeframe="1")
+BEAR = Condition(signal="regime", operator="==", value="bear_high", timeframe="1")
+CALM = Condition(signal="is_transition", operator="==", value=False, timeframe="1")
+RSI_UP = Condition(signal="rsi", operator=">", value=50.0, timeframe="1")
+RSI_DOWN = Condition(signal="rsi", operator="<", value=50.0, timeframe="1")
+
+
+def regime_bar(minute: int, regime, rsi: float = 60.0, is_transition: bool = False) -> dict:
+    return {"1": deque([bar(minute, regime=regime, is_transition=is_transition, rsi=rsi)])}
+
+
+class TestLeadingGuards(unittest.TestCase):
+    """Guard detection in rule sets."""
+
+    def test_only_leading_conditions_of_all_rule_sets(self):
+        """Test guards stop at the first other condition and "any" rule sets have none."""
+        self.assertEqual(leading_regime_guards(EntryRules(conditions=[BULL, CALM, RSI_UP, BEAR])), [BULL, CALM])
+        self.assertEqual(leading_regime_guards(EntryRules(conditions=[RSI_UP, BULL])), [])
+        self.assertEqual(leading_regime_guards(EntryRules(mode="any", conditions=[BULL, RSI_UP])), [])
+
+    def test_index_requires_every_rule_set_guarded(self):
+        """Test a strategy with one unguarded rule set can fire in any regime and is not indexed."""
+        compiler = StrategyCompiler(create_null_logger())
+        index = RegimeIndex()
+        index.update(compiler.compile(make_strategy("guarded", long=EntryRules(conditions=[BULL, RSI_UP]))))
+        index.update(compiler.compile(make_strategy(
+            "mixed", long=EntryRules(conditions=[BULL, RSI_UP]), short=EntryRules(conditions=[RSI_DOWN]),
+        )))
+
+        self.assertEqual(len(index), 1)
+
+
+class TestRegimeDispatch(unittest.TestCase):
+    """StrategyEngine skips strategies ruled out by their regime guards."""
+
+    def setUp(self):
+        """Set up an engine with bull-only, bear-only and unguarded strategies."""
+        self.strategies = {
+            "bull": make_strategy("bull", long=EntryRules(conditions=[BULL, CALM, RSI_UP])),
+            "bear": make_strategy(
+                "bear",
+                short=EntryRules(conditions=[BEAR, RSI_DOWN]),
+                exit=ExitDirectionalRules(short=ExitRules(mode="all", conditions=[BEAR, RSI_UP])),
+            ),
+            "free": make_strategy("free", long=EntryRules(conditions=[RSI_UP, BULL])),
+        }
+        loader = Mock()
+        loader.load_strategies.return_value = self.strategies
+        loader.get_strategy.side_effect = self.strategies.__getitem__
+        self.engine = StrategyEngine(loader, DefaultEvaluatorFactory(create_null_logger()), create_null_logger())
+
+    def test_results_match_full_evaluation(self):
+        """Test every strategy gets the result of evaluating it directly, in every regime."""
+        bars = [
+            regime_bar(0, "bull_high"), regime_bar(1, "bull_high", rsi=40.0), regime_bar(2, "bear_high", rsi=40.0),
+            regime_bar(3, "bear_high", rsi=60.0), regime_bar(4, "bull_low", is_transition=True), regime_bar(5, None),
+        ]
+        for data in bars:
+            results = self.engine.evaluate(data).strategies
+            for name in self.strategies:
+                self.assertEqual(results[name], self.engine.evaluate_single_strategy(name, data), (name, data))
+
+    def test_ruled_out_strategy_runs_no_conditions(self):
+        """Test a strategy ruled out by the regime is not checked at all."""
+        self.engine.evaluate(regime_bar(0, "bull_high"))
+        plan = self.engine._plans["bear"]
+        plan.check_entry = Mock(wraps=plan.check_entry)
+        plan.check_exit = Mock(wraps=plan.check_exit)
+
+        result = self.engine.evaluate(regime_bar(1, "bull_high")).strategies["bear"]
+
+        plan.check_entry.assert_not_called()
+        plan.check_exit.assert_not_called()
+        self.assertIs(result.entry.short, False)
+        self.assertIsNone(result.entry.long)
+        self.assertIs(result.exit.short, False)
+
+    def test_guards_rechecked_only_on_regime_change(self):
+        """Test the index is refreshed once per regime state, including returns to a known one."""
+        index = self.engine._regime_index
+        for minute, regime in enumerate(["bull_high", "bull_high", "bear_high", "bear_high", "bull_high"]):
+            self.engine.evaluate(regime_bar(minute, regime))
+
+        self.assertEqual(index.refreshes, 2)
+
+    def test_failing_guard_rules_nothing_out(self):
+        """Test a guard that raises leaves the strategy to the normal evaluation."""
+        index = RegimeIndex()
+        plan = StrategyCompiler(create_null_logger()).compile(self.strategies["bull"])
+        index.update(plan)
+        plan.regime_guards["entry_long"][0] = Mock(
+            id=-1, condition=BULL, check=Mock(side_effect=RuntimeError("no regime")),
+        )
+
+        self.assertEqual(index.blocked(_Rows({"regime": "bear_high", "is_transition": False})), frozenset())
+
+
+class _Rows:
+    """Row accessor with a single M1 row."""
+
+    def __init__(self, row):
+        self.row = row
+
+    def latest(self, timeframe):
+        return self.row if timeframe == "1" else None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unit tests for reloading strategies into a running engine.
+
+These tests verify that:
+- Unchanged strategies keep their instance and compiled plan, so only added
+  and edited strategies are recompiled
+- A file that fails validation leaves the previous strategies, files and
+  plans in use
+- Removed strategies disappear, and the matrix backend stops computing
+  conditions that no remaining plan uses
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+from app.strategy_builder.factory import StrategyEngineFactory
+
+STRATEGY_DIR = Path(__file__).resolve().parents[1] / "strategy"
+
+ONE_SIDED = "One sided strategy"
+MULTI_TF = "Multi-TF Momentum Strategy"
+
+
+class TestStrategyReload(unittest.TestCase):
+    """StrategyEngine.reload_strategies() over real strategy files."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = [
+            shutil.copy(STRATEGY_DIR / name, self.temp_dir) for name in ("only_longs.yaml", "complex.yaml")
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def create_engine(self, backend="compiled"):
+        engine = StrategyEngineFactory.create_engine_for_testing(config_paths=self.paths, backend=backend)
+        engine.compile_strategies()
+        return engine
+
+    def edit(self, path, **changes):
+        config = yaml.safe_load(Path(path).read_text())
+        config.update(changes)
+        Path(path).write_text(yaml.safe_dump(config))
+
+    def test_only_edited_strategy_is_recompiled(self):
+        """Test an unchanged strategy keeps its instance and plan across a reload."""
+        engine = self.create_engine()
+        plans = dict(engine._plans)
+        kept = engine.get_strategy_info(MULTI_TF)
+        self.edit(self.paths[0], timeframes=["1"])
+
+        summary = engine.reload_strategies()
+
+        self.assertEqual(summary, {"added": [], "changed": [ONE_SIDED], "removed": []})
+        self.assertIs(engine.get_strategy_info(MULTI_TF), kept)
+        self.assertIs(engine._plans[MULTI_TF], plans[MULTI_TF])
+        self.assertIsNot(engine._plans[ONE_SIDED], plans[ONE_SIDED])
+        self.assertEqual(engine._plans[ONE_SIDED].strategy.timeframes, ["1"])
+
+    def test_invalid_file_keeps_previous_strategies(self):
+        """Test a failed reload leaves strategies, files and plans untouched."""
+        engine = self.create_engine()
+        plans = dict(engine._plans)
+        strategies = {name: engine.get_strategy_info(name) for name in engine.list_available_strategies()}
+        self.edit(self.paths[0], entry="not a rule set")
+
+        with self.assertRaises(Exception):
+            engine.reload_strategies()
+
+        self.assertEqual(engine._plans, plans)
+        self.assertEqual(engine.strategy_loader.config_paths, self.paths)
+        for name, strategy in strategies.items():
+            self.assertIs(engine.get_strategy_info(name), strategy)
+
+    def test_removed_strategy_drops_its_conditions(self):
+        """Test new file lists remove strategies and the matrix skips their conditions."""
+        engine = self.create_engine(backend="matrix")
+        engine._matrix_signals(engine.strategy_loader.load_strategies(), _NoRows())
+        conditions = engine._matrix.size
+
+        summary = engine.reload_strategies([self.paths[1]])
+        engine._matrix_signals(engine.strategy_loader.load_strategies(), _NoRows())
+
+        self.assertEqual(summary["removed"], [ONE_SIDED])
+        self.assertEqual(engine.list_available_strategies(), [MULTI_TF])
+        used = {int(i) for block in engine._matrix._blocks for i in block.ids}
+        used |= {interned.id for interned in engine._matrix._generic}
+        self.assertEqual(used, set(engine._matrix._users))
+        self.assertLess(len(used), conditions)
+
+
+class _NoRows:
+    """Row accessor without any timeframe: every condition is left unset."""
+
+    def has(self, timeframe):
+        return False
+
+    def latest(self, timeframe):
+        return None
+
+
+if __name__ == "__main__":
+    unittest.main()
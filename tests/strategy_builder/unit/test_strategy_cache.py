@@ -0,0 +1,138 @@
+"""
+Unit tests for the validated strategy cache.
+
+These tests verify that:
+- A second load of unchanged files is served from the cache without
+  parsing or schema validation, and gives equal strategies
+- Editing one file re-validates only that file; editing the schema
+  invalidates every entry
+- A cache file written by other code or that cannot be read is ignored
+- Caches sharing a file (one per shard process) keep each other's entries
+- The CLI pre-builds a cache from a folder and reports stale files
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from app.strategy_builder.core.services.loader import StrategyLoader
+from app.strategy_builder.factory import get_default_schema_path
+from app.strategy_builder.infrastructure.config import (
+    ConfigurationLoader,
+    create_config_manager,
+    create_validation_service,
+)
+from app.strategy_builder.infrastructure.logging import create_null_logger
+from app.strategy_builder.infrastructure.strategy_cache import StrategyCache, main
+
+STRATEGY_DIR = Path(__file__).resolve().parents[1] / "strategy"
+
+
+class TestStrategyCache(unittest.TestCase):
+    """Cache hits, per-file invalidation and version checks."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.schema_path = os.path.join(self.temp_dir, "schema.json")
+        shutil.copy(get_default_schema_path(), self.schema_path)
+        self.paths = []
+        for name in ("only_longs.yaml", "complex.yaml"):
+            self.paths.append(shutil.copy(STRATEGY_DIR / name, self.temp_dir))
+        self.cache_path = os.path.join(self.temp_dir, "cache", "strategies.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def load(self):
+        """Load through a fresh cache and loader; returns (strategies, validated paths, cache)."""
+        config_loader = ConfigurationLoader(create_config_manager(), create_validation_service())
+        cache = StrategyCache(self.cache_path)
+        loader = StrategyLoader(self.schema_path, self.paths, config_loader, create_null_logger(), cache=cache)
+        with patch.object(config_loader, "load_and_validate_configs",
+                          wraps=config_loader.load_and_validate_configs) as validate:
+            strategies = loader.load_strategies()
+        return strategies, validate.call_args.args[1] if validate.called else [], cache
+
+    def test_unchanged_files_skip_validation(self):
+        """Test the second load validates nothing and returns equal strategies."""
+        first, validated, _ = self.load()
+        second, revalidated, cache = self.load()
+
+        self.assertEqual(validated, self.paths)
+        self.assertEqual(revalidated, [])      # schema not even parsed
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(second, first)
+
+    def test_edit_invalidates_only_that_file(self):
+        """Test an edited file is re-validated, replaces its old entry and is loaded as edited."""
+        self.load()
+        config = yaml.safe_load(Path(self.paths[0]).read_text())
+        config["name"] = "Renamed"
+        Path(self.paths[0]).write_text(yaml.safe_dump(config))
+
+        strategies, validated, cache = self.load()
+
+        self.assertEqual(validated, [self.paths[0]])
+        self.assertIn("Renamed", strategies)
+        self.assertEqual(len(cache), 2)
+
+    def test_schema_change_invalidates_all(self):
+        """Test a different schema re-validates every file."""
+        self.load()
+        with open(self.schema_path, "a") as f:
+            f.write("\n")
+
+        _, validated, _ = self.load()
+
+        self.assertEqual(validated, self.paths)
+
+    def test_other_code_version_or_corrupt_file_is_ignored(self):
+        """Test a cache written by other code, or garbage, starts empty."""
+        self.load()
+        with patch("app.strategy_builder.infrastructure.strategy_cache.code_version", return_value="other"):
+            _, validated, _ = self.load()
+        self.assertEqual(validated, self.paths)
+
+        Path(self.cache_path).write_bytes(b"not a cache")
+        _, validated, _ = self.load()
+        self.assertEqual(validated, self.paths)
+
+    def test_caches_sharing_a_file_merge_on_save(self):
+        """Test two caches that read the file before either saved keep both sets of entries."""
+        config_loader = ConfigurationLoader(create_config_manager(), create_validation_service())
+        caches = [StrategyCache(self.cache_path), StrategyCache(self.cache_path)]
+        for cache in caches:
+            self.assertEqual(len(cache), 0)        # both read the (missing) file up front
+
+        for cache, path in zip(caches, self.paths):    # each load saves its own file's entry
+            loader = StrategyLoader(self.schema_path, [path], config_loader, create_null_logger(), cache=cache)
+            loader.load_strategies()
+
+        _, validated, cache = self.load()
+        self.assertEqual(validated, [])
+        self.assertEqual(len(cache), 2)
+        self.assertFalse(os.path.exists(f"{self.cache_path}.lock"))
+
+    def test_cli_build_and_check(self):
+        """Test build caches every file of a folder and check flags edited files."""
+        folder = os.path.join(self.temp_dir, "strategies")
+        os.makedirs(folder)
+        for path in self.paths:
+            shutil.move(path, folder)
+        args = [self.cache_path, folder, "--schema", self.schema_path]
+
+        with patch("builtins.print"):
+            self.assertEqual(main(["build", *args]), 0)
+            self.assertEqual(main(["check", *args]), 0)
+            with open(os.path.join(folder, "complex.yaml"), "a") as f:
+                f.write("\n# edited\n")
+            self.assertEqual(main(["check", *args]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
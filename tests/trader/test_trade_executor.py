@@ -312,11 +312,10 @@ class TestTradeExecutor:
         assert isinstance(context, TradingContext)
         assert context is trade_executor.context
 
-    @patch('app.trader.trade_executor.datetime')
-    def test_context_time_update(self, mock_datetime, trade_executor, mock_date_helper):
-        """Test that context time is updated correctly."""
+    def test_context_time_update(self, trade_executor, mock_date_helper):
+        """Test that context time is read from the date helper's clock."""
         fixed_time = datetime(2024, 1, 15, 10, 30, 0)
-        mock_datetime.now.return_value = fixed_time
+        mock_date_helper.now.return_value = fixed_time
         
         trade_executor._update_context(mock_date_helper)
         
@@ -0,0 +1,139 @@
+"""
+Tests for the clock abstraction.
+
+These tests verify that:
+- SimulatedClock sleeps by advancing time instantly, with a monotonic counter
+- The process-wide clock can be swapped and restored
+- DateHelper, Event timestamps, time-based exits, the account stop loss
+  daily reset and the automation state times all read the installed clock
+"""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.events.automation_events import AutomationAction, AutomationStateChangedEvent, ToggleAutomationEvent
+from app.infrastructure.automation_state_manager import AutomationStateManager
+from app.infrastructure.event_bus import EventBus
+from app.risk.account_stop_loss import AccountStopLossConfig, AccountStopLossManager, StopLossStatus
+from app.strategy_builder.core.domain.models import TimeBasedExit
+from app.strategy_builder.core.evaluators.logic import LogicEvaluator
+from app.utils.clock import Clock, SimulatedClock, SystemClock, get_clock, set_clock, use_clock
+from app.utils.date_helper import DateHelper
+
+
+@pytest.fixture
+def clock():
+    """Simulated clock installed process-wide for the test."""
+    with use_clock(SimulatedClock(datetime(2024, 1, 2, 23, 58))) as clock:
+        yield clock
+
+
+class TestSimulatedClock:
+    """Test the simulated clock itself."""
+
+    def test_sleep_advances_without_blocking(self):
+        """Test an hour of sleeps returns immediately and moves now() and monotonic()."""
+        clock = SimulatedClock(datetime(2024, 1, 2, 10, 0))
+        started = time.perf_counter()
+
+        for _ in range(60):
+            clock.sleep(60)
+
+        assert time.perf_counter() - started < 0.5
+        assert clock.now() == datetime(2024, 1, 2, 11, 0)
+        assert clock.monotonic() == 3600
+        assert clock.time() == datetime(2024, 1, 2, 11, 0, tzinfo=timezone.utc).timestamp()
+
+    def test_set_backwards_keeps_monotonic(self):
+        """Test jumping back (a new replay) never decreases the interval counter."""
+        clock = SimulatedClock(datetime(2024, 1, 2, 10, 0))
+        clock.set(datetime(2024, 1, 2, 10, 5))
+        clock.set(datetime(2024, 1, 1))
+
+        assert clock.now() == datetime(2024, 1, 1)
+        assert clock.monotonic() == 300
+        with pytest.raises(ValueError):
+            clock.advance(timedelta(seconds=-1))
+
+    def test_use_clock_restores_previous(self):
+        """Test the previous clock is restored after the block, and None means SystemClock."""
+        original = get_clock()
+        with use_clock(SimulatedClock()) as clock:
+            assert get_clock() is clock
+        assert get_clock() is original
+
+        previous = set_clock(None)
+        try:
+            assert isinstance(get_clock(), SystemClock)
+        finally:
+            set_clock(previous)
+
+
+    def test_incomplete_clock_cannot_be_created(self):
+        """Test a Clock subclass missing a method fails on construction, not mid-replay."""
+        class WallTimeOnly(Clock):
+            def now(self) -> datetime:
+                return datetime.now()
+
+        with pytest.raises(TypeError):
+            WallTimeOnly()
+
+class TestClockConsumers:
+    """Test components read time from the installed clock."""
+
+    def test_date_helper_and_event_defaults(self, clock):
+        """Test DateHelper and Event.timestamp follow the simulated clock."""
+        helper = DateHelper()
+
+        assert helper.get_today() == "2024-01-02"
+        assert helper.get_date_days_ago(-1) == "2024-01-03"
+        event = AutomationStateChangedEvent(enabled=True)
+        assert event.timestamp == event.changed_at == clock.now()
+
+        clock.advance(timedelta(minutes=3))
+        assert helper.is_new_day("00:01")
+        assert DateHelper(clock=SimulatedClock(datetime(2020, 5, 1))).get_today() == "2020-05-01"
+
+    def test_time_based_exit(self, clock):
+        """Test max_duration triggers once the simulated clock passes it."""
+        evaluator = LogicEvaluator(condition_evaluator=None, position_data={"entry_time": clock.now()})
+        rule = TimeBasedExit(max_duration="2h")
+
+        assert not evaluator._evaluate_time_based_exit(rule)
+        clock.advance(timedelta(hours=2))
+        assert evaluator._evaluate_time_based_exit(rule)
+
+    def test_account_stop_loss_daily_reset(self, clock):
+        """Test a daily loss breach clears when the simulated day rolls over."""
+        manager = AccountStopLossManager(
+            AccountStopLossConfig(daily_loss_limit=500.0, max_drawdown_pct=50.0, close_positions_on_breach=False), None
+        )
+        manager.initialize(10000.0)
+
+        manager.update_account_metrics(9400.0)
+        assert manager.status == StopLossStatus.DAILY_LOSS_BREACHED
+        assert manager.breach_time == clock.now()
+
+        clock.sleep(300)
+        manager.update_account_metrics(9400.0)
+        assert manager.status == StopLossStatus.ACTIVE
+        assert manager.last_reset_date == datetime(2024, 1, 3).date()
+
+    def test_automation_state_times(self, clock, tmp_path):
+        """Test automation state changes are stamped and saved with the simulated time."""
+        event_bus = EventBus()
+        state_file = tmp_path / "automation_state.json"
+        AutomationStateManager(event_bus=event_bus, state_file_path=str(state_file), default_enabled=True)
+        received = []
+        event_bus.subscribe(AutomationStateChangedEvent, received.append)
+
+        clock.advance(timedelta(minutes=5))
+        event_bus.publish(ToggleAutomationEvent(action=AutomationAction.DISABLE, reason="test"))
+
+        assert received[0].changed_at == received[0].timestamp == clock.now()
+        saved = json.loads(state_file.read_text())
+        assert saved["saved_at"] == clock.now().isoformat()
+        assert saved["last_changed"] == clock.now().isoformat()